@@ -0,0 +1,82 @@
+"""
+Benchmark: Matchmaking-Scoring über alle Paare des Active Sets
+
+Misst für Active Sets verschiedener Größe die Laufzeit von score_pairs()
+(alle Terme und Hard-Constraints für alle Paare i < j, mit q-Matrix),
+select_pair() (Top-K per argpartition, Softmax) und select_round() (Runde
+mit disjunkten Paaren).
+
+Ausführung:
+    python -m benchmarks.bench_matchmaking [--episodes 250 1000] [--resamples 200] [--round 20]
+"""
+
+import argparse
+import logging
+import time
+from typing import Callable
+
+import numpy as np
+
+from bot.matchmaking import score_pairs, select_pair, select_round, MatchmakingInput
+from bot.q_matrix import compute_q_counts, QMatrix
+
+
+def generate_state(n_episodes: int, n_resamples: int, seed: int = 0):
+    """Erzeugt einen zufälligen Zustand nach dem Bootstrap samt q-Matrix."""
+    rng = np.random.default_rng(seed)
+    episode_ids = np.arange(1, n_episodes + 1)
+    theta = rng.normal(0.0, 1.0, n_episodes)
+    state = MatchmakingInput(
+        episode_ids=episode_ids,
+        theta=theta,
+        n_total=rng.integers(0, 30, n_episodes),
+        n_calib=rng.integers(0, 5, n_episodes),
+        last_seen_poll_idx=rng.integers(-1, 500, n_episodes),
+        poll_count=500,
+        sd_theta=rng.uniform(0.05, 0.5, n_episodes)
+    )
+    draws = theta + rng.normal(0.0, 0.3, (n_resamples, n_episodes))
+    q_matrix = QMatrix(episode_ids, compute_q_counts(draws), n_resamples, 500, seed)
+    return state, q_matrix
+
+
+def best_of(function: Callable, repeat: int) -> float:
+    """Beste Laufzeit aus repeat Durchläufen in Sekunden."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--episodes', type=int, nargs='+', default=[250, 1000])
+    parser.add_argument('--resamples', type=int, default=200)
+    parser.add_argument('--round', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+    
+    logging.disable(logging.CRITICAL)
+    rng = np.random.default_rng(0)
+    
+    print(
+        f"{'Episoden':>9} {'Paare':>9} {'Scoring [ms]':>13} {'Auswahl [ms]':>13}"
+        f" {'Runde [ms]':>11}"
+    )
+    for n_episodes in args.episodes:
+        state, q_matrix = generate_state(n_episodes, args.resamples)
+        scores = score_pairs(state, q_matrix)
+        
+        scoring = best_of(lambda: score_pairs(state, q_matrix), args.repeat)
+        selection = best_of(lambda: select_pair(scores, rng), args.repeat)
+        round_selection = best_of(lambda: select_round(scores, args.round, rng), args.repeat)
+        print(
+            f"{n_episodes:>9} {len(scores.rows):>9} {scoring * 1000:>13.1f}"
+            f" {selection * 1000:>13.1f} {round_selection * 1000:>11.1f}"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+"""
+Benchmark: Datenaufbereitung der Rating-Berechnung
+
+Vergleicht die bisherige Aufbereitung über Dictionaries (Graph, BFS,
+Filterung, Aggregation, Match-Zählung) mit build_model_input() über
+Integer-Arrays, wie sie load_poll_columns() liefert. Gemessen wird nur die
+Aufbereitung, der Fit ist für beide Varianten identisch. Die letzte Spalte
+enthält zusätzlich die Umwandlung von Dictionaries in Arrays.
+
+Ausführung:
+    python -m benchmarks.bench_rating_pipeline [--sizes 10000 100000 1000000]
+"""
+
+import argparse
+import logging
+import time
+from typing import Callable, List, Dict
+
+import numpy as np
+
+from bot.bradley_terry import (
+    ANCHOR_EPISODE_ID,
+    build_connectivity_graph,
+    find_connected_component,
+    filter_polls_by_episodes,
+    prepare_pairwise_data_aggregated,
+    count_matches_per_episode,
+    polls_to_arrays,
+    build_model_input
+)
+
+
+def generate_polls(n_polls: int, n_episodes: int = 1000, seed: int = 0) -> List[Dict]:
+    """
+    Erzeugt zufällige, geparste Polls (wie von filter_and_parse_polls()).
+    
+    Einige Episoden bilden eine eigene Komponente ohne Verbindung zu
+    Episode 1, damit die Filterung tatsächlich Polls entfernt.
+    """
+    rng = np.random.default_rng(seed)
+    n_main = n_episodes - 10
+    episode_a = rng.integers(1, n_main + 1, n_polls)
+    episode_b = (episode_a + rng.integers(1, n_main, n_polls) - 1) % n_main + 1
+    
+    # Abgetrennte Komponente: Episoden n_main+1 .. n_episodes
+    isolated = rng.random(n_polls) < 0.01
+    episode_a[isolated] = rng.integers(n_main + 1, n_episodes + 1, isolated.sum())
+    episode_b[isolated] = (episode_a[isolated] - n_main) % 10 + n_main + 1
+    
+    votes_a = rng.integers(0, 100, n_polls)
+    votes_b = rng.integers(1, 100, n_polls)
+    
+    return [
+        {'episode_a_id': int(a), 'episode_b_id': int(b), 'votes_a': int(va), 'votes_b': int(vb)}
+        for a, b, va, vb in zip(episode_a, episode_b, votes_a, votes_b)
+    ]
+
+
+def prepare_with_dicts(polls: List[Dict]):
+    """Bisherige Aufbereitung über Dictionaries und Sets."""
+    graph = build_connectivity_graph(polls)
+    connected = find_connected_component(graph, ANCHOR_EPISODE_ID)
+    filtered = filter_polls_by_episodes(polls, connected)
+    episode_ids = sorted(connected)
+    counts = prepare_pairwise_data_aggregated(filtered, episode_ids)
+    matches = count_matches_per_episode(filtered, episode_ids)
+    return episode_ids, counts, matches
+
+
+def prepare_with_arrays(polls: List[Dict]):
+    """Aufbereitung über Integer-Arrays (inklusive Umwandlung der Dictionaries)."""
+    return build_model_input(*polls_to_arrays(polls))
+
+
+def best_of(function: Callable, argument, repeat: int) -> float:
+    """Beste Laufzeit aus repeat Durchläufen in Sekunden."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(argument)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10_000, 100_000, 1_000_000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    
+    logging.disable(logging.CRITICAL)
+    
+    print(
+        f"{'Polls':>10} {'Dicts [s]':>10} {'Arrays [s]':>11} {'Speedup':>8}"
+        f" {'Arrays inkl. Umwandlung aus Dicts [s]':>38}"
+    )
+    for n_polls in args.sizes:
+        polls = generate_polls(n_polls)
+        arrays = polls_to_arrays(polls)
+        
+        # Gleiche Ergebnisse sicherstellen
+        episode_ids, counts, matches = prepare_with_dicts(polls)
+        model_input = build_model_input(*arrays)
+        assert model_input.episode_ids.tolist() == episode_ids
+        assert model_input.matches.tolist() == [matches[ep_id] for ep_id in episode_ids]
+        assert np.allclose(model_input.counts.wins_a, counts.wins_a)
+        
+        dict_time = best_of(prepare_with_dicts, polls, args.repeat)
+        array_time = best_of(lambda a: build_model_input(*a), arrays, args.repeat)
+        converted_time = best_of(prepare_with_arrays, polls, args.repeat)
+        print(
+            f"{n_polls:>10} {dict_time:>10.3f} {array_time:>11.3f} {dict_time / array_time:>7.1f}x"
+            f" {converted_time:>38.3f}"
+        )
+
+if __name__ == '__main__':
+    main()
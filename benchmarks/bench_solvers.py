@@ -0,0 +1,92 @@
+"""
+Benchmark: Newton gegen MM für einzelne Fits
+
+Misst die Laufzeit eines vollständigen Fits (DEFAULT_ALPHA, DEFAULT_TOL)
+mit beiden Solvern über zufälligen Polls und zeigt die Wahl von 'auto'
+(select_solver). AUTO_NEWTON_MAX_ITEMS liegt am gemessenen Schnittpunkt.
+
+Ausführung:
+    python -m benchmarks.bench_solvers [--episodes 100 250 500 1000 1500] [--polls 20000 100000]
+
+Messung (1 Kern, 20 Stimmen pro Poll, --repeat 1):
+
+    Episoden   Polls  Newton [s]  MM [s]  auto
+         100   20000       0.004   0.005  newton
+         250   20000       0.014   0.017  newton
+         250  100000       0.021   0.032  newton
+         500   20000       0.045   0.017  mm
+         500  100000       0.069   0.065  mm
+        1000  100000       0.236   0.076  mm
+        1500  100000       0.593   0.092  mm
+        3500  100000      24.393   0.088  mm
+
+Oberhalb von NEWTON_DENSE_MAX_ITEMS wird das Newton-System dünn besetzt
+gelöst und ist um Größenordnungen langsamer (letzte Zeile); 'auto' wählt
+diesen Pfad nie.
+"""
+
+import argparse
+import logging
+import time
+from typing import Callable
+
+import numpy as np
+
+from bot.bradley_terry import DEFAULT_ALPHA, DEFAULT_TOL, build_model_input, fit_bradley_terry_model
+from bot.bt_solvers import select_solver
+
+
+def generate_counts(n_episodes: int, n_polls: int, votes: int = 20, seed: int = 0):
+    """Zufällige Polls nach Bradley-Terry-Stärken, aggregiert zu ModelInput."""
+    rng = np.random.default_rng(seed)
+    strength = rng.normal(0.0, 1.0, n_episodes)
+    episode_a = rng.integers(1, n_episodes + 1, n_polls)
+    episode_b = (episode_a + rng.integers(1, n_episodes, n_polls) - 1) % n_episodes + 1
+    p = 1.0 / (1.0 + np.exp(-(strength[episode_a - 1] - strength[episode_b - 1])))
+    votes_a = rng.binomial(votes, p)
+    return build_model_input(
+        episode_a, episode_b, votes_a, votes - votes_a, np.ones(n_polls, dtype=np.int64)
+    )
+
+
+def best_of(function: Callable, repeat: int) -> float:
+    """Beste Laufzeit aus repeat Durchläufen in Sekunden."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--episodes', type=int, nargs='+', default=[100, 250, 500, 1000, 1500])
+    parser.add_argument('--polls', type=int, nargs='+', default=[20000, 100000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+    
+    logging.disable(logging.CRITICAL)
+    
+    print(f"{'Episoden':>8} {'Polls':>7} {'Newton [s]':>11} {'MM [s]':>7}  auto")
+    for n_episodes in args.episodes:
+        for n_polls in args.polls:
+            model = generate_counts(n_episodes, n_polls)
+            n_items = len(model.episode_ids)
+            timings = [
+                best_of(
+                    lambda: fit_bradley_terry_model(
+                        model.counts, n_items, DEFAULT_ALPHA, tol=DEFAULT_TOL, solver=solver
+                    ),
+                    args.repeat
+                )
+                for solver in ('newton', 'mm')
+            ]
+            print(
+                f"{n_episodes:>8} {n_polls:>7} {timings[0]:>11.3f} {timings[1]:>7.3f}"
+                f"  {select_solver(n_items)}"
+            )
+
+
+if __name__ == '__main__':
+    main()
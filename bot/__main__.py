@@ -6,13 +6,39 @@ Dieses Modul ermöglicht die Ausführung des Bots via:
 
 Verfügbare Befehle:
     validate-data: Validiert die API-Daten (Episoden) und TSV-Dateien (Polls, Ratings)
+    rebuild-matchmaking-state: Baut den Matchmaking-State aus polls.tsv neu auf
+        und prüft den inkrementell geführten Checkpoint dagegen
+    backfill-ratings: Berechnet Rating-Snapshots für viele Cutoffs in einem Sweep
+    online-ratings: Rechnet neu finalisierte Polls lokal in die Online-Ratings ein
+        (mit --refit: vollständiger Refit, misst die Abweichung der Online-Werte)
+    tune-alpha: Wählt die Regularisierungsstärke alpha per Kreuzvalidierung
+    rate-catalogs: Rating-Update für alle Kataloge aus data/catalogs.tsv in
+        einem Prozess (gemeinsame API-Session, Kataloge optional parallel)
+    bootstrap: Berechnet bootstrap_theta_sd.tsv und die q-Matrix neu, wenn
+        der Bootstrap laut Zeitplan fällig ist (mit --force immer)
 """
 
 import sys
 import argparse
+from datetime import datetime, timezone
 from pathlib import Path
+from typing import Optional
 from bot.logger import setup_logging, get_logger
-from bot.tsv_loader import load_polls, load_ratings, TSVLoadError
+from bot.alpha_tuning import select_alpha, AlphaTuningError, ALPHA_GRID, DEFAULT_FOLDS
+from bot.backfill import run_backfill, BackfillError, DEFAULT_INTERVAL_DAYS
+from bot.bootstrap import run_bootstrap_if_due, BootstrapError, BOOTSTRAP_RESAMPLES
+from bot.bradley_terry import filter_poll_columns, parse_datetime_utc, BradleyTerryError
+from bot.catalogs import default_catalogs_path, load_catalog_config, run_catalogs, CatalogError
+from bot.matchmaking_state import (
+    default_matchmaking_state_path, diff_matchmaking_states, load_matchmaking_state,
+    rebuild_matchmaking_state, save_matchmaking_state, set_catalog_size, update_matchmaking_state,
+    MatchmakingStateError
+)
+from bot.online_rating import (
+    default_online_rating_path, load_online_rating_state, refit_online_ratings,
+    save_online_rating_state, update_online_ratings, OnlineRatingError
+)
+from bot.tsv_repository import load_poll_columns, load_ratings, TSVLoadError
 from bot.dreimetadaten_api import fetch_all_episodes, APIError
 from bot.validator import validate_episodes, validate_polls_schema, validate_ratings, ValidationError
 
@@ -42,9 +68,9 @@ def validate_data() -> int:
         logger.info("Validiere Episoden...")
         validate_episodes(episodes)
         
-        # Polls laden und Schema validieren
+        # Polls laden (typisiert, über den Binär-Cache) und Schema validieren
         logger.info("Lade polls.tsv...")
-        polls = load_polls(polls_file)
+        polls = load_poll_columns(polls_file)
         
         logger.info("Validiere Polls-Schema...")
         validate_polls_schema(polls)
@@ -59,7 +85,7 @@ def validate_data() -> int:
         logger.info("=" * 60)
         logger.info("✓ Validierung erfolgreich abgeschlossen")
         logger.info(f"  - {len(episodes)} Episoden validiert (von API)")
-        logger.info(f"  - {len(polls)} Polls geladen (Schema korrekt)")
+        logger.info(f"  - {len(polls.poll_id)} Polls geladen (Schema korrekt)")
         logger.info(f"  - {len(ratings)} Ratings validiert")
         logger.info("=" * 60)
         
@@ -79,6 +105,276 @@ def validate_data() -> int:
         return 1
 
 
+def rebuild_state(catalog_size: int = 0) -> int:
+    """
+    Baut den Matchmaking-State aus polls.tsv neu auf und prüft den Checkpoint.
+    
+    Der gespeicherte Checkpoint wird inkrementell auf den aktuellen Stand
+    gebracht und mit dem Neuaufbau verglichen. Gespeichert wird in jedem
+    Fall der Neuaufbau.
+    
+    Args:
+        catalog_size: Größte bekannte Episode-ID (0: aus Checkpoint und Polls)
+    
+    Returns:
+        Exit-Code: 0 bei Übereinstimmung (oder ohne Checkpoint), 1 bei
+        Abweichungen oder Fehlern
+    """
+    logger = get_logger(__name__)
+    
+    polls_file = Path(__file__).parent.parent / "data" / "polls.tsv"
+    state_file = default_matchmaking_state_path(polls_file)
+    
+    try:
+        polls = filter_poll_columns(load_poll_columns(polls_file), datetime.now(timezone.utc))
+        stored = load_matchmaking_state(state_file)
+        if stored is not None:
+            catalog_size = max(catalog_size, stored.catalog_size)
+        
+        rebuilt = rebuild_matchmaking_state(polls, catalog_size=catalog_size)
+        
+        exit_code = 0
+        if stored is None:
+            logger.info("Kein Matchmaking-State vorhanden - lege ihn neu an")
+        else:
+            updated = set_catalog_size(update_matchmaking_state(stored, polls), catalog_size)
+            differences = diff_matchmaking_states(updated, rebuilt)
+            if differences:
+                logger.error(f"✗ Matchmaking-State weicht vom Neuaufbau ab: {', '.join(differences)}")
+                exit_code = 1
+            else:
+                logger.info("✓ Matchmaking-State stimmt mit dem Neuaufbau überein")
+        
+        save_matchmaking_state(state_file, rebuilt)
+        logger.info(
+            f"Matchmaking-State geschrieben: {rebuilt.poll_count} Polls, "
+            f"{int(rebuilt.activated.sum())} aktivierte Episoden, Frontier {rebuilt.frontier}"
+        )
+        return exit_code
+        
+    except (TSVLoadError, MatchmakingStateError) as e:
+        logger.error(f"✗ Matchmaking-State konnte nicht aufgebaut werden: {e}")
+        return 1
+
+
+def backfill(
+    output: Optional[str] = None,
+    start: Optional[str] = None,
+    end: Optional[str] = None,
+    interval_days: float = DEFAULT_INTERVAL_DAYS,
+    workers: int = 1,
+    half_life_days: Optional[float] = None
+) -> int:
+    """
+    Berechnet die Rating-Historie aus polls.tsv neu (ein Sweep über alle Cutoffs).
+    
+    Geschrieben wird standardmäßig nach data/ratings_backfill.tsv, damit die
+    bestehende ratings.tsv unverändert bleibt und bewusst ersetzt werden kann.
+    
+    Args:
+        output: Optional - Ziel-TSV (default: data/ratings_backfill.tsv)
+        start: Optional - erster Cutoff (ISO-8601, default: erster Poll)
+        end: Optional - letzter Cutoff (ISO-8601, default: letzter Poll)
+        interval_days: Abstand der Cutoffs in Tagen
+        workers: Anzahl Prozesse für disjunkte Cutoff-Bereiche
+        half_life_days: Optional - Halbwertszeit des abklingenden Modells
+    
+    Returns:
+        Exit-Code: 0 bei Erfolg, 1 bei Fehler
+    """
+    logger = get_logger(__name__)
+    
+    data_dir = Path(__file__).parent.parent / "data"
+    output_path = Path(output) if output else data_dir / "ratings_backfill.tsv"
+    
+    try:
+        rows = run_backfill(
+            data_dir / "polls.tsv",
+            output_path,
+            interval_days=interval_days,
+            start=parse_datetime_utc(start) if start else None,
+            end=parse_datetime_utc(end) if end else None,
+            n_workers=workers,
+            half_life_days=half_life_days
+        )
+        logger.info(f"✓ Backfill geschrieben: {len(rows)} Zeilen nach {output_path}")
+        return 0
+        
+    except (BackfillError, BradleyTerryError) as e:
+        logger.error(f"✗ Backfill fehlgeschlagen: {e}")
+        return 1
+
+
+def online_ratings(refit: bool = False) -> int:
+    """
+    Bringt die Online-Ratings auf den Stand von polls.tsv.
+    
+    Ohne refit werden neu finalisierte Polls lokal eingerechnet (Sekunden,
+    für das Leaderboard); mit refit wird vollständig neu gefittet und die
+    Abweichung der bisherigen Online-Werte vom exakten Fit protokolliert.
+    
+    Args:
+        refit: Vollständigen Refit erzwingen (geplanter Abgleich)
+    
+    Returns:
+        Exit-Code: 0 bei Erfolg, 1 bei Fehler
+    """
+    logger = get_logger(__name__)
+    
+    polls_file = Path(__file__).parent.parent / "data" / "polls.tsv"
+    state_file = default_online_rating_path(polls_file)
+    
+    try:
+        polls = filter_poll_columns(load_poll_columns(polls_file), datetime.now(timezone.utc))
+        state = load_online_rating_state(state_file)
+        if refit:
+            state = refit_online_ratings(state, polls)
+        else:
+            state = update_online_ratings(state, polls)
+        save_online_rating_state(state_file, state)
+        logger.info(
+            f"✓ Online-Ratings: {len(state.episode_ids)} Episoden, {state.n_polls} Polls, "
+            f"{state.n_online} Online-Updates seit dem Refit, Abweichung beim letzten Refit "
+            f"{state.last_deviation:.2e} (max. {state.max_deviation:.2e})"
+        )
+        return 0
+        
+    except (TSVLoadError, BradleyTerryError, OnlineRatingError) as e:
+        logger.error(f"✗ Online-Ratings konnten nicht aktualisiert werden: {e}")
+        return 1
+
+
+def tune_alpha(
+    alphas: Optional[str] = None,
+    folds: int = DEFAULT_FOLDS,
+    workers: int = 1,
+    seed: int = 0
+) -> int:
+    """
+    Kreuzvalidiert die Regularisierungsstärke alpha über alle finalisierten Polls.
+    
+    Gibt die mittlere Log-Likelihood pro zurückgehaltener Stimme je alpha
+    und das nach der Ein-Standardfehler-Regel gewählte alpha aus;
+    DEFAULT_ALPHA wird nicht verändert.
+    
+    Args:
+        alphas: Optional - kommagetrennte alpha-Werte (default: ALPHA_GRID)
+        folds: Anzahl der Folds
+        workers: Anzahl Prozesse für die Folds
+        seed: Seed der Fold-Zuordnung
+    
+    Returns:
+        Exit-Code: 0 bei Erfolg, 1 bei Fehler
+    """
+    logger = get_logger(__name__)
+    
+    polls_file = Path(__file__).parent.parent / "data" / "polls.tsv"
+    
+    try:
+        grid = [float(value) for value in alphas.split(',')] if alphas else ALPHA_GRID
+        polls = filter_poll_columns(load_poll_columns(polls_file), datetime.now(timezone.utc))
+        selection = select_alpha(polls, grid, n_folds=folds, n_workers=workers, seed=seed)
+        
+        rows = zip(selection.alphas, selection.log_likelihood, selection.standard_error)
+        for alpha, log_likelihood, standard_error in rows:
+            marker = "  <- bestes alpha" if alpha == selection.best_alpha else ""
+            logger.info(
+                f"  alpha = {alpha:<8g} Log-Likelihood pro Stimme: {log_likelihood:.6f} "
+                f"(SE zum Maximum {standard_error:.6f}){marker}"
+            )
+        if selection.flat:
+            logger.warning("⚠ Kurve flach - alpha ist durch die Daten nicht bestimmt")
+        logger.info(f"✓ Bestes alpha: {selection.best_alpha:g}")
+        return 0
+        
+    except ValueError as e:
+        logger.error(f"✗ Ungültige alpha-Werte '{alphas}': {e}")
+        return 1
+    except (TSVLoadError, BradleyTerryError, AlphaTuningError) as e:
+        logger.error(f"✗ Kreuzvalidierung fehlgeschlagen: {e}")
+        return 1
+
+
+def rate_catalogs(
+    catalogs_file: Optional[str] = None,
+    workers: int = 1,
+    check_episodes: bool = True
+) -> int:
+    """
+    Führt das Rating-Update für alle konfigurierten Kataloge durch.
+    
+    Jeder Katalog hat ein eigenes Datenverzeichnis und eine eigene
+    Anker-Episode; ein fehlgeschlagener Katalog hält die übrigen nicht auf.
+    
+    Args:
+        catalogs_file: Optional - Pfad zu catalogs.tsv (default: data/catalogs.tsv)
+        workers: Anzahl Prozesse für die Kataloge
+        check_episodes: Polls gegen die Episoden der API prüfen
+    
+    Returns:
+        Exit-Code: 0 wenn alle Kataloge erfolgreich waren, sonst 1
+    """
+    logger = get_logger(__name__)
+    
+    data_dir = Path(__file__).parent.parent / "data"
+    config_path = Path(catalogs_file) if catalogs_file else default_catalogs_path(data_dir)
+    
+    try:
+        catalogs = load_catalog_config(config_path, data_dir)
+    except CatalogError as e:
+        logger.error(f"✗ Katalog-Konfiguration ungültig: {e}")
+        return 1
+    
+    results = run_catalogs(catalogs, n_workers=workers, check_episodes=check_episodes)
+    failed = [result.name for result in results if result.error is not None]
+    if failed:
+        logger.error(f"✗ {len(failed)} von {len(results)} Katalogen fehlgeschlagen: {', '.join(failed)}")
+        return 1
+    logger.info(f"✓ {len(results)} Kataloge aktualisiert")
+    return 0
+
+
+def bootstrap(
+    force: bool = False,
+    resamples: int = BOOTSTRAP_RESAMPLES,
+    workers: Optional[int] = None,
+    seed: Optional[int] = None
+) -> int:
+    """
+    Berechnet den Bootstrap neu, wenn er fällig ist.
+    
+    Fällig ist er ab BOOTSTRAP_START_POLLS finalisierten Polls und danach
+    alle BOOTSTRAP_INTERVAL_POLLS Polls seit updated_at_poll_idx in
+    bootstrap_theta_sd.tsv; sonst endet der Befehl ohne Rechnung.
+    
+    Args:
+        force: Auch ohne Fälligkeit rechnen
+        resamples: Anzahl Resamples B
+        workers: Anzahl Prozesse (None: alle Kerne)
+        seed: Optionaler Seed für Reproduzierbarkeit
+    
+    Returns:
+        Exit-Code: 0 bei Erfolg (auch wenn nicht fällig), 1 bei Fehler
+    """
+    logger = get_logger(__name__)
+    
+    polls_file = Path(__file__).parent.parent / "data" / "polls.tsv"
+    
+    try:
+        result = run_bootstrap_if_due(
+            polls_file, n_resamples=resamples, seed=seed, n_workers=workers, force=force
+        )
+    except BootstrapError as e:
+        logger.error(f"✗ Bootstrap fehlgeschlagen: {e}")
+        return 1
+    
+    if result is None:
+        logger.info("✓ Bootstrap nicht fällig")
+    else:
+        logger.info(f"✓ Bootstrap aktualisiert: {len(result.episode_ids)} Episoden, {len(result.theta)} Resamples")
+    return 0
+
+
 def show_status() -> int:
     """
     Zeigt den Bot-Status an (ursprüngliche Funktion).
@@ -134,15 +430,91 @@ def main():
     parser.add_argument(
         'command',
         nargs='?',
-        choices=['validate-data'],
+        choices=[
+            'validate-data', 'rebuild-matchmaking-state', 'backfill-ratings', 'online-ratings', 'tune-alpha',
+            'rate-catalogs', 'bootstrap'
+        ],
         help='Auszuführender Befehl (optional)'
     )
     
+    parser.add_argument(
+        '--catalog-size',
+        type=int,
+        default=0,
+        help='Größte bekannte Episode-ID für die Frontier (rebuild-matchmaking-state)'
+    )
+    
+    parser.add_argument('--output', help='Ziel-TSV (backfill-ratings, default: data/ratings_backfill.tsv)')
+    parser.add_argument('--start', help='Erster Cutoff, ISO-8601 (backfill-ratings)')
+    parser.add_argument('--end', help='Letzter Cutoff, ISO-8601 (backfill-ratings)')
+    parser.add_argument(
+        '--interval-days',
+        type=float,
+        default=DEFAULT_INTERVAL_DAYS,
+        help='Abstand der Cutoffs in Tagen (backfill-ratings)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Anzahl Prozesse (backfill-ratings, tune-alpha, rate-catalogs: default 1; bootstrap: default alle Kerne)'
+    )
+    parser.add_argument(
+        '--half-life-days',
+        type=float,
+        default=None,
+        help='Halbwertszeit für das zeitlich abklingende Modell (backfill-ratings)'
+    )
+    parser.add_argument(
+        '--refit',
+        action='store_true',
+        help='Vollständigen Refit erzwingen (online-ratings)'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Auch ohne Fälligkeit rechnen (bootstrap)'
+    )
+    parser.add_argument(
+        '--resamples',
+        type=int,
+        default=BOOTSTRAP_RESAMPLES,
+        help='Anzahl Resamples (bootstrap)'
+    )
+    parser.add_argument('--alphas', help='Kommagetrennte alpha-Werte (tune-alpha, default: Standard-Grid)')
+    parser.add_argument('--folds', type=int, default=DEFAULT_FOLDS, help='Anzahl Folds (tune-alpha)')
+    parser.add_argument(
+        '--seed',
+        type=int,
+        default=None,
+        help='Seed der Fold-Zuordnung (tune-alpha, default: 0) bzw. der Resamples (bootstrap)'
+    )
+    parser.add_argument('--catalogs', help='Katalog-Konfiguration (rate-catalogs, default: data/catalogs.tsv)')
+    parser.add_argument(
+        '--skip-episode-check',
+        action='store_true',
+        help='Polls nicht gegen die Episoden der API prüfen (rate-catalogs, ohne Netzwerk)'
+    )
+    
     args = parser.parse_args()
     
     # Befehl ausführen
     if args.command == 'validate-data':
         return validate_data()
+    elif args.command == 'rebuild-matchmaking-state':
+        return rebuild_state(args.catalog_size)
+    elif args.command == 'backfill-ratings':
+        return backfill(
+            args.output, args.start, args.end, args.interval_days, args.workers or 1, args.half_life_days
+        )
+    elif args.command == 'online-ratings':
+        return online_ratings(args.refit)
+    elif args.command == 'tune-alpha':
+        return tune_alpha(args.alphas, args.folds, args.workers or 1, 0 if args.seed is None else args.seed)
+    elif args.command == 'rate-catalogs':
+        return rate_catalogs(args.catalogs, args.workers or 1, not args.skip_episode_check)
+    elif args.command == 'bootstrap':
+        return bootstrap(args.force, args.resamples, args.workers, args.seed)
     else:
         return show_status()
 
@@ -0,0 +1,326 @@
+"""
+Wahl der Regularisierungsstärke alpha per Kreuzvalidierung
+
+Die Polls (Komponente mit Episode 1) werden zufällig in k Folds geteilt.
+Für jeden Fold und jedes alpha aus einem Grid wird auf den übrigen Polls
+gefittet und die Binomial-Log-Likelihood der zurückgehaltenen Stimmen
+ausgewertet. Gewählt wird nach der Ein-Standardfehler-Regel: das größte
+alpha, dessen mittlere Log-Likelihood pro zurückgehaltener Stimme höchstens
+einen Standardfehler unter dem Maximum liegt. Der Standardfehler ist der
+der gepaarten Differenz zum Maximum über die Folds - die Folds teilen sich
+die Daten, ihre Schwankung im Niveau sagt über den Abstand zweier alpha-Werte
+nichts. Liegen alle alpha-Werte innerhalb dieser Toleranz, ist die Kurve
+flach - die Daten bestimmen alpha dann nicht, und das wird geloggt.
+
+Das Grid reicht bis alpha = 100: Der Prior wirkt erst dann spürbar, wenn
+alpha in die Größenordnung der Stimmen pro Episode kommt; ein Grid bis 1
+bleibt bei Dutzenden Stimmen pro Episode im flachen Bereich.
+
+Pro Fold werden nur die suffizienten Statistiken neu gebildet: Jeder Poll
+kennt seinen Paar-Index, die zurückgehaltenen Counts eines Folds sind eine
+bincount-Reduktion, die Trainings-Counts deren Differenz zu den
+Gesamt-Counts. Die Folds laufen optional auf einem Prozess-Pool; innerhalb
+eines Folds wird der alpha-Pfad von großem zu kleinem alpha mit
+Warm-Starts durchlaufen.
+
+Siehe auch: docs/bradley_terry_research.md (Regularisierung)
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, NamedTuple, Sequence, Tuple, Union
+
+import numpy as np
+
+from bot.bradley_terry import (
+    build_model_input, fit_bradley_terry_model, polls_to_arrays, BradleyTerryError, DEFAULT_TOL
+)
+from bot.bt_solvers import PairwiseCounts
+from bot.logger import get_logger
+from bot.tsv_repository import PollColumns
+
+logger = get_logger(__name__)
+
+
+# Standard-Grid (log-äquidistant von 0.001 bis zur Größenordnung der
+# Stimmen pro Episode)
+ALPHA_GRID = (0.001, 0.003, 0.01, 0.03, 0.1, 0.3, 1.0, 3.0, 10.0, 30.0, 100.0)
+
+# Anzahl Folds der Kreuzvalidierung
+DEFAULT_FOLDS = 5
+
+# Mindest-Toleranz der Ein-Standardfehler-Regel (Log-Likelihood pro Stimme),
+# damit numerisch gleiche alpha-Werte auch bei Standardfehler 0 gleich gelten
+LIKELIHOOD_TOLERANCE = 1e-6
+
+
+class AlphaTuningError(Exception):
+    """Exception für Fehler bei der Wahl von alpha"""
+    pass
+
+
+class AlphaSelection(NamedTuple):
+    """
+    Ergebnis der Kreuzvalidierung.
+    
+    Attributes:
+        alphas: Geprüfte alpha-Werte (aufsteigend)
+        log_likelihood: Mittlere Log-Likelihood pro zurückgehaltener Stimme je alpha
+        fold_log_likelihood: Log-Likelihood-Summe je Fold und alpha (n_folds, n_alphas)
+        standard_error: Standardfehler der Differenz zum Maximum je alpha
+            (gepaart über die Folds, pro Stimme)
+        best_alpha: Größtes alpha innerhalb eines Standardfehlers vom Maximum
+        flat: True, wenn alle alpha-Werte innerhalb eines Standardfehlers liegen
+    """
+    alphas: np.ndarray
+    log_likelihood: np.ndarray
+    fold_log_likelihood: np.ndarray
+    standard_error: np.ndarray
+    best_alpha: float
+    flat: bool
+
+
+class FoldStatistics(NamedTuple):
+    """
+    Suffiziente Statistiken aller Folds über denselben Paaren.
+    
+    Attributes:
+        idx_a, idx_b: Modell-Indizes der Paare (idx_a < idx_b)
+        total_a, total_b: Stimmen pro Paar über alle Polls
+        held_a, held_b: Zurückgehaltene Stimmen pro Fold und Paar (n_folds, n_pairs)
+        n_items: Anzahl der Episoden
+    """
+    idx_a: np.ndarray
+    idx_b: np.ndarray
+    total_a: np.ndarray
+    total_b: np.ndarray
+    held_a: np.ndarray
+    held_b: np.ndarray
+    n_items: int
+
+
+def assign_folds(n_polls: int, n_folds: int, seed: int = 0) -> np.ndarray:
+    """
+    Teilt Polls zufällig und gleichmäßig auf Folds auf.
+    
+    Args:
+        n_polls: Anzahl der Polls
+        n_folds: Anzahl der Folds (>= 2)
+        seed: Seed für die Zufallszahlen
+        
+    Returns:
+        Fold-Nummer pro Poll (int64, 0 .. n_folds - 1)
+        
+    Raises:
+        AlphaTuningError: Bei weniger als 2 Folds oder weniger Polls als Folds
+    """
+    if n_folds < 2:
+        raise AlphaTuningError(f"Mindestens 2 Folds nötig, erhalten: {n_folds}")
+    if n_polls < n_folds:
+        raise AlphaTuningError(f"Zu wenige Polls ({n_polls}) für {n_folds} Folds")
+    return np.random.default_rng(seed).permutation(n_polls) % n_folds
+
+
+def build_fold_statistics(
+    polls: Union[List[Dict], PollColumns],
+    folds: np.ndarray,
+    n_folds: int
+) -> FoldStatistics:
+    """
+    Bildet Gesamt- und zurückgehaltene Counts pro Paar für alle Folds.
+    
+    Verwendet wie das Modell nur Polls der Komponente mit Episode 1. Jeder
+    Poll wird einmal einem Paar-Index zugeordnet; die Counts eines Folds
+    sind danach eine gewichtete bincount-Reduktion.
+    
+    Args:
+        polls: Geparste Polls oder PollColumns (ein Eintrag pro Poll)
+        folds: Fold-Nummer pro Poll (assign_folds())
+        n_folds: Anzahl der Folds
+        
+    Returns:
+        FoldStatistics
+        
+    Raises:
+        BradleyTerryError: Wenn Episode 1 nicht im Vergleichsgraph ist
+    """
+    episode_a, episode_b, votes_a, votes_b, n_polls = polls_to_arrays(polls)
+    episode_ids = build_model_input(episode_a, episode_b, votes_a, votes_b, n_polls).episode_ids
+    
+    keep = np.isin(episode_a, episode_ids)
+    index_a = np.searchsorted(episode_ids, episode_a[keep])
+    index_b = np.searchsorted(episode_ids, episode_b[keep])
+    votes_a, votes_b, folds = votes_a[keep], votes_b[keep], folds[keep]
+    
+    # Paare kanonisch orientieren (kleinerer Index zuerst)
+    swap = index_a > index_b
+    lo, hi = np.where(swap, index_b, index_a), np.where(swap, index_a, index_b)
+    wins_lo, wins_hi = np.where(swap, votes_b, votes_a), np.where(swap, votes_a, votes_b)
+    n_items = len(episode_ids)
+    keys, pair = np.unique(lo * n_items + hi, return_inverse=True)
+    pair = pair.reshape(-1)
+    n_pairs = len(keys)
+    
+    fold_pair = folds * n_pairs + pair
+    size = n_folds * n_pairs
+    return FoldStatistics(
+        idx_a=keys // n_items,
+        idx_b=keys % n_items,
+        total_a=np.bincount(pair, weights=wins_lo, minlength=n_pairs),
+        total_b=np.bincount(pair, weights=wins_hi, minlength=n_pairs),
+        held_a=np.bincount(fold_pair, weights=wins_lo, minlength=size).reshape(n_folds, n_pairs),
+        held_b=np.bincount(fold_pair, weights=wins_hi, minlength=size).reshape(n_folds, n_pairs),
+        n_items=n_items
+    )
+
+
+def held_out_log_likelihood(
+    theta: np.ndarray,
+    idx_a: np.ndarray,
+    idx_b: np.ndarray,
+    held_a: np.ndarray,
+    held_b: np.ndarray
+) -> float:
+    """
+    Binomial-Log-Likelihood zurückgehaltener Stimmen unter theta.
+    
+    Args:
+        theta: Log-Stärken aus dem Trainings-Fit
+        idx_a, idx_b: Modell-Indizes der Paare
+        held_a, held_b: Zurückgehaltene Stimmen pro Paar
+        
+    Returns:
+        sum(held_a * log sigma(d) + held_b * log sigma(-d)) mit d = theta_a - theta_b
+    """
+    diff = theta[idx_a] - theta[idx_b]
+    return float(-(held_a @ np.logaddexp(0.0, -diff) + held_b @ np.logaddexp(0.0, diff)))
+
+
+def _fold_path(args) -> np.ndarray:
+    """Worker: alpha-Pfad (absteigend, mit Warm-Start) für einen Fold."""
+    stats, fold, alphas, solver = args
+    train = PairwiseCounts(
+        idx_a=stats.idx_a,
+        idx_b=stats.idx_b,
+        wins_a=stats.total_a - stats.held_a[fold],
+        wins_b=stats.total_b - stats.held_b[fold]
+    )
+    
+    log_likelihood = np.empty(len(alphas))
+    theta = None
+    for k in np.argsort(alphas)[::-1]:
+        theta = fit_bradley_terry_model(
+            train, stats.n_items, alpha=float(alphas[k]), tol=DEFAULT_TOL,
+            solver=solver, initial_theta=theta
+        )
+        log_likelihood[k] = held_out_log_likelihood(
+            theta, stats.idx_a, stats.idx_b, stats.held_a[fold], stats.held_b[fold]
+        )
+    return log_likelihood
+
+
+def one_standard_error_choice(
+    alphas: np.ndarray,
+    log_likelihood: np.ndarray,
+    fold_log_likelihood: np.ndarray,
+    fold_votes: np.ndarray
+) -> Tuple[np.ndarray, float, bool]:
+    """
+    Ein-Standardfehler-Regel über die Log-Likelihood pro Stimme.
+    
+    Pro Fold wird die Differenz jedes alpha zum alpha mit der höchsten
+    mittleren Log-Likelihood gebildet; ein alpha gilt als gleich gut, wenn
+    seine mittlere Differenz höchstens einen Standardfehler (mindestens
+    LIKELIHOOD_TOLERANCE) unter 0 liegt.
+    
+    Args:
+        alphas: Geprüfte alpha-Werte (aufsteigend)
+        log_likelihood: Mittlere Log-Likelihood pro Stimme je alpha
+        fold_log_likelihood: Log-Likelihood-Summe je Fold und alpha
+        fold_votes: Zurückgehaltene Stimmen je Fold
+        
+    Returns:
+        (Standardfehler je alpha, gewähltes alpha, flach)
+    """
+    best = int(np.argmax(log_likelihood))
+    per_vote = fold_log_likelihood / np.maximum(fold_votes, 1.0)[:, np.newaxis]
+    difference = per_vote - per_vote[:, [best]]
+    standard_error = np.std(difference, axis=0, ddof=1) / np.sqrt(len(fold_votes))
+    
+    within = difference.mean(axis=0) >= -np.maximum(standard_error, LIKELIHOOD_TOLERANCE)
+    best_alpha = float(alphas[np.flatnonzero(within)[-1]])
+    return standard_error, best_alpha, bool(np.all(within))
+
+
+def select_alpha(
+    polls: Union[List[Dict], PollColumns],
+    alphas: Sequence[float] = ALPHA_GRID,
+    n_folds: int = DEFAULT_FOLDS,
+    n_workers: int = 1,
+    seed: int = 0,
+    solver: str = 'auto'
+) -> AlphaSelection:
+    """
+    Wählt alpha per k-facher Kreuzvalidierung über Polls.
+    
+    Args:
+        polls: Finalisierte Polls (filter_and_parse_polls() oder filter_poll_columns())
+        alphas: Zu prüfende alpha-Werte (> 0)
+        n_folds: Anzahl der Folds
+        n_workers: Anzahl Prozesse für die Folds (1: im aktuellen Prozess)
+        seed: Seed der Fold-Zuordnung
+        solver: Solver für die Binomial-Counts
+        
+    Returns:
+        AlphaSelection
+        
+    Raises:
+        AlphaTuningError: Bei ungültigem Grid, zu wenigen Polls oder Fit-Fehlern
+    """
+    alphas = np.unique(np.asarray(alphas, dtype=np.float64))
+    if len(alphas) == 0 or not np.all(alphas > 0):
+        raise AlphaTuningError(f"alphas müssen > 0 sein, erhalten: {alphas.tolist()}")
+    
+    n_polls = len(polls.poll_id) if isinstance(polls, PollColumns) else len(polls)
+    folds = assign_folds(n_polls, n_folds, seed)
+    try:
+        stats = build_fold_statistics(polls, folds, n_folds)
+    except BradleyTerryError as e:
+        raise AlphaTuningError(str(e))
+    
+    logger.info(
+        f"Kreuzvalidierung: {n_folds} Folds, {len(alphas)} alpha-Werte, "
+        f"{stats.n_items} Episoden, {len(stats.idx_a)} Paare, {n_workers} Prozess(e)"
+    )
+    tasks = [(stats, fold, alphas, solver) for fold in range(n_folds)]
+    try:
+        if n_workers <= 1:
+            fold_log_likelihood = np.array([_fold_path(task) for task in tasks])
+        else:
+            with ProcessPoolExecutor(max_workers=min(n_workers, n_folds)) as pool:
+                fold_log_likelihood = np.array(list(pool.map(_fold_path, tasks)))
+    except BradleyTerryError as e:
+        raise AlphaTuningError(f"Fit in der Kreuzvalidierung fehlgeschlagen: {e}")
+    
+    fold_votes = stats.held_a.sum(axis=1) + stats.held_b.sum(axis=1)
+    log_likelihood = fold_log_likelihood.sum(axis=0) / fold_votes.sum()
+    standard_error, best_alpha, flat = one_standard_error_choice(
+        alphas, log_likelihood, fold_log_likelihood, fold_votes
+    )
+    if flat:
+        logger.warning(
+            f"Log-Likelihood-Kurve flach: alle {len(alphas)} alpha-Werte liegen innerhalb eines "
+            f"Standardfehlers vom Maximum, die Daten bestimmen alpha nicht"
+        )
+    logger.info(
+        f"Bestes alpha: {best_alpha} (Maximum {log_likelihood.max():.6f} pro Stimme "
+        f"bei alpha = {alphas[np.argmax(log_likelihood)]})"
+    )
+    
+    return AlphaSelection(
+        alphas=alphas,
+        log_likelihood=log_likelihood,
+        fold_log_likelihood=fold_log_likelihood,
+        standard_error=standard_error,
+        best_alpha=best_alpha,
+        flat=flat
+    )
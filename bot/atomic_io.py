@@ -0,0 +1,88 @@
+"""
+Atomare Dateioperationen
+
+Hilfsfunktionen zum Schreiben abgeleiteter Dateien (Caches, Sidecars,
+Checkpoints). Dateien werden zuerst temporär im Zielverzeichnis geschrieben
+und dann per os.replace ersetzt, sodass Leser nie eine halb geschriebene
+Datei sehen und ein abgebrochener Lauf den alten Stand hinterlässt.
+
+mkstemp legt die temporäre Datei mit Modus 0600 an; vor dem Ersetzen
+übernimmt sie den Modus der bestehenden Zieldatei bzw. für neue Dateien
+0666 abzüglich umask, wie bei einem normalen open().
+"""
+
+import os
+import stat
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+
+def _target_mode(file_path: Path) -> int:
+    """Modus der bestehenden Zieldatei bzw. 0666 abzüglich umask für neue Dateien."""
+    try:
+        return stat.S_IMODE(os.stat(file_path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def atomic_write_bytes(file_path: Path, data: bytes) -> None:
+    """
+    Schreibt Bytes atomar nach file_path.
+    
+    Args:
+        file_path: Zieldatei (Verzeichnis wird bei Bedarf angelegt)
+        data: Zu schreibender Inhalt
+        
+    Raises:
+        OSError: Wenn die Datei nicht geschrieben werden kann
+    """
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=file_path.parent, prefix=file_path.name, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_name, _target_mode(file_path))
+        os.replace(tmp_name, file_path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+@contextmanager
+def atomic_replace(file_path: Path) -> Iterator[Path]:
+    """
+    Liefert einen temporären Pfad, der bei Erfolg file_path ersetzt.
+    
+    Für Dateien, die nicht als Bytes im Speicher vorliegen sollen (z.B.
+    blockweise über np.lib.format.open_memmap geschrieben). Bei einer
+    Exception wird die temporäre Datei gelöscht, file_path bleibt unverändert.
+    
+    Args:
+        file_path: Zieldatei (Verzeichnis wird bei Bedarf angelegt)
+        
+    Yields:
+        Temporärer Pfad im Zielverzeichnis
+        
+    Raises:
+        OSError: Wenn die Datei nicht ersetzt werden kann
+    """
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=file_path.parent, prefix=file_path.name, suffix='.tmp')
+    os.close(fd)
+    try:
+        yield Path(tmp_name)
+        with open(tmp_name, 'rb') as f:
+            os.fsync(f.fileno())
+        os.chmod(tmp_name, _target_mode(file_path))
+        os.replace(tmp_name, file_path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
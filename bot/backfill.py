@@ -0,0 +1,252 @@
+"""
+Historische Neuberechnung von ratings.tsv (Backfill)
+
+Berechnet Rating-Snapshots für viele Cutoffs, z.B. nach einer Änderung der
+Methodik. Statt N unabhängiger Läufe von run_rating_update() (jeder lädt und
+parst polls.tsv neu) läuft ein Sweep:
+
+1. polls.tsv einmal laden, nach finalized_at sortieren und validieren
+2. Cutoffs aufsteigend abarbeiten; pro Cutoff nur die neu hinzugekommenen
+   Polls (ein Slice der sortierten Spalten) in Statistik, Konnektivität
+   (und ggf. Decay) einrechnen - ohne Konsistenzprüfung gegen den
+   bisherigen Stand, die Reihenfolge ist durch die Sortierung gesichert
+3. jeden Fit mit den Stärken des vorherigen Cutoffs warm starten
+4. alle Snapshots am Ende in einem Append schreiben
+
+Optional werden disjunkte, zusammenhängende Cutoff-Bereiche auf
+Worker-Prozesse verteilt; jeder Worker baut seine Aggregate bis zum ersten
+eigenen Cutoff einmal auf und läuft dann inkrementell weiter.
+"""
+
+import math
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import List, Dict, Optional, Sequence
+
+import numpy as np
+
+from bot.bradley_terry import (
+    compute_ratings_from_polls, filter_poll_columns, sort_poll_columns, BradleyTerryError
+)
+from bot.connectivity import add_polls_to_connectivity, empty_connectivity
+from bot.decay import (
+    add_polls_to_decayed_statistics, decayed_counts, empty_decayed_statistics, half_life_seconds, DecayError
+)
+from bot.logger import get_logger
+from bot.poll_statistics import add_polls_to_statistics, empty_poll_statistics
+from bot.tsv_repository import PollColumns, append_ratings, load_poll_columns, TSVError
+
+logger = get_logger(__name__)
+
+
+# Standardabstand zwischen zwei Cutoffs
+DEFAULT_INTERVAL_DAYS = 7.0
+
+
+class BackfillError(Exception):
+    """Exception für Fehler beim Backfill"""
+    pass
+
+
+def cutoff_schedule(
+    finalized_at: np.ndarray,
+    interval_days: float = DEFAULT_INTERVAL_DAYS,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None
+) -> List[datetime]:
+    """
+    Erzeugt gleichabständige Cutoffs über den Zeitraum der Polls.
+    
+    Args:
+        finalized_at: Sortierte finalized_at der finalisierten Polls (Unix-Sekunden)
+        interval_days: Abstand zwischen zwei Cutoffs in Tagen (> 0)
+        start: Optional - erster Cutoff (default: erster finalisierter Poll)
+        end: Optional - letzter Cutoff (default: letzter finalisierter Poll)
+        
+    Returns:
+        Aufsteigende Liste von UTC-Zeitpunkten; end ist immer enthalten
+        
+    Raises:
+        BackfillError: Bei ungültigem Intervall oder ohne Polls und Zeitraum
+    """
+    if not interval_days > 0:
+        raise BackfillError(f"interval_days muss > 0 sein, erhalten: {interval_days}")
+    if len(finalized_at) == 0 and (start is None or end is None):
+        raise BackfillError("Keine finalisierten Polls - Zeitraum muss angegeben werden")
+    
+    if start is None:
+        start = datetime.fromtimestamp(int(finalized_at[0]), tz=timezone.utc)
+    if end is None:
+        end = datetime.fromtimestamp(int(finalized_at[-1]), tz=timezone.utc)
+    if end < start:
+        raise BackfillError(f"Ende ({end}) liegt vor dem Start ({start})")
+    
+    step = timedelta(days=interval_days)
+    n_steps = math.floor((end - start) / step)
+    cutoffs = [start + k * step for k in range(n_steps + 1)]
+    if cutoffs[-1] < end:
+        cutoffs.append(end)
+    return cutoffs
+
+
+def sweep_cutoffs(
+    polls: PollColumns,
+    cutoffs: Sequence[datetime],
+    half_life_days: Optional[float] = None,
+    solver: str = 'auto'
+) -> List[Dict]:
+    """
+    Berechnet Rating-Snapshots für aufsteigende Cutoffs in einem Durchlauf.
+    
+    Cutoffs, zu denen noch kein Modell möglich ist (z.B. Episode 1 noch
+    ohne Polls), werden mit einer Warnung übersprungen. Pro Cutoff werden
+    nur die Polls seit dem vorherigen Cutoff eingerechnet; der Aufwand für
+    die Aggregate ist über alle Cutoffs zusammen linear in der Anzahl Polls.
+    
+    Args:
+        polls: Validierte, nach finalized_at sortierte Polls
+            (sort_poll_columns() und filter_poll_columns())
+        cutoffs: Aufsteigende UTC-Zeitpunkte
+        half_life_days: Optional - Halbwertszeit des abklingenden Modells
+        solver: Solver für die Binomial-Counts ('auto', 'mm', 'newton')
+        
+    Returns:
+        Rating-Rows aller Snapshots (calculated_at = Cutoff), in Cutoff-Reihenfolge
+    """
+    stats = empty_poll_statistics()
+    connectivity = empty_connectivity()
+    decayed = empty_decayed_statistics(half_life_seconds(half_life_days)) if half_life_days else None
+    initial_theta = None
+    rows = []
+    start = 0
+    
+    for calculated_at in cutoffs:
+        cutoff = int(calculated_at.timestamp())
+        end = int(np.searchsorted(polls.finalized_at, cutoff, side='right'))
+        new_polls = PollColumns(*(column[start:end] for column in polls))
+        start = end
+        
+        stats = add_polls_to_statistics(stats, new_polls)
+        connectivity = add_polls_to_connectivity(connectivity, new_polls)
+        fit_input = stats
+        if decayed is not None:
+            decayed = add_polls_to_decayed_statistics(decayed, new_polls)
+            fit_input = decayed_counts(decayed, cutoff)
+        if stats.n_polls == 0:
+            continue
+        
+        try:
+            snapshot = compute_ratings_from_polls(
+                fit_input, calculated_at, solver=solver,
+                initial_theta=initial_theta, connectivity=connectivity
+            )
+        except BradleyTerryError as e:
+            logger.warning(f"Backfill: Cutoff {calculated_at.isoformat()} übersprungen: {e}")
+            continue
+        
+        initial_theta = {row['episode_id']: float(np.log(row['utility'])) for row in snapshot}
+        rows.extend(snapshot)
+    
+    return rows
+
+
+def _sweep_range(args) -> List[Dict]:
+    """Worker: sweep_cutoffs() für einen zusammenhängenden Cutoff-Bereich."""
+    return sweep_cutoffs(*args)
+
+
+def split_cutoffs(cutoffs: Sequence[datetime], n_ranges: int) -> List[List[datetime]]:
+    """
+    Teilt aufsteigende Cutoffs in höchstens n_ranges zusammenhängende Bereiche.
+    
+    Args:
+        cutoffs: Aufsteigende Cutoffs
+        n_ranges: Gewünschte Anzahl Bereiche
+        
+    Returns:
+        Liste nicht leerer Bereiche (Reihenfolge bleibt erhalten)
+    """
+    return [list(part) for part in np.array_split(np.array(cutoffs, dtype=object), n_ranges) if len(part)]
+
+
+def run_backfill(
+    polls_path: Path,
+    output_path: Path,
+    cutoffs: Optional[Sequence[datetime]] = None,
+    interval_days: float = DEFAULT_INTERVAL_DAYS,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    n_workers: int = 1,
+    half_life_days: Optional[float] = None,
+    solver: str = 'auto'
+) -> List[Dict]:
+    """
+    Berechnet die Rating-Historie für viele Cutoffs und schreibt sie in einem Append.
+    
+    Args:
+        polls_path: Pfad zu polls.tsv
+        output_path: Ziel-TSV im Format von ratings.tsv (wird angehängt)
+        cutoffs: Optional - explizite Cutoffs (sonst cutoff_schedule())
+        interval_days: Abstand der Cutoffs in Tagen (ohne explizite Cutoffs)
+        start: Optional - erster Cutoff (ohne explizite Cutoffs)
+        end: Optional - letzter Cutoff (ohne explizite Cutoffs)
+        n_workers: Anzahl Prozesse (1: im aktuellen Prozess)
+        half_life_days: Optional - Halbwertszeit des abklingenden Modells
+        solver: Solver für die Binomial-Counts
+        
+    Returns:
+        Geschriebene Rating-Rows aller Snapshots
+        
+    Raises:
+        BackfillError: Bei Lade-, Validierungs- oder Schreibfehlern
+    """
+    try:
+        columns = sort_poll_columns(load_poll_columns(polls_path))
+    except TSVError as e:
+        raise BackfillError(f"Fehler beim Laden von polls.tsv: {e}")
+    
+    if cutoffs is None:
+        last = end if end is not None else datetime.now(timezone.utc)
+        finalized = columns.finalized_at[:np.searchsorted(columns.finalized_at, int(last.timestamp()), side='right')]
+        cutoffs = cutoff_schedule(finalized, interval_days, start, end)
+    cutoffs = sorted(cutoffs)
+    if not cutoffs:
+        raise BackfillError("Keine Cutoffs angegeben")
+    
+    try:
+        polls = filter_poll_columns(columns, cutoffs[-1])
+        if half_life_days is not None:
+            half_life_seconds(half_life_days)
+    except (BradleyTerryError, DecayError) as e:
+        raise BackfillError(str(e))
+    
+    logger.info(
+        f"Backfill: {len(cutoffs)} Cutoffs von {cutoffs[0].isoformat()} bis {cutoffs[-1].isoformat()}, "
+        f"{len(polls.poll_id)} Polls, {n_workers} Prozess(e)"
+    )
+    
+    ranges = split_cutoffs(cutoffs, max(1, n_workers))
+    if len(ranges) <= 1:
+        rows = sweep_cutoffs(polls, cutoffs, half_life_days, solver)
+    else:
+        # Jeder Worker bekommt nur die Polls bis zu seinem letzten Cutoff
+        tasks = []
+        for part in ranges:
+            stop = int(np.searchsorted(polls.finalized_at, int(part[-1].timestamp()), side='right'))
+            tasks.append((PollColumns(*(column[:stop] for column in polls)), part, half_life_days, solver))
+        with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+            rows = [row for part_rows in pool.map(_sweep_range, tasks) for row in part_rows]
+    
+    if not rows:
+        logger.warning("Backfill: keine Snapshots berechnet - nichts zu schreiben")
+        return []
+    
+    try:
+        append_ratings(output_path, rows)
+    except TSVError as e:
+        raise BackfillError(f"Fehler beim Schreiben von {output_path.name}: {e}")
+    
+    n_snapshots = len({row['calculated_at'] for row in rows})
+    logger.info(f"Backfill abgeschlossen: {n_snapshots} Snapshots, {len(rows)} Zeilen nach {output_path}")
+    return rows
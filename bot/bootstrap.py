@@ -0,0 +1,607 @@
+"""
+Bootstrap-Unsicherheit für das Bradley-Terry-Modell
+
+Dieses Modul implementiert den gewichteten Poll-Bootstrap aus
+docs/matchmaking.md (Abschnitt "Bootstrap-Spezifikation"):
+
+- B Resamples, je M Polls mit Zurücklegen (M = Anzahl Polls)
+- Ziehwahrscheinlichkeit proportional zu sqrt(n_votes) pro Poll
+- pro Resample ein vollständiger Bradley-Terry-Fit -> theta^(b)
+- Ausgabe: sd_theta[i] = std_b(theta_i^(b)) in bootstrap_theta_sd.tsv
+
+Ein Resample wird als Vielfachheit pro Poll gezogen (Multinomial) und zu
+Binomial-Counts pro Paar aggregiert; das ist gleichwertig zum Ziehen
+einzelner Polls. Jedes Resample hat einen eigenen Zufallsstrom
+(SeedSequence.spawn), das Ergebnis hängt daher nur vom Seed ab, nicht von
+der Anzahl der Prozesse.
+
+Die Resamples werden auf einen Prozess-Pool verteilt (n_workers = 1:
+nacheinander im aktuellen Prozess). Die Poll-Arrays liegen dabei einmal in
+Shared Memory und werden von den Workern nur eingeblendet, nicht pro
+Aufgabe gepickelt; jeder Fit startet beim Fit auf allen Polls. Der Pool
+skaliert nahezu linear mit den Kernen. Ein Bootstrap kostet damit etwa
+B / n_workers Warm-Start-Fits; schon das Ziehen der B Resamples ist teurer
+als wenige einzelne Fits (benchmarks/bench_bootstrap.py).
+"""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import List, Dict, Any, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from bot.bradley_terry import (
+    DEFAULT_ALPHA, DEFAULT_TOL, aggregate_pairwise_counts, build_model_input,
+    filter_poll_columns, polls_to_arrays, BradleyTerryError
+)
+from bot.bt_solvers import get_solver
+from bot.logger import get_logger
+from bot.q_matrix import default_q_matrix_path, refresh_q_matrix, QMatrixError
+from bot.tsv_repository import (
+    PollColumns, load_bootstrap_theta_sd, load_poll_columns, write_bootstrap_theta_sd, TSVError
+)
+
+logger = get_logger(__name__)
+
+# Parameter aus docs/matchmaking.md (Bootstrap / Uncertainty Engine)
+BOOTSTRAP_RESAMPLES = 200
+BOOTSTRAP_START_POLLS = 20
+BOOTSTRAP_INTERVAL_POLLS = 5
+
+# Maximale Iterationen pro Resample-Fit
+BOOTSTRAP_MAX_ITER = 10000
+
+# Aufgaben pro Worker (kleinere Shards gleichen unterschiedliche Fit-Zeiten aus)
+SHARDS_PER_WORKER = 4
+
+
+class BootstrapError(Exception):
+    """Exception für Fehler im Bootstrap"""
+    pass
+
+
+class BootstrapInput(NamedTuple):
+    """
+    Poll-Arrays der Komponente mit Episode 1, ein Eintrag pro Poll.
+    
+    Attributes:
+        episode_ids: Sortierte Episode-IDs im Modell (Index = Modell-Index)
+        idx_a: Modell-Index der Episode A pro Poll (int64)
+        idx_b: Modell-Index der Episode B pro Poll (int64)
+        votes_a: Stimmen für Episode A pro Poll (float64)
+        votes_b: Stimmen für Episode B pro Poll (float64)
+        probabilities: Ziehwahrscheinlichkeit pro Poll (proportional zu sqrt(n_votes))
+    """
+    episode_ids: np.ndarray
+    idx_a: np.ndarray
+    idx_b: np.ndarray
+    votes_a: np.ndarray
+    votes_b: np.ndarray
+    probabilities: np.ndarray
+
+
+class BootstrapResult(NamedTuple):
+    """
+    Ergebnis eines Bootstrap-Laufs.
+    
+    Attributes:
+        episode_ids: Episode-IDs im Modell (Spalten von theta)
+        theta: Log-Stärken aller Resamples (B, n_episodes), zentriert
+        sd_theta: Standardabweichung von theta pro Episode über die Resamples
+        n_polls: Anzahl Polls im Modell
+        seed: Entropie der SeedSequence (reproduziert den Lauf)
+    """
+    episode_ids: np.ndarray
+    theta: np.ndarray
+    sd_theta: np.ndarray
+    n_polls: int
+    seed: int
+
+
+def build_bootstrap_input(polls: Union[List[Dict], PollColumns]) -> BootstrapInput:
+    """
+    Bereitet die Poll-Arrays für den Bootstrap auf.
+    
+    Es werden nur Polls der Komponente mit Episode 1 verwendet (wie im
+    Rating-Fit). Aggregierte Eingaben (PollStatistics) sind nicht möglich,
+    da der Bootstrap einzelne Polls zieht.
+    
+    Args:
+        polls: Geparste Poll-Dictionaries oder gefilterte PollColumns
+        
+    Returns:
+        BootstrapInput
+        
+    Raises:
+        BootstrapError: Bei aggregierten Eingaben oder ohne Polls
+    """
+    episode_a, episode_b, votes_a, votes_b, n_polls = polls_to_arrays(polls)
+    if len(episode_a) == 0:
+        raise BootstrapError("Keine Polls für den Bootstrap vorhanden")
+    if np.any(n_polls != 1):
+        raise BootstrapError("Bootstrap benötigt einzelne Polls, keine aggregierten Einträge")
+    
+    try:
+        model_input = build_model_input(episode_a, episode_b, votes_a, votes_b, n_polls)
+    except BradleyTerryError as e:
+        raise BootstrapError(f"Fehler beim Aufbereiten der Polls: {e}")
+    episode_ids = model_input.episode_ids
+    
+    # Beide Enden eines Polls liegen in derselben Komponente
+    idx_a = np.searchsorted(episode_ids, episode_a).clip(max=len(episode_ids) - 1)
+    keep = episode_ids[idx_a] == episode_a
+    idx_a = idx_a[keep]
+    idx_b = np.searchsorted(episode_ids, episode_b[keep])
+    votes_a = np.ascontiguousarray(votes_a[keep], dtype=np.float64)
+    votes_b = np.ascontiguousarray(votes_b[keep], dtype=np.float64)
+    
+    weights = np.sqrt(votes_a + votes_b)
+    return BootstrapInput(
+        episode_ids=episode_ids,
+        idx_a=idx_a.astype(np.int64),
+        idx_b=idx_b.astype(np.int64),
+        votes_a=votes_a,
+        votes_b=votes_b,
+        probabilities=weights / weights.sum()
+    )
+
+
+def draw_multiplicity(data: BootstrapInput, seed: np.random.SeedSequence) -> np.ndarray:
+    """
+    Zieht ein Resample als Vielfachheit pro Poll.
+    
+    M = Anzahl Polls Ziehungen mit Zurücklegen, Wahrscheinlichkeit
+    data.probabilities. Gleiche Seeds ergeben dieselben Resamples,
+    unabhängig vom Prozess, der sie fittet.
+    
+    Args:
+        data: Poll-Arrays (von build_bootstrap_input)
+        seed: Eigener Zufallsstrom dieses Resamples
+        
+    Returns:
+        Array (n_polls,) mit der Anzahl Ziehungen pro Poll
+    """
+    rng = np.random.default_rng(seed)
+    return rng.multinomial(len(data.idx_a), data.probabilities)
+
+
+def fit_resample(
+    data: BootstrapInput,
+    seed: np.random.SeedSequence,
+    alpha: float = DEFAULT_ALPHA,
+    tol: float = DEFAULT_TOL,
+    solver: str = 'auto',
+    initial_theta: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Zieht ein Resample und fittet das Bradley-Terry-Modell darauf.
+    
+    Episoden, die im Resample nicht vorkommen, werden durch die
+    Regularisierung bei theta = 0 gehalten.
+    
+    Args:
+        data: Poll-Arrays (von build_bootstrap_input)
+        seed: Eigener Zufallsstrom dieses Resamples
+        alpha: Regularisierungsstärke
+        tol: Konvergenztoleranz
+        solver: 'auto', 'mm' oder 'newton'
+        initial_theta: Optionale Startwerte (z.B. Fit auf allen Polls)
+        
+    Returns:
+        Log-Stärken theta (n_episodes,), zentriert
+    """
+    multiplicity = draw_multiplicity(data, seed)
+    drawn = np.flatnonzero(multiplicity)
+    counts = aggregate_pairwise_counts(
+        data.idx_a[drawn],
+        data.idx_b[drawn],
+        data.votes_a[drawn] * multiplicity[drawn],
+        data.votes_b[drawn] * multiplicity[drawn]
+    )
+    n_items = len(data.episode_ids)
+    _, solve = get_solver(solver, n_items)
+    theta, _ = solve(
+        counts=counts,
+        n_items=n_items,
+        alpha=alpha,
+        max_iter=BOOTSTRAP_MAX_ITER,
+        tol=tol,
+        initial_theta=initial_theta
+    )
+    return theta
+
+
+def _fit_point_estimate(data: BootstrapInput, alpha: float, tol: float, solver: str) -> np.ndarray:
+    """Fit auf allen Polls (Startwert für die Resamples)."""
+    counts = aggregate_pairwise_counts(data.idx_a, data.idx_b, data.votes_a, data.votes_b)
+    n_items = len(data.episode_ids)
+    _, solve = get_solver(solver, n_items)
+    theta, _ = solve(
+        counts=counts, n_items=n_items, alpha=alpha, max_iter=BOOTSTRAP_MAX_ITER, tol=tol
+    )
+    return theta
+
+
+# Shared-Memory-Spezifikation eines Arrays: (Name, Shape, dtype)
+SharedArraySpec = Tuple[str, Tuple[int, ...], str]
+
+# Zustand eines Worker-Prozesses (gesetzt von _init_worker)
+_worker_state: Dict[str, Any] = {}
+
+
+def _share_array(array: np.ndarray) -> Tuple[shared_memory.SharedMemory, SharedArraySpec]:
+    """Kopiert ein Array in einen neuen Shared-Memory-Block."""
+    block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+    view = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+    view[...] = array
+    return block, (block.name, array.shape, array.dtype.str)
+
+
+def _attach_array(spec: SharedArraySpec) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+    """Blendet ein Array aus Shared Memory ein (ohne Kopie)."""
+    name, shape, dtype = spec
+    block = shared_memory.SharedMemory(name=name)
+    array = np.ndarray(shape, dtype=np.dtype(dtype), buffer=block.buf)
+    array.flags.writeable = False
+    return block, array
+
+
+def _init_worker(
+    specs: Sequence[SharedArraySpec],
+    episode_ids: np.ndarray,
+    alpha: float,
+    tol: float,
+    solver: str,
+    initial_theta: Optional[np.ndarray]
+) -> None:
+    """Initialisiert einen Worker: Poll-Arrays aus Shared Memory einblenden."""
+    blocks, arrays = zip(*(_attach_array(spec) for spec in specs))
+    _worker_state['blocks'] = blocks
+    _worker_state['data'] = BootstrapInput(episode_ids, *arrays)
+    _worker_state['params'] = (alpha, tol, solver, initial_theta)
+
+
+def _fit_shard(seeds: Sequence[np.random.SeedSequence]) -> np.ndarray:
+    """Fittet die Resamples eines Shards im Worker-Prozess."""
+    data = _worker_state['data']
+    alpha, tol, solver, initial_theta = _worker_state['params']
+    return np.array([
+        fit_resample(data, seed, alpha, tol, solver, initial_theta) for seed in seeds
+    ]).reshape(len(seeds), len(data.episode_ids))
+
+
+def _shard(seeds: List[np.random.SeedSequence], n_shards: int) -> List[List[np.random.SeedSequence]]:
+    """Teilt die Resample-Seeds in zusammenhängende Shards (Reihenfolge bleibt erhalten)."""
+    size = math.ceil(len(seeds) / n_shards)
+    return [seeds[start:start + size] for start in range(0, len(seeds), size)]
+
+
+def run_bootstrap_fits(
+    data: BootstrapInput,
+    n_resamples: int = BOOTSTRAP_RESAMPLES,
+    seed: Optional[int] = None,
+    n_workers: Optional[int] = None,
+    alpha: float = DEFAULT_ALPHA,
+    tol: float = DEFAULT_TOL,
+    solver: str = 'auto'
+) -> BootstrapResult:
+    """
+    Fittet alle Resamples, verteilt auf einen Prozess-Pool.
+    
+    Jedes Resample erhält einen eigenen Zufallsstrom aus
+    SeedSequence(seed).spawn(n_resamples); das Ergebnis ist daher
+    unabhängig von n_workers identisch. Mit n_workers = 1 wird ohne Pool im
+    aktuellen Prozess gerechnet.
+    
+    Args:
+        data: Poll-Arrays (von build_bootstrap_input)
+        n_resamples: Anzahl Resamples B
+        seed: Optionaler Seed (None: neue Entropie, wird geloggt)
+        n_workers: Anzahl Prozesse (default: os.cpu_count())
+        alpha: Regularisierungsstärke
+        tol: Konvergenztoleranz
+        solver: 'auto', 'mm' oder 'newton'
+        
+    Returns:
+        BootstrapResult
+        
+    Raises:
+        BootstrapError: Wenn ein Fit fehlschlägt
+    """
+    if n_resamples < 2:
+        raise BootstrapError(f"Mindestens 2 Resamples erforderlich, erhalten: {n_resamples}")
+    
+    seed_sequence = np.random.SeedSequence(seed)
+    seeds = seed_sequence.spawn(n_resamples)
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    n_workers = max(1, min(n_workers, n_resamples))
+    
+    logger.info(
+        f"Bootstrap: {n_resamples} Resamples über {len(data.idx_a)} Polls, "
+        f"{len(data.episode_ids)} Episoden, {n_workers} Prozesse "
+        f"(seed={seed_sequence.entropy})"
+    )
+    
+    try:
+        initial_theta = _fit_point_estimate(data, alpha, tol, solver)
+        
+        if n_workers == 1:
+            theta = np.array([
+                fit_resample(data, s, alpha, tol, solver, initial_theta) for s in seeds
+            ])
+        else:
+            theta = _run_pool(data, seeds, n_workers, alpha, tol, solver, initial_theta)
+    except (RuntimeError, ValueError, np.linalg.LinAlgError) as e:
+        raise BootstrapError(f"Fehler beim Fitten eines Bootstrap-Resamples: {e}")
+    
+    if not np.isfinite(theta).all():
+        raise BootstrapError("Bootstrap-Fits haben nicht-finite Werte produziert")
+    
+    return BootstrapResult(
+        episode_ids=data.episode_ids,
+        theta=theta,
+        sd_theta=theta.std(axis=0, ddof=1),
+        n_polls=len(data.idx_a),
+        seed=seed_sequence.entropy
+    )
+
+
+def _run_pool(
+    data: BootstrapInput,
+    seeds: List[np.random.SeedSequence],
+    n_workers: int,
+    alpha: float,
+    tol: float,
+    solver: str,
+    initial_theta: np.ndarray
+) -> np.ndarray:
+    """Verteilt die Resamples auf einen Prozess-Pool (Poll-Arrays in Shared Memory)."""
+    shared = [
+        _share_array(array)
+        for array in (data.idx_a, data.idx_b, data.votes_a, data.votes_b, data.probabilities)
+    ]
+    try:
+        with ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_init_worker,
+            initargs=(
+                [spec for _, spec in shared], data.episode_ids,
+                alpha, tol, solver, initial_theta
+            )
+        ) as pool:
+            shards = _shard(seeds, n_workers * SHARDS_PER_WORKER)
+            return np.concatenate(list(pool.map(_fit_shard, shards)))
+    finally:
+        for block, _ in shared:
+            block.close()
+            block.unlink()
+
+
+def compute_bootstrap(
+    polls: Union[List[Dict], PollColumns],
+    n_resamples: int = BOOTSTRAP_RESAMPLES,
+    seed: Optional[int] = None,
+    n_workers: Optional[int] = None,
+    solver: str = 'auto'
+) -> BootstrapResult:
+    """
+    Berechnet den gewichteten Poll-Bootstrap - REIN, ohne I/O.
+    
+    Args:
+        polls: Geparste Poll-Dictionaries oder gefilterte PollColumns
+        n_resamples: Anzahl Resamples B
+        seed: Optionaler Seed für Reproduzierbarkeit
+        n_workers: Anzahl Prozesse (default: os.cpu_count())
+        solver: 'auto', 'mm' oder 'newton'
+        
+    Returns:
+        BootstrapResult
+        
+    Raises:
+        BootstrapError: Bei allen kritischen Fehlern
+    """
+    data = build_bootstrap_input(polls)
+    return run_bootstrap_fits(
+        data, n_resamples, seed=seed, n_workers=n_workers, solver=solver
+    )
+
+
+def is_bootstrap_due(poll_count: int, updated_at_poll_idx: Optional[int]) -> bool:
+    """
+    Prüft, ob der Bootstrap neu berechnet werden soll.
+    
+    Der Bootstrap startet nach BOOTSTRAP_START_POLLS Polls und wird danach
+    alle BOOTSTRAP_INTERVAL_POLLS Polls aktualisiert.
+    
+    Args:
+        poll_count: Aktuelle Anzahl abgeschlossener Polls
+        updated_at_poll_idx: poll_count des letzten Bootstrap-Laufs (None: noch keiner)
+        
+    Returns:
+        True, wenn ein neuer Lauf fällig ist
+    """
+    if poll_count < BOOTSTRAP_START_POLLS:
+        return False
+    if updated_at_poll_idx is None:
+        return True
+    return poll_count - updated_at_poll_idx >= BOOTSTRAP_INTERVAL_POLLS
+
+
+def bootstrap_sd_rows(result: BootstrapResult, poll_count: int) -> List[Dict[str, Any]]:
+    """
+    Wandelt ein Bootstrap-Ergebnis in Zeilen für bootstrap_theta_sd.tsv um.
+    
+    Args:
+        result: Bootstrap-Ergebnis
+        poll_count: Anzahl abgeschlossener Polls zum Zeitpunkt des Laufs
+        
+    Returns:
+        Liste von Dictionaries (episode_id, sd_theta, updated_at_poll_idx)
+    """
+    return [
+        {
+            'episode_id': int(ep_id),
+            'sd_theta': float(sd),
+            'updated_at_poll_idx': int(poll_count)
+        }
+        for ep_id, sd in zip(result.episode_ids, result.sd_theta)
+    ]
+
+
+def default_bootstrap_sd_path(polls_path: Path) -> Path:
+    """
+    Standardpfad von bootstrap_theta_sd.tsv (neben polls.tsv).
+    
+    Args:
+        polls_path: Pfad zu polls.tsv
+        
+    Returns:
+        Pfad zu bootstrap_theta_sd.tsv
+    """
+    return polls_path.parent / 'bootstrap_theta_sd.tsv'
+
+
+def load_bootstrap_poll_idx(output_path: Path) -> Optional[int]:
+    """
+    Liest den Poll-Stand (updated_at_poll_idx) des letzten Bootstrap-Laufs.
+    
+    Args:
+        output_path: Pfad zu bootstrap_theta_sd.tsv
+        
+    Returns:
+        poll_count des letzten Laufs oder None (Datei fehlt, ist leer oder
+        nicht lesbar - der Bootstrap gilt dann als noch nicht gelaufen)
+    """
+    if not output_path.exists():
+        return None
+    
+    try:
+        rows = load_bootstrap_theta_sd(output_path)
+        return max(int(row['updated_at_poll_idx']) for row in rows) if rows else None
+    except (TSVError, ValueError) as e:
+        logger.warning(f"{output_path.name} nicht lesbar, Bootstrap wird neu berechnet: {e}")
+        return None
+
+
+def run_bootstrap(
+    polls_path: Path,
+    output_path: Optional[Path] = None,
+    calculated_at: Optional[datetime] = None,
+    n_resamples: int = BOOTSTRAP_RESAMPLES,
+    seed: Optional[int] = None,
+    n_workers: Optional[int] = None,
+    q_matrix_path: Optional[Path] = None
+) -> BootstrapResult:
+    """
+    Führt einen Bootstrap-Lauf durch und schreibt bootstrap_theta_sd.tsv.
+    
+    Verwendet alle bis calculated_at finalisierten Polls; updated_at_poll_idx
+    ist deren Anzahl. Zusätzlich wird die q-Matrix (bot/q_matrix.py) aus
+    denselben Draws aktualisiert.
+    
+    Args:
+        polls_path: Pfad zu polls.tsv
+        output_path: Optional - Pfad zur Ausgabe (default: data/bootstrap_theta_sd.tsv)
+        calculated_at: Optional - UTC-Zeitpunkt (default: jetzt)
+        n_resamples: Anzahl Resamples B
+        seed: Optionaler Seed für Reproduzierbarkeit
+        n_workers: Anzahl Prozesse (default: os.cpu_count())
+        q_matrix_path: Optional - Pfad der q-Matrix
+            (default: data/.cache/bootstrap_q_matrix.json)
+        
+    Returns:
+        BootstrapResult
+        
+    Raises:
+        BootstrapError: Bei allen kritischen Fehlern
+    """
+    if calculated_at is None:
+        calculated_at = datetime.now(timezone.utc)
+    if output_path is None:
+        output_path = default_bootstrap_sd_path(polls_path)
+    if q_matrix_path is None:
+        q_matrix_path = default_q_matrix_path(polls_path)
+    
+    try:
+        polls = filter_poll_columns(load_poll_columns(polls_path), calculated_at)
+    except (TSVError, BradleyTerryError) as e:
+        raise BootstrapError(f"Fehler beim Laden von polls.tsv: {e}")
+    
+    poll_count = len(polls.poll_id)
+    result = compute_bootstrap(polls, n_resamples, seed=seed, n_workers=n_workers)
+    
+    try:
+        write_bootstrap_theta_sd(output_path, bootstrap_sd_rows(result, poll_count))
+    except TSVError as e:
+        raise BootstrapError(f"Fehler beim Schreiben von {output_path.name}: {e}")
+    
+    # q-Matrix ist ein abgeleiteter Cache - Fehler brechen den Lauf nicht ab
+    try:
+        refresh_q_matrix(q_matrix_path, result.theta, result.episode_ids, poll_count, result.seed)
+    except QMatrixError as e:
+        logger.warning(f"q-Matrix konnte nicht aktualisiert werden: {e}")
+    
+    logger.info(
+        f"Bootstrap abgeschlossen: sd_theta median {np.median(result.sd_theta):.4f}, "
+        f"max {result.sd_theta.max():.4f}"
+    )
+    return result
+
+
+def run_bootstrap_if_due(
+    polls_path: Path,
+    output_path: Optional[Path] = None,
+    calculated_at: Optional[datetime] = None,
+    n_resamples: int = BOOTSTRAP_RESAMPLES,
+    seed: Optional[int] = None,
+    n_workers: Optional[int] = None,
+    force: bool = False
+) -> Optional[BootstrapResult]:
+    """
+    Führt run_bootstrap() aus, wenn der Bootstrap laut Zeitplan fällig ist.
+    
+    Vergleicht die Anzahl der bis calculated_at finalisierten Polls mit
+    updated_at_poll_idx aus bootstrap_theta_sd.tsv (is_bootstrap_due()).
+    
+    Args:
+        polls_path: Pfad zu polls.tsv
+        output_path: Optional - Pfad zur Ausgabe (default: data/bootstrap_theta_sd.tsv)
+        calculated_at: Optional - UTC-Zeitpunkt (default: jetzt)
+        n_resamples: Anzahl Resamples B
+        seed: Optionaler Seed für Reproduzierbarkeit
+        n_workers: Anzahl Prozesse (default: os.cpu_count())
+        force: Auch ohne Fälligkeit rechnen
+        
+    Returns:
+        BootstrapResult oder None, wenn kein Lauf fällig war
+        
+    Raises:
+        BootstrapError: Bei allen kritischen Fehlern
+    """
+    if calculated_at is None:
+        calculated_at = datetime.now(timezone.utc)
+    if output_path is None:
+        output_path = default_bootstrap_sd_path(polls_path)
+    
+    try:
+        poll_count = len(filter_poll_columns(load_poll_columns(polls_path), calculated_at).poll_id)
+    except (TSVError, BradleyTerryError) as e:
+        raise BootstrapError(f"Fehler beim Laden von polls.tsv: {e}")
+    
+    updated_at_poll_idx = load_bootstrap_poll_idx(output_path)
+    if not force and not is_bootstrap_due(poll_count, updated_at_poll_idx):
+        logger.info(
+            f"Bootstrap nicht fällig ({poll_count} Polls, letzter Lauf bei {updated_at_poll_idx}, "
+            f"Start ab {BOOTSTRAP_START_POLLS}, Intervall {BOOTSTRAP_INTERVAL_POLLS})"
+        )
+        return None
+    
+    return run_bootstrap(
+        polls_path, output_path, calculated_at,
+        n_resamples=n_resamples, seed=seed, n_workers=n_workers
+    )
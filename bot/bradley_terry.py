@@ -8,28 +8,64 @@ Methodik:
 - Bradley-Terry Discrete Choice Model
 - MM-Algorithmus (Minorization-Maximization)
 - L2-Regularisierung (alpha = 0.01)
-- Nur Episoden berücksichtigt, die mit Episode 1 verbunden sind
+- Nur Episoden berücksichtigt, die mit Episode 1 verbunden sind (übrige
+  Komponenten optional mit vorläufigen Stärken: compute_component_ratings)
 - Normierung: mean(utility) = 1.0
 
-Hinweis: Votes werden zu Einzelbeobachtungen expandiert (disaggregiert).
-Dies ist mathematisch äquivalent zur Binomial-Likelihood, aber weniger effizient.
+Datenformat: Votes werden pro Episodenpaar zu Binomial-Counts (w_ij, w_ji)
+aggregiert. Der Aufwand hängt damit von der Anzahl der Paare ab, nicht von der
+Anzahl der Stimmen. Die frühere Expansion zu Einzelbeobachtungen
+(prepare_pairwise_data_expanded) bleibt als Referenzpfad verfügbar.
 
 Siehe auch: docs/bradley_terry_research.md
 """
 
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-from typing import List, Dict, Tuple, Set
+from typing import List, Dict, Tuple, Set, Union, Optional, Any, NamedTuple
 from datetime import datetime, timezone
 from collections import defaultdict, deque
 
 import choix
 import numpy as np
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
 
+from bot.bt_solvers import PairwiseCounts, get_solver
+from bot.connectivity import (
+    Connectivity, component_ids, default_connectivity_path, load_connectivity,
+    save_connectivity, update_connectivity, ConnectivityError
+)
+from bot.decay import (
+    build_decayed_statistics, decayed_counts, default_decay_path, half_life_seconds,
+    load_decayed_statistics, save_decayed_statistics, update_decayed_statistics, DecayError
+)
 from bot.logger import get_logger
-from bot.tsv_repository import load_polls, append_ratings, TSVError
+from bot.poll_statistics import (
+    PollStatistics, merge_pair_arrays, default_statistics_path, load_poll_statistics,
+    save_poll_statistics, update_poll_statistics, PollStatisticsError
+)
+from bot.rating_cache import (
+    compute_poll_digest, load_cached_ratings, save_cached_ratings, RatingCacheError
+)
+from bot.rating_uncertainty import rank_intervals, standard_errors, RatingUncertaintyError
+from bot.tsv_repository import (
+    PollColumns, load_poll_columns, load_ratings, append_ratings, parse_epoch_seconds,
+    write_component_ratings, write_rating_uncertainty, TSVError
+)
 
 logger = get_logger(__name__)
 
+# Modellparameter (siehe docs/bradley_terry_research.md)
+DEFAULT_ALPHA = 0.01
+DEFAULT_TOL = 1e-6
+ANCHOR_EPISODE_ID = 1
+
+# Untergrenze für Utilities beim Zurückrechnen auf log-Stärken (utility wird
+# mit 6 Dezimalstellen gespeichert und kann auf 0.000000 gerundet sein)
+MIN_WARM_START_UTILITY = 1e-6
+
 
 class BradleyTerryError(Exception):
     """Exception für Bradley-Terry-Berechnungsfehler"""
@@ -87,23 +123,26 @@ def filter_and_parse_polls(raw_polls: List[Dict[str, str]], calculated_at: datet
     
     logger.info(f"Polls geladen: {len(raw_polls)} Einträge")
     
-    for poll in raw_polls:
-        # Prüfe ob finalized_at gesetzt ist
-        if not poll.get('finalized_at'):
-            continue
-        
-        # Parse finalized_at
-        try:
-            finalized_at = parse_datetime_utc(poll['finalized_at'])
-        except BradleyTerryError as e:
-            raise BradleyTerryError(
-                f"Fehler beim Parsen von finalized_at in Poll "
-                f"{poll.get('poll_id', 'unknown')}: {e}"
-            )
-        
-        # Nur Polls bis calculated_at verwenden
-        if finalized_at > calculated_at:
-            continue
+    # finalized_at gesammelt parsen (leer = nicht finalisiert)
+    try:
+        finalized_epochs = parse_epoch_seconds([poll.get('finalized_at') or '' for poll in raw_polls])
+    except ValueError as e:
+        # Fehlerhaften Poll für die Meldung einzeln suchen
+        for poll in raw_polls:
+            if poll.get('finalized_at'):
+                try:
+                    parse_datetime_utc(poll['finalized_at'])
+                except BradleyTerryError as parse_error:
+                    raise BradleyTerryError(
+                        f"Fehler beim Parsen von finalized_at in Poll "
+                        f"{poll.get('poll_id', 'unknown')}: {parse_error}"
+                    )
+        raise BradleyTerryError(f"Fehler beim Parsen von finalized_at: {e}")
+    
+    cutoff = int(calculated_at.timestamp())
+    for index in np.flatnonzero(finalized_epochs <= cutoff):
+        poll = raw_polls[index]
+        finalized_at = datetime.fromtimestamp(int(finalized_epochs[index]), timezone.utc)
         
         # Parse IDs und Votes
         try:
@@ -156,6 +195,105 @@ def filter_and_parse_polls(raw_polls: List[Dict[str, str]], calculated_at: datet
     return finalized_polls
 
 
+def finalized_cutoff_index(finalized_at: np.ndarray, cutoff: int) -> Optional[int]:
+    """
+    Bestimmt den Cutoff per Binärsuche, falls finalized_at sortiert ist.
+    
+    Args:
+        finalized_at: finalized_at in Unix-Sekunden (z.B. PollColumns.finalized_at)
+        cutoff: Cutoff in Unix-Sekunden
+        
+    Returns:
+        Anzahl der Polls mit finalized_at <= cutoff, oder None wenn
+        finalized_at nicht aufsteigend sortiert ist
+    """
+    if len(finalized_at) > 1 and np.any(finalized_at[1:] < finalized_at[:-1]):
+        return None
+    return int(np.searchsorted(finalized_at, cutoff, side='right'))
+
+
+def sort_poll_columns(columns: PollColumns) -> PollColumns:
+    """
+    Sortiert Polls stabil nach finalized_at.
+    
+    Für historische Neuberechnungen mit vielen Cutoffs: einmal sortieren,
+    danach ist jeder Cutoff in filter_poll_columns() eine Binärsuche.
+    Bereits sortierte Spalten werden unverändert zurückgegeben.
+    
+    Args:
+        columns: Polls von tsv_repository.load_poll_columns()
+        
+    Returns:
+        PollColumns aufsteigend nach finalized_at (nicht finalisierte am Ende)
+    """
+    if finalized_cutoff_index(columns.finalized_at, 0) is not None:
+        return columns
+    order = np.argsort(columns.finalized_at, kind='stable')
+    return PollColumns(*(column[order] for column in columns))
+
+
+def filter_poll_columns(columns: PollColumns, calculated_at: datetime) -> PollColumns:
+    """
+    Filtert und validiert spaltenweise geladene Polls.
+    
+    Gegenstück zu filter_and_parse_polls() für PollColumns: gleiche Regeln,
+    aber als Masken über die Arrays statt einer Schleife über Dictionaries.
+    Sind die Polls nach finalized_at sortiert (polls.tsv wird in dieser
+    Reihenfolge fortgeschrieben), wird der Cutoff per Binärsuche bestimmt.
+    
+    Args:
+        columns: Polls von tsv_repository.load_poll_columns()
+        calculated_at: Cutoff-Zeit für finalisierte Polls (UTC)
+        
+    Returns:
+        PollColumns mit den finalisierten Polls bis calculated_at
+        
+    Raises:
+        BradleyTerryError: Bei Validierungsfehlern
+    """
+    logger.info(f"Polls geladen: {len(columns.poll_id)} Einträge")
+    
+    cutoff = int(calculated_at.timestamp())
+    end = finalized_cutoff_index(columns.finalized_at, cutoff)
+    if end is not None:
+        # Nach finalized_at sortiert: Cutoff ist ein Präfix (Views, keine Kopie)
+        finalized = PollColumns(*(column[:end] for column in columns))
+    else:
+        finalized = PollColumns(*(column[columns.finalized_at <= cutoff] for column in columns))
+    
+    # Validierung: episode_a_id != episode_b_id
+    same_episode = np.flatnonzero(finalized.episode_a_id == finalized.episode_b_id)
+    if len(same_episode):
+        i = same_episode[0]
+        raise BradleyTerryError(
+            f"Poll {finalized.poll_id[i]}: "
+            f"episode_a_id und episode_b_id sind identisch ({finalized.episode_a_id[i]})"
+        )
+    
+    # Validierung: votes >= 0
+    negative = np.flatnonzero((finalized.votes_a < 0) | (finalized.votes_b < 0))
+    if len(negative):
+        i = negative[0]
+        raise BradleyTerryError(
+            f"Poll {finalized.poll_id[i]}: "
+            f"Negative Stimmen nicht erlaubt (votes_a={finalized.votes_a[i]}, votes_b={finalized.votes_b[i]})"
+        )
+    
+    # Polls mit 0 Votes ignorieren
+    zero_votes = (finalized.votes_a + finalized.votes_b) == 0
+    for i in np.flatnonzero(zero_votes):
+        logger.warning(
+            f"Poll {finalized.poll_id[i]} hat 0 Stimmen "
+            f"(Episode {finalized.episode_a_id[i]} vs {finalized.episode_b_id[i]}) - wird ignoriert"
+        )
+    filtered = PollColumns(*(column[~zero_votes] for column in finalized))
+    
+    logger.info(f"Finalisierte Polls: {len(filtered.poll_id)}")
+    if zero_votes.any():
+        logger.info(f"Polls mit 0 Stimmen ignoriert: {int(zero_votes.sum())}")
+    
+    return filtered
+
 
 def build_connectivity_graph(polls: List[Dict]) -> Dict[int, Set[int]]:
     """
@@ -268,10 +406,68 @@ def prepare_pairwise_data_expanded(polls: List[Dict], episode_ids: List[int]) ->
     return comparisons
 
 
+def aggregate_pairwise_counts(
+    idx_a: np.ndarray,
+    idx_b: np.ndarray,
+    votes_a: np.ndarray,
+    votes_b: np.ndarray
+) -> PairwiseCounts:
+    """
+    Fasst Stimmen pro ungeordnetem Episodenpaar zu Binomial-Counts zusammen.
+    
+    Args:
+        idx_a: Index der Episode A pro Poll
+        idx_b: Index der Episode B pro Poll
+        votes_a: Stimmen für Episode A pro Poll
+        votes_b: Stimmen für Episode B pro Poll
+        
+    Returns:
+        PairwiseCounts mit einem Eintrag pro Paar (idx_a < idx_b)
+    """
+    pair_a, pair_b, wins_a, wins_b, _ = merge_pair_arrays(
+        idx_a, idx_b, votes_a, votes_b, np.ones(len(idx_a), dtype=np.int64)
+    )
+    return PairwiseCounts(idx_a=pair_a, idx_b=pair_b, wins_a=wins_a, wins_b=wins_b)
+
+
+def prepare_pairwise_data_aggregated(polls: List[Dict], episode_ids: List[int]) -> PairwiseCounts:
+    """
+    Bereitet Paarvergleichsdaten als Binomial-Counts auf (ohne Expansion).
+    
+    Mehrere Polls desselben Paars werden zusammengefasst. Speicher und Laufzeit
+    hängen nur von der Anzahl der Polls bzw. Paare ab, nicht von den Stimmen.
+    
+    Args:
+        polls: Liste von Poll-Dictionaries
+        episode_ids: Sortierte Liste von Episode-IDs (für Index-Mapping)
+        
+    Returns:
+        PairwiseCounts mit aggregierten Stimmen pro Episodenpaar
+    """
+    # Mapping: episode_id -> index
+    id_to_idx = {ep_id: idx for idx, ep_id in enumerate(episode_ids)}
+    
+    n_polls = len(polls)
+    idx_a = np.empty(n_polls, dtype=np.int64)
+    idx_b = np.empty(n_polls, dtype=np.int64)
+    votes_a = np.empty(n_polls, dtype=np.float64)
+    votes_b = np.empty(n_polls, dtype=np.float64)
+    
+    for k, poll in enumerate(polls):
+        idx_a[k] = id_to_idx[poll['episode_a_id']]
+        idx_b[k] = id_to_idx[poll['episode_b_id']]
+        votes_a[k] = poll['votes_a']
+        votes_b[k] = poll['votes_b']
+    
+    return aggregate_pairwise_counts(idx_a, idx_b, votes_a, votes_b)
+
+
 def count_matches_per_episode(polls: List[Dict], episode_ids: List[int]) -> Dict[int, int]:
     """
     Zählt die Anzahl der Matches pro Episode.
     
+    Aggregierte Einträge (aus PollStatistics) zählen mit ihrem n_polls.
+    
     Args:
         polls: Liste von Poll-Dictionaries
         episode_ids: Liste von Episode-IDs
@@ -282,28 +478,255 @@ def count_matches_per_episode(polls: List[Dict], episode_ids: List[int]) -> Dict
     match_counts = {ep_id: 0 for ep_id in episode_ids}
     
     for poll in polls:
-        match_counts[poll['episode_a_id']] += 1
-        match_counts[poll['episode_b_id']] += 1
+        n_polls = poll.get('n_polls', 1)
+        match_counts[poll['episode_a_id']] += n_polls
+        match_counts[poll['episode_b_id']] += n_polls
     
     return match_counts
 
 
+class ModelInput(NamedTuple):
+    """
+    Fit-Eingaben der Komponente mit Episode 1 (aus build_model_input()).
+    
+    Attributes:
+        episode_ids: Sortierte Episode-IDs im Modell (Index = Modell-Index)
+        counts: Binomial-Counts pro Paar über Modell-Indizes
+        matches: Anzahl Polls pro Episode (parallel zu episode_ids)
+        n_polls: Anzahl verwendeter Polls
+        n_graph_episodes: Anzahl Episoden im gesamten Vergleichsgraph
+        dropped_episode_ids: Episoden ohne Verbindung zu Episode 1
+    """
+    episode_ids: np.ndarray
+    counts: PairwiseCounts
+    matches: np.ndarray
+    n_polls: int
+    n_graph_episodes: int
+    dropped_episode_ids: np.ndarray
+
+
+def polls_to_arrays(
+    polls: Union[List[Dict], PollStatistics, PollColumns]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Stellt Polls in jeder unterstützten Form als parallele Arrays dar.
+    
+    Args:
+        polls: Geparste Poll-Dictionaries, PollStatistics oder PollColumns
+        
+    Returns:
+        Tuple (episode_a, episode_b, votes_a, votes_b, n_polls) mit n_polls
+        als Anzahl Polls pro Eintrag (1 außer bei aggregierten Einträgen)
+    """
+    if isinstance(polls, PollStatistics):
+        return polls.episode_a, polls.episode_b, polls.wins_a, polls.wins_b, polls.pair_polls
+    
+    if isinstance(polls, PollColumns):
+        return (
+            polls.episode_a_id,
+            polls.episode_b_id,
+            polls.votes_a.astype(np.float64),
+            polls.votes_b.astype(np.float64),
+            np.ones(len(polls.poll_id), dtype=np.int64)
+        )
+    
+    return (
+        np.array([poll['episode_a_id'] for poll in polls], dtype=np.int64),
+        np.array([poll['episode_b_id'] for poll in polls], dtype=np.int64),
+        np.array([poll['votes_a'] for poll in polls], dtype=np.float64),
+        np.array([poll['votes_b'] for poll in polls], dtype=np.float64),
+        np.array([poll.get('n_polls', 1) for poll in polls], dtype=np.int64)
+    )
+
+
+def build_model_input(
+    episode_a: np.ndarray,
+    episode_b: np.ndarray,
+    votes_a: np.ndarray,
+    votes_b: np.ndarray,
+    n_polls: np.ndarray,
+    connectivity: Optional[Connectivity] = None,
+    anchor_episode_id: int = ANCHOR_EPISODE_ID
+) -> ModelInput:
+    """
+    Bereitet die Fit-Eingaben in einem Durchlauf über Integer-Arrays auf.
+    
+    Episode-IDs werden einmal auf dichte Indizes abgebildet. Zusammenhang,
+    Filterung auf die Komponente mit Episode 1, Match-Zählung und
+    Binomial-Counts sind danach Masken und Reduktionen über dieselben
+    Arrays (ersetzt Graph, BFS und Filterung über Dictionaries).
+    
+    Mit connectivity (Union-Find-Sidecar über dieselben Polls) wird die
+    Komponente mit Episode 1 direkt abgefragt statt berechnet.
+    
+    Args:
+        episode_a, episode_b: Episode-IDs pro Eintrag
+        votes_a, votes_b: Stimmen pro Eintrag
+        n_polls: Anzahl Polls pro Eintrag
+        connectivity: Optional - Union-Find-Struktur über dieselben Polls
+        anchor_episode_id: Anker-Episode, deren Komponente gefittet wird
+            (default: Episode 1; andere Kataloge, siehe bot.catalogs)
+        
+    Returns:
+        ModelInput
+        
+    Raises:
+        BradleyTerryError: Wenn die Anker-Episode nicht im Vergleichsgraph ist
+    """
+    graph_ids, idx_a, idx_b, components = _graph_components(episode_a, episode_b, n_polls, connectivity)
+    anchor = np.flatnonzero(graph_ids == anchor_episode_id)
+    if len(anchor) == 0:
+        raise BradleyTerryError(
+            f"Episode {anchor_episode_id} ist nicht im Vergleichsgraph vorhanden. "
+            "Modell kann nicht sinnvoll berechnet werden."
+        )
+    
+    # Komponenten-ID ist die kleinste Episode-ID (für Episode 1 also 1)
+    return _component_model_input(
+        graph_ids, idx_a, idx_b, votes_a, votes_b, n_polls, components == components[anchor[0]]
+    )
+
+
+def _graph_components(
+    episode_a: np.ndarray,
+    episode_b: np.ndarray,
+    n_polls: np.ndarray,
+    connectivity: Optional[Connectivity]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Dichte Indizes und Komponente jeder Episode im Vergleichsgraph.
+    
+    Die Komponente wird wie in bot.connectivity über die kleinste Episode-ID
+    identifiziert (die Komponente mit Episode 1 hat die ID 1).
+    
+    Returns:
+        Tuple (graph_ids, idx_a, idx_b, components) mit sortierten Episode-IDs,
+        Indizes der Einträge in graph_ids und component_id pro Episode
+    """
+    n_entries = len(episode_a)
+    graph_ids, inverse = np.unique(np.concatenate([episode_a, episode_b]), return_inverse=True)
+    inverse = inverse.reshape(-1)
+    idx_a, idx_b = inverse[:n_entries], inverse[n_entries:]
+    n_graph = len(graph_ids)
+    
+    if connectivity is not None and connectivity.n_polls != int(n_polls.sum()):
+        logger.warning(
+            f"Konnektivität passt nicht zu den Polls ({connectivity.n_polls} statt "
+            f"{int(n_polls.sum())}) - berechne Komponenten neu"
+        )
+        connectivity = None
+    
+    if connectivity is not None:
+        # Komponenten aus dem Union-Find-Sidecar
+        return graph_ids, idx_a, idx_b, component_ids(connectivity, graph_ids)
+    
+    # Zusammenhangskomponenten über die Kantenliste; graph_ids ist sortiert,
+    # das erste Vorkommen eines Labels ist also die kleinste Episode-ID
+    adjacency = coo_matrix(
+        (np.ones(n_entries, dtype=np.int8), (idx_a, idx_b)), shape=(n_graph, n_graph)
+    )
+    _, labels = connected_components(adjacency, directed=False)
+    _, first = np.unique(labels, return_index=True)
+    return graph_ids, idx_a, idx_b, graph_ids[first][labels]
+
+
+def _component_model_input(
+    graph_ids: np.ndarray,
+    idx_a: np.ndarray,
+    idx_b: np.ndarray,
+    votes_a: np.ndarray,
+    votes_b: np.ndarray,
+    n_polls: np.ndarray,
+    in_component: np.ndarray
+) -> ModelInput:
+    """Filtert Einträge auf eine Komponente und aggregiert Matches und Binomial-Counts."""
+    # Beide Enden eines Polls liegen immer in derselben Komponente
+    keep = in_component[idx_a]
+    model_index = np.cumsum(in_component) - 1
+    model_a = model_index[idx_a[keep]]
+    model_b = model_index[idx_b[keep]]
+    kept_polls = n_polls[keep]
+    n_items = int(in_component.sum())
+    
+    matches = (
+        np.bincount(model_a, weights=kept_polls, minlength=n_items)
+        + np.bincount(model_b, weights=kept_polls, minlength=n_items)
+    ).astype(np.int64)
+    
+    return ModelInput(
+        episode_ids=graph_ids[in_component],
+        counts=aggregate_pairwise_counts(model_a, model_b, votes_a[keep], votes_b[keep]),
+        matches=matches,
+        n_polls=int(kept_polls.sum()),
+        n_graph_episodes=len(graph_ids),
+        dropped_episode_ids=graph_ids[~in_component]
+    )
+
+
+def build_component_inputs(
+    episode_a: np.ndarray,
+    episode_b: np.ndarray,
+    votes_a: np.ndarray,
+    votes_b: np.ndarray,
+    n_polls: np.ndarray,
+    connectivity: Optional[Connectivity] = None
+) -> List[ModelInput]:
+    """
+    Bereitet die Fit-Eingaben für jede Zusammenhangskomponente auf.
+    
+    Wie build_model_input(), aber ohne Beschränkung auf die Komponente mit
+    Episode 1. Die component_id einer Eingabe ist ihre kleinste Episode-ID
+    (episode_ids[0]); dropped_episode_ids enthält alle Episoden der übrigen
+    Komponenten.
+    
+    Args:
+        episode_a, episode_b: Episode-IDs pro Eintrag
+        votes_a, votes_b: Stimmen pro Eintrag
+        n_polls: Anzahl Polls pro Eintrag
+        connectivity: Optional - Union-Find-Struktur über dieselben Polls
+        
+    Returns:
+        Liste von ModelInput, größte Komponente zuerst (bei gleicher Größe
+        nach component_id)
+    """
+    if len(episode_a) == 0:
+        return []
+    
+    graph_ids, idx_a, idx_b, components = _graph_components(episode_a, episode_b, n_polls, connectivity)
+    unique_components, sizes = np.unique(components, return_counts=True)
+    order = np.lexsort((unique_components, -sizes))
+    return [
+        _component_model_input(
+            graph_ids, idx_a, idx_b, votes_a, votes_b, n_polls, components == unique_components[k]
+        )
+        for k in order
+    ]
+
+
 def fit_bradley_terry_model(
-    data: List[Tuple[int, int]],
+    data: Union[List[Tuple[int, int]], PairwiseCounts],
     n_items: int,
-    alpha: float = 0.01,
+    alpha: float = DEFAULT_ALPHA,
     max_iter: int = 10000,
-    tol: float = 1e-6
+    tol: float = DEFAULT_TOL,
+    solver: str = 'auto',
+    initial_theta: Optional[np.ndarray] = None
 ) -> np.ndarray:
     """
-    Fittet das Bradley-Terry-Modell mit MM-Algorithmus.
+    Fittet das Bradley-Terry-Modell.
+    
+    Aggregierte Binomial-Counts (PairwiseCounts, bevorzugt) werden mit einem
+    nativen NumPy-Solver aus bot.bt_solvers gefittet; expandierte
+    Einzelbeobachtungen weiterhin über choix.mm_pairwise.
     
     Args:
-        data: Pairwise comparison data als Liste von (winner_idx, loser_idx)
+        data: PairwiseCounts oder Liste von (winner_idx, loser_idx)
         n_items: Anzahl der Items (Episoden)
         alpha: L2-Regularisierungsstärke
         max_iter: Maximale Iterationen
         tol: Konvergenztoleranz
+        solver: 'auto', 'mm' oder 'newton' (nur für PairwiseCounts)
+        initial_theta: Optionale Startwerte (n_items,) für einen Warm-Start
         
     Returns:
         Log-Stärken theta (n_items,)
@@ -312,14 +735,30 @@ def fit_bradley_terry_model(
         BradleyTerryError: Bei Konvergenzfehlern oder numerischen Problemen
     """
     try:
-        # Fit Bradley-Terry mit MM-Algorithmus
-        theta = choix.mm_pairwise(
-            n_items=n_items,
-            data=data,
-            alpha=alpha,
-            max_iter=max_iter,
-            tol=tol
-        )
+        # Fit Bradley-Terry mit nativem Solver oder choix
+        if isinstance(data, PairwiseCounts):
+            solver_name, solve = get_solver(solver, n_items)
+            theta, n_iter = solve(
+                counts=data,
+                n_items=n_items,
+                alpha=alpha,
+                max_iter=max_iter,
+                tol=tol,
+                initial_theta=initial_theta
+            )
+            logger.info(
+                f"Solver '{solver_name}' konvergiert nach {n_iter} Iterationen"
+                f"{' (Warm-Start)' if initial_theta is not None else ''}"
+            )
+        else:
+            theta = choix.mm_pairwise(
+                n_items=n_items,
+                data=data,
+                initial_params=initial_theta,
+                alpha=alpha,
+                max_iter=max_iter,
+                tol=tol
+            )
         
         # Post-Fit Sanity Check: Prüfe auf numerische Probleme
         if not np.isfinite(theta).all():
@@ -357,9 +796,78 @@ def normalize_utilities(theta: np.ndarray) -> np.ndarray:
     return utilities
 
 
+def initial_theta_from_ratings(ratings: List[Dict[str, str]]) -> Dict[int, float]:
+    """
+    Leitet Startwerte für einen Warm-Start aus dem letzten Rating-Snapshot ab.
+    
+    Verwendet nur die Zeilen mit dem neuesten calculated_at (ein vollständiger
+    Berechnungslauf) und rechnet von der Skala mean(utility) = 1 zurück auf
+    log-Stärken: theta = log(utility).
+    
+    Args:
+        ratings: Rohe Rating-Daten von tsv_repository.load_ratings()
+        
+    Returns:
+        Dict[episode_id, theta] (leer, wenn keine Ratings vorhanden sind)
+        
+    Raises:
+        BradleyTerryError: Wenn eine Zeile nicht geparst werden kann
+    """
+    if not ratings:
+        return {}
+    
+    # ISO-8601 UTC mit 'Z' ist lexikographisch sortierbar
+    latest = max(row['calculated_at'] for row in ratings)
+    
+    initial_theta = {}
+    for row in ratings:
+        if row['calculated_at'] != latest:
+            continue
+        try:
+            episode_id = int(row['episode_id'])
+            utility = float(row['utility'])
+        except (ValueError, KeyError) as e:
+            raise BradleyTerryError(f"Fehler beim Parsen von ratings.tsv für Warm-Start: {e}")
+        initial_theta[episode_id] = float(np.log(max(utility, MIN_WARM_START_UTILITY)))
+    
+    logger.info(f"Warm-Start aus Snapshot {latest}: {len(initial_theta)} Episoden")
+    return initial_theta
+
+
+def build_initial_theta(
+    initial_theta: Dict[int, float],
+    episode_ids: List[int]
+) -> np.ndarray:
+    """
+    Ordnet Startwerte den Modell-Indizes zu.
+    
+    Episoden ohne Startwert (neu verbunden) erhalten theta = 0, also die
+    Stärke einer durchschnittlichen Episode (utility = 1.0).
+    
+    Args:
+        initial_theta: Dict[episode_id, theta]
+        episode_ids: Sortierte Liste von Episode-IDs (für Index-Mapping)
+        
+    Returns:
+        Array (len(episode_ids),) mit Startwerten
+    """
+    theta = np.array([initial_theta.get(ep_id, 0.0) for ep_id in episode_ids], dtype=np.float64)
+    n_new = sum(1 for ep_id in episode_ids if ep_id not in initial_theta)
+    if n_new:
+        logger.info(f"Warm-Start: {n_new} neue Episoden starten mit theta = 0")
+    return theta
+
+
 def compute_ratings_from_polls(
-    polls: List[Dict],
-    calculated_at: datetime
+    polls: Union[List[Dict], PollStatistics, PollColumns],
+    calculated_at: datetime,
+    expand_votes: bool = False,
+    solver: str = 'auto',
+    initial_theta: Optional[Dict[int, float]] = None,
+    connectivity: Optional[Connectivity] = None,
+    with_uncertainty: bool = False,
+    half_life_days: Optional[float] = None,
+    anchor_episode_id: int = ANCHOR_EPISODE_ID
 ) -> List[Dict]:
     """
     Berechnet Bradley-Terry Ratings aus Polls - REIN, ohne I/O.
@@ -367,18 +875,37 @@ def compute_ratings_from_polls(
     Diese Funktion ist vollständig I/O-frei und daher ideal für Tests.
     Sie nimmt Polls entgegen und gibt Rating-Daten zurück.
     
-    Ablauf:
-    1. Baue Konnektivitätsgraph
-    2. Finde Komponente mit Episode 1
-    3. Filtere Polls und Episoden
-    4. Bereite Daten für choix vor
+    Ablauf (build_model_input, ein Episoden-Index für alle Schritte):
+    1. Bilde Episode-IDs auf dichte Indizes ab
+    2. Finde Komponente mit Episode 1 (über die Kantenliste)
+    3. Filtere Polls und Episoden (Masken)
+    4. Zähle Matches und aggregiere Stimmen zu Binomial-Counts pro Paar
     5. Fitte Bradley-Terry-Modell
     6. Berechne normierte Utilities
     7. Gebe Rating-Rows zurück
     
     Args:
-        polls: Bereits geparste Poll-Daten (mit episode_a_id, episode_b_id, votes_a, votes_b)
+        polls: Bereits geparste Poll-Daten (mit episode_a_id, episode_b_id, votes_a, votes_b),
+            PollStatistics aus dem Statistik-Sidecar (ein Eintrag pro Paar) oder
+            gefilterte PollColumns von filter_poll_columns()
         calculated_at: UTC-Zeitpunkt der Berechnung (muss timezone-aware UTC sein)
+        expand_votes: Wenn True, werden Votes zu Einzelbeobachtungen expandiert
+            und mit choix gefittet (Referenzpfad, Aufwand wächst mit den Stimmen)
+        solver: Solver für die Binomial-Counts ('auto', 'mm', 'newton')
+        initial_theta: Optionale Startwerte Dict[episode_id, theta] (log-Stärken),
+            z.B. aus initial_theta_from_ratings(); fehlende Episoden starten bei 0
+        connectivity: Optional - Union-Find-Struktur über dieselben Polls
+            (z.B. aus dem Konnektivitäts-Sidecar), siehe build_model_input()
+        with_uncertainty: Standardfehler und Rang-Intervalle aus der Hesse-Matrix
+            am Optimum ergänzen (bot.rating_uncertainty, eine dichte
+            Cholesky-Zerlegung; nur bis UNCERTAINTY_MAX_ITEMS Episoden, nicht
+            mit expand_votes)
+        half_life_days: Optional - Halbwertszeit in Tagen für das zeitlich
+            abklingende Modell (bot.decay); Stimmen zählen zu calculated_at mit
+            2^(-Alter / Halbwertszeit). None (default): statisches Modell.
+            Benötigt Polls mit finalized_at (nicht PollStatistics)
+        anchor_episode_id: Anker-Episode, deren Komponente gerankt wird
+            (default: Episode 1)
         
     Returns:
         Liste von Rating-Dictionaries mit Feldern:
@@ -386,6 +913,8 @@ def compute_ratings_from_polls(
         - utility: float (normiert, mean = 1.0)
         - matches: int (Anzahl Vergleiche)
         - calculated_at: datetime (timezone-aware UTC)
+        - mit with_uncertainty zusätzlich se_theta, se_utility (float) und
+          rank, rank_low, rank_high (int)
         
     Raises:
         BradleyTerryError: Bei allen kritischen Fehlern
@@ -406,6 +935,122 @@ def compute_ratings_from_polls(
             "Verwenden Sie datetime.now(timezone.utc)."
         )
     
+    if half_life_days is not None:
+        if expand_votes or isinstance(polls, PollStatistics):
+            raise BradleyTerryError(
+                "half_life_days braucht einzelne Polls mit finalized_at "
+                "(nicht mit expand_votes oder PollStatistics)"
+            )
+        try:
+            decayed = build_decayed_statistics(polls, half_life_seconds(half_life_days))
+        except DecayError as e:
+            raise BradleyTerryError(str(e))
+        polls = decayed_counts(decayed, int(calculated_at.timestamp()))
+        logger.info(f"Zeitlich abklingendes Modell: Halbwertszeit {half_life_days} Tage")
+    
+    if expand_votes:
+        if with_uncertainty:
+            raise BradleyTerryError("with_uncertainty ist mit expand_votes nicht möglich")
+        if isinstance(polls, (PollStatistics, PollColumns)):
+            raise BradleyTerryError(f"expand_votes ist mit {type(polls).__name__} nicht möglich")
+        return _compute_ratings_expanded(polls, calculated_at, initial_theta, anchor_episode_id)
+    
+    # Alle Eingabeformen als parallele Arrays
+    episode_a, episode_b, votes_a, votes_b, n_polls = polls_to_arrays(polls)
+    
+    if len(episode_a) == 0:
+        logger.warning("Keine Polls zum Verarbeiten - leere Berechnung")
+        return []
+    
+    # 1.-5. Komponente mit der Anker-Episode, Filterung, Matches und Binomial-Counts
+    model_input = build_model_input(
+        episode_a, episode_b, votes_a, votes_b, n_polls, connectivity, anchor_episode_id
+    )
+    episode_ids = model_input.episode_ids
+    counts = model_input.counts
+    
+    logger.info(f"Graph enthält {model_input.n_graph_episodes} Episoden")
+    logger.info(f"Episoden verbunden mit Episode {anchor_episode_id}: {len(episode_ids)}")
+    if len(model_input.dropped_episode_ids):
+        logger.warning(
+            f"{len(model_input.dropped_episode_ids)} Episoden NICHT mit Episode {anchor_episode_id} verbunden "
+            f"und werden ignoriert: {model_input.dropped_episode_ids.tolist()}"
+        )
+    logger.info(f"Polls nach Filterung: {model_input.n_polls}")
+    logger.info(
+        f"Episodenpaare: {len(counts.idx_a)} "
+        f"(Stimmen: {int(counts.wins_a.sum() + counts.wins_b.sum())})"
+    )
+    
+    # 6. Fitte Modell
+    logger.info(f"Fitte Bradley-Terry-Modell (solver={solver}, alpha={DEFAULT_ALPHA})...")
+    theta = fit_bradley_terry_model(
+        data=counts,
+        n_items=len(episode_ids),
+        alpha=DEFAULT_ALPHA,
+        tol=DEFAULT_TOL,
+        solver=solver,
+        initial_theta=(
+            build_initial_theta(initial_theta, episode_ids.tolist())
+            if initial_theta else None
+        )
+    )
+    logger.info(f"Modell konvergiert, theta shape: {theta.shape}")
+    
+    # 7. Normiere Utilities und gebe Rating-Rows zurück
+    utilities = normalize_utilities(theta)
+    logger.info(f"Utilities berechnet - mean: {np.mean(utilities):.6f}, std: {np.std(utilities):.6f}")
+    
+    rating_rows = [
+        {
+            'episode_id': int(ep_id),
+            'utility': float(utility),
+            'matches': int(matches),
+            'calculated_at': calculated_at  # datetime (timezone-aware UTC)
+        }
+        for ep_id, utility, matches in zip(episode_ids, utilities, model_input.matches)
+    ]
+    
+    # Optional: Standardfehler und Rang-Intervalle (Laplace-Approximation)
+    if with_uncertainty:
+        try:
+            errors = standard_errors(theta, counts, DEFAULT_ALPHA)
+            ranks = rank_intervals(theta, errors.se_theta)
+        except RatingUncertaintyError as e:
+            logger.warning(f"Standardfehler konnten nicht berechnet werden: {e}")
+        else:
+            for k, row in enumerate(rating_rows):
+                row.update(
+                    se_theta=float(errors.se_theta[k]),
+                    se_utility=float(errors.se_utility[k]),
+                    rank=int(ranks.rank[k]),
+                    rank_low=int(ranks.rank_low[k]),
+                    rank_high=int(ranks.rank_high[k])
+                )
+            logger.info(f"Standardfehler berechnet - median se_theta: {np.median(errors.se_theta):.4f}")
+    
+    # Finale Metriken
+    logger.info(f"=== Berechnung abgeschlossen ===")
+    logger.info(f"Verwendete Polls: {model_input.n_polls}")
+    logger.info(f"Gerankte Episoden: {len(episode_ids)}")
+    logger.info(f"Gedroppte Episoden: {len(model_input.dropped_episode_ids)}")
+    
+    return rating_rows
+
+
+def _compute_ratings_expanded(
+    polls: List[Dict],
+    calculated_at: datetime,
+    initial_theta: Optional[Dict[int, float]] = None,
+    anchor_episode_id: int = ANCHOR_EPISODE_ID
+) -> List[Dict]:
+    """
+    Referenzpfad: Votes als Einzelbeobachtungen, Fit mit choix.
+    
+    Verwendet die Graph-Funktionen über Dictionaries (build_connectivity_graph,
+    find_connected_component, filter_polls_by_episodes). Aufwand wächst mit
+    der Anzahl der Stimmen.
+    """
     if not polls:
         logger.warning("Keine Polls zum Verarbeiten - leere Berechnung")
         return []
@@ -415,22 +1060,22 @@ def compute_ratings_from_polls(
     graph = build_connectivity_graph(polls)
     logger.info(f"Graph enthält {len(graph)} Episoden")
     
-    # 2. Finde Komponente mit Episode 1
-    if 1 not in graph:
+    # 2. Finde Komponente mit der Anker-Episode
+    if anchor_episode_id not in graph:
         raise BradleyTerryError(
-            "Episode 1 ist nicht im Vergleichsgraph vorhanden. "
+            f"Episode {anchor_episode_id} ist nicht im Vergleichsgraph vorhanden. "
             "Modell kann nicht sinnvoll berechnet werden."
         )
     
-    connected_episodes = find_connected_component(graph, start_node=1)
-    logger.info(f"Episoden verbunden mit Episode 1: {len(connected_episodes)}")
+    connected_episodes = find_connected_component(graph, start_node=anchor_episode_id)
+    logger.info(f"Episoden verbunden mit Episode {anchor_episode_id}: {len(connected_episodes)}")
     
     # Logge gedroppte Episoden
     all_episodes = set(graph.keys())
     dropped_episodes = all_episodes - connected_episodes
     if dropped_episodes:
         logger.warning(
-            f"{len(dropped_episodes)} Episoden NICHT mit Episode 1 verbunden "
+            f"{len(dropped_episodes)} Episoden NICHT mit Episode {anchor_episode_id} verbunden "
             f"und werden ignoriert: {sorted(dropped_episodes)}"
         )
     
@@ -438,10 +1083,10 @@ def compute_ratings_from_polls(
     filtered_polls = filter_polls_by_episodes(polls, connected_episodes)
     logger.info(f"Polls nach Filterung: {len(filtered_polls)}")
     
-    # Edge-Case: Episode 1 im Graph, aber keine Polls nach Filterung
+    # Edge-Case: Anker-Episode im Graph, aber keine Polls nach Filterung
     if not filtered_polls:
         raise BradleyTerryError(
-            "Episode 1 ist im Vergleichsgraph, aber keine Polls nach "
+            f"Episode {anchor_episode_id} ist im Vergleichsgraph, aber keine Polls nach "
             "Connectivity-Filterung übrig. Dies deutet auf ein Datenproblem hin."
         )
     
@@ -449,7 +1094,7 @@ def compute_ratings_from_polls(
     episode_ids = sorted(list(connected_episodes))
     logger.info(f"Episoden im Modell: {len(episode_ids)}")
     
-    # 5. Bereite Daten vor (Disaggregierung zu Einzelbeobachtungen)
+    # 5. Expandiere Votes zu Einzelbeobachtungen
     pairwise_data = prepare_pairwise_data_expanded(filtered_polls, episode_ids)
     logger.info(f"Pairwise comparisons: {len(pairwise_data)}")
     
@@ -457,11 +1102,16 @@ def compute_ratings_from_polls(
     match_counts = count_matches_per_episode(filtered_polls, episode_ids)
     
     # 7. Fitte Modell
-    logger.info("Fitte Bradley-Terry-Modell (MM, alpha=0.01)...")
+    logger.info(f"Fitte Bradley-Terry-Modell (choix, alpha={DEFAULT_ALPHA})...")
     theta = fit_bradley_terry_model(
         data=pairwise_data,
         n_items=len(episode_ids),
-        alpha=0.01
+        alpha=DEFAULT_ALPHA,
+        tol=DEFAULT_TOL,
+        initial_theta=(
+            build_initial_theta(initial_theta, episode_ids)
+            if initial_theta else None
+        )
     )
     logger.info(f"Modell konvergiert, theta shape: {theta.shape}")
     
@@ -488,32 +1138,195 @@ def compute_ratings_from_polls(
     return rating_rows
 
 
+def fit_component(
+    model_input: ModelInput,
+    calculated_at: datetime,
+    solver: str = 'auto'
+) -> List[Dict]:
+    """
+    Fittet eine Zusammenhangskomponente (auch als Worker-Prozess nutzbar).
+    
+    Args:
+        model_input: Fit-Eingaben einer Komponente (build_component_inputs())
+        calculated_at: UTC-Zeitpunkt der Berechnung
+        solver: Solver für die Binomial-Counts
+        
+    Returns:
+        Rating-Rows (episode_id, component_id, utility, matches, calculated_at);
+        utility ist innerhalb der Komponente normiert (mean = 1.0)
+        
+    Raises:
+        BradleyTerryError: Bei Konvergenzfehlern oder numerischen Problemen
+    """
+    theta = fit_bradley_terry_model(
+        data=model_input.counts,
+        n_items=len(model_input.episode_ids),
+        alpha=DEFAULT_ALPHA,
+        tol=DEFAULT_TOL,
+        solver=solver
+    )
+    component = int(model_input.episode_ids[0])
+    return [
+        {
+            'episode_id': int(ep_id),
+            'component_id': component,
+            'utility': float(utility),
+            'matches': int(matches),
+            'calculated_at': calculated_at
+        }
+        for ep_id, utility, matches in zip(
+            model_input.episode_ids, normalize_utilities(theta), model_input.matches
+        )
+    ]
+
+
+def _collect_component_ratings(futures: List, inputs: List[ModelInput]) -> List[Dict]:
+    """Sammelt Worker-Ergebnisse; eine nicht fitbare Komponente wird übersprungen."""
+    rows = []
+    for future, model_input in zip(futures, inputs):
+        try:
+            rows.extend(future.result())
+        except BradleyTerryError as e:
+            logger.warning(
+                f"Komponente {int(model_input.episode_ids[0])} "
+                f"({len(model_input.episode_ids)} Episoden) übersprungen: {e}"
+            )
+    return rows
+
+
+def compute_component_ratings(
+    polls: Union[List[Dict], PollStatistics, PollColumns],
+    calculated_at: datetime,
+    n_workers: int = 1,
+    solver: str = 'auto',
+    connectivity: Optional[Connectivity] = None,
+    skip_anchor: bool = False,
+    anchor_episode_id: int = ANCHOR_EPISODE_ID
+) -> List[Dict]:
+    """
+    Fittet jede Zusammenhangskomponente unabhängig, statt sie zu verwerfen.
+    
+    compute_ratings_from_polls() verwendet nur die Komponente der Anker-Episode.
+    Hier erhält jede Komponente ein eigenes Modell (vorläufige Stärken, z.B.
+    für Frontier-Episoden vor der ersten Verbindung). Utilities sind nur
+    innerhalb einer Komponente vergleichbar. Mit n_workers > 1 laufen die
+    Fits auf einem Prozess-Pool, die größte Komponente zuerst.
+    
+    Args:
+        polls: Poll-Daten wie bei compute_ratings_from_polls()
+        calculated_at: UTC-Zeitpunkt der Berechnung
+        n_workers: Anzahl Prozesse (1: im aktuellen Prozess)
+        solver: Solver für die Binomial-Counts
+        connectivity: Optional - Union-Find-Struktur über dieselben Polls
+        skip_anchor: Komponente der Anker-Episode auslassen
+        anchor_episode_id: Anker-Episode für skip_anchor
+        
+    Returns:
+        Rating-Rows (episode_id, component_id, utility, matches, calculated_at),
+        nach Komponenten gruppiert, größte zuerst; nicht fitbare Komponenten
+        werden mit Warnung übersprungen
+    """
+    inputs = [
+        model_input
+        for model_input in build_component_inputs(*polls_to_arrays(polls), connectivity=connectivity)
+        if not (skip_anchor and np.any(model_input.episode_ids == anchor_episode_id))
+    ]
+    if not inputs:
+        return []
+    
+    logger.info(
+        f"Fitte {len(inputs)} Komponenten (größte: {len(inputs[0].episode_ids)} Episoden, "
+        f"{n_workers} Prozess(e))"
+    )
+    if n_workers <= 1 or len(inputs) == 1:
+        rows = []
+        for model_input in inputs:
+            try:
+                rows.extend(fit_component(model_input, calculated_at, solver))
+            except BradleyTerryError as e:
+                logger.warning(f"Komponente {int(model_input.episode_ids[0])} übersprungen: {e}")
+        return rows
+    
+    with ProcessPoolExecutor(max_workers=min(n_workers, len(inputs))) as pool:
+        futures = [pool.submit(fit_component, model_input, calculated_at, solver) for model_input in inputs]
+        return _collect_component_ratings(futures, inputs)
+
+
+def rating_model_params(
+    half_life_days: Optional[float] = None,
+    calculated_at: Optional[datetime] = None,
+    anchor_episode_id: int = ANCHOR_EPISODE_ID
+) -> Dict[str, Any]:
+    """
+    Gibt die Modellparameter zurück, die das Rating-Ergebnis bestimmen.
+    
+    Wird als Teil des Cache-Digests verwendet: Ändert sich ein Parameter,
+    ist ein gecachtes Ergebnis ungültig. Im Decay-Modus hängt das Ergebnis
+    auch vom Auswertungszeitpunkt ab.
+    
+    Args:
+        half_life_days: Optional - Halbwertszeit des abklingenden Modells
+        calculated_at: Auswertungszeitpunkt (nur im Decay-Modus relevant)
+        anchor_episode_id: Anker-Episode der gerankten Komponente
+    
+    Returns:
+        Dict mit alpha, tol und der Komponentenregel (Anker-Episode),
+        im Decay-Modus zusätzlich Halbwertszeit und Auswertungszeitpunkt
+    """
+    params = {
+        'alpha': DEFAULT_ALPHA,
+        'tol': DEFAULT_TOL,
+        'component_anchor': anchor_episode_id
+    }
+    if half_life_days is not None:
+        params['half_life_days'] = float(half_life_days)
+        params['decayed_at'] = int(calculated_at.timestamp())
+    return params
+
+
 def run_rating_update_from_polls(
-    polls: List[Dict],
+    polls: Union[List[Dict], PollStatistics, PollColumns],
     ratings_path: Path,
-    calculated_at: datetime
-) -> None:
+    calculated_at: datetime,
+    initial_theta: Optional[Dict[int, float]] = None,
+    connectivity: Optional[Connectivity] = None,
+    uncertainty_path: Optional[Path] = None,
+    anchor_episode_id: int = ANCHOR_EPISODE_ID
+) -> List[Dict]:
     """
     Führt Bradley-Terry Rating-Update durch und schreibt zu ratings.tsv.
     
     Wrapper um compute_ratings_from_polls(), der das Ergebnis
-    über tsv_repository in die Datei schreibt.
+    über tsv_repository in die Datei schreibt. Mit uncertainty_path werden
+    zusätzlich Standardfehler und Rang-Intervalle nach
+    rating_uncertainty.tsv geschrieben (ersetzt den vorherigen Stand).
     
     Args:
-        polls: Bereits geparste Poll-Daten (mit episode_a_id, episode_b_id, votes_a, votes_b)
+        polls: Bereits geparste Poll-Daten (mit episode_a_id, episode_b_id, votes_a, votes_b),
+            PollStatistics oder PollColumns
         ratings_path: Pfad zu ratings.tsv
         calculated_at: UTC-Zeitpunkt der Berechnung (muss timezone-aware UTC sein)
+        initial_theta: Optionale Startwerte Dict[episode_id, theta] für einen Warm-Start
+        connectivity: Optional - Union-Find-Struktur über dieselben Polls
+        uncertainty_path: Optional - Pfad zu rating_uncertainty.tsv
+        anchor_episode_id: Anker-Episode der gerankten Komponente (default: 1)
+        
+    Returns:
+        Die geschriebenen Rating-Rows (leer, wenn nichts berechnet wurde)
         
     Raises:
         BradleyTerryError: Bei allen kritischen Fehlern
         TSVError: Bei Problemen beim Schreiben von ratings.tsv
     """
     # Berechne Ratings (I/O-frei)
-    rating_rows = compute_ratings_from_polls(polls, calculated_at)
+    rating_rows = compute_ratings_from_polls(
+        polls, calculated_at, initial_theta=initial_theta, connectivity=connectivity,
+        with_uncertainty=uncertainty_path is not None, anchor_episode_id=anchor_episode_id
+    )
     
     if not rating_rows:
         logger.warning("Keine Ratings berechnet - nichts zu schreiben")
-        return
+        return []
     
     # Schreibe zu ratings.tsv über tsv_repository
     try:
@@ -522,23 +1335,139 @@ def run_rating_update_from_polls(
         raise BradleyTerryError(f"Fehler beim Schreiben von ratings.tsv: {e}")
     
     logger.info(f"=== Update in ratings.tsv geschrieben ===")
+    
+    if uncertainty_path is not None and 'se_theta' in rating_rows[0]:
+        try:
+            write_rating_uncertainty(uncertainty_path, rating_rows)
+        except TSVError as e:
+            raise BradleyTerryError(f"Fehler beim Schreiben von {uncertainty_path.name}: {e}")
+    
+    return rating_rows
+
+
+def default_rating_cache_path(ratings_path: Path) -> Path:
+    """
+    Standardpfad des Ergebnis-Caches neben ratings.tsv (data/.cache/).
+    
+    Args:
+        ratings_path: Pfad zu ratings.tsv
+        
+    Returns:
+        Pfad zur Cache-Datei
+    """
+    return ratings_path.parent / '.cache' / f"{ratings_path.stem}_result.json"
+
+
+def default_component_ratings_path(ratings_path: Path) -> Path:
+    """
+    Standardpfad von component_ratings.tsv (neben ratings.tsv).
+    
+    Args:
+        ratings_path: Pfad zu ratings.tsv
+        
+    Returns:
+        Pfad zu component_ratings.tsv
+    """
+    return ratings_path.parent / 'component_ratings.tsv'
+
+
+def default_rating_uncertainty_path(ratings_path: Path) -> Path:
+    """
+    Standardpfad von rating_uncertainty.tsv (neben ratings.tsv).
+    
+    Args:
+        ratings_path: Pfad zu ratings.tsv
+        
+    Returns:
+        Pfad zu rating_uncertainty.tsv
+    """
+    return ratings_path.parent / 'rating_uncertainty.tsv'
 
 
 def run_rating_update(
     polls_path: Path,
     ratings_path: Path,
-    calculated_at: datetime = None
-) -> None:
+    calculated_at: datetime = None,
+    warm_start: bool = True,
+    use_cache: bool = True,
+    cache_path: Optional[Path] = None,
+    write_snapshot_on_cache_hit: bool = False,
+    use_statistics: bool = True,
+    statistics_path: Optional[Path] = None,
+    connectivity_path: Optional[Path] = None,
+    uncertainty: bool = False,
+    uncertainty_path: Optional[Path] = None,
+    half_life_days: Optional[float] = None,
+    decay_path: Optional[Path] = None,
+    components: bool = False,
+    components_path: Optional[Path] = None,
+    component_workers: int = 1,
+    anchor_episode_id: int = ANCHOR_EPISODE_ID
+) -> List[Dict]:
     """
     Führt ein vollständiges Bradley-Terry Rating-Update durch.
     
     Lädt Polls aus polls.tsv, filtert und verarbeitet sie.
     Delegiert die eigentliche Berechnung an run_rating_update_from_polls().
     
+    Mit warm_start startet der Fit beim letzten Snapshot aus ratings.tsv
+    statt bei theta = 0. Nach wenigen neuen Polls liegt das Optimum nahe am
+    vorherigen, der Fit braucht dann deutlich weniger Iterationen. Ist der
+    Snapshot nicht lesbar, wird mit Warnung ohne Warm-Start gefittet.
+    
+    Mit use_cache wird das Ergebnis unter einem Digest der gefilterten Polls
+    und Modellparameter gespeichert. Sind die Eingaben unverändert, wird das
+    gecachte Ergebnis ohne Fit zurückgegeben; ein neuer Snapshot wird dann nur
+    mit write_snapshot_on_cache_hit geschrieben.
+    
+    Mit use_statistics wird das Statistik-Sidecar (Stimmen pro Paar) um neu
+    finalisierte Polls ergänzt und direkt als Fit-Input verwendet. Ebenso
+    wird das Konnektivitäts-Sidecar (Union-Find) fortgeschrieben und für die
+    Komponente mit Episode 1 verwendet.
+    
+    Mit uncertainty werden nach jedem Fit Standardfehler von theta und
+    Utilities sowie Rang-Intervalle aus der Hesse-Matrix am Optimum nach
+    rating_uncertainty.tsv geschrieben (bei Cache-Treffer bleibt die Datei
+    des letzten Fits gültig). Kostet eine dichte Cholesky-Zerlegung und wird
+    oberhalb von UNCERTAINTY_MAX_ITEMS Episoden mit Warnung übersprungen.
+    
+    Mit half_life_days wird das zeitlich abklingende Modell gefittet: ein
+    eigenes Sidecar (bot.decay) hält vorwärts gewichtete Stimmen pro Paar,
+    neue Polls werden inkrementell eingerechnet und zu calculated_at mit
+    einem globalen Faktor abgeklungen.
+    
+    Mit components werden alle übrigen Zusammenhangskomponenten parallel zum
+    Haupt-Fit auf einem Prozess-Pool gefittet (compute_component_ratings()).
+    ratings.tsv bleibt unverändert (nur die Komponente mit Episode 1); alle
+    Komponenten mit component_id landen in component_ratings.tsv.
+    
     Args:
         polls_path: Pfad zu polls.tsv
         ratings_path: Pfad zu ratings.tsv
         calculated_at: Optional - UTC-Zeitpunkt der Berechnung (default: jetzt)
+        warm_start: Startwerte aus dem letzten Snapshot in ratings.tsv verwenden
+        use_cache: Ergebnis-Cache verwenden
+        cache_path: Optional - Pfad zur Cache-Datei (default: data/.cache/ratings_result.json)
+        write_snapshot_on_cache_hit: Auch bei Cache-Treffer einen Snapshot anhängen
+        use_statistics: Statistik-Sidecar pflegen und als Fit-Input verwenden
+        statistics_path: Optional - Pfad zum Sidecar (default: data/.cache/polls_stats.npz)
+        connectivity_path: Optional - Pfad zum Konnektivitäts-Sidecar
+            (default: data/.cache/polls_components.npz)
+        uncertainty: Standardfehler und Rang-Intervalle schreiben
+        uncertainty_path: Optional - Pfad zur Unsicherheits-Datei
+            (default: data/rating_uncertainty.tsv)
+        half_life_days: Optional - Halbwertszeit in Tagen (None: statisches Modell)
+        decay_path: Optional - Pfad zum Decay-Sidecar
+            (default: data/.cache/polls_decay.npz)
+        components: Übrige Komponenten vorläufig fitten
+        components_path: Optional - Pfad zu component_ratings.tsv
+            (default: data/component_ratings.tsv)
+        component_workers: Anzahl Prozesse für die übrigen Komponenten
+        anchor_episode_id: Anker-Episode der gerankten Komponente (default: 1;
+            andere Kataloge mit eigenem Datenverzeichnis, siehe bot.catalogs)
+        
+    Returns:
+        Rating-Rows dieses Laufs (leer, wenn keine Polls vorhanden sind)
         
     Raises:
         BradleyTerryError: Bei allen kritischen Fehlern
@@ -551,18 +1480,128 @@ def run_rating_update(
     logger.info(f"=== Bradley-Terry Rating Update ===")
     logger.info(f"Calculated at: {calculated_at.strftime('%Y-%m-%d %H:%M:%S UTC')}")
     
-    # 1. Lade Polls über tsv_repository (validiert Schema)
+    # 1. Lade Polls spaltenweise über tsv_repository (validiert Schema)
     try:
-        raw_polls = load_polls(polls_path)
+        poll_columns = load_poll_columns(polls_path)
     except TSVError as e:
         raise BradleyTerryError(f"Fehler beim Laden von polls.tsv: {e}")
     
-    # 2. Filtere und parse finalisierte Polls
-    polls = filter_and_parse_polls(raw_polls, calculated_at)
+    # 2. Filtere finalisierte Polls
+    polls = filter_poll_columns(poll_columns, calculated_at)
     
-    if not polls:
+    if len(polls.poll_id) == 0:
         logger.warning("Keine finalisierten Polls gefunden - leere Berechnung")
-        return
+        return []
+    
+    # 3. Ergebnis-Cache prüfen
+    digest = None
+    if use_cache:
+        if cache_path is None:
+            cache_path = default_rating_cache_path(ratings_path)
+        digest = compute_poll_digest(polls, rating_model_params(half_life_days, calculated_at, anchor_episode_id))
+        cached_rows = load_cached_ratings(cache_path, digest)
+        if cached_rows is not None:
+            logger.info("Polls und Modellparameter unverändert - verwende gecachtes Ergebnis")
+            rating_rows = [dict(row, calculated_at=calculated_at) for row in cached_rows]
+            if write_snapshot_on_cache_hit:
+                try:
+                    append_ratings(ratings_path, rating_rows)
+                except TSVError as e:
+                    raise BradleyTerryError(f"Fehler beim Schreiben von ratings.tsv: {e}")
+            else:
+                logger.info("Kein neuer Snapshot geschrieben (write_snapshot_on_cache_hit=False)")
+            return rating_rows
+    
+    # 4. Startwerte aus dem letzten Snapshot (falls vorhanden); ein nicht
+    #    lesbarer Snapshot bedeutet nur: kein Warm-Start
+    initial_theta = None
+    if warm_start and ratings_path.exists() and ratings_path.stat().st_size > 0:
+        try:
+            initial_theta = initial_theta_from_ratings(load_ratings(ratings_path))
+        except (TSVError, BradleyTerryError) as e:
+            logger.warning(f"Letzter Snapshot aus ratings.tsv nicht lesbar, Fit ohne Warm-Start: {e}")
+    
+    # 5. Statistik- und Konnektivitäts-Sidecar inkrementell aktualisieren
+    fit_input = polls
+    connectivity = None
+    if use_statistics:
+        if statistics_path is None:
+            statistics_path = default_statistics_path(polls_path)
+        stats = update_poll_statistics(load_poll_statistics(statistics_path), polls)
+        try:
+            save_poll_statistics(statistics_path, stats)
+        except PollStatisticsError as e:
+            logger.warning(f"Statistik-Sidecar konnte nicht geschrieben werden: {e}")
+        fit_input = stats
+        
+        if connectivity_path is None:
+            connectivity_path = default_connectivity_path(polls_path)
+        connectivity = update_connectivity(load_connectivity(connectivity_path), polls)
+        try:
+            save_connectivity(connectivity_path, connectivity)
+        except ConnectivityError as e:
+            logger.warning(f"Konnektivitäts-Sidecar konnte nicht geschrieben werden: {e}")
+    
+    # 5b. Zeitlich abklingendes Modell: gewichtete Stimmen als Fit-Input
+    if half_life_days is not None:
+        try:
+            half_life = half_life_seconds(half_life_days)
+        except DecayError as e:
+            raise BradleyTerryError(str(e))
+        if use_statistics:
+            if decay_path is None:
+                decay_path = default_decay_path(polls_path)
+            decayed = update_decayed_statistics(load_decayed_statistics(decay_path, half_life), polls)
+            try:
+                save_decayed_statistics(decay_path, decayed)
+            except DecayError as e:
+                logger.warning(f"Decay-Sidecar konnte nicht geschrieben werden: {e}")
+        else:
+            decayed = build_decayed_statistics(polls, half_life)
+        fit_input = decayed_counts(decayed, int(calculated_at.timestamp()))
+        logger.info(f"Zeitlich abklingendes Modell: Halbwertszeit {half_life_days} Tage")
+    
+    # 6. Delegiere an I/O-freie Funktion; übrige Komponenten laufen parallel
+    if uncertainty and uncertainty_path is None:
+        uncertainty_path = default_rating_uncertainty_path(ratings_path)
+    component_inputs = []
+    if components:
+        component_inputs = [
+            model_input
+            for model_input in build_component_inputs(*polls_to_arrays(fit_input), connectivity=connectivity)
+            if not np.any(model_input.episode_ids == anchor_episode_id)
+        ]
+    
+    pool = ProcessPoolExecutor(max_workers=max(1, component_workers)) if component_inputs else nullcontext()
+    with pool:
+        futures = [pool.submit(fit_component, model_input, calculated_at) for model_input in component_inputs]
+        rating_rows = run_rating_update_from_polls(
+            fit_input, ratings_path, calculated_at,
+            initial_theta=initial_theta, connectivity=connectivity,
+            uncertainty_path=uncertainty_path if uncertainty else None,
+            anchor_episode_id=anchor_episode_id
+        )
+        provisional_rows = _collect_component_ratings(futures, component_inputs)
+    
+    if components and rating_rows:
+        if components_path is None:
+            components_path = default_component_ratings_path(ratings_path)
+        anchor_component = min(row['episode_id'] for row in rating_rows)
+        anchor_rows = [dict(row, component_id=anchor_component) for row in rating_rows]
+        try:
+            write_component_ratings(components_path, anchor_rows + provisional_rows)
+        except TSVError as e:
+            raise BradleyTerryError(f"Fehler beim Schreiben von {components_path.name}: {e}")
+        logger.info(
+            f"Vorläufige Ratings für {len(component_inputs)} weitere Komponenten "
+            f"({len(provisional_rows)} Episoden) geschrieben"
+        )
     
-    # 3. Delegiere an I/O-freie Funktion
-    run_rating_update_from_polls(polls, ratings_path, calculated_at)
+    # 7. Ergebnis cachen
+    if use_cache and rating_rows:
+        try:
+            save_cached_ratings(cache_path, digest, rating_rows)
+        except RatingCacheError as e:
+            logger.warning(f"Rating-Cache konnte nicht geschrieben werden: {e}")
+    
+    return rating_rows
@@ -0,0 +1,362 @@
+"""
+Solver für das Bradley-Terry-Modell
+
+Dieses Modul enthält native NumPy-Solver, die direkt auf aggregierten
+Binomial-Counts pro Episodenpaar (Kantenarrays) arbeiten.
+
+Zielfunktion (identisch zu choix.mm_pairwise mit Regularisierung alpha):
+    f(theta) = sum_k [w_ab log sigma(theta_a - theta_b) + w_ba log sigma(theta_b - theta_a)]
+               + alpha * sum_i (theta_i - exp(theta_i))
+
+Am Optimum gilt mean(exp(theta)) = 1. Alle Solver geben theta zentriert
+(sum theta = 0) zurück, wie choix.
+
+Verfügbare Solver:
+- mm: MM-Algorithmus (Hunter 2004), ein Update kostet O(Paare)
+- newton: Newton/IRLS auf der Zielfunktion, konvergiert in wenigen Iterationen,
+  pro Iteration ein lineares Gleichungssystem (dicht oder dünn besetzt)
+- auto: Newton für kleine Kataloge, sonst MM (select_solver)
+
+Siehe auch: docs/bradley_terry_research.md
+"""
+
+from typing import Callable, Dict, NamedTuple, Optional, Tuple
+
+import numpy as np
+import scipy.linalg
+import scipy.sparse
+import scipy.sparse.linalg
+from choix.convergence import NormOfDifferenceTest
+from choix.utils import exp_transform, log_transform
+
+from bot.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# Bis zu dieser Episodenzahl wird das Newton-System dicht gelöst
+NEWTON_DENSE_MAX_ITEMS = 3000
+
+# Bis zu dieser Episodenzahl wählt 'auto' den Newton-Solver (gemessener
+# Schnittpunkt mit MM, siehe benchmarks/bench_solvers.py); liegt unter
+# NEWTON_DENSE_MAX_ITEMS, 'auto' löst Newton also nie dünn besetzt
+AUTO_NEWTON_MAX_ITEMS = 300
+
+
+class PairwiseCounts(NamedTuple):
+    """
+    Aggregierte Binomial-Counts pro Episodenpaar.
+    
+    Jeder Eintrag k beschreibt ein ungeordnetes Paar (idx_a[k], idx_b[k]) mit
+    idx_a[k] < idx_b[k]. Jedes Paar kommt genau einmal vor.
+    
+    Attributes:
+        idx_a: Index der ersten Episode (int64)
+        idx_b: Index der zweiten Episode (int64)
+        wins_a: Summe der Stimmen für idx_a über alle Polls des Paars (float64)
+        wins_b: Summe der Stimmen für idx_b über alle Polls des Paars (float64)
+    """
+    idx_a: np.ndarray
+    idx_b: np.ndarray
+    wins_a: np.ndarray
+    wins_b: np.ndarray
+
+
+def _initial_params(n_items: int, initial_theta: Optional[np.ndarray]) -> np.ndarray:
+    """Startwerte: übergebenes theta (zentriert) oder Nullvektor."""
+    if initial_theta is None:
+        return np.zeros(n_items)
+    params = np.asarray(initial_theta, dtype=np.float64)
+    if params.shape != (n_items,):
+        raise ValueError(
+            f"initial_theta hat Shape {params.shape}, erwartet ({n_items},)"
+        )
+    return params - params.mean()
+
+
+def episode_wins(counts: PairwiseCounts, n_items: int) -> np.ndarray:
+    """
+    Summiert die Stimmen pro Episode über alle Paare.
+    
+    Args:
+        counts: Aggregierte Paar-Counts
+        n_items: Anzahl der Episoden
+        
+    Returns:
+        Array (n_items,) mit gewonnenen Stimmen pro Episode
+    """
+    return (np.bincount(counts.idx_a, weights=counts.wins_a, minlength=n_items)
+            + np.bincount(counts.idx_b, weights=counts.wins_b, minlength=n_items))
+
+
+def log_posterior(
+    theta: np.ndarray,
+    counts: PairwiseCounts,
+    alpha: float
+) -> float:
+    """
+    Wertet die regularisierte Log-Likelihood f(theta) aus.
+    
+    Args:
+        theta: Log-Stärken (n_items,)
+        counts: Aggregierte Paar-Counts
+        alpha: Regularisierungsstärke
+        
+    Returns:
+        Wert der Zielfunktion
+    """
+    diff = theta[counts.idx_a] - theta[counts.idx_b]
+    # log sigma(x) = -log(1 + exp(-x)), numerisch stabil über logaddexp
+    loglik = -(counts.wins_a @ np.logaddexp(0.0, -diff)
+               + counts.wins_b @ np.logaddexp(0.0, diff))
+    return float(loglik + alpha * np.sum(theta - np.exp(theta)))
+
+
+def solve_mm(
+    counts: PairwiseCounts,
+    n_items: int,
+    alpha: float,
+    max_iter: int,
+    tol: float,
+    initial_theta: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, int]:
+    """
+    MM-Algorithmus auf Binomial-Counts (vektorisiert über Kantenarrays).
+    
+    Entspricht Schritt für Schritt choix.mm_pairwise auf den expandierten
+    Daten (gleiche Update-Regel, gleiche Transformationen, gleiches
+    Konvergenzkriterium), summiert aber pro Paar statt pro Stimme.
+    
+    Args:
+        counts: Aggregierte Paar-Counts
+        n_items: Anzahl der Episoden
+        alpha: Regularisierungsstärke
+        max_iter: Maximale Iterationen
+        tol: Konvergenztoleranz (L1-Norm der Änderung pro Episode)
+        initial_theta: Optionale Startwerte
+        
+    Returns:
+        Tuple (theta, Anzahl Iterationen)
+        
+    Raises:
+        RuntimeError: Wenn der Algorithmus nicht konvergiert
+    """
+    # Siege pro Episode sind unabhängig von theta
+    wins = episode_wins(counts, n_items)
+    totals = counts.wins_a + counts.wins_b
+    
+    params = _initial_params(n_items, initial_theta)
+    converged = NormOfDifferenceTest(tol=tol, order=1)
+    converged(params)
+    for iteration in range(1, max_iter + 1):
+        weights = exp_transform(params)
+        val = totals / (weights[counts.idx_a] + weights[counts.idx_b])
+        denoms = (np.bincount(counts.idx_a, weights=val, minlength=n_items)
+                  + np.bincount(counts.idx_b, weights=val, minlength=n_items))
+        params = log_transform((wins + alpha) / (denoms + alpha))
+        if converged(params):
+            return params, iteration
+    raise RuntimeError("Did not converge after {} iterations".format(max_iter))
+
+
+def _newton_system(
+    theta: np.ndarray,
+    counts: PairwiseCounts,
+    wins: np.ndarray,
+    n_items: int,
+    alpha: float,
+    dense: bool
+):
+    """
+    Berechnet Gradient und negative Hesse-Matrix der Zielfunktion.
+    
+    Die negative Hesse-Matrix ist der mit n_ab * p(1-p) gewichtete
+    Graph-Laplace plus alpha * diag(exp(theta)).
+    
+    Returns:
+        Tuple (gradient, matrix) - matrix dicht (ndarray) oder CSR
+    """
+    totals = counts.wins_a + counts.wins_b
+    p = 0.5 * (1.0 + np.tanh(0.5 * (theta[counts.idx_a] - theta[counts.idx_b])))
+    expected = np.bincount(counts.idx_a, weights=totals * p, minlength=n_items) \
+        + np.bincount(counts.idx_b, weights=totals * (1.0 - p), minlength=n_items)
+    pi = np.exp(theta)
+    gradient = wins - expected + alpha * (1.0 - pi)
+    
+    edge_weights = totals * p * (1.0 - p)
+    diagonal = (np.bincount(counts.idx_a, weights=edge_weights, minlength=n_items)
+                + np.bincount(counts.idx_b, weights=edge_weights, minlength=n_items)
+                + alpha * pi)
+    
+    if dense:
+        # Jedes Paar kommt genau einmal vor: direkte Zuweisung statt Summation
+        matrix = np.zeros((n_items, n_items))
+        matrix[counts.idx_a, counts.idx_b] = -edge_weights
+        matrix[counts.idx_b, counts.idx_a] = -edge_weights
+        matrix[np.diag_indices(n_items)] = diagonal
+    else:
+        rows = np.concatenate([counts.idx_a, counts.idx_b, np.arange(n_items)])
+        cols = np.concatenate([counts.idx_b, counts.idx_a, np.arange(n_items)])
+        vals = np.concatenate([-edge_weights, -edge_weights, diagonal])
+        matrix = scipy.sparse.csr_matrix((vals, (rows, cols)), shape=(n_items, n_items))
+    
+    return gradient, matrix
+
+
+def fisher_information(
+    theta: np.ndarray,
+    counts: PairwiseCounts,
+    n_items: int,
+    alpha: float,
+    dense: bool = True
+):
+    """
+    Fisher-Information (negative Hesse-Matrix) der Zielfunktion bei theta.
+    
+    Der mit n_ab * p(1-p) gewichtete Graph-Laplace plus alpha * diag(exp(theta)),
+    dieselbe Matrix wie in den Newton-Schritten von solve_newton().
+    
+    Args:
+        theta: Log-Stärken (n_items,), z.B. von fit_bradley_terry_model()
+        counts: Aggregierte Paar-Counts
+        n_items: Anzahl der Items
+        alpha: Regularisierungsstärke
+        dense: Dichte Matrix (ndarray) statt CSR
+        
+    Returns:
+        Matrix (n_items, n_items)
+    """
+    _, matrix = _newton_system(theta, counts, np.zeros(n_items), n_items, alpha, dense)
+    return matrix
+
+
+def _solve_spd(matrix, rhs: np.ndarray, alpha: float, dense: bool) -> np.ndarray:
+    """
+    Löst matrix @ x = rhs für die (semi-)definite Newton-Matrix.
+    
+    Ohne Regularisierung (alpha = 0) ist die Matrix ein Graph-Laplace und
+    singulär; dann wird Episode 0 als Referenz fixiert (x_0 = 0).
+    """
+    if alpha > 0:
+        if dense:
+            return scipy.linalg.solve(matrix, rhs, assume_a='pos')
+        return scipy.sparse.linalg.spsolve(matrix.tocsc(), rhs)
+    
+    x = np.zeros_like(rhs)
+    if dense:
+        x[1:] = scipy.linalg.solve(matrix[1:, 1:], rhs[1:], assume_a='pos')
+    else:
+        x[1:] = scipy.sparse.linalg.spsolve(matrix[1:, 1:].tocsc(), rhs[1:])
+    return x
+
+
+def solve_newton(
+    counts: PairwiseCounts,
+    n_items: int,
+    alpha: float,
+    max_iter: int,
+    tol: float,
+    initial_theta: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, int]:
+    """
+    Newton/IRLS-Verfahren auf Binomial-Counts.
+    
+    Maximiert dieselbe Zielfunktion wie der MM-Algorithmus. Pro Iteration wird
+    das System (L_w + alpha * diag(pi)) * delta = gradient gelöst; bis
+    NEWTON_DENSE_MAX_ITEMS Episoden dicht (Cholesky), darüber dünn besetzt.
+    Schritte werden per Backtracking gedämpft, falls die Zielfunktion sinkt.
+    
+    Args:
+        counts: Aggregierte Paar-Counts
+        n_items: Anzahl der Episoden
+        alpha: Regularisierungsstärke
+        max_iter: Maximale Iterationen
+        tol: Konvergenztoleranz (L1-Norm der Änderung pro Episode)
+        initial_theta: Optionale Startwerte
+        
+    Returns:
+        Tuple (theta, Anzahl Iterationen)
+        
+    Raises:
+        RuntimeError: Wenn das Verfahren nicht konvergiert
+    """
+    dense = n_items <= NEWTON_DENSE_MAX_ITEMS
+    wins = episode_wins(counts, n_items)
+    
+    # Ohne Regularisierung ist nur die zentrierte Lösung identifiziert;
+    # mit alpha > 0 liegt das Optimum bei mean(exp(theta)) = 1.
+    theta = _initial_params(n_items, initial_theta)
+    if alpha > 0:
+        theta = theta - np.log(np.mean(np.exp(theta)))
+    objective = log_posterior(theta, counts, alpha)
+    
+    for iteration in range(1, max_iter + 1):
+        gradient, matrix = _newton_system(theta, counts, wins, n_items, alpha, dense)
+        delta = _solve_spd(matrix, gradient, alpha, dense)
+        
+        step = 1.0
+        while True:
+            candidate = theta + step * delta
+            candidate_objective = log_posterior(candidate, counts, alpha)
+            if candidate_objective >= objective - 1e-12 * abs(objective) or step < 1e-8:
+                break
+            step *= 0.5
+        
+        change = np.linalg.norm(step * (delta - delta.mean()), ord=1)
+        theta = candidate
+        objective = candidate_objective
+        if change <= tol * n_items:
+            return theta - theta.mean(), iteration
+    
+    raise RuntimeError("Did not converge after {} iterations".format(max_iter))
+
+
+SOLVERS: Dict[str, Callable[..., Tuple[np.ndarray, int]]] = {
+    'mm': solve_mm,
+    'newton': solve_newton,
+}
+
+
+def select_solver(n_items: int) -> str:
+    """
+    Wählt einen Solver anhand der Problemgröße.
+    
+    Newton konvergiert in wenigen Iterationen und ist bis
+    AUTO_NEWTON_MAX_ITEMS Episoden am schnellsten. Darüber kostet das
+    lineare System (O(n^3) dicht, dünn besetzt noch mehr) mehr als die
+    zusätzlichen MM-Iterationen (O(Paare) pro Iteration); ab etwa 500
+    Episoden ist MM deutlich schneller.
+    
+    Args:
+        n_items: Anzahl der Episoden
+        
+    Returns:
+        Name des Solvers ('mm' oder 'newton')
+    """
+    if n_items <= AUTO_NEWTON_MAX_ITEMS:
+        return 'newton'
+    return 'mm'
+
+
+def get_solver(name: str, n_items: int) -> Tuple[str, Callable[..., Tuple[np.ndarray, int]]]:
+    """
+    Löst einen Solver-Namen (inkl. 'auto') zur Solver-Funktion auf.
+    
+    Args:
+        name: 'auto', 'mm' oder 'newton'
+        n_items: Anzahl der Episoden
+        
+    Returns:
+        Tuple (aufgelöster Name, Solver-Funktion)
+        
+    Raises:
+        ValueError: Bei unbekanntem Solver-Namen
+    """
+    if name == 'auto':
+        name = select_solver(n_items)
+    if name not in SOLVERS:
+        raise ValueError(
+            f"Unbekannter Solver: '{name}' (verfügbar: auto, {', '.join(sorted(SOLVERS))})"
+        )
+    return name, SOLVERS[name]
+
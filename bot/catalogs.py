@@ -0,0 +1,285 @@
+"""
+Mehrere Episoden-Kataloge in einem Prozess ranken
+
+Neben der Hauptserie (Tabelle serie, Anker Episode 1) enthält die
+Dreimetadaten-Datenbank weitere Kataloge, z.B. Spezialfolgen. Jeder Katalog
+hat ein eigenes Datenverzeichnis (polls.tsv, ratings.tsv, .cache/) und eine
+eigene Anker-Episode; Sidecars und Caches liegen damit getrennt.
+
+Konfiguration: data/catalogs.tsv (Spalten siehe CATALOGS_HEADERS), ohne
+Datei nur die Hauptserie in data/.
+
+Ein Lauf teilt sich eine API-Session und lädt jede Episoden-Tabelle einmal;
+die Fits der Kataloge laufen optional parallel auf einem Prozess-Pool. Ein
+fehlerhafter Katalog bricht die übrigen nicht ab.
+
+Siehe auch: docs/data_schema.md (Kataloge)
+"""
+
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import List, Dict, NamedTuple, Optional
+
+import numpy as np
+import requests
+
+from bot.bradley_terry import filter_poll_columns, run_rating_update, ANCHOR_EPISODE_ID, BradleyTerryError
+from bot.dreimetadaten_api import fetch_all_episodes, APIError, DEFAULT_EPISODE_TABLE, TABLE_NAME_PATTERN
+from bot.logger import get_logger
+from bot.tsv_repository import load_catalogs, load_poll_columns, TSVError
+
+logger = get_logger(__name__)
+
+
+# Name des Standard-Katalogs ohne catalogs.tsv
+DEFAULT_CATALOG_NAME = 'serie'
+
+
+class CatalogError(Exception):
+    """Exception für Fehler in der Katalog-Konfiguration"""
+    pass
+
+
+class Catalog(NamedTuple):
+    """
+    Ein Episoden-Katalog mit eigenem Datenverzeichnis.
+    
+    Attributes:
+        name: Eindeutiger Name (Logs, Ergebnisse)
+        table: Tabelle der Dreimetadaten-API mit Spalte nummer
+        anchor_episode_id: Anker-Episode, deren Komponente gerankt wird
+        data_dir: Verzeichnis mit polls.tsv, ratings.tsv und .cache/
+    """
+    name: str
+    table: str
+    anchor_episode_id: int
+    data_dir: Path
+
+
+class CatalogResult(NamedTuple):
+    """
+    Ergebnis eines Katalogs in run_catalogs().
+    
+    Attributes:
+        name: Name des Katalogs
+        n_ratings: Anzahl gerankter Episoden (0 bei Fehler oder ohne Polls)
+        seconds: Laufzeit des Katalogs
+        error: Fehlermeldung oder None bei Erfolg
+    """
+    name: str
+    n_ratings: int
+    seconds: float
+    error: Optional[str]
+
+
+def default_catalogs_path(data_root: Path) -> Path:
+    """
+    Standardpfad von catalogs.tsv (im Datenverzeichnis).
+    
+    Args:
+        data_root: Datenverzeichnis (data/)
+        
+    Returns:
+        Pfad zu catalogs.tsv
+    """
+    return data_root / 'catalogs.tsv'
+
+
+def load_catalog_config(file_path: Path, data_root: Optional[Path] = None) -> List[Catalog]:
+    """
+    Lädt und prüft die Katalog-Konfiguration.
+    
+    data_dir ist relativ zu data_root ('.' für data_root selbst). Ohne Datei
+    wird nur die Hauptserie mit Anker Episode 1 in data_root verwendet.
+    
+    Args:
+        file_path: Pfad zu catalogs.tsv
+        data_root: Optional - Basis für data_dir (default: Verzeichnis von file_path)
+        
+    Returns:
+        Liste von Catalog in Dateireihenfolge
+        
+    Raises:
+        CatalogError: Bei ungültigen Einträgen, doppelten Namen oder
+            doppelten Datenverzeichnissen
+    """
+    if data_root is None:
+        data_root = file_path.parent
+    
+    if not file_path.exists():
+        logger.info(f"Keine {file_path.name} - verwende nur den Katalog '{DEFAULT_CATALOG_NAME}'")
+        return [Catalog(DEFAULT_CATALOG_NAME, DEFAULT_EPISODE_TABLE, ANCHOR_EPISODE_ID, data_root)]
+    
+    try:
+        rows = load_catalogs(file_path)
+    except TSVError as e:
+        raise CatalogError(str(e))
+    
+    catalogs = []
+    for line, row in enumerate(rows, start=2):
+        name = row['name'].strip()
+        table = row['table'].strip()
+        if not name:
+            raise CatalogError(f"Zeile {line}: name darf nicht leer sein")
+        if not TABLE_NAME_PATTERN.match(table):
+            raise CatalogError(f"Zeile {line}: ungültiger Tabellenname '{table}'")
+        try:
+            anchor_episode_id = int(row['anchor_episode_id'])
+        except ValueError:
+            raise CatalogError(f"Zeile {line}: anchor_episode_id '{row['anchor_episode_id']}' ist keine Ganzzahl")
+        if anchor_episode_id < 1:
+            raise CatalogError(f"Zeile {line}: anchor_episode_id muss >= 1 sein")
+        catalogs.append(Catalog(name, table, anchor_episode_id, data_root / row['data_dir'].strip()))
+    
+    if not catalogs:
+        raise CatalogError(f"{file_path.name} enthält keine Kataloge")
+    names = [catalog.name for catalog in catalogs]
+    if len(set(names)) != len(names):
+        raise CatalogError(f"Doppelte Katalog-Namen in {file_path.name}: {names}")
+    data_dirs = [catalog.data_dir.resolve() for catalog in catalogs]
+    if len(set(data_dirs)) != len(data_dirs):
+        raise CatalogError(f"Kataloge müssen getrennte Datenverzeichnisse haben: {names}")
+    
+    return catalogs
+
+
+def fetch_catalog_episodes(
+    catalogs: List[Catalog],
+    session: Optional[requests.Session] = None
+) -> Dict[str, Optional[np.ndarray]]:
+    """
+    Lädt die Episodennummern aller Kataloge über eine gemeinsame Session.
+    
+    Jede Tabelle wird nur einmal abgefragt, auch wenn mehrere Kataloge sie
+    verwenden. Fehler einer Tabelle betreffen nur ihre Kataloge.
+    
+    Args:
+        catalogs: Kataloge aus load_catalog_config()
+        session: Optional - requests.Session (default: neue Session für diesen Aufruf)
+        
+    Returns:
+        Dict[table, sortierte Episodennummern] (None bei API-Fehler)
+    """
+    own_session = session is None
+    if own_session:
+        session = requests.Session()
+    
+    episodes = {}
+    try:
+        for table in dict.fromkeys(catalog.table for catalog in catalogs):
+            try:
+                rows = fetch_all_episodes(table, session=session)
+                episodes[table] = np.unique(np.array([int(row['nummer']) for row in rows], dtype=np.int64))
+            except (APIError, KeyError, TypeError, ValueError) as e:
+                logger.error(f"Episoden der Tabelle '{table}' konnten nicht geladen werden: {e}")
+                episodes[table] = None
+    finally:
+        if own_session:
+            session.close()
+    return episodes
+
+
+def check_catalog_polls(catalog: Catalog, episode_ids: np.ndarray, calculated_at: datetime) -> None:
+    """
+    Prüft, dass alle finalisierten Polls eines Katalogs bekannte Episoden vergleichen.
+    
+    Fängt vertauschte Datenverzeichnisse ab, bevor ratings.tsv geschrieben wird.
+    
+    Args:
+        catalog: Katalog
+        episode_ids: Sortierte Episodennummern der Tabelle des Katalogs
+        calculated_at: UTC-Zeitpunkt der Berechnung
+        
+    Raises:
+        CatalogError: Bei unbekannten Episoden oder unbekannter Anker-Episode
+        TSVError: Wenn polls.tsv nicht geladen werden kann
+    """
+    if not np.any(episode_ids == catalog.anchor_episode_id):
+        raise CatalogError(
+            f"Anker-Episode {catalog.anchor_episode_id} fehlt in der Tabelle '{catalog.table}'"
+        )
+    
+    polls = filter_poll_columns(load_poll_columns(catalog.data_dir / 'polls.tsv'), calculated_at)
+    compared = np.union1d(polls.episode_a_id, polls.episode_b_id)
+    unknown = compared[~np.isin(compared, episode_ids)]
+    if len(unknown):
+        raise CatalogError(
+            f"{len(unknown)} Episoden in polls.tsv fehlen in der Tabelle '{catalog.table}': "
+            f"{unknown[:10].tolist()}"
+        )
+
+
+def _run_catalog(args) -> CatalogResult:
+    """Worker: Prüfung und Rating-Update eines Katalogs, Fehler als Ergebnis."""
+    catalog, calculated_at, episode_ids = args
+    start = time.perf_counter()
+    try:
+        if episode_ids is not None:
+            check_catalog_polls(catalog, episode_ids, calculated_at)
+        rows = run_rating_update(
+            catalog.data_dir / 'polls.tsv',
+            catalog.data_dir / 'ratings.tsv',
+            calculated_at,
+            anchor_episode_id=catalog.anchor_episode_id
+        )
+        return CatalogResult(catalog.name, len(rows), time.perf_counter() - start, None)
+    except (CatalogError, BradleyTerryError, TSVError) as e:
+        return CatalogResult(catalog.name, 0, time.perf_counter() - start, str(e))
+
+
+def run_catalogs(
+    catalogs: List[Catalog],
+    calculated_at: Optional[datetime] = None,
+    n_workers: int = 1,
+    check_episodes: bool = True,
+    session: Optional[requests.Session] = None
+) -> List[CatalogResult]:
+    """
+    Führt das Rating-Update für mehrere Kataloge in einem Prozess durch.
+    
+    Die Episoden aller Tabellen werden vorab über eine gemeinsame Session
+    geladen (jede Tabelle einmal); danach läuft pro Katalog
+    run_rating_update() mit eigenem Datenverzeichnis und eigener
+    Anker-Episode. Alle Kataloge erhalten denselben calculated_at.
+    
+    Args:
+        catalogs: Kataloge aus load_catalog_config()
+        calculated_at: Optional - UTC-Zeitpunkt der Berechnung (default: jetzt)
+        n_workers: Anzahl Prozesse für die Kataloge (1: nacheinander im aktuellen Prozess)
+        check_episodes: Polls vor dem Fit gegen die Episoden der API prüfen
+        session: Optional - requests.Session für die API-Abfragen
+        
+    Returns:
+        CatalogResult pro Katalog in Konfigurationsreihenfolge
+    """
+    if calculated_at is None:
+        calculated_at = datetime.now(timezone.utc)
+    
+    episodes = fetch_catalog_episodes(catalogs, session) if check_episodes else {}
+    tasks = []
+    failed = {}
+    for catalog in catalogs:
+        if check_episodes and episodes[catalog.table] is None:
+            failed[catalog.name] = CatalogResult(
+                catalog.name, 0, 0.0, f"Episoden der Tabelle '{catalog.table}' nicht verfügbar"
+            )
+        else:
+            tasks.append((catalog, calculated_at, episodes.get(catalog.table)))
+    
+    logger.info(f"Rating-Update für {len(tasks)} Kataloge ({n_workers} Prozess(e))")
+    if n_workers <= 1 or len(tasks) <= 1:
+        done = [_run_catalog(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=min(n_workers, len(tasks))) as pool:
+            done = list(pool.map(_run_catalog, tasks))
+    
+    by_name = dict(failed, **{result.name: result for result in done})
+    results = [by_name[catalog.name] for catalog in catalogs]
+    for result in results:
+        if result.error is None:
+            logger.info(f"  {result.name}: {result.n_ratings} Episoden gerankt ({result.seconds:.2f}s)")
+        else:
+            logger.error(f"  {result.name}: fehlgeschlagen - {result.error}")
+    return results
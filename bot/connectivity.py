@@ -0,0 +1,358 @@
+"""
+Zusammenhang des Vergleichsgraphen (Union-Find / DSU)
+
+Dieses Modul führt die Zusammenhangskomponenten des Vergleichsgraphen
+inkrementell mit einer Union-Find-Struktur (Pfadkompression, Union by
+Rank). Jeder finalisierte Poll vereinigt die Komponenten seiner beiden
+Episoden; Abfragen wie "in welcher Komponente liegt Episode i" oder "ist
+Episode i mit Episode 1 verbunden" kosten nahezu konstante Zeit.
+
+Der Zustand wird wie das Statistik-Sidecar mit Watermark (neuester
+enthaltener finalized_at) als .npz neben polls.tsv gespeichert, sodass
+spätere Läufe nur neue Polls einrechnen. Verwendet von der Rating-
+Berechnung (Komponente mit Episode 1) und vom Matchmaking (component_id,
+siehe docs/matchmaking.md).
+"""
+
+import io
+from pathlib import Path
+from typing import List, Dict, NamedTuple, Union, Iterable
+
+import numpy as np
+
+from bot.atomic_io import atomic_write_bytes
+from bot.logger import get_logger
+from bot.poll_statistics import (
+    combine_checksums, poll_arrays, poll_checksum, split_polls_at_watermark,
+    EMPTY_CHECKSUM, EMPTY_WATERMARK
+)
+from bot.tsv_repository import PollColumns
+
+logger = get_logger(__name__)
+
+
+# Bei inkompatiblen Änderungen am Sidecar-Format erhöhen
+CONNECTIVITY_VERSION = 2
+
+
+class ConnectivityError(Exception):
+    """Exception für Fehler beim Lesen oder Schreiben des Konnektivitäts-Sidecars"""
+    pass
+
+
+class Connectivity(NamedTuple):
+    """
+    Union-Find-Struktur über Episode-IDs.
+    
+    Listen sind parallel über interne Indizes (Reihenfolge des ersten
+    Auftretens). parent, rank und smallest werden bei Abfragen und
+    Vereinigungen in place aktualisiert.
+    
+    Attributes:
+        episode_ids: Episode-ID pro Index
+        index: Episode-ID -> Index
+        parent: Eltern-Index pro Index (Wurzel: parent[i] == i)
+        rank: Obere Schranke der Baumhöhe pro Wurzel
+        smallest: Kleinste Episode-ID der Komponente pro Wurzel (= component_id)
+        watermark: Neuester enthaltener finalized_at (Unix-Sekunden, UTC)
+        n_polls: Anzahl der enthaltenen Polls
+        checksum: Prüfsumme der enthaltenen Polls (siehe poll_checksum())
+    """
+    episode_ids: List[int]
+    index: Dict[int, int]
+    parent: List[int]
+    rank: List[int]
+    smallest: List[int]
+    watermark: int
+    n_polls: int
+    checksum: int
+
+
+def empty_connectivity() -> Connectivity:
+    """
+    Erzeugt eine leere Struktur (keine Episoden, keine Polls).
+    
+    Returns:
+        Leere Connectivity
+    """
+    return Connectivity(
+        episode_ids=[], index={}, parent=[], rank=[], smallest=[],
+        watermark=EMPTY_WATERMARK, n_polls=0, checksum=EMPTY_CHECKSUM
+    )
+
+
+def _add_episode(connectivity: Connectivity, episode_id: int) -> int:
+    """Legt eine Episode als eigene Komponente an und gibt ihren Index zurück."""
+    position = connectivity.index.get(episode_id)
+    if position is None:
+        position = len(connectivity.episode_ids)
+        connectivity.index[episode_id] = position
+        connectivity.episode_ids.append(episode_id)
+        connectivity.parent.append(position)
+        connectivity.rank.append(0)
+        connectivity.smallest.append(episode_id)
+    return position
+
+
+def _find_root(connectivity: Connectivity, position: int) -> int:
+    """Wurzel eines Index mit Pfadkompression (Path Halving)."""
+    parent = connectivity.parent
+    while parent[position] != position:
+        parent[position] = parent[parent[position]]
+        position = parent[position]
+    return position
+
+
+def union_episodes(connectivity: Connectivity, episode_a: int, episode_b: int) -> bool:
+    """
+    Vereinigt die Komponenten zweier Episoden (Union by Rank).
+    
+    Args:
+        connectivity: Union-Find-Struktur (wird in place aktualisiert)
+        episode_a, episode_b: Episode-IDs eines Polls
+        
+    Returns:
+        True, wenn zwei verschiedene Komponenten vereinigt wurden
+    """
+    root_a = _find_root(connectivity, _add_episode(connectivity, episode_a))
+    root_b = _find_root(connectivity, _add_episode(connectivity, episode_b))
+    if root_a == root_b:
+        return False
+    
+    rank = connectivity.rank
+    if rank[root_a] < rank[root_b]:
+        root_a, root_b = root_b, root_a
+    connectivity.parent[root_b] = root_a
+    if rank[root_a] == rank[root_b]:
+        rank[root_a] += 1
+    connectivity.smallest[root_a] = min(connectivity.smallest[root_a], connectivity.smallest[root_b])
+    return True
+
+
+def component_id(connectivity: Connectivity, episode_id: int) -> int:
+    """
+    Komponente einer Episode (kleinste Episode-ID der Komponente).
+    
+    Die ID hängt nur von der Komponente ab, nicht von der Reihenfolge der
+    Vereinigungen; die Komponente mit Episode 1 hat immer die ID 1.
+    
+    Args:
+        connectivity: Union-Find-Struktur
+        episode_id: Episode-ID
+        
+    Returns:
+        component_id, oder episode_id selbst für Episoden ohne Polls
+    """
+    position = connectivity.index.get(episode_id)
+    if position is None:
+        return episode_id
+    return connectivity.smallest[_find_root(connectivity, position)]
+
+
+def component_ids(connectivity: Connectivity, episode_ids: Iterable[int]) -> np.ndarray:
+    """
+    Komponenten mehrerer Episoden (siehe component_id()).
+    
+    Args:
+        connectivity: Union-Find-Struktur
+        episode_ids: Episode-IDs
+        
+    Returns:
+        int64-Array mit component_id pro Episode
+    """
+    return np.array(
+        [component_id(connectivity, int(episode_id)) for episode_id in episode_ids],
+        dtype=np.int64
+    )
+
+
+def is_connected(connectivity: Connectivity, episode_a: int, episode_b: int) -> bool:
+    """
+    Prüft, ob zwei Episoden über Polls verbunden sind.
+    
+    Args:
+        connectivity: Union-Find-Struktur
+        episode_a, episode_b: Episode-IDs
+        
+    Returns:
+        True, wenn beide in derselben Komponente liegen
+    """
+    return component_id(connectivity, episode_a) == component_id(connectivity, episode_b)
+
+
+def count_components(connectivity: Connectivity) -> int:
+    """
+    Anzahl der Zusammenhangskomponenten (über Episoden mit Polls).
+    
+    Args:
+        connectivity: Union-Find-Struktur
+        
+    Returns:
+        Anzahl der Komponenten
+    """
+    return sum(1 for position, parent in enumerate(connectivity.parent) if position == parent)
+
+
+def _add_arrays_to_connectivity(
+    connectivity: Connectivity,
+    episode_a: np.ndarray,
+    episode_b: np.ndarray,
+    votes_a: np.ndarray,
+    votes_b: np.ndarray,
+    finalized_at: np.ndarray
+) -> Connectivity:
+    """Rechnet Polls in Array-Form (siehe poll_arrays()) in die Struktur ein (in place, plus Watermark)."""
+    if len(episode_a) == 0:
+        return connectivity
+    
+    for a, b in zip(episode_a.tolist(), episode_b.tolist()):
+        union_episodes(connectivity, a, b)
+    
+    return connectivity._replace(
+        watermark=max(connectivity.watermark, int(finalized_at.max())),
+        n_polls=connectivity.n_polls + len(episode_a),
+        checksum=combine_checksums(
+            connectivity.checksum, poll_checksum(episode_a, episode_b, votes_a, votes_b, finalized_at)
+        )
+    )
+
+
+def add_polls_to_connectivity(
+    connectivity: Connectivity,
+    polls: Union[List[Dict], PollColumns]
+) -> Connectivity:
+    """
+    Rechnet neue Polls in die Struktur ein (in place, plus Watermark).
+    
+    Wie add_polls_to_statistics(): ohne Prüfung, ob Polls bereits enthalten
+    sind - dafür ist update_connectivity() zuständig.
+    
+    Args:
+        connectivity: Bisherige Struktur
+        polls: Neue Polls von filter_and_parse_polls() oder PollColumns
+            
+    Returns:
+        Aktualisierte Connectivity
+    """
+    return _add_arrays_to_connectivity(connectivity, *poll_arrays(polls))
+
+
+def update_connectivity(
+    connectivity: Connectivity,
+    polls: Union[List[Dict], PollColumns]
+) -> Connectivity:
+    """
+    Bringt die Struktur auf den Stand der übergebenen Polls.
+    
+    Eingerechnet werden nur Polls mit finalized_at nach dem Watermark.
+    Stimmen Anzahl oder Prüfsumme der Polls bis zum Watermark nicht überein
+    (z.B. nachträglich entfernte Polls, die Union-Find nicht rückgängig
+    machen kann), wird die Struktur vollständig neu aufgebaut.
+    
+    Args:
+        connectivity: Bisherige Struktur (z.B. von load_connectivity())
+        polls: Alle finalisierten Polls von filter_and_parse_polls()
+            oder filter_poll_columns()
+            
+    Returns:
+        Aktualisierte Connectivity
+    """
+    arrays = poll_arrays(polls)
+    delta = split_polls_at_watermark(
+        arrays, connectivity.watermark, connectivity.n_polls, connectivity.checksum
+    )
+    
+    if not delta.consistent:
+        logger.warning(
+            f"Konnektivitäts-Sidecar inkonsistent ({connectivity.n_polls} Polls gespeichert, "
+            f"{delta.n_known} bis zum Watermark gefunden oder Prüfsumme abweichend) - baue neu auf"
+        )
+        return _add_arrays_to_connectivity(empty_connectivity(), *arrays)
+    
+    logger.info(f"Konnektivität: {int(delta.new.sum())} neue Polls eingerechnet")
+    return _add_arrays_to_connectivity(connectivity, *(array[delta.new] for array in arrays))
+
+
+def default_connectivity_path(polls_path: Path) -> Path:
+    """
+    Standardpfad des Sidecars neben polls.tsv (data/.cache/).
+    
+    Args:
+        polls_path: Pfad zu polls.tsv
+        
+    Returns:
+        Pfad zur Sidecar-Datei
+    """
+    return polls_path.parent / '.cache' / f"{polls_path.stem}_components.npz"
+
+
+def load_connectivity(file_path: Path) -> Connectivity:
+    """
+    Lädt das Konnektivitäts-Sidecar.
+    
+    Ein fehlendes, unlesbares oder veraltetes Sidecar ergibt eine leere
+    Struktur; update_connectivity() baut sie dann neu auf.
+    
+    Args:
+        file_path: Pfad zur Sidecar-Datei
+        
+    Returns:
+        Connectivity
+    """
+    if not file_path.exists():
+        return empty_connectivity()
+    
+    try:
+        with np.load(file_path) as data:
+            if int(data['version']) != CONNECTIVITY_VERSION:
+                logger.warning(f"Konnektivitäts-Sidecar {file_path} hat veraltete Version - wird ignoriert")
+                return empty_connectivity()
+            episode_ids = data['episode_ids'].tolist()
+            return Connectivity(
+                episode_ids=episode_ids,
+                index={episode_id: position for position, episode_id in enumerate(episode_ids)},
+                parent=data['parent'].tolist(),
+                rank=data['rank'].tolist(),
+                smallest=data['smallest'].tolist(),
+                watermark=int(data['watermark']),
+                n_polls=int(data['n_polls']),
+                checksum=int(data['checksum'])
+            )
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Konnektivitäts-Sidecar {file_path} nicht lesbar, wird ignoriert: {e}")
+        return empty_connectivity()
+
+
+def save_connectivity(file_path: Path, connectivity: Connectivity) -> None:
+    """
+    Speichert das Konnektivitäts-Sidecar atomar.
+    
+    Args:
+        file_path: Pfad zur Sidecar-Datei
+        connectivity: Zu speichernde Struktur
+        
+    Raises:
+        ConnectivityError: Wenn die Datei nicht geschrieben werden kann
+    """
+    buffer = io.BytesIO()
+    np.savez(
+        buffer,
+        version=np.int64(CONNECTIVITY_VERSION),
+        episode_ids=np.array(connectivity.episode_ids, dtype=np.int64),
+        parent=np.array(connectivity.parent, dtype=np.int64),
+        rank=np.array(connectivity.rank, dtype=np.int64),
+        smallest=np.array(connectivity.smallest, dtype=np.int64),
+        watermark=np.int64(connectivity.watermark),
+        n_polls=np.int64(connectivity.n_polls),
+        checksum=np.uint64(connectivity.checksum)
+    )
+    
+    try:
+        atomic_write_bytes(file_path, buffer.getvalue())
+    except OSError as e:
+        raise ConnectivityError(f"Fehler beim Schreiben des Konnektivitäts-Sidecars {file_path}: {e}")
+    
+    logger.debug(
+        f"Konnektivitäts-Sidecar geschrieben: {file_path} "
+        f"({len(connectivity.episode_ids)} Episoden, {count_components(connectivity)} Komponenten)"
+    )
@@ -0,0 +1,368 @@
+"""
+Zeitlich abklingende Poll-Statistiken (Option B aus docs/bradley_terry_research.md)
+
+Im Decay-Modus zählt eine Stimme mit dem Gewicht 2^(-(t - finalized_at) / h)
+(Halbwertszeit h) zum Auswertungszeitpunkt t. Statt jede Stimme bei jedem
+Lauf neu zu gewichten, werden die Stimmen relativ zu einem festen
+Referenzzeitpunkt r vorwärts gewichtet gespeichert:
+
+    S_ij = sum_k votes_k * 2^((finalized_at_k - r) / h)
+
+Die abgeklungenen Counts zum Zeitpunkt t sind dann S_ij * 2^(-(t - r) / h),
+ein globaler Faktor für alle Paare. Ein neuer Poll ändert nur sein Paar, das
+Fortschreiten der Zeit ändert nur den Faktor. Damit die Gewichte nicht
+überlaufen, wird r gelegentlich nachgezogen (Rebase, einmal O(Paare)).
+
+Die Statistiken haben dieselbe Paarstruktur wie bot.poll_statistics und
+ergeben über decayed_counts() ein PollStatistics, das direkt gefittet wird:
+ein Refit kostet so viel wie im statischen Modell.
+"""
+
+import io
+from pathlib import Path
+from typing import List, Dict, NamedTuple, Union
+
+import numpy as np
+
+from bot.atomic_io import atomic_write_bytes
+from bot.logger import get_logger
+from bot.poll_statistics import (
+    combine_checksums, merge_pair_arrays, poll_arrays, poll_checksum, split_polls_at_watermark,
+    EMPTY_CHECKSUM, EMPTY_WATERMARK, PollStatistics
+)
+from bot.tsv_repository import PollColumns
+
+logger = get_logger(__name__)
+
+
+# Bei inkompatiblen Änderungen am Sidecar-Format erhöhen
+DECAY_VERSION = 2
+
+SECONDS_PER_DAY = 86400
+
+# Größter gespeicherter Exponent (log2 des Gewichts) vor einem Rebase
+MAX_DECAY_EXPONENT = 256.0
+
+
+class DecayError(Exception):
+    """Exception für Fehler bei den abklingenden Statistiken"""
+    pass
+
+
+class DecayedStatistics(NamedTuple):
+    """
+    Vorwärts gewichtete Stimmen pro ungeordnetem Episodenpaar.
+    
+    Attributes:
+        episode_a: Kleinere Episode-ID des Paars (int64)
+        episode_b: Größere Episode-ID des Paars (int64)
+        weighted_a: Summe votes * 2^((finalized_at - reference) / h) für episode_a
+        weighted_b: Dasselbe für episode_b
+        pair_polls: Anzahl der Polls pro Paar (ungewichtet, int64)
+        half_life: Halbwertszeit h in Sekunden
+        reference: Referenzzeitpunkt r (Unix-Sekunden, UTC)
+        watermark: Neuester enthaltener finalized_at (Unix-Sekunden, UTC)
+        n_polls: Anzahl der enthaltenen Polls
+        checksum: Prüfsumme der enthaltenen Polls (siehe poll_checksum())
+    """
+    episode_a: np.ndarray
+    episode_b: np.ndarray
+    weighted_a: np.ndarray
+    weighted_b: np.ndarray
+    pair_polls: np.ndarray
+    half_life: float
+    reference: int
+    watermark: int
+    n_polls: int
+    checksum: int
+
+
+def half_life_seconds(half_life_days: float) -> float:
+    """
+    Rechnet eine Halbwertszeit in Tagen in Sekunden um.
+    
+    Args:
+        half_life_days: Halbwertszeit in Tagen (> 0)
+        
+    Returns:
+        Halbwertszeit in Sekunden
+        
+    Raises:
+        DecayError: Bei nicht positiver Halbwertszeit
+    """
+    if not half_life_days > 0:
+        raise DecayError(f"Halbwertszeit muss > 0 sein, erhalten: {half_life_days}")
+    return float(half_life_days) * SECONDS_PER_DAY
+
+
+def empty_decayed_statistics(half_life: float) -> DecayedStatistics:
+    """
+    Erzeugt leere Statistiken für eine Halbwertszeit.
+    
+    Args:
+        half_life: Halbwertszeit in Sekunden
+        
+    Returns:
+        Leere DecayedStatistics (Referenz wird mit dem ersten Poll gesetzt)
+    """
+    return DecayedStatistics(
+        episode_a=np.empty(0, dtype=np.int64),
+        episode_b=np.empty(0, dtype=np.int64),
+        weighted_a=np.empty(0, dtype=np.float64),
+        weighted_b=np.empty(0, dtype=np.float64),
+        pair_polls=np.empty(0, dtype=np.int64),
+        half_life=float(half_life),
+        reference=EMPTY_WATERMARK,
+        watermark=EMPTY_WATERMARK,
+        n_polls=0,
+        checksum=EMPTY_CHECKSUM
+    )
+
+
+def rebase_decayed_statistics(stats: DecayedStatistics, reference: int) -> DecayedStatistics:
+    """
+    Verschiebt den Referenzzeitpunkt (ändert keine abgeklungenen Counts).
+    
+    Args:
+        stats: Bisherige Statistiken
+        reference: Neuer Referenzzeitpunkt (Unix-Sekunden)
+        
+    Returns:
+        DecayedStatistics mit reference als Bezug
+    """
+    scale = np.exp2(-(reference - stats.reference) / stats.half_life)
+    return stats._replace(
+        weighted_a=stats.weighted_a * scale,
+        weighted_b=stats.weighted_b * scale,
+        reference=int(reference)
+    )
+
+
+def _add_arrays_to_decayed_statistics(
+    stats: DecayedStatistics,
+    new_a: np.ndarray,
+    new_b: np.ndarray,
+    new_votes_a: np.ndarray,
+    new_votes_b: np.ndarray,
+    finalized_at: np.ndarray
+) -> DecayedStatistics:
+    """Rechnet Polls in Array-Form (siehe poll_arrays()) in die Statistiken ein."""
+    if len(new_a) == 0:
+        return stats
+    
+    # Referenz auf den neuesten Poll legen, bevor Gewichte überlaufen können
+    # (gespeicherte Gewichte bleiben <= 2^MAX_DECAY_EXPONENT)
+    newest = int(finalized_at.max())
+    if stats.reference == EMPTY_WATERMARK:
+        stats = stats._replace(reference=newest)
+    elif (newest - stats.reference) / stats.half_life > MAX_DECAY_EXPONENT:
+        stats = rebase_decayed_statistics(stats, newest)
+    
+    weights = np.exp2((finalized_at - stats.reference) / stats.half_life)
+    episode_a, episode_b, weighted_a, weighted_b, pair_polls = merge_pair_arrays(
+        np.concatenate([stats.episode_a, new_a]),
+        np.concatenate([stats.episode_b, new_b]),
+        np.concatenate([stats.weighted_a, new_votes_a * weights]),
+        np.concatenate([stats.weighted_b, new_votes_b * weights]),
+        np.concatenate([stats.pair_polls, np.ones(len(new_a), dtype=np.int64)])
+    )
+    
+    return stats._replace(
+        episode_a=episode_a,
+        episode_b=episode_b,
+        weighted_a=weighted_a,
+        weighted_b=weighted_b,
+        pair_polls=pair_polls,
+        watermark=max(stats.watermark, int(finalized_at.max())),
+        n_polls=stats.n_polls + len(new_a),
+        checksum=combine_checksums(
+            stats.checksum, poll_checksum(new_a, new_b, new_votes_a, new_votes_b, finalized_at)
+        )
+    )
+
+
+def build_decayed_statistics(
+    polls: Union[List[Dict], PollColumns],
+    half_life: float
+) -> DecayedStatistics:
+    """
+    Baut die Statistiken aus allen Polls neu auf.
+    
+    Args:
+        polls: Finalisierte Polls von filter_and_parse_polls() oder PollColumns
+        half_life: Halbwertszeit in Sekunden
+        
+    Returns:
+        DecayedStatistics
+    """
+    return _add_arrays_to_decayed_statistics(empty_decayed_statistics(half_life), *poll_arrays(polls))
+
+
+def add_polls_to_decayed_statistics(
+    stats: DecayedStatistics,
+    polls: Union[List[Dict], PollColumns]
+) -> DecayedStatistics:
+    """
+    Rechnet neue Polls in die Statistiken ein.
+    
+    Wie add_polls_to_statistics(): ohne Prüfung, ob Polls bereits enthalten
+    sind - dafür ist update_decayed_statistics() zuständig.
+    
+    Args:
+        stats: Bisherige Statistiken
+        polls: Neue Polls von filter_and_parse_polls() oder PollColumns
+            
+    Returns:
+        Neue DecayedStatistics (stats bleibt unverändert)
+    """
+    return _add_arrays_to_decayed_statistics(stats, *poll_arrays(polls))
+
+
+def update_decayed_statistics(
+    stats: DecayedStatistics,
+    polls: Union[List[Dict], PollColumns]
+) -> DecayedStatistics:
+    """
+    Bringt die Statistiken auf den Stand der übergebenen Polls.
+    
+    Wie update_poll_statistics(): eingerechnet werden nur Polls nach dem
+    Watermark; passen Anzahl oder Prüfsumme bis zum Watermark nicht, wird
+    neu aufgebaut.
+    
+    Args:
+        stats: Bisherige Statistiken (z.B. von load_decayed_statistics())
+        polls: Alle finalisierten Polls von filter_and_parse_polls()
+            oder PollColumns
+            
+    Returns:
+        Aktualisierte DecayedStatistics
+    """
+    arrays = poll_arrays(polls)
+    delta = split_polls_at_watermark(arrays, stats.watermark, stats.n_polls, stats.checksum)
+    
+    if not delta.consistent:
+        logger.warning(
+            f"Decay-Sidecar inkonsistent ({stats.n_polls} Polls gespeichert, "
+            f"{delta.n_known} bis zum Watermark gefunden oder Prüfsumme abweichend) - baue neu auf"
+        )
+        return _add_arrays_to_decayed_statistics(empty_decayed_statistics(stats.half_life), *arrays)
+    
+    logger.info(f"Decay-Sidecar: {int(delta.new.sum())} neue Polls eingerechnet")
+    return _add_arrays_to_decayed_statistics(stats, *(array[delta.new] for array in arrays))
+
+
+def decayed_counts(stats: DecayedStatistics, at: int) -> PollStatistics:
+    """
+    Abgeklungene Counts zum Zeitpunkt at als PollStatistics (Fit-Input).
+    
+    Ein globaler Faktor 2^(-(at - reference) / h) auf alle Paare.
+    
+    Args:
+        stats: Abklingende Statistiken
+        at: Auswertungszeitpunkt (Unix-Sekunden, UTC)
+        
+    Returns:
+        PollStatistics mit abgeklungenen Stimmen (pair_polls ungewichtet)
+    """
+    scale = np.exp2(-(at - stats.reference) / stats.half_life) if stats.n_polls else 1.0
+    return PollStatistics(
+        episode_a=stats.episode_a,
+        episode_b=stats.episode_b,
+        wins_a=stats.weighted_a * scale,
+        wins_b=stats.weighted_b * scale,
+        pair_polls=stats.pair_polls,
+        watermark=stats.watermark,
+        n_polls=stats.n_polls,
+        checksum=stats.checksum
+    )
+
+
+def default_decay_path(polls_path: Path) -> Path:
+    """
+    Standardpfad des Decay-Sidecars neben polls.tsv (data/.cache/).
+    
+    Args:
+        polls_path: Pfad zu polls.tsv
+        
+    Returns:
+        Pfad zur Sidecar-Datei
+    """
+    return polls_path.parent / '.cache' / f"{polls_path.stem}_decay.npz"
+
+
+def load_decayed_statistics(file_path: Path, half_life: float) -> DecayedStatistics:
+    """
+    Lädt das Decay-Sidecar für eine Halbwertszeit.
+    
+    Ein fehlendes, unlesbares oder veraltetes Sidecar oder eine andere
+    Halbwertszeit ergibt leere Statistiken; update_decayed_statistics()
+    baut sie dann neu auf.
+    
+    Args:
+        file_path: Pfad zur Sidecar-Datei
+        half_life: Erwartete Halbwertszeit in Sekunden
+        
+    Returns:
+        DecayedStatistics
+    """
+    if not file_path.exists():
+        return empty_decayed_statistics(half_life)
+    
+    try:
+        with np.load(file_path) as data:
+            if int(data['version']) != DECAY_VERSION:
+                logger.warning(f"Decay-Sidecar {file_path} hat veraltete Version - wird ignoriert")
+                return empty_decayed_statistics(half_life)
+            if float(data['half_life']) != float(half_life):
+                logger.info(f"Decay-Sidecar {file_path} hat andere Halbwertszeit - wird neu aufgebaut")
+                return empty_decayed_statistics(half_life)
+            return DecayedStatistics(
+                episode_a=data['episode_a'],
+                episode_b=data['episode_b'],
+                weighted_a=data['weighted_a'],
+                weighted_b=data['weighted_b'],
+                pair_polls=data['pair_polls'],
+                half_life=float(data['half_life']),
+                reference=int(data['reference']),
+                watermark=int(data['watermark']),
+                n_polls=int(data['n_polls']),
+                checksum=int(data['checksum'])
+            )
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Decay-Sidecar {file_path} nicht lesbar, wird ignoriert: {e}")
+        return empty_decayed_statistics(half_life)
+
+
+def save_decayed_statistics(file_path: Path, stats: DecayedStatistics) -> None:
+    """
+    Speichert das Decay-Sidecar atomar.
+    
+    Args:
+        file_path: Pfad zur Sidecar-Datei
+        stats: Zu speichernde Statistiken
+        
+    Raises:
+        DecayError: Wenn die Datei nicht geschrieben werden kann
+    """
+    buffer = io.BytesIO()
+    np.savez(
+        buffer,
+        version=np.int64(DECAY_VERSION),
+        episode_a=stats.episode_a,
+        episode_b=stats.episode_b,
+        weighted_a=stats.weighted_a,
+        weighted_b=stats.weighted_b,
+        pair_polls=stats.pair_polls,
+        half_life=np.float64(stats.half_life),
+        reference=np.int64(stats.reference),
+        watermark=np.int64(stats.watermark),
+        n_polls=np.int64(stats.n_polls),
+        checksum=np.uint64(stats.checksum)
+    )
+    
+    try:
+        atomic_write_bytes(file_path, buffer.getvalue())
+    except OSError as e:
+        raise DecayError(f"Fehler beim Schreiben des Decay-Sidecars {file_path}: {e}")
+    
+    logger.debug(f"Decay-Sidecar geschrieben: {file_path} ({len(stats.episode_a)} Paare)")
@@ -7,6 +7,7 @@ mit Logging, Fehlerhandling und expliziten Helper-Funktionen.
 API-Endpoint: https://api.dreimetadaten.de/db.json
 """
 
+import re
 import requests
 import time
 from typing import Dict, List, Union, Optional, Any
@@ -14,6 +15,12 @@ from bot.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Tabelle der Hauptserie (Standard für fetch_all_episodes)
+DEFAULT_EPISODE_TABLE = 'serie'
+
+# Erlaubte Tabellennamen (werden direkt in den Query eingesetzt)
+TABLE_NAME_PATTERN = re.compile(r'^\w+$')
+
 
 class APIError(Exception):
     """Exception für API-bezogene Fehler"""
@@ -33,7 +40,8 @@ class APIResponseError(APIError):
 def run_query(
     query: str,
     timeout: int = 30,
-    max_retries: int = 3
+    max_retries: int = 3,
+    session: Optional[requests.Session] = None
 ) -> Union[Dict, List]:
     """
     Führt einen SQL-Query gegen die Dreimetadaten API aus.
@@ -42,6 +50,8 @@ def run_query(
         query: SQL-Query-String (ohne URL-Encoding)
         timeout: Request-Timeout in Sekunden (Standard: 30)
         max_retries: Maximale Anzahl von Wiederholungsversuchen bei Fehlern (Standard: 3)
+        session: Optional - gemeinsame requests.Session (hält Verbindungen
+            offen, z.B. für mehrere Kataloge in einem Prozess)
         
     Returns:
         JSON-Antwort als Dictionary oder Liste
@@ -71,7 +81,7 @@ def run_query(
                 f"API-Request (Versuch {attempt + 1}/{max_retries}): {query[:100]}..."
             )
             
-            response = requests.get(
+            response = (session or requests).get(
                 base_url,
                 params=params,
                 timeout=timeout
@@ -133,18 +143,27 @@ def run_query(
     raise APIError("Unbekannter Fehler beim API-Request")
 
 
-def fetch_all_episodes() -> List[Dict[str, Any]]:
+def fetch_all_episodes(
+    table: str = DEFAULT_EPISODE_TABLE,
+    session: Optional[requests.Session] = None
+) -> List[Dict[str, Any]]:
     """
     Lädt nur die Nummern aller Episoden von der Dreimetadaten API.
     
     Für detaillierte Metadaten einzelner Episoden verwende fetch_episode_metadata().
     
+    Args:
+        table: Tabelle mit Spalte nummer (default: 'serie'; weitere Kataloge
+            wie Spezialfolgen liegen in eigenen Tabellen)
+        session: Optional - gemeinsame requests.Session, siehe run_query()
+    
     Returns:
         Liste von Episode-Dictionaries mit dem Feld:
         - nummer (int): Folgennummer
         
     Raises:
         APIError: Bei Fehlern während des API-Aufrufs
+        ValueError: Wenn table kein gültiger Tabellenname ist
         
     Example:
         >>> episodes = fetch_all_episodes()
@@ -152,17 +171,21 @@ def fetch_all_episodes() -> List[Dict[str, Any]]:
         >>> # Für Metadaten einer Episode:
         >>> metadata = fetch_episode_metadata(episodes[0]['nummer'])
     """
-    query = """
+    # Validiere table als Bezeichner zur Vermeidung von SQL-Injection
+    if not isinstance(table, str) or not TABLE_NAME_PATTERN.match(table):
+        raise ValueError(f"Ungültiger Tabellenname: {table!r}")
+    
+    query = f"""
     SELECT 
         s.nummer
-    FROM serie s
+    FROM {table} s
     ORDER BY s.nummer
     """
     
-    logger.info("Lade alle Episoden von der API...")
+    logger.info(f"Lade alle Episoden ({table}) von der API...")
     
     try:
-        episodes = run_query(query)
+        episodes = run_query(query, session=session)
         
         if not isinstance(episodes, list):
             raise APIResponseError(
@@ -0,0 +1,226 @@
+"""
+Informationsoptimale Paarauswahl über die Fisher-Information
+
+Ergänzend zu den heuristischen Scores aus docs/matchmaking.md bewertet
+dieses Modul jedes Paar des Active Sets mit der erwarteten Verringerung der
+Unsicherheit von theta durch einen weiteren Poll.
+
+Ausgangspunkt ist die Fisher-Information H des gefitteten Modells
+(bt_solvers.fisher_information: Graph-Laplace mit Gewichten n_ij p(1-p)
+plus Prior alpha * diag(exp(theta))) und die Kovarianz Sigma = H^-1, einmal
+per Cholesky berechnet. Ein Poll (i, j) mit erwartet v Stimmen fügt
+w * e e^T hinzu (e = e_i - e_j, w = v p_ij (1 - p_ij)). Nach Sherman-Morrison
+gilt
+
+    Sigma' = Sigma - w Sigma e e^T Sigma / (1 + w e^T Sigma e)
+
+und damit für alle Paare ohne erneute Faktorisierung:
+
+- trace (A-optimal): Abnahme von tr(Sigma) = w ||Sigma e||^2 / (1 + w e^T Sigma e)
+- logdet (D-optimal): Abnahme von log det(Sigma) = log(1 + w e^T Sigma e)
+
+e^T Sigma e und ||Sigma e||^2 folgen aus Sigma und Sigma^2 über die
+Paarindizes (ein vektorisierter Durchlauf). Episoden ohne Polls gehen mit
+theta = 0 und Prior-Varianz ein.
+"""
+
+from typing import NamedTuple, Optional
+
+import numpy as np
+import scipy.linalg
+
+from bot.bradley_terry import DEFAULT_ALPHA, ModelInput
+from bot.bt_solvers import PairwiseCounts, fisher_information
+from bot.logger import get_logger
+from bot.matchmaking import PairScores, PairSelection, MatchmakingError, pair_selection
+
+logger = get_logger(__name__)
+
+
+INFORMATION_CRITERIA = ('trace', 'logdet')
+
+
+class InformationGainError(Exception):
+    """Exception für Fehler bei der informationsoptimalen Auswahl"""
+    pass
+
+
+class PosteriorCovariance(NamedTuple):
+    """
+    Kovarianz von theta über Modell- und Active-Set-Episoden.
+    
+    Attributes:
+        episode_ids: Sortierte Episode-IDs (Index = Zeile/Spalte)
+        theta: Log-Stärken (0 für Episoden außerhalb des Modells)
+        covariance: Sigma = H^-1 (n, n)
+    """
+    episode_ids: np.ndarray
+    theta: np.ndarray
+    covariance: np.ndarray
+
+
+def posterior_covariance(
+    model: ModelInput,
+    theta: np.ndarray,
+    episode_ids: np.ndarray,
+    alpha: float = DEFAULT_ALPHA
+) -> PosteriorCovariance:
+    """
+    Invertiert die Fisher-Information einmal per Cholesky.
+    
+    Args:
+        model: Fit-Eingaben von build_model_input()
+        theta: Log-Stärken von fit_bradley_terry_model() (parallel zu model.episode_ids)
+        episode_ids: Zusätzliche Episoden (z.B. das Active Set)
+        alpha: Regularisierungsstärke des Fits (muss > 0 sein)
+        
+    Returns:
+        PosteriorCovariance über model.episode_ids ∪ episode_ids
+        
+    Raises:
+        InformationGainError: Bei alpha <= 0 oder nicht positiv definiter Matrix
+    """
+    if alpha <= 0:
+        raise InformationGainError("alpha muss > 0 sein (Episoden ohne Polls haben sonst keine Varianz)")
+    
+    union_ids = np.union1d(model.episode_ids, np.asarray(episode_ids, dtype=np.int64))
+    model_positions = np.searchsorted(union_ids, model.episode_ids)
+    union_theta = np.zeros(len(union_ids))
+    union_theta[model_positions] = theta
+    
+    counts = PairwiseCounts(
+        idx_a=model_positions[model.counts.idx_a],
+        idx_b=model_positions[model.counts.idx_b],
+        wins_a=model.counts.wins_a,
+        wins_b=model.counts.wins_b
+    )
+    information = fisher_information(union_theta, counts, len(union_ids), alpha)
+    
+    try:
+        factor = scipy.linalg.cho_factor(information, overwrite_a=True)
+        covariance = scipy.linalg.cho_solve(factor, np.eye(len(union_ids)), overwrite_b=True)
+    except np.linalg.LinAlgError as e:
+        raise InformationGainError(f"Fisher-Information nicht positiv definit: {e}")
+    
+    return PosteriorCovariance(episode_ids=union_ids, theta=union_theta, covariance=covariance)
+
+
+def information_gain(
+    scores: PairScores,
+    posterior: PosteriorCovariance,
+    votes_per_poll: float,
+    criterion: str = 'trace'
+) -> np.ndarray:
+    """
+    Erwartete Abnahme der Unsicherheit für alle Paare (Sherman-Morrison).
+    
+    Args:
+        scores: PairScores von score_pairs() (Paare des Active Sets)
+        posterior: PosteriorCovariance, die alle Episoden von scores enthält
+        votes_per_poll: Erwartete Stimmen pro Poll
+        criterion: 'trace' (Summe der Varianzen) oder 'logdet'
+        
+    Returns:
+        Array mit Informationsgewinn pro Paar (parallel zu scores.rows)
+        
+    Raises:
+        InformationGainError: Bei unbekanntem Kriterium oder fehlenden Episoden
+    """
+    if criterion not in INFORMATION_CRITERIA:
+        raise InformationGainError(
+            f"Unbekanntes Kriterium '{criterion}' (erlaubt: {', '.join(INFORMATION_CRITERIA)})"
+        )
+    
+    positions = np.searchsorted(posterior.episode_ids, scores.episode_ids).clip(max=len(posterior.episode_ids) - 1)
+    if not np.array_equal(posterior.episode_ids[positions], scores.episode_ids):
+        raise InformationGainError("Kovarianz enthält nicht alle Episoden des Active Sets")
+    
+    columns = posterior.covariance[:, positions]
+    sigma = columns[positions]
+    rows, cols = scores.rows, scores.cols
+    
+    theta = posterior.theta[positions]
+    p = 0.5 * (1.0 + np.tanh(0.5 * (theta[rows] - theta[cols])))
+    weight = votes_per_poll * p * (1.0 - p)
+    
+    diagonal = np.diagonal(sigma)
+    quadratic = diagonal[rows] + diagonal[cols] - 2.0 * sigma[rows, cols]
+    if criterion == 'logdet':
+        return np.log1p(weight * quadratic)
+    
+    squared = columns.T @ columns
+    squared_diagonal = np.diagonal(squared)
+    norm = squared_diagonal[rows] + squared_diagonal[cols] - 2.0 * squared[rows, cols]
+    return weight * norm / (1.0 + weight * quadratic)
+
+
+def information_gain_scores(
+    scores: PairScores,
+    model: ModelInput,
+    theta: np.ndarray,
+    alpha: float = DEFAULT_ALPHA,
+    votes_per_poll: Optional[float] = None,
+    criterion: str = 'trace'
+) -> PairScores:
+    """
+    Ersetzt den heuristischen Score durch den normierten Informationsgewinn.
+    
+    Der Gewinn wird auf das Maximum über die eligible Paare normiert (0..1),
+    sodass select_pair() und select_round() mit ihrer Temperatur direkt
+    darauf arbeiten können. Hard-Constraints (eligible) bleiben erhalten.
+    
+    Args:
+        scores: PairScores von score_pairs()
+        model: Fit-Eingaben von build_model_input()
+        theta: Log-Stärken von fit_bradley_terry_model()
+        alpha: Regularisierungsstärke des Fits
+        votes_per_poll: Optional - erwartete Stimmen pro Poll
+            (default: Mittel der bisherigen Polls im Modell)
+        criterion: 'trace' oder 'logdet'
+        
+    Returns:
+        PairScores mit score = Informationsgewinn / max
+        
+    Raises:
+        InformationGainError: Bei ungültigen Eingaben
+    """
+    if votes_per_poll is None:
+        if model.n_polls == 0:
+            raise InformationGainError("Keine Polls im Modell - votes_per_poll muss angegeben werden")
+        votes_per_poll = float(np.sum(model.counts.wins_a + model.counts.wins_b)) / model.n_polls
+    
+    posterior = posterior_covariance(model, theta, scores.episode_ids, alpha)
+    gain = information_gain(scores, posterior, votes_per_poll, criterion)
+    
+    best = gain[scores.eligible].max() if scores.eligible.any() else 0.0
+    if best > 0:
+        gain /= best
+    return scores._replace(score=gain)
+
+
+def select_most_informative(scores: PairScores) -> PairSelection:
+    """
+    Wählt das eligible Paar mit dem größten Score (deterministisch).
+    
+    Für Scores von information_gain_scores() ist das der Poll mit der
+    größten erwarteten Verringerung der Unsicherheit.
+    
+    Args:
+        scores: PairScores (z.B. von information_gain_scores())
+        
+    Returns:
+        PairSelection
+        
+    Raises:
+        MatchmakingError: Wenn kein Paar eligible ist
+    """
+    if not scores.eligible.any():
+        raise MatchmakingError("Kein Paar erfüllt die Hard-Constraints")
+    
+    masked = np.where(scores.eligible, scores.score, -np.inf)
+    selection = pair_selection(scores, int(np.argmax(masked)))
+    logger.info(
+        f"Informationsoptimales Paar: {selection.episode_a_id} vs {selection.episode_b_id} "
+        f"(Score {selection.score:.3f})"
+    )
+    return selection
@@ -0,0 +1,588 @@
+"""
+Matchmaking: Bewertung und Auswahl des nächsten Polls
+
+Dieses Modul implementiert Scoring und stochastische Auswahl aus
+docs/matchmaking.md für alle Paare des Active Sets auf einmal:
+
+- Paare (i, j) mit i < j als oberes Dreieck (np.triu_indices) über das
+  Active Set, alle Terme als Arrays über diese Paare
+- Hard-Constraints als boolesche Maske (eligible)
+- Score = w_q*S_q + w_close*S_close + w_unc*S_unc + w_cal*S_cal + w_rec*S_rec
+- Top K_candidates per np.argpartition (kein vollständiges Sortieren),
+  Softmax mit Temperatur T, mit Wahrscheinlichkeit epsilon uniform aus
+  allen eligible Paaren
+- Runden mit mehreren gleichzeitigen Polls (select_round): greedy,
+  paarweise disjunkte Episoden, Malus für überlappende Information
+
+theta stammt aus compute_ratings_from_polls() (theta = log(utility)),
+n_total aus count_matches_per_episode(), sd_theta aus dem Bootstrap
+(bot/bootstrap.py) und q aus der q-Matrix (bot/q_matrix.py).
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from bot.logger import get_logger
+from bot.q_matrix import QMatrix, packed_index
+
+logger = get_logger(__name__)
+
+
+# Pool & Kalibrierung (docs/matchmaking.md, "Parameter")
+D_MIN = 6
+M_MIN = 2
+MIN_ANCHOR_FOR_UNCAL_VS_UNCAL = 1
+
+# Recency: Zeitskala in Polls
+TAU_REC = 4.0
+
+# Stochastische Auswahl
+K_CANDIDATES = 100
+TEMPERATURE = 0.3
+EPSILON = 0.05
+
+# last_seen_poll_idx für Episoden ohne Poll (Recency-Bonus = 1)
+NEVER_SEEN = -1
+
+# Runden mit mehreren Polls: Malus für Paare, die denselben Bereich der
+# Skala vergleichen wie ein bereits gewähltes Paar (Informationsüberlappung)
+OVERLAP_WEIGHT = 0.5
+OVERLAP_SCALE = 0.5
+
+
+class MatchmakingError(Exception):
+    """Exception für Fehler im Matchmaking"""
+    pass
+
+
+class ScoreWeights(NamedTuple):
+    """
+    Gewichte des linearen Gesamtscores.
+    
+    Attributes:
+        close: Gewicht für S_close (Modell-p nahe 0.5)
+        unc: Gewicht für S_unc (Uncertainty / Under-sampling)
+        cal: Gewicht für S_cal (Kalibrierungs-Bonus)
+        rec: Gewicht für S_rec (Recency-Bonus)
+        q: Gewicht für S_q (Order-Uncertainty aus dem Bootstrap)
+    """
+    close: float
+    unc: float
+    cal: float
+    rec: float
+    q: float
+
+
+WEIGHTS_BEFORE_BOOTSTRAP = ScoreWeights(close=0.6, unc=0.6, cal=1.0, rec=0.4, q=0.0)
+WEIGHTS_AFTER_BOOTSTRAP = ScoreWeights(close=0.2, unc=0.6, cal=1.0, rec=0.4, q=1.0)
+
+
+class MatchmakingInput(NamedTuple):
+    """
+    Zustand des Active Sets (Arrays parallel zu episode_ids).
+    
+    Attributes:
+        episode_ids: Sortierte Episode-IDs des Active Sets
+        theta: BT-Stärken (log-Skala, 0 für Episoden ohne Rating)
+        n_total: Anzahl Polls pro Episode
+        n_calib: Anzahl Kalibrierungs-Polls pro Episode
+        last_seen_poll_idx: Index des letzten Polls (NEVER_SEEN ohne Poll)
+        poll_count: Laufender Poll-Index
+        sd_theta: Optional - Bootstrap-sd pro Episode (NaN ohne Wert);
+            None vor dem ersten Bootstrap
+        component_id: Optional - Komponente im Vergleichsgraphen; wenn gesetzt,
+            gilt die Connectivity-Phase (nur Paare über Komponenten hinweg)
+    """
+    episode_ids: np.ndarray
+    theta: np.ndarray
+    n_total: np.ndarray
+    n_calib: np.ndarray
+    last_seen_poll_idx: np.ndarray
+    poll_count: int
+    sd_theta: Optional[np.ndarray] = None
+    component_id: Optional[np.ndarray] = None
+
+
+class PairScores(NamedTuple):
+    """
+    Scores aller Paare i < j des Active Sets (oberes Dreieck).
+    
+    Attributes:
+        episode_ids: Sortierte Episode-IDs des Active Sets
+        theta: BT-Stärken des Active Sets (für die Überlappung in select_round())
+        rows: Index der ersten Episode pro Paar (in episode_ids)
+        cols: Index der zweiten Episode pro Paar (rows < cols)
+        eligible: Maske der Paare, die alle Hard-Constraints erfüllen
+        s_close: Closeness aus Modell-p (0..1)
+        s_q: Order-Uncertainty aus dem Bootstrap (0..1, 0 ohne q)
+        s_unc: Uncertainty / Under-sampling (0..1)
+        s_cal: Kalibrierungs-Bonus (0 oder 1)
+        s_rec: Recency-Bonus (0..1)
+        score: Gewichteter Gesamtscore
+    """
+    episode_ids: np.ndarray
+    theta: np.ndarray
+    rows: np.ndarray
+    cols: np.ndarray
+    eligible: np.ndarray
+    s_close: np.ndarray
+    s_q: np.ndarray
+    s_unc: np.ndarray
+    s_cal: np.ndarray
+    s_rec: np.ndarray
+    score: np.ndarray
+
+
+class PairSelection(NamedTuple):
+    """
+    Ausgewähltes Paar für den nächsten Poll.
+    
+    Attributes:
+        episode_a_id: Erste Episode (kleinere ID)
+        episode_b_id: Zweite Episode
+        score: Gesamtscore des Paars
+        explored: True, wenn per epsilon uniform gezogen
+    """
+    episode_a_id: int
+    episode_b_id: int
+    score: float
+    explored: bool
+
+
+def build_matchmaking_input(
+    episode_ids: List[int],
+    rating_rows: List[Dict],
+    match_counts: Mapping[int, int],
+    n_calib: Mapping[int, int],
+    last_seen_poll_idx: Mapping[int, int],
+    poll_count: int,
+    sd_theta: Optional[Mapping[int, float]] = None,
+    component_id: Optional[Mapping[int, int]] = None
+) -> MatchmakingInput:
+    """
+    Baut die Arrays des Active Sets aus Rating-Rows und Zählern.
+    
+    Args:
+        episode_ids: Episode-IDs des Active Sets
+        rating_rows: Ergebnis von compute_ratings_from_polls() (episode_id, utility);
+            Episoden ohne Rating erhalten theta = 0 (mittlere Stärke)
+        match_counts: Dict[episode_id, n_total], z.B. von count_matches_per_episode()
+        n_calib: Dict[episode_id, Anzahl Kalibrierungs-Polls] (fehlend = 0)
+        last_seen_poll_idx: Dict[episode_id, Poll-Index] (fehlend = NEVER_SEEN)
+        poll_count: Laufender Poll-Index
+        sd_theta: Optional - Dict[episode_id, sd_theta] aus dem Bootstrap
+        component_id: Optional - Dict[episode_id, Komponente] (Connectivity-Phase)
+        
+    Returns:
+        MatchmakingInput mit sortierten Episode-IDs
+    """
+    ids = np.unique(np.asarray(episode_ids, dtype=np.int64))
+    utility = {int(row['episode_id']): float(row['utility']) for row in rating_rows}
+
+    def column(values: Mapping[int, float], default: float, dtype) -> np.ndarray:
+        return np.array([values.get(int(ep_id), default) for ep_id in ids], dtype=dtype)
+    
+    return MatchmakingInput(
+        episode_ids=ids,
+        theta=np.log(column(utility, 1.0, np.float64)),
+        n_total=column(match_counts, 0, np.int64),
+        n_calib=column(n_calib, 0, np.int64),
+        last_seen_poll_idx=column(last_seen_poll_idx, NEVER_SEEN, np.int64),
+        poll_count=int(poll_count),
+        sd_theta=None if sd_theta is None else column(sd_theta, np.nan, np.float64),
+        component_id=None if component_id is None else column(component_id, -1, np.int64)
+    )
+
+
+def is_calibrated(n_total: np.ndarray, n_calib: np.ndarray) -> np.ndarray:
+    """Maske der calibrated Episoden (n_total >= D_MIN und n_calib >= M_MIN)."""
+    return (np.asarray(n_total) >= D_MIN) & (np.asarray(n_calib) >= M_MIN)
+
+
+@lru_cache(maxsize=4)
+def upper_triangle(n_items: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Paarindizes (rows, cols) mit rows < cols, zeilenweise sortiert.
+    
+    Wird pro Größe des Active Sets zwischengespeichert (schreibgeschützt),
+    da sich das Active Set zwischen zwei Polls selten ändert.
+    """
+    rows, cols = np.triu_indices(n_items, k=1)
+    rows.setflags(write=False)
+    cols.setflags(write=False)
+    return rows, cols
+
+
+def _min_max(values: np.ndarray) -> np.ndarray:
+    """Skaliert auf 0..1 (konstante Werte ergeben 0)."""
+    low, high = values.min(), values.max()
+    if high <= low:
+        return np.zeros_like(values)
+    return (values - low) / (high - low)
+
+
+def episode_uncertainty(state: MatchmakingInput) -> np.ndarray:
+    """
+    Normierte Uncertainty pro Episode (0..1 über das Active Set).
+    
+    Vor dem Bootstrap U(i) = 1 / sqrt(n_total[i] + 1), danach sd_theta[i].
+    Episoden ohne Bootstrap-Wert (z.B. neu aktiviert) gelten als maximal
+    unsicher.
+    
+    Args:
+        state: MatchmakingInput
+        
+    Returns:
+        Array (n,) mit Werten in 0..1
+    """
+    if state.sd_theta is None:
+        return _min_max(1.0 / np.sqrt(state.n_total + 1.0))
+    
+    sd = np.asarray(state.sd_theta, dtype=np.float64)
+    known = np.isfinite(sd)
+    if not known.any():
+        return np.ones_like(sd)
+    normalized = np.ones_like(sd)
+    normalized[known] = _min_max(sd[known])
+    return normalized
+
+
+def episode_recency(state: MatchmakingInput, tau_rec: float = TAU_REC) -> np.ndarray:
+    """
+    Recency-Bonus R(i) = 1 - exp(-age_i / tau_rec) pro Episode.
+    
+    Episoden ohne Poll erhalten R = 1.
+    """
+    age = state.poll_count - state.last_seen_poll_idx
+    recency = 1.0 - np.exp(-age / tau_rec)
+    recency[state.last_seen_poll_idx == NEVER_SEEN] = 1.0
+    return recency
+
+
+def _pair_q_uncertainty(
+    q_matrix: QMatrix,
+    episode_ids: np.ndarray,
+    rows: np.ndarray,
+    cols: np.ndarray
+) -> np.ndarray:
+    """
+    S_q = 1 - 2|q_ij - 0.5| für alle Paare, 0 wenn q für ein Paar fehlt.
+    
+    Die Positionen in der q-Matrix werden einmal pro Episode bestimmt; da
+    beide ID-Listen sortiert sind, gilt für rows < cols auch pos_i < pos_j.
+    Der gepackte Index zerfällt in einen Zeilenanteil pro Episode und die
+    Spaltenposition, pro Paar bleibt eine Addition.
+    """
+    q_ids = q_matrix.episode_ids
+    n_q = len(q_ids)
+    if n_q < 2:
+        return np.zeros(len(rows))
+    
+    position = np.searchsorted(q_ids, episode_ids).clip(max=n_q - 1)
+    known = q_ids[position] == episode_ids
+    row_offset = packed_index(position, position + 1, n_q) - position - 1
+    
+    index = row_offset[rows] + position[cols]
+    np.clip(index, 0, len(q_matrix.counts) - 1, out=index)
+    s_q = np.abs(q_matrix.counts[index] * (1.0 / q_matrix.n_resamples) - 1.0)
+    np.subtract(1.0, s_q, out=s_q)
+    if not known.all():
+        s_q[~(known[rows] & known[cols])] = 0.0
+    return s_q
+
+
+def score_pairs(
+    state: MatchmakingInput,
+    q_matrix: Optional[QMatrix] = None,
+    weights: Optional[ScoreWeights] = None,
+    tau_rec: float = TAU_REC
+) -> PairScores:
+    """
+    Berechnet Hard-Constraints und alle Score-Terme für alle Paare i < j.
+    
+    Per-Episoden-Größen (Uncertainty, Recency, Kalibrierung) werden einmal
+    über das Active Set berechnet und dann über die Paarindizes verteilt.
+    
+    Args:
+        state: MatchmakingInput des Active Sets
+        q_matrix: Optional - q-Matrix aus dem Bootstrap (ohne: S_q = 0)
+        weights: Optional - Gewichte (default: WEIGHTS_AFTER_BOOTSTRAP, wenn
+            sd_theta oder q_matrix vorliegt, sonst WEIGHTS_BEFORE_BOOTSTRAP)
+        tau_rec: Zeitskala des Recency-Bonus in Polls
+        
+    Returns:
+        PairScores
+        
+    Raises:
+        MatchmakingError: Bei inkonsistenten Eingaben
+    """
+    n_items = len(state.episode_ids)
+    for name in ('theta', 'n_total', 'n_calib', 'last_seen_poll_idx', 'sd_theta', 'component_id'):
+        values = getattr(state, name)
+        if values is not None and len(values) != n_items:
+            raise MatchmakingError(f"{name} hat Länge {len(values)}, erwartet {n_items}")
+    
+    if weights is None:
+        bootstrapped = state.sd_theta is not None or q_matrix is not None
+        weights = WEIGHTS_AFTER_BOOTSTRAP if bootstrapped else WEIGHTS_BEFORE_BOOTSTRAP
+    
+    rows, cols = upper_triangle(n_items)
+    
+    # Hard-Constraints
+    observed = state.n_total > 0
+    calibrated = is_calibrated(state.n_total, state.n_calib)
+    anchored = state.n_calib >= MIN_ANCHOR_FOR_UNCAL_VS_UNCAL
+    eligible = observed[rows] | observed[cols]
+    eligible &= calibrated[rows] | calibrated[cols] | (anchored[rows] & anchored[cols])
+    if state.component_id is not None:
+        eligible &= state.component_id[rows] != state.component_id[cols]
+    
+    # S_close = 1 - 2|sigma(d) - 0.5| = 1 - |tanh(d / 2)|
+    s_close = 1.0 - np.abs(np.tanh(0.5 * (state.theta[rows] - state.theta[cols])))
+    
+    if q_matrix is not None:
+        s_q = _pair_q_uncertainty(q_matrix, state.episode_ids, rows, cols)
+    else:
+        s_q = np.zeros(len(rows))
+    
+    uncertainty = episode_uncertainty(state)
+    s_unc = 0.5 * (uncertainty[rows] + uncertainty[cols])
+    # S_cal nur für uncalibrated (beobachtet, nicht calibrated) gegen calibrated
+    uncalibrated = observed & ~calibrated
+    s_cal = (
+        (uncalibrated[rows] & calibrated[cols]) | (calibrated[rows] & uncalibrated[cols])
+    ).astype(np.float64)
+    recency = episode_recency(state, tau_rec)
+    s_rec = 0.5 * (recency[rows] + recency[cols])
+    
+    score = weights.close * s_close
+    score += weights.unc * s_unc
+    score += weights.cal * s_cal
+    score += weights.rec * s_rec
+    if weights.q:
+        score += weights.q * s_q
+    
+    return PairScores(
+        episode_ids=state.episode_ids,
+        theta=state.theta,
+        rows=rows,
+        cols=cols,
+        eligible=eligible,
+        s_close=s_close,
+        s_q=s_q,
+        s_unc=s_unc,
+        s_cal=s_cal,
+        s_rec=s_rec,
+        score=score
+    )
+
+
+def top_candidates(scores: PairScores, k_candidates: int = K_CANDIDATES) -> np.ndarray:
+    """
+    Indizes der k_candidates eligible Paare mit dem höchsten Score.
+    
+    Verwendet np.argpartition (O(Paare)) statt vollständiger Sortierung;
+    die Reihenfolge innerhalb der Top-K ist nicht definiert.
+    
+    Args:
+        scores: PairScores von score_pairs()
+        k_candidates: Anzahl Kandidaten K
+        
+    Returns:
+        Paarindizes (in scores.rows/cols), höchstens k_candidates
+    """
+    candidates = np.flatnonzero(scores.eligible)
+    if len(candidates) <= k_candidates:
+        return candidates
+    
+    top = np.argpartition(scores.score[candidates], len(candidates) - k_candidates)
+    return candidates[top[len(candidates) - k_candidates:]]
+
+
+def _softmax_choice(
+    candidates: np.ndarray,
+    values: np.ndarray,
+    rng: np.random.Generator,
+    temperature: float
+) -> int:
+    """Zieht einen Kandidaten mit Wahrscheinlichkeit proportional zu exp(value / T)."""
+    logits = values / temperature
+    weights = np.exp(logits - logits.max())
+    return int(rng.choice(candidates, p=weights / weights.sum()))
+
+
+def pair_selection(scores: PairScores, pair: int, explored: bool = False) -> PairSelection:
+    """PairSelection für einen Paarindex (in scores.rows/cols)."""
+    return PairSelection(
+        episode_a_id=int(scores.episode_ids[scores.rows[pair]]),
+        episode_b_id=int(scores.episode_ids[scores.cols[pair]]),
+        score=float(scores.score[pair]),
+        explored=bool(explored)
+    )
+
+
+def select_pair(
+    scores: PairScores,
+    rng: Optional[np.random.Generator] = None,
+    k_candidates: int = K_CANDIDATES,
+    temperature: float = TEMPERATURE,
+    epsilon: float = EPSILON
+) -> PairSelection:
+    """
+    Wählt das Paar für den nächsten Poll (Softmax über Top-K, epsilon-greedy).
+    
+    Args:
+        scores: PairScores von score_pairs()
+        rng: Optional - Zufallsgenerator (default: np.random.default_rng())
+        k_candidates: Anzahl Kandidaten für die Softmax-Auswahl
+        temperature: Softmax-Temperatur T
+        epsilon: Wahrscheinlichkeit für uniforme Auswahl aus allen eligible Paaren
+        
+    Returns:
+        PairSelection
+        
+    Raises:
+        MatchmakingError: Wenn kein Paar eligible ist
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    
+    if not scores.eligible.any():
+        raise MatchmakingError("Kein Paar erfüllt die Hard-Constraints")
+    
+    explored = rng.random() < epsilon
+    if explored:
+        pair = int(rng.choice(np.flatnonzero(scores.eligible)))
+    else:
+        candidates = top_candidates(scores, k_candidates)
+        pair = _softmax_choice(candidates, scores.score[candidates], rng, temperature)
+    
+    selection = pair_selection(scores, pair, explored)
+    logger.info(
+        f"Paar gewählt: {selection.episode_a_id} vs {selection.episode_b_id} "
+        f"(Score {selection.score:.3f}{', Exploration' if explored else ''})"
+    )
+    return selection
+
+
+def pair_overlap(
+    scores: PairScores,
+    pairs: np.ndarray,
+    chosen: int,
+    overlap_scale: float = OVERLAP_SCALE
+) -> np.ndarray:
+    """
+    Informationsüberlappung von Paaren mit einem gewählten Paar (0..1).
+    
+    Zwei Paare überlappen, wenn sie denselben Bereich der Skala vergleichen:
+    die schwächeren und die stärkeren Episoden beider Paare liegen in theta
+    nahe beieinander. overlap = exp(-(|lo - lo_c| + |hi - hi_c|) / scale).
+    
+    Args:
+        scores: PairScores von score_pairs()
+        pairs: Paarindizes, für die die Überlappung berechnet wird
+        chosen: Paarindex des gewählten Paars
+        overlap_scale: Abstand in theta, bei dem die Überlappung auf 1/e fällt
+        
+    Returns:
+        Array mit Überlappung pro Paar in pairs
+    """
+    theta_rows = scores.theta[scores.rows[pairs]]
+    theta_cols = scores.theta[scores.cols[pairs]]
+    low = np.minimum(theta_rows, theta_cols)
+    high = np.maximum(theta_rows, theta_cols)
+    
+    chosen_rows = scores.theta[scores.rows[chosen]]
+    chosen_cols = scores.theta[scores.cols[chosen]]
+    distance = np.abs(low - min(chosen_rows, chosen_cols)) + np.abs(high - max(chosen_rows, chosen_cols))
+    return np.exp(-distance / overlap_scale)
+
+
+def select_round(
+    scores: PairScores,
+    n_polls: int,
+    rng: Optional[np.random.Generator] = None,
+    k_candidates: int = K_CANDIDATES,
+    temperature: float = TEMPERATURE,
+    epsilon: float = EPSILON,
+    overlap_weight: float = OVERLAP_WEIGHT,
+    overlap_scale: float = OVERLAP_SCALE
+) -> List[PairSelection]:
+    """
+    Wählt eine Runde gleichzeitiger Polls mit paarweise disjunkten Episoden.
+    
+    Greedy über die Slots der Runde: pro Slot dieselbe Auswahl wie
+    select_pair() (Softmax über Top-K, epsilon-greedy), aber nur unter Paaren
+    ohne bereits verplante Episode und mit Score abzüglich
+    overlap_weight * maximaler Überlappung mit den gewählten Paaren
+    (pair_overlap()). Gearbeitet wird auf einem Pool der
+    n_polls * k_candidates besten Paare; erst wenn dieser erschöpft ist,
+    auf allen eligible Paaren.
+    
+    Args:
+        scores: PairScores von score_pairs()
+        n_polls: Anzahl Polls der Runde
+        rng: Optional - Zufallsgenerator (default: np.random.default_rng())
+        k_candidates: Anzahl Kandidaten für die Softmax-Auswahl pro Slot
+        temperature: Softmax-Temperatur T
+        epsilon: Wahrscheinlichkeit für uniforme Auswahl pro Slot
+        overlap_weight: Gewicht des Überlappungs-Malus
+        overlap_scale: Skala der Überlappung in theta (siehe pair_overlap())
+        
+    Returns:
+        Liste von PairSelection (kürzer als n_polls, wenn nicht genügend
+        disjunkte eligible Paare existieren)
+        
+    Raises:
+        MatchmakingError: Wenn kein Paar eligible ist
+    """
+    if rng is None:
+        rng = np.random.default_rng()
+    
+    if not scores.eligible.any():
+        raise MatchmakingError("Kein Paar erfüllt die Hard-Constraints")
+    
+    used = np.zeros(len(scores.episode_ids), dtype=bool)
+    chosen: List[int] = []
+    selections: List[PairSelection] = []
+    pool = top_candidates(scores, n_polls * k_candidates)
+    penalty = np.zeros(len(pool))
+    
+    for _ in range(n_polls):
+        available = ~(used[scores.rows[pool]] | used[scores.cols[pool]])
+        if not available.any() and len(pool) < int(scores.eligible.sum()):
+            # Pool erschöpft: auf alle eligible Paare erweitern
+            pool = np.flatnonzero(scores.eligible)
+            penalty = np.zeros(len(pool))
+            for pair in chosen:
+                np.maximum(penalty, pair_overlap(scores, pool, pair, overlap_scale), out=penalty)
+            available = ~(used[scores.rows[pool]] | used[scores.cols[pool]])
+        if not available.any():
+            break
+        
+        explored = rng.random() < epsilon
+        if explored:
+            remaining = np.flatnonzero(scores.eligible & ~used[scores.rows] & ~used[scores.cols])
+            pair = int(rng.choice(remaining))
+        else:
+            candidates = pool[available]
+            adjusted = scores.score[candidates] - overlap_weight * penalty[available]
+            if len(candidates) > k_candidates:
+                top = np.argpartition(adjusted, len(candidates) - k_candidates)[len(candidates) - k_candidates:]
+                candidates, adjusted = candidates[top], adjusted[top]
+            pair = _softmax_choice(candidates, adjusted, rng, temperature)
+        
+        used[scores.rows[pair]] = True
+        used[scores.cols[pair]] = True
+        chosen.append(pair)
+        np.maximum(penalty, pair_overlap(scores, pool, pair, overlap_scale), out=penalty)
+        selections.append(pair_selection(scores, pair, explored))
+    
+    if len(selections) < n_polls:
+        logger.warning(f"Nur {len(selections)} von {n_polls} disjunkten Paaren verfügbar")
+    logger.info(
+        "Runde geplant: " + ", ".join(f"{sel.episode_a_id} vs {sel.episode_b_id}" for sel in selections)
+    )
+    return selections
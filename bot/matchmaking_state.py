@@ -0,0 +1,473 @@
+"""
+Matchmaking-State pro Episode (Sidecar zu polls.tsv)
+
+Dieses Modul führt den Zustand aus docs/matchmaking.md ("Daten / State")
+inkrementell:
+
+- n_total, n_calib, last_seen_poll_idx, activated pro Episode
+  (Arrays, Index = Episode-ID - 1)
+- frontier: die nächsten frontier_size nicht aktivierten Episoden
+  (chronologisch = nach Episode-ID)
+- poll_count: laufender Poll-Index
+
+Jeder finalisierte Poll wird in O(1) eingerechnet (apply_poll). Da der
+Kalibrierungsstatus von der Reihenfolge der Polls abhängt, werden Polls
+nach finalized_at verarbeitet. Der Zustand wird wie die anderen Sidecars mit
+Watermark als .npz neben polls.tsv gespeichert; das Matchmaking liest ihn
+direkt (build_matchmaking_input_from_state) statt polls.tsv erneut
+durchzugehen. rebuild_matchmaking_state() baut ihn zur Prüfung aus allen
+Polls neu auf (python -m bot rebuild-matchmaking-state).
+"""
+
+import io
+from pathlib import Path
+from typing import List, Dict, NamedTuple, Optional, Union, Mapping
+
+import numpy as np
+
+from bot.atomic_io import atomic_write_bytes
+from bot.logger import get_logger
+from bot.matchmaking import D_MIN, M_MIN, NEVER_SEEN, MatchmakingInput, build_matchmaking_input
+from bot.poll_statistics import (
+    combine_checksums, poll_arrays, poll_checksum, split_polls_at_watermark,
+    EMPTY_CHECKSUM, EMPTY_WATERMARK
+)
+from bot.tsv_repository import PollColumns
+
+logger = get_logger(__name__)
+
+
+# Bei inkompatiblen Änderungen am Sidecar-Format erhöhen
+MATCHMAKING_STATE_VERSION = 2
+
+# Seed-Pool (Episoden 1..K_SEED) und Frontier-Größe (docs/matchmaking.md)
+K_SEED = 8
+FRONTIER_SIZE = 4
+
+
+class MatchmakingStateError(Exception):
+    """Exception für Fehler beim Lesen oder Schreiben des Matchmaking-States"""
+    pass
+
+
+class MatchmakingState(NamedTuple):
+    """
+    Matchmaking-State pro Episode.
+    
+    Die Arrays sind über Episode-ID - 1 indiziert und können größer als
+    catalog_size sein (Kapazität). Sie werden von apply_poll() in place
+    aktualisiert.
+    
+    Attributes:
+        n_total: Anzahl Polls pro Episode
+        n_calib: Anzahl Kalibrierungs-Polls pro Episode
+        last_seen_poll_idx: Poll-Index des letzten Polls (NEVER_SEEN ohne Poll)
+        activated: Episode dauerhaft im Pool
+        frontier: Episode-IDs der Frontier (aufsteigend)
+        next_episode: Nächste Episode-ID, die für die Frontier geprüft wird
+        catalog_size: Größte bekannte Episode-ID des Katalogs
+        k_seed: Größe des Seed-Pools
+        frontier_size: Anzahl Frontier-Episoden
+        poll_count: Anzahl eingerechneter Polls (= nächster Poll-Index)
+        watermark: Neuester enthaltener finalized_at (Unix-Sekunden, UTC)
+        checksum: Prüfsumme der eingerechneten Polls (siehe poll_checksum())
+    """
+    n_total: np.ndarray
+    n_calib: np.ndarray
+    last_seen_poll_idx: np.ndarray
+    activated: np.ndarray
+    frontier: List[int]
+    next_episode: int
+    catalog_size: int
+    k_seed: int
+    frontier_size: int
+    poll_count: int
+    watermark: int
+    checksum: int
+
+
+def _grow(state: MatchmakingState, episode_id: int) -> MatchmakingState:
+    """Vergrößert die Arrays (verdoppelnd), sodass episode_id hineinpasst."""
+    capacity = len(state.n_total)
+    if episode_id <= capacity:
+        return state
+    
+    new_capacity = max(episode_id, 2 * capacity)
+
+    def grown(array: np.ndarray, fill) -> np.ndarray:
+        result = np.full(new_capacity, fill, dtype=array.dtype)
+        result[:capacity] = array
+        return result
+    
+    return state._replace(
+        n_total=grown(state.n_total, 0),
+        n_calib=grown(state.n_calib, 0),
+        last_seen_poll_idx=grown(state.last_seen_poll_idx, NEVER_SEEN),
+        activated=grown(state.activated, False)
+    )
+
+
+def _refill_frontier(state: MatchmakingState) -> MatchmakingState:
+    """Entfernt aktivierte Episoden aus der Frontier und rückt chronologisch nach."""
+    frontier = [ep_id for ep_id in state.frontier if not state.activated[ep_id - 1]]
+    next_episode = state.next_episode
+    while len(frontier) < state.frontier_size and next_episode <= state.catalog_size:
+        if not state.activated[next_episode - 1]:
+            frontier.append(next_episode)
+        next_episode += 1
+    return state._replace(frontier=frontier, next_episode=next_episode)
+
+
+def empty_matchmaking_state(
+    catalog_size: int = 0,
+    k_seed: int = K_SEED,
+    frontier_size: int = FRONTIER_SIZE
+) -> MatchmakingState:
+    """
+    Erzeugt den Anfangszustand (keine Polls, Seed-Pool aktiviert).
+    
+    Args:
+        catalog_size: Größte bekannte Episode-ID (mindestens k_seed)
+        k_seed: Größe des Seed-Pools (Episoden 1..k_seed)
+        frontier_size: Anzahl Frontier-Episoden
+        
+    Returns:
+        MatchmakingState
+    """
+    catalog_size = max(catalog_size, k_seed)
+    activated = np.zeros(catalog_size, dtype=bool)
+    activated[:k_seed] = True
+    state = MatchmakingState(
+        n_total=np.zeros(catalog_size, dtype=np.int64),
+        n_calib=np.zeros(catalog_size, dtype=np.int64),
+        last_seen_poll_idx=np.full(catalog_size, NEVER_SEEN, dtype=np.int64),
+        activated=activated,
+        frontier=[],
+        next_episode=k_seed + 1,
+        catalog_size=catalog_size,
+        k_seed=k_seed,
+        frontier_size=frontier_size,
+        poll_count=0,
+        watermark=EMPTY_WATERMARK,
+        checksum=EMPTY_CHECKSUM
+    )
+    return _refill_frontier(state)
+
+
+def set_catalog_size(state: MatchmakingState, catalog_size: int) -> MatchmakingState:
+    """
+    Erweitert den Katalog (neue Episoden erscheinen in der Frontier).
+    
+    Args:
+        state: Bisheriger Zustand
+        catalog_size: Größte bekannte Episode-ID
+        
+    Returns:
+        Zustand mit catalog_size >= dem übergebenen Wert
+    """
+    if catalog_size <= state.catalog_size:
+        return state
+    state = _grow(state, catalog_size)._replace(catalog_size=catalog_size)
+    return _refill_frontier(state)
+
+
+def apply_poll(state: MatchmakingState, episode_a: int, episode_b: int) -> MatchmakingState:
+    """
+    Rechnet einen finalisierten Poll ein (O(1), Arrays in place).
+    
+    Ein Poll ist ein Kalibrierungs-Poll für eine nicht calibrated Episode,
+    wenn die andere Episode vor dem Poll calibrated war oder zum Seed-Pool
+    gehört (Seed-Anchor; ohne Anker könnte anfangs keine Episode calibrated
+    werden). Beide Episoden werden aktiviert; die Frontier rückt bei Bedarf
+    nach.
+    
+    Args:
+        state: Bisheriger Zustand
+        episode_a, episode_b: Episode-IDs des Polls
+        
+    Returns:
+        Aktualisierter Zustand (neues Tupel, ggf. mit vergrößerten Arrays)
+    """
+    state = _grow(state, max(episode_a, episode_b))
+    if max(episode_a, episode_b) > state.catalog_size:
+        state = state._replace(catalog_size=max(episode_a, episode_b))
+    
+    a, b = episode_a - 1, episode_b - 1
+    n_total, n_calib = state.n_total, state.n_calib
+    calibrated_a = n_total[a] >= D_MIN and n_calib[a] >= M_MIN
+    calibrated_b = n_total[b] >= D_MIN and n_calib[b] >= M_MIN
+    if not calibrated_a and (calibrated_b or episode_b <= state.k_seed):
+        n_calib[a] += 1
+    if not calibrated_b and (calibrated_a or episode_a <= state.k_seed):
+        n_calib[b] += 1
+    
+    n_total[a] += 1
+    n_total[b] += 1
+    state.last_seen_poll_idx[a] = state.poll_count
+    state.last_seen_poll_idx[b] = state.poll_count
+    
+    newly_activated = not (state.activated[a] and state.activated[b])
+    state.activated[a] = True
+    state.activated[b] = True
+    
+    state = state._replace(poll_count=state.poll_count + 1)
+    if newly_activated or len(state.frontier) < state.frontier_size:
+        state = _refill_frontier(state)
+    return state
+
+
+def _add_arrays_to_state(
+    state: MatchmakingState,
+    episode_a: np.ndarray,
+    episode_b: np.ndarray,
+    votes_a: np.ndarray,
+    votes_b: np.ndarray,
+    finalized_at: np.ndarray
+) -> MatchmakingState:
+    """Rechnet Polls in Array-Form (siehe poll_arrays()) nach finalized_at geordnet ein (plus Watermark)."""
+    if len(episode_a) == 0:
+        return state
+    
+    order = np.argsort(finalized_at, kind='stable')
+    for a, b in zip(episode_a[order].tolist(), episode_b[order].tolist()):
+        state = apply_poll(state, a, b)
+    
+    return state._replace(
+        watermark=max(state.watermark, int(finalized_at.max())),
+        checksum=combine_checksums(
+            state.checksum, poll_checksum(episode_a, episode_b, votes_a, votes_b, finalized_at)
+        )
+    )
+
+
+def rebuild_matchmaking_state(
+    polls: Union[List[Dict], PollColumns],
+    catalog_size: int = 0,
+    k_seed: int = K_SEED,
+    frontier_size: int = FRONTIER_SIZE
+) -> MatchmakingState:
+    """
+    Baut den Zustand aus allen Polls neu auf.
+    
+    Args:
+        polls: Alle finalisierten Polls von filter_and_parse_polls()
+            oder filter_poll_columns()
+        catalog_size: Größte bekannte Episode-ID
+        k_seed: Größe des Seed-Pools
+        frontier_size: Anzahl Frontier-Episoden
+        
+    Returns:
+        MatchmakingState
+    """
+    state = empty_matchmaking_state(catalog_size, k_seed, frontier_size)
+    return _add_arrays_to_state(state, *poll_arrays(polls))
+
+
+def update_matchmaking_state(
+    state: MatchmakingState,
+    polls: Union[List[Dict], PollColumns]
+) -> MatchmakingState:
+    """
+    Bringt den Zustand auf den Stand der übergebenen Polls.
+    
+    Eingerechnet werden nur Polls mit finalized_at nach dem Watermark.
+    Stimmen Anzahl (poll_count) oder Prüfsumme der Polls bis zum Watermark
+    nicht überein, wird der Zustand vollständig neu aufgebaut (Kalibrierung
+    hängt von der Reihenfolge ab und lässt sich nicht zurückrechnen).
+    
+    Args:
+        state: Bisheriger Zustand (z.B. von load_matchmaking_state())
+        polls: Alle finalisierten Polls von filter_and_parse_polls()
+            oder filter_poll_columns()
+            
+    Returns:
+        Aktualisierter MatchmakingState
+    """
+    arrays = poll_arrays(polls)
+    delta = split_polls_at_watermark(arrays, state.watermark, state.poll_count, state.checksum)
+    
+    if not delta.consistent:
+        logger.warning(
+            f"Matchmaking-State inkonsistent ({state.poll_count} Polls gespeichert, "
+            f"{delta.n_known} bis zum Watermark gefunden oder Prüfsumme abweichend) - baue neu auf"
+        )
+        empty = empty_matchmaking_state(state.catalog_size, state.k_seed, state.frontier_size)
+        return _add_arrays_to_state(empty, *arrays)
+    
+    logger.info(f"Matchmaking-State: {int(delta.new.sum())} neue Polls eingerechnet")
+    return _add_arrays_to_state(state, *(array[delta.new] for array in arrays))
+
+
+def active_episode_ids(state: MatchmakingState) -> np.ndarray:
+    """
+    Active Set = activated ∪ frontier (sortierte Episode-IDs).
+    
+    Args:
+        state: MatchmakingState
+        
+    Returns:
+        Array der Episode-IDs
+    """
+    activated = np.flatnonzero(state.activated[:state.catalog_size]) + 1
+    return np.union1d(activated, np.array(state.frontier, dtype=np.int64))
+
+
+def build_matchmaking_input_from_state(
+    state: MatchmakingState,
+    rating_rows: List[Dict],
+    sd_theta: Optional[Mapping[int, float]] = None,
+    component_id: Optional[Mapping[int, int]] = None
+) -> MatchmakingInput:
+    """
+    Baut die Matchmaking-Arrays des Active Sets direkt aus dem State.
+    
+    Args:
+        state: MatchmakingState
+        rating_rows: Ergebnis von compute_ratings_from_polls() (episode_id, utility);
+            Episoden ohne Rating erhalten theta = 0
+        sd_theta: Optional - Dict[episode_id, sd_theta] aus dem Bootstrap
+        component_id: Optional - Dict[episode_id, Komponente] (Connectivity-Phase)
+        
+    Returns:
+        MatchmakingInput
+    """
+    episode_ids = active_episode_ids(state)
+    positions = episode_ids - 1
+
+    def by_episode(array: np.ndarray) -> Dict[int, int]:
+        return dict(zip(episode_ids.tolist(), array[positions].tolist()))
+    
+    return build_matchmaking_input(
+        episode_ids.tolist(),
+        rating_rows,
+        by_episode(state.n_total),
+        by_episode(state.n_calib),
+        by_episode(state.last_seen_poll_idx),
+        state.poll_count,
+        sd_theta=sd_theta,
+        component_id=component_id
+    )
+
+
+def diff_matchmaking_states(left: MatchmakingState, right: MatchmakingState) -> List[str]:
+    """
+    Vergleicht zwei Zustände (unabhängig von der Array-Kapazität).
+    
+    Args:
+        left, right: Zu vergleichende Zustände
+        
+    Returns:
+        Namen der abweichenden Felder (leer bei Gleichheit)
+    """
+    differences = []
+    size = max(left.catalog_size, right.catalog_size)
+    defaults = {'n_total': 0, 'n_calib': 0, 'last_seen_poll_idx': NEVER_SEEN, 'activated': False}
+    for name, fill in defaults.items():
+        arrays = []
+        for state in (left, right):
+            array = np.full(size, fill, dtype=getattr(state, name).dtype)
+            used = min(size, len(getattr(state, name)))
+            array[:used] = getattr(state, name)[:used]
+            arrays.append(array)
+        if not np.array_equal(*arrays):
+            differences.append(name)
+    
+    for name in ('frontier', 'next_episode', 'catalog_size', 'k_seed', 'frontier_size',
+                 'poll_count', 'watermark', 'checksum'):
+        if getattr(left, name) != getattr(right, name):
+            differences.append(name)
+    return differences
+
+
+def default_matchmaking_state_path(polls_path: Path) -> Path:
+    """
+    Standardpfad des Sidecars neben polls.tsv (data/.cache/).
+    
+    Args:
+        polls_path: Pfad zu polls.tsv
+        
+    Returns:
+        Pfad zur Sidecar-Datei
+    """
+    return polls_path.parent / '.cache' / f"{polls_path.stem}_matchmaking.npz"
+
+
+def load_matchmaking_state(file_path: Path) -> Optional[MatchmakingState]:
+    """
+    Lädt den Matchmaking-State.
+    
+    Ein fehlender, unlesbarer oder veralteter Checkpoint ergibt None; der
+    Aufrufer baut den Zustand dann mit rebuild_matchmaking_state() neu auf.
+    
+    Args:
+        file_path: Pfad zur Sidecar-Datei
+        
+    Returns:
+        MatchmakingState oder None
+    """
+    if not file_path.exists():
+        return None
+    
+    try:
+        with np.load(file_path) as data:
+            if int(data['version']) != MATCHMAKING_STATE_VERSION:
+                logger.warning(f"Matchmaking-State {file_path} hat veraltete Version - wird ignoriert")
+                return None
+            return MatchmakingState(
+                n_total=data['n_total'],
+                n_calib=data['n_calib'],
+                last_seen_poll_idx=data['last_seen_poll_idx'],
+                activated=data['activated'],
+                frontier=data['frontier'].tolist(),
+                next_episode=int(data['next_episode']),
+                catalog_size=int(data['catalog_size']),
+                k_seed=int(data['k_seed']),
+                frontier_size=int(data['frontier_size']),
+                poll_count=int(data['poll_count']),
+                watermark=int(data['watermark']),
+                checksum=int(data['checksum'])
+            )
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Matchmaking-State {file_path} nicht lesbar, wird ignoriert: {e}")
+        return None
+
+
+def save_matchmaking_state(file_path: Path, state: MatchmakingState) -> None:
+    """
+    Speichert den Matchmaking-State atomar (Checkpoint).
+    
+    Args:
+        file_path: Pfad zur Sidecar-Datei
+        state: Zu speichernder Zustand
+        
+    Raises:
+        MatchmakingStateError: Wenn die Datei nicht geschrieben werden kann
+    """
+    size = state.catalog_size
+    buffer = io.BytesIO()
+    np.savez(
+        buffer,
+        version=np.int64(MATCHMAKING_STATE_VERSION),
+        n_total=state.n_total[:size],
+        n_calib=state.n_calib[:size],
+        last_seen_poll_idx=state.last_seen_poll_idx[:size],
+        activated=state.activated[:size],
+        frontier=np.array(state.frontier, dtype=np.int64),
+        next_episode=np.int64(state.next_episode),
+        catalog_size=np.int64(state.catalog_size),
+        k_seed=np.int64(state.k_seed),
+        frontier_size=np.int64(state.frontier_size),
+        poll_count=np.int64(state.poll_count),
+        watermark=np.int64(state.watermark),
+        checksum=np.uint64(state.checksum)
+    )
+    
+    try:
+        atomic_write_bytes(file_path, buffer.getvalue())
+    except OSError as e:
+        raise MatchmakingStateError(f"Fehler beim Schreiben des Matchmaking-States {file_path}: {e}")
+    
+    logger.debug(
+        f"Matchmaking-State geschrieben: {file_path} "
+        f"({state.poll_count} Polls, {int(state.activated.sum())} aktivierte Episoden)"
+    )
@@ -0,0 +1,532 @@
+"""
+Online-Updates der Ratings zwischen vollständigen Refits (Sidecar zu polls.tsv)
+
+Nach jedem geschlossenen Poll soll das Leaderboard innerhalb von Sekunden
+aktualisiert werden; ein vollständiger Fit (compute_ratings_from_polls) ist
+dafür unnötig teuer. Dieses Modul hält deshalb den letzten Fit als Zustand
+(theta, Binomial-Counts pro Paar, Matches) und rechnet neue Polls lokal ein:
+
+1. Stimmen des Polls zu den Counts des Paars addieren
+2. wenige Newton-Schritte nur auf den beiden Episoden des Polls und ihren
+   Nachbarn im Vergleichsgraph; alle anderen theta bleiben fest
+
+Ein geplanter vollständiger Refit (refit_online_ratings) gleicht die Drift
+aus und misst dabei die Abweichung der Online-Werte vom exakten Fit
+(maximale Differenz von log(utility)); letzte und größte Abweichung werden
+im Zustand geführt. Der Zustand wird wie die anderen Sidecars mit Watermark
+als .npz neben polls.tsv gespeichert.
+
+Nur für das statische Modell (ohne half_life_days). Polls außerhalb der
+Komponente mit Episode 1 übernimmt erst der nächste Refit.
+"""
+
+import io
+from datetime import datetime
+from pathlib import Path
+from typing import List, Dict, NamedTuple, Optional, Union
+
+import numpy as np
+import scipy.linalg
+
+from bot.atomic_io import atomic_write_bytes
+from bot.bradley_terry import (
+    build_initial_theta, build_model_input, fit_bradley_terry_model, normalize_utilities,
+    polls_to_arrays, DEFAULT_ALPHA, DEFAULT_TOL
+)
+from bot.bt_solvers import PairwiseCounts, log_posterior
+from bot.logger import get_logger
+from bot.poll_statistics import (
+    combine_checksums, poll_arrays, poll_checksum, split_polls_at_watermark,
+    EMPTY_CHECKSUM, EMPTY_WATERMARK
+)
+from bot.tsv_repository import PollColumns
+
+logger = get_logger(__name__)
+
+
+# Bei inkompatiblen Änderungen am Sidecar-Format erhöhen
+ONLINE_RATING_VERSION = 2
+
+# Newton-Schritte pro Online-Update und Abbruch bei kleiner Änderung
+ONLINE_NEWTON_STEPS = 3
+ONLINE_TOL = 1e-8
+
+# Nach so vielen Online-Updates seit dem letzten Refit wird neu gefittet
+MAX_ONLINE_POLLS = 50
+
+
+class OnlineRatingError(Exception):
+    """Exception für Fehler beim Lesen oder Schreiben des Online-Rating-States"""
+    pass
+
+
+class OnlineRatingState(NamedTuple):
+    """
+    Zustand der Online-Ratings (letzter Refit plus Online-Updates).
+    
+    Modell-Indizes sind Positionen in episode_ids: nach einem Refit sortiert,
+    online neu verbundene Episoden werden hinten angehängt.
+    
+    Attributes:
+        episode_ids: Episode-IDs im Modell (Index = Modell-Index)
+        theta: log(utility) pro Episode (Skala mean(exp(theta)) = 1 am Optimum)
+        counts: Binomial-Counts pro Paar über Modell-Indizes
+        matches: Anzahl Polls pro Episode
+        n_polls: Anzahl eingerechneter finalisierter Polls (inkl. nicht verbundener)
+        watermark: Neuester enthaltener finalized_at (Unix-Sekunden, UTC)
+        checksum: Prüfsumme der eingerechneten Polls (siehe poll_checksum())
+        n_online: Online eingerechnete Polls seit dem letzten Refit
+        last_deviation: Abweichung vom exakten Fit beim letzten Refit
+        max_deviation: Größte beim Refit gemessene Abweichung
+    """
+    episode_ids: np.ndarray
+    theta: np.ndarray
+    counts: PairwiseCounts
+    matches: np.ndarray
+    n_polls: int
+    watermark: int
+    checksum: int
+    n_online: int
+    last_deviation: float
+    max_deviation: float
+
+
+def empty_online_rating_state() -> OnlineRatingState:
+    """
+    Erzeugt einen leeren Zustand (noch kein Refit).
+    
+    Returns:
+        Leerer OnlineRatingState
+    """
+    return OnlineRatingState(
+        episode_ids=np.empty(0, dtype=np.int64),
+        theta=np.empty(0, dtype=np.float64),
+        counts=PairwiseCounts(
+            idx_a=np.empty(0, dtype=np.int64),
+            idx_b=np.empty(0, dtype=np.int64),
+            wins_a=np.empty(0, dtype=np.float64),
+            wins_b=np.empty(0, dtype=np.float64)
+        ),
+        matches=np.empty(0, dtype=np.int64),
+        n_polls=0,
+        watermark=EMPTY_WATERMARK,
+        checksum=EMPTY_CHECKSUM,
+        n_online=0,
+        last_deviation=0.0,
+        max_deviation=0.0
+    )
+
+
+def local_newton_update(
+    theta: np.ndarray,
+    counts: PairwiseCounts,
+    local: np.ndarray,
+    alpha: float = DEFAULT_ALPHA,
+    max_steps: int = ONLINE_NEWTON_STEPS,
+    tol: float = ONLINE_TOL
+) -> np.ndarray:
+    """
+    Newton-Schritte auf einer Teilmenge der Episoden, alle anderen fest.
+    
+    Maximiert dieselbe Zielfunktion wie bot.bt_solvers, eingeschränkt auf
+    theta[local]. Beteiligt sind nur Paare mit mindestens einer Episode aus
+    local; das System hat die Größe len(local).
+    
+    Args:
+        theta: log-Stärken aller Episoden (n_items,)
+        counts: Binomial-Counts pro Paar
+        local: Modell-Indizes der zu aktualisierenden Episoden (eindeutig)
+        alpha: Regularisierungsstärke (> 0)
+        max_steps: Maximale Anzahl Newton-Schritte
+        tol: Abbruch, wenn sich kein theta um mehr als tol ändert
+        
+    Returns:
+        Aktualisiertes theta (Kopie)
+    """
+    theta = theta.copy()
+    n_local = len(local)
+    position = np.full(len(theta), -1, dtype=np.int64)
+    position[local] = np.arange(n_local)
+    
+    touching = (position[counts.idx_a] >= 0) | (position[counts.idx_b] >= 0)
+    sub = PairwiseCounts(*(column[touching] for column in counts))
+    pos_a, pos_b = position[sub.idx_a], position[sub.idx_b]
+    in_a, in_b = pos_a >= 0, pos_b >= 0
+    both = in_a & in_b
+    totals = sub.wins_a + sub.wins_b
+    objective = log_posterior(theta, sub, alpha)
+    
+    for _ in range(max_steps):
+        p = 0.5 * (1.0 + np.tanh(0.5 * (theta[sub.idx_a] - theta[sub.idx_b])))
+        pi = np.exp(theta[local])
+        gradient = (np.bincount(pos_a[in_a], weights=(sub.wins_a - totals * p)[in_a], minlength=n_local)
+                    + np.bincount(pos_b[in_b], weights=(sub.wins_b - totals * (1.0 - p))[in_b], minlength=n_local)
+                    + alpha * (1.0 - pi))
+        
+        edge_weights = totals * p * (1.0 - p)
+        matrix = np.zeros((n_local, n_local))
+        matrix[np.diag_indices(n_local)] = (
+            np.bincount(pos_a[in_a], weights=edge_weights[in_a], minlength=n_local)
+            + np.bincount(pos_b[in_b], weights=edge_weights[in_b], minlength=n_local)
+            + alpha * pi
+        )
+        np.add.at(matrix, (pos_a[both], pos_b[both]), -edge_weights[both])
+        np.add.at(matrix, (pos_b[both], pos_a[both]), -edge_weights[both])
+        delta = scipy.linalg.solve(matrix, gradient, assume_a='pos')
+        
+        # Gedämpft wie solve_newton(), falls die Zielfunktion sinkt
+        step = 1.0
+        while True:
+            candidate = theta.copy()
+            candidate[local] += step * delta
+            candidate_objective = log_posterior(candidate, sub, alpha)
+            if candidate_objective >= objective - 1e-12 * abs(objective) or step < 1e-8:
+                break
+            step *= 0.5
+        
+        theta, objective = candidate, candidate_objective
+        if np.max(np.abs(step * delta)) <= tol:
+            break
+    
+    return theta
+
+
+def apply_online_poll(
+    state: OnlineRatingState,
+    episode_a: int,
+    episode_b: int,
+    votes_a: float,
+    votes_b: float
+) -> OnlineRatingState:
+    """
+    Rechnet einen finalisierten Poll online ein.
+    
+    Die Stimmen werden zu den Counts des Paars addiert; danach folgen
+    local_newton_update() auf den beiden Episoden und ihren Nachbarn. Eine
+    bisher unbekannte Episode, die gegen eine Episode im Modell antritt,
+    startet wie beim Warm-Start mit theta = 0. Polls ohne Episode im Modell
+    werden übersprungen (der nächste Refit übernimmt sie).
+    
+    Args:
+        state: Bisheriger Zustand (mit mindestens einem Refit)
+        episode_a, episode_b: Episode-IDs des Polls
+        votes_a, votes_b: Stimmen des Polls
+        
+    Returns:
+        Aktualisierter Zustand (ohne Watermark/n_polls, siehe update_online_ratings())
+    """
+    episode_ids, theta, counts, matches = state.episode_ids, state.theta, state.counts, state.matches
+    found = [np.flatnonzero(episode_ids == episode_id) for episode_id in (episode_a, episode_b)]
+    if not len(found[0]) and not len(found[1]):
+        logger.debug(f"Poll {episode_a} vs {episode_b} nicht mit Episode 1 verbunden - bis zum Refit übersprungen")
+        return state
+    
+    indices = []
+    for episode_id, index in zip((episode_a, episode_b), found):
+        if len(index):
+            indices.append(int(index[0]))
+            continue
+        indices.append(len(episode_ids))
+        episode_ids = np.append(episode_ids, episode_id)
+        theta = np.append(theta, 0.0)
+        matches = np.append(matches, 0)
+    
+    index_a, index_b = indices
+    if index_a > index_b:
+        index_a, index_b, votes_a, votes_b = index_b, index_a, votes_b, votes_a
+    
+    pair = np.flatnonzero((counts.idx_a == index_a) & (counts.idx_b == index_b))
+    if len(pair):
+        wins_a, wins_b = counts.wins_a.copy(), counts.wins_b.copy()
+        wins_a[pair[0]] += votes_a
+        wins_b[pair[0]] += votes_b
+        counts = counts._replace(wins_a=wins_a, wins_b=wins_b)
+    else:
+        counts = PairwiseCounts(
+            idx_a=np.append(counts.idx_a, index_a),
+            idx_b=np.append(counts.idx_b, index_b),
+            wins_a=np.append(counts.wins_a, float(votes_a)),
+            wins_b=np.append(counts.wins_b, float(votes_b))
+        )
+    matches = matches.copy()
+    matches[[index_a, index_b]] += 1
+    
+    # Betroffene Episoden: beide Seiten des Polls und ihre Nachbarn
+    touched = np.isin(counts.idx_a, indices) | np.isin(counts.idx_b, indices)
+    local = np.unique(np.concatenate([counts.idx_a[touched], counts.idx_b[touched]]))
+    theta = local_newton_update(theta, counts, local)
+    
+    return state._replace(
+        episode_ids=episode_ids, theta=theta, counts=counts, matches=matches,
+        n_online=state.n_online + 1
+    )
+
+
+def online_deviation(
+    online_ids: np.ndarray,
+    online_theta: np.ndarray,
+    exact_ids: np.ndarray,
+    exact_theta: np.ndarray
+) -> float:
+    """
+    Maximale Abweichung der Online-Werte vom exakten Fit.
+    
+    Verglichen wird log(utility) auf den gemeinsamen Episoden, beide Seiten
+    über diese Episoden auf mean(utility) = 1 normiert.
+    
+    Args:
+        online_ids, online_theta: Episode-IDs und theta des Online-Zustands
+        exact_ids, exact_theta: Episode-IDs und theta des exakten Fits
+        
+    Returns:
+        max |log(utility_online) - log(utility_exact)| (0.0 ohne gemeinsame Episoden)
+    """
+    common, online_index, exact_index = np.intersect1d(online_ids, exact_ids, return_indices=True)
+    if len(common) == 0:
+        return 0.0
+    online = np.log(normalize_utilities(online_theta[online_index]))
+    exact = np.log(normalize_utilities(exact_theta[exact_index]))
+    return float(np.max(np.abs(online - exact)))
+
+
+def refit_online_ratings(
+    state: Optional[OnlineRatingState],
+    polls: Union[List[Dict], PollColumns]
+) -> OnlineRatingState:
+    """
+    Vollständiger Refit: gleicht die Drift der Online-Updates aus.
+    
+    Fittet alle Polls (Komponente mit Episode 1, warm gestartet mit den
+    Online-Werten) und misst vorher die Abweichung der Online-Werte vom
+    exakten Ergebnis (online_deviation()).
+    
+    Args:
+        state: Bisheriger Zustand oder None
+        polls: Alle finalisierten Polls von filter_and_parse_polls()
+            oder filter_poll_columns()
+            
+    Returns:
+        Neuer Zustand (n_online = 0)
+        
+    Raises:
+        BradleyTerryError: Wenn das Modell nicht gefittet werden kann
+    """
+    if state is None:
+        state = empty_online_rating_state()
+    
+    episode_a, episode_b, votes_a, votes_b, n_polls = polls_to_arrays(polls)
+    arrays = poll_arrays(polls)
+    if len(episode_a) == 0:
+        return empty_online_rating_state()
+    
+    model_input = build_model_input(episode_a, episode_b, votes_a, votes_b, n_polls)
+    initial_theta = dict(zip(state.episode_ids.tolist(), state.theta.tolist()))
+    theta = fit_bradley_terry_model(
+        data=model_input.counts,
+        n_items=len(model_input.episode_ids),
+        alpha=DEFAULT_ALPHA,
+        tol=DEFAULT_TOL,
+        initial_theta=(
+            build_initial_theta(initial_theta, model_input.episode_ids.tolist())
+            if initial_theta else None
+        )
+    )
+    theta = np.log(normalize_utilities(theta))
+    
+    deviation = state.last_deviation
+    if state.n_online:
+        deviation = online_deviation(state.episode_ids, state.theta, model_input.episode_ids, theta)
+        logger.info(
+            f"Online-Ratings: Abweichung vom exakten Fit nach {state.n_online} "
+            f"Online-Updates: {deviation:.2e} (max. bisher {max(deviation, state.max_deviation):.2e})"
+        )
+    
+    return OnlineRatingState(
+        episode_ids=model_input.episode_ids,
+        theta=theta,
+        counts=model_input.counts,
+        matches=model_input.matches,
+        n_polls=int(n_polls.sum()),
+        watermark=int(arrays[4].max()),
+        checksum=poll_checksum(*arrays),
+        n_online=0,
+        last_deviation=deviation,
+        max_deviation=max(deviation, state.max_deviation)
+    )
+
+
+def update_online_ratings(
+    state: Optional[OnlineRatingState],
+    polls: Union[List[Dict], PollColumns],
+    max_online_polls: int = MAX_ONLINE_POLLS
+) -> OnlineRatingState:
+    """
+    Bringt die Online-Ratings auf den Stand der übergebenen Polls.
+    
+    Polls mit finalized_at nach dem Watermark werden in Zeitreihenfolge mit
+    apply_online_poll() eingerechnet. Ein vollständiger Refit erfolgt statt
+    dessen, wenn noch kein Zustand existiert, Anzahl oder Prüfsumme der
+    Polls bis zum Watermark nicht passen oder seit dem letzten Refit mehr als
+    max_online_polls Polls online eingerechnet würden.
+    
+    Args:
+        state: Bisheriger Zustand (z.B. von load_online_rating_state()) oder None
+        polls: Alle finalisierten Polls von filter_and_parse_polls()
+            oder filter_poll_columns()
+        max_online_polls: Höchstzahl Online-Updates zwischen zwei Refits
+        
+    Returns:
+        Aktualisierter OnlineRatingState
+        
+    Raises:
+        BradleyTerryError: Wenn ein nötiger Refit fehlschlägt
+    """
+    arrays = poll_arrays(polls)
+    episode_a, episode_b, votes_a, votes_b, finalized_at = arrays
+    if state is None or len(state.episode_ids) == 0:
+        return refit_online_ratings(state, polls)
+    
+    delta = split_polls_at_watermark(arrays, state.watermark, state.n_polls, state.checksum)
+    new = delta.new
+    n_new = int(new.sum())
+    if not delta.consistent:
+        logger.warning(
+            f"Online-Ratings inkonsistent ({state.n_polls} Polls gespeichert, "
+            f"{delta.n_known} bis zum Watermark gefunden oder Prüfsumme abweichend) - Refit"
+        )
+        return refit_online_ratings(state, polls)
+    if state.n_online + n_new > max_online_polls:
+        logger.info(f"Online-Ratings: {state.n_online + n_new} Polls seit dem letzten Refit - Refit")
+        return refit_online_ratings(state, polls)
+    if n_new == 0:
+        return state
+    
+    order = np.flatnonzero(new)[np.argsort(finalized_at[new], kind='stable')]
+    for k in order.tolist():
+        state = apply_online_poll(state, int(episode_a[k]), int(episode_b[k]), votes_a[k], votes_b[k])
+    
+    logger.info(f"Online-Ratings: {n_new} neue Polls lokal eingerechnet ({state.n_online} seit dem Refit)")
+    return state._replace(
+        n_polls=state.n_polls + n_new,
+        watermark=int(finalized_at[new].max()),
+        checksum=combine_checksums(state.checksum, poll_checksum(*(array[new] for array in arrays)))
+    )
+
+
+def online_rating_rows(state: OnlineRatingState, calculated_at: datetime) -> List[Dict]:
+    """
+    Rating-Rows aus dem Online-Zustand (Format wie compute_ratings_from_polls).
+    
+    Args:
+        state: OnlineRatingState
+        calculated_at: UTC-Zeitpunkt des Snapshots
+        
+    Returns:
+        Liste von Rating-Dictionaries (episode_id, utility, matches,
+        calculated_at), sortiert nach episode_id
+    """
+    utilities = normalize_utilities(state.theta)
+    order = np.argsort(state.episode_ids)
+    return [
+        {
+            'episode_id': int(state.episode_ids[k]),
+            'utility': float(utilities[k]),
+            'matches': int(state.matches[k]),
+            'calculated_at': calculated_at
+        }
+        for k in order
+    ]
+
+
+def default_online_rating_path(polls_path: Path) -> Path:
+    """
+    Standardpfad des Sidecars neben polls.tsv (data/.cache/).
+    
+    Args:
+        polls_path: Pfad zu polls.tsv
+        
+    Returns:
+        Pfad zur Sidecar-Datei
+    """
+    return polls_path.parent / '.cache' / f"{polls_path.stem}_online.npz"
+
+
+def load_online_rating_state(file_path: Path) -> Optional[OnlineRatingState]:
+    """
+    Lädt den Online-Rating-State.
+    
+    Ein fehlender, unlesbarer oder veralteter Zustand ergibt None; der
+    Aufrufer fittet dann neu (update_online_ratings() mit None).
+    
+    Args:
+        file_path: Pfad zur Sidecar-Datei
+        
+    Returns:
+        OnlineRatingState oder None
+    """
+    if not file_path.exists():
+        return None
+    
+    try:
+        with np.load(file_path) as data:
+            if int(data['version']) != ONLINE_RATING_VERSION:
+                logger.warning(f"Online-Rating-State {file_path} hat veraltete Version - wird ignoriert")
+                return None
+            return OnlineRatingState(
+                episode_ids=data['episode_ids'],
+                theta=data['theta'],
+                counts=PairwiseCounts(
+                    idx_a=data['idx_a'],
+                    idx_b=data['idx_b'],
+                    wins_a=data['wins_a'],
+                    wins_b=data['wins_b']
+                ),
+                matches=data['matches'],
+                n_polls=int(data['n_polls']),
+                watermark=int(data['watermark']),
+                checksum=int(data['checksum']),
+                n_online=int(data['n_online']),
+                last_deviation=float(data['last_deviation']),
+                max_deviation=float(data['max_deviation'])
+            )
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Online-Rating-State {file_path} nicht lesbar, wird ignoriert: {e}")
+        return None
+
+
+def save_online_rating_state(file_path: Path, state: OnlineRatingState) -> None:
+    """
+    Speichert den Online-Rating-State atomar.
+    
+    Args:
+        file_path: Pfad zur Sidecar-Datei
+        state: Zu speichernder Zustand
+        
+    Raises:
+        OnlineRatingError: Wenn die Datei nicht geschrieben werden kann
+    """
+    buffer = io.BytesIO()
+    np.savez(
+        buffer,
+        version=np.int64(ONLINE_RATING_VERSION),
+        episode_ids=state.episode_ids,
+        theta=state.theta,
+        idx_a=state.counts.idx_a,
+        idx_b=state.counts.idx_b,
+        wins_a=state.counts.wins_a,
+        wins_b=state.counts.wins_b,
+        matches=state.matches,
+        n_polls=np.int64(state.n_polls),
+        watermark=np.int64(state.watermark),
+        checksum=np.uint64(state.checksum),
+        n_online=np.int64(state.n_online),
+        last_deviation=np.float64(state.last_deviation),
+        max_deviation=np.float64(state.max_deviation)
+    )
+    
+    try:
+        atomic_write_bytes(file_path, buffer.getvalue())
+    except OSError as e:
+        raise OnlineRatingError(f"Fehler beim Schreiben des Online-Rating-States {file_path}: {e}")
+    
+    logger.debug(f"Online-Rating-State geschrieben: {file_path} ({state.n_polls} Polls)")
@@ -0,0 +1,496 @@
+"""
+Suffiziente Statistiken der Polls (Sidecar zu polls.tsv)
+
+Das Bradley-Terry-Modell braucht nur aggregierte Stimmen pro Episodenpaar
+und die Anzahl der Polls pro Paar (daraus folgen die Matches pro Episode).
+Dieses Modul hält diese Aggregate kompakt als NumPy-Arrays, zusammen mit
+einem Watermark (neuester enthaltener finalized_at), und speichert sie als
+binäre Sidecar-Datei (.npz) neben polls.tsv.
+
+Neue finalisierte Polls werden inkrementell eingerechnet; der Aufwand hängt
+von der Anzahl neuer Polls und bestehender Paare ab, nicht von der Historie.
+Ob die Polls bis zum Watermark noch dem Sidecar entsprechen, prüft eine
+additive Prüfsumme über die Poll-Zeilen (split_polls_at_watermark(), auch
+von den übrigen Sidecars verwendet) - ein vektorisierter Durchlauf über die
+bekannten Polls statt eines Neuaufbaus.
+"""
+
+import io
+from pathlib import Path
+from typing import List, Dict, NamedTuple, Tuple, Union
+
+import numpy as np
+
+from bot.atomic_io import atomic_write_bytes
+from bot.logger import get_logger
+from bot.tsv_repository import PollColumns
+
+logger = get_logger(__name__)
+
+
+# Bei inkompatiblen Änderungen am Sidecar-Format erhöhen
+STATISTICS_VERSION = 2
+
+# Watermark eines leeren Sidecars (vor jedem finalized_at)
+EMPTY_WATERMARK = -1
+
+# Prüfsumme eines leeren Sidecars (keine Polls)
+EMPTY_CHECKSUM = 0
+
+# Konstanten des 64-Bit-Mixers (splitmix64) für die Poll-Prüfsumme
+_MIX_MULTIPLIERS = (0xBF58476D1CE4E5B9, 0x94D049BB133111EB)
+_FIELD_MULTIPLIERS = (
+    0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F, 0x165667B19E3779F9,
+    0xD6E8FEB86659FD93, 0xFF51AFD7ED558CCD
+)
+
+
+class PollStatisticsError(Exception):
+    """Exception für Fehler beim Lesen oder Schreiben des Statistik-Sidecars"""
+    pass
+
+
+class PollStatistics(NamedTuple):
+    """
+    Aggregierte Poll-Daten pro ungeordnetem Episodenpaar.
+    
+    Paare sind über Episode-IDs (nicht Modell-Indizes) gespeichert, mit
+    episode_a < episode_b, und jedes Paar kommt genau einmal vor.
+    
+    Attributes:
+        episode_a: Kleinere Episode-ID des Paars (int64)
+        episode_b: Größere Episode-ID des Paars (int64)
+        wins_a: Summe der Stimmen für episode_a (float64)
+        wins_b: Summe der Stimmen für episode_b (float64)
+        pair_polls: Anzahl der Polls pro Paar (int64)
+        watermark: Neuester enthaltener finalized_at (Unix-Sekunden, UTC)
+        n_polls: Anzahl der enthaltenen Polls
+        checksum: Prüfsumme der enthaltenen Polls (siehe poll_checksum())
+    """
+    episode_a: np.ndarray
+    episode_b: np.ndarray
+    wins_a: np.ndarray
+    wins_b: np.ndarray
+    pair_polls: np.ndarray
+    watermark: int
+    n_polls: int
+    checksum: int
+
+
+class PollDelta(NamedTuple):
+    """
+    Abgleich der Polls mit dem Stand eines Sidecars (split_polls_at_watermark()).
+    
+    Attributes:
+        new: Maske der Polls mit finalized_at nach dem Watermark
+        consistent: Anzahl und Prüfsumme der Polls bis zum Watermark
+            entsprechen dem Sidecar
+        n_known: Anzahl der Polls bis zum Watermark
+        checksum: Prüfsumme aller übergebenen Polls (Stand nach dem Update)
+    """
+    new: np.ndarray
+    consistent: bool
+    n_known: int
+    checksum: int
+
+
+def empty_poll_statistics() -> PollStatistics:
+    """
+    Erzeugt leere Statistiken (keine Polls, Watermark vor allen Polls).
+    
+    Returns:
+        Leere PollStatistics
+    """
+    return PollStatistics(
+        episode_a=np.empty(0, dtype=np.int64),
+        episode_b=np.empty(0, dtype=np.int64),
+        wins_a=np.empty(0, dtype=np.float64),
+        wins_b=np.empty(0, dtype=np.float64),
+        pair_polls=np.empty(0, dtype=np.int64),
+        watermark=EMPTY_WATERMARK,
+        n_polls=0,
+        checksum=EMPTY_CHECKSUM
+    )
+
+
+def merge_pair_arrays(
+    episode_a: np.ndarray,
+    episode_b: np.ndarray,
+    wins_a: np.ndarray,
+    wins_b: np.ndarray,
+    pair_polls: np.ndarray
+):
+    """
+    Fasst Einträge desselben ungeordneten Paars zusammen.
+    
+    Args:
+        episode_a, episode_b: Episode-IDs pro Eintrag (beliebige Orientierung)
+        wins_a, wins_b: Stimmen pro Eintrag
+        pair_polls: Anzahl Polls pro Eintrag
+        
+    Returns:
+        Tuple (episode_a, episode_b, wins_a, wins_b, pair_polls) mit
+        eindeutigen, kanonisch orientierten Paaren (sortiert)
+    """
+    episode_a = np.asarray(episode_a, dtype=np.int64)
+    episode_b = np.asarray(episode_b, dtype=np.int64)
+    swap = episode_a > episode_b
+    lo = np.where(swap, episode_b, episode_a)
+    hi = np.where(swap, episode_a, episode_b)
+    wins_lo = np.where(swap, wins_b, wins_a).astype(np.float64)
+    wins_hi = np.where(swap, wins_a, wins_b).astype(np.float64)
+    
+    stride = int(hi.max()) + 1 if len(hi) else 1
+    unique_keys, inverse = np.unique(lo * stride + hi, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    n_pairs = len(unique_keys)
+    
+    return (
+        unique_keys // stride,
+        unique_keys % stride,
+        np.bincount(inverse, weights=wins_lo, minlength=n_pairs),
+        np.bincount(inverse, weights=wins_hi, minlength=n_pairs),
+        np.bincount(inverse, weights=pair_polls, minlength=n_pairs).astype(np.int64)
+    )
+
+
+def poll_arrays(
+    polls: Union[List[Dict], PollColumns]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Stellt geparste Polls als Arrays dar.
+    
+    Args:
+        polls: Polls von filter_and_parse_polls() oder PollColumns
+        
+    Returns:
+        Tuple (episode_a, episode_b, votes_a, votes_b, finalized_at) mit
+        finalized_at in Unix-Sekunden (UTC)
+    """
+    if isinstance(polls, PollColumns):
+        return (
+            polls.episode_a_id,
+            polls.episode_b_id,
+            polls.votes_a.astype(np.float64),
+            polls.votes_b.astype(np.float64),
+            polls.finalized_at
+        )
+    
+    return (
+        np.array([poll['episode_a_id'] for poll in polls], dtype=np.int64),
+        np.array([poll['episode_b_id'] for poll in polls], dtype=np.int64),
+        np.array([poll['votes_a'] for poll in polls], dtype=np.float64),
+        np.array([poll['votes_b'] for poll in polls], dtype=np.float64),
+        np.array([int(poll['finalized_at'].timestamp()) for poll in polls], dtype=np.int64)
+    )
+
+
+def _mix64(values: np.ndarray) -> np.ndarray:
+    """splitmix64-Finalizer auf uint64-Arrays (Überlauf modulo 2^64)."""
+    values = values ^ (values >> np.uint64(30))
+    values = values * np.uint64(_MIX_MULTIPLIERS[0])
+    values = values ^ (values >> np.uint64(27))
+    values = values * np.uint64(_MIX_MULTIPLIERS[1])
+    return values ^ (values >> np.uint64(31))
+
+
+def poll_row_hashes(
+    episode_a: np.ndarray,
+    episode_b: np.ndarray,
+    votes_a: np.ndarray,
+    votes_b: np.ndarray,
+    finalized_at: np.ndarray
+) -> np.ndarray:
+    """
+    64-Bit-Hash pro Poll-Zeile (Arrays wie von poll_arrays()).
+    
+    Returns:
+        uint64-Array mit einem Hash pro Poll
+    """
+    fields = (
+        np.asarray(episode_a, dtype=np.int64).view(np.uint64),
+        np.asarray(episode_b, dtype=np.int64).view(np.uint64),
+        np.asarray(votes_a, dtype=np.float64).view(np.uint64),
+        np.asarray(votes_b, dtype=np.float64).view(np.uint64),
+        np.asarray(finalized_at, dtype=np.int64).view(np.uint64)
+    )
+    hashes = np.zeros(len(fields[0]), dtype=np.uint64)
+    for field, multiplier in zip(fields, _FIELD_MULTIPLIERS):
+        hashes = _mix64(hashes ^ (field * np.uint64(multiplier)))
+    return hashes
+
+
+def poll_checksum(*arrays: np.ndarray) -> int:
+    """
+    Reihenfolgeunabhängige Prüfsumme über Poll-Zeilen.
+    
+    Summe der Zeilen-Hashes (poll_row_hashes()) modulo 2^64. Die Prüfsumme
+    ist additiv (combine_checksums()), sodass Sidecars sie beim Einrechnen
+    neuer Polls fortschreiben können; jede Änderung einer Zeile ändert sie
+    bis auf Kollisionen.
+    
+    Args:
+        arrays: (episode_a, episode_b, votes_a, votes_b, finalized_at) wie
+            von poll_arrays()
+        
+    Returns:
+        Prüfsumme als int in [0, 2^64)
+    """
+    return int(poll_row_hashes(*arrays).sum(dtype=np.uint64))
+
+
+def combine_checksums(first: int, second: int) -> int:
+    """Prüfsumme der Vereinigung zweier disjunkter Poll-Mengen."""
+    return (first + second) % (1 << 64)
+
+
+def split_polls_at_watermark(
+    arrays: Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray],
+    watermark: int,
+    n_polls: int,
+    checksum: int
+) -> PollDelta:
+    """
+    Trennt neue von bekannten Polls und prüft die bekannten gegen ein Sidecar.
+    
+    Gemeinsame Konsistenzprüfung aller inkrementellen Sidecars: Die Polls
+    bis zum Watermark müssen in Anzahl und Prüfsumme dem gespeicherten Stand
+    entsprechen. Nachträglich eingefügte, entfernte oder geänderte Polls
+    (z.B. korrigierte Stimmen) ergeben consistent=False; das Sidecar wird
+    dann neu aufgebaut.
+    
+    Args:
+        arrays: Polls wie von poll_arrays()
+        watermark: Watermark des Sidecars
+        n_polls: Anzahl Polls im Sidecar
+        checksum: Prüfsumme der Polls im Sidecar
+        
+    Returns:
+        PollDelta
+    """
+    hashes = poll_row_hashes(*arrays)
+    new = arrays[4] > watermark
+    n_known = len(new) - int(new.sum())
+    known_checksum = int(hashes[~new].sum(dtype=np.uint64))
+    return PollDelta(
+        new=new,
+        consistent=n_known == n_polls and known_checksum == checksum,
+        n_known=n_known,
+        checksum=int(hashes.sum(dtype=np.uint64))
+    )
+
+
+def _add_arrays_to_statistics(
+    stats: PollStatistics,
+    new_a: np.ndarray,
+    new_b: np.ndarray,
+    new_wins_a: np.ndarray,
+    new_wins_b: np.ndarray,
+    finalized_at: np.ndarray
+) -> PollStatistics:
+    """Rechnet Polls in Array-Form (siehe poll_arrays()) in die Statistiken ein."""
+    if len(new_a) == 0:
+        return stats
+    
+    episode_a, episode_b, wins_a, wins_b, pair_polls = merge_pair_arrays(
+        np.concatenate([stats.episode_a, new_a]),
+        np.concatenate([stats.episode_b, new_b]),
+        np.concatenate([stats.wins_a, new_wins_a]),
+        np.concatenate([stats.wins_b, new_wins_b]),
+        np.concatenate([stats.pair_polls, np.ones(len(new_a), dtype=np.int64)])
+    )
+    
+    return PollStatistics(
+        episode_a=episode_a,
+        episode_b=episode_b,
+        wins_a=wins_a,
+        wins_b=wins_b,
+        pair_polls=pair_polls,
+        watermark=max(stats.watermark, int(finalized_at.max())),
+        n_polls=stats.n_polls + len(new_a),
+        checksum=combine_checksums(
+            stats.checksum, poll_checksum(new_a, new_b, new_wins_a, new_wins_b, finalized_at)
+        )
+    )
+
+
+def add_polls_to_statistics(
+    stats: PollStatistics,
+    polls: Union[List[Dict], PollColumns]
+) -> PollStatistics:
+    """
+    Rechnet neue, geparste Polls in die Statistiken ein.
+    
+    Der Aufruf prüft nicht, ob Polls bereits enthalten sind - dafür ist
+    update_poll_statistics() zuständig.
+    
+    Args:
+        stats: Bisherige Statistiken
+        polls: Neue Polls von filter_and_parse_polls() (mit finalized_at)
+            oder PollColumns
+        
+    Returns:
+        Neue PollStatistics (stats bleibt unverändert)
+    """
+    return _add_arrays_to_statistics(stats, *poll_arrays(polls))
+
+
+def update_poll_statistics(
+    stats: PollStatistics,
+    polls: Union[List[Dict], PollColumns]
+) -> PollStatistics:
+    """
+    Bringt die Statistiken auf den Stand der übergebenen Polls.
+    
+    Eingerechnet werden nur Polls mit finalized_at nach dem Watermark.
+    Stimmen Anzahl oder Prüfsumme der Polls bis zum Watermark nicht mit dem
+    Sidecar überein (z.B. nachträglich eingefügte oder geänderte Polls),
+    werden die Statistiken vollständig neu aufgebaut.
+    
+    Args:
+        stats: Bisherige Statistiken (z.B. von load_poll_statistics())
+        polls: Alle finalisierten Polls von filter_and_parse_polls()
+            oder PollColumns
+        
+    Returns:
+        Aktualisierte PollStatistics
+    """
+    arrays = poll_arrays(polls)
+    delta = split_polls_at_watermark(arrays, stats.watermark, stats.n_polls, stats.checksum)
+    
+    if not delta.consistent:
+        logger.warning(
+            f"Statistik-Sidecar inkonsistent ({stats.n_polls} Polls gespeichert, "
+            f"{delta.n_known} bis zum Watermark gefunden oder Prüfsumme abweichend) - baue neu auf"
+        )
+        return _add_arrays_to_statistics(empty_poll_statistics(), *arrays)
+    
+    logger.info(f"Statistik-Sidecar: {int(delta.new.sum())} neue Polls eingerechnet")
+    return _add_arrays_to_statistics(stats, *(array[delta.new] for array in arrays))
+
+
+def statistics_match_counts(stats: PollStatistics) -> Dict[int, int]:
+    """
+    Zählt die Anzahl der Matches (Polls) pro Episode.
+    
+    Args:
+        stats: Poll-Statistiken
+        
+    Returns:
+        Dict[episode_id, match_count]
+    """
+    episode_ids = np.concatenate([stats.episode_a, stats.episode_b])
+    polls = np.concatenate([stats.pair_polls, stats.pair_polls])
+    unique_ids, inverse = np.unique(episode_ids, return_inverse=True)
+    counts = np.bincount(inverse.reshape(-1), weights=polls, minlength=len(unique_ids))
+    return {int(ep_id): int(count) for ep_id, count in zip(unique_ids, counts)}
+
+
+def statistics_to_pair_polls(stats: PollStatistics) -> List[Dict]:
+    """
+    Stellt die Statistiken als Liste aggregierter Poll-Dictionaries dar.
+    
+    Jeder Eintrag fasst alle Polls eines Paars zusammen; n_polls gibt an,
+    wie viele Polls es sind. Das Format entspricht den geparsten Polls und
+    kann an compute_ratings_from_polls() übergeben werden.
+    
+    Args:
+        stats: Poll-Statistiken
+        
+    Returns:
+        Liste von Dictionaries (episode_a_id, episode_b_id, votes_a, votes_b, n_polls)
+    """
+    return [
+        {
+            'episode_a_id': int(a),
+            'episode_b_id': int(b),
+            'votes_a': float(wa),
+            'votes_b': float(wb),
+            'n_polls': int(n)
+        }
+        for a, b, wa, wb, n in zip(
+            stats.episode_a, stats.episode_b, stats.wins_a, stats.wins_b, stats.pair_polls
+        )
+    ]
+
+
+def default_statistics_path(polls_path: Path) -> Path:
+    """
+    Standardpfad des Sidecars neben polls.tsv (data/.cache/).
+    
+    Args:
+        polls_path: Pfad zu polls.tsv
+        
+    Returns:
+        Pfad zur Sidecar-Datei
+    """
+    return polls_path.parent / '.cache' / f"{polls_path.stem}_stats.npz"
+
+
+def load_poll_statistics(file_path: Path) -> PollStatistics:
+    """
+    Lädt das Statistik-Sidecar.
+    
+    Ein fehlendes, unlesbares oder veraltetes Sidecar ergibt leere
+    Statistiken; update_poll_statistics() baut es dann neu auf.
+    
+    Args:
+        file_path: Pfad zur Sidecar-Datei
+        
+    Returns:
+        PollStatistics
+    """
+    if not file_path.exists():
+        return empty_poll_statistics()
+    
+    try:
+        with np.load(file_path) as data:
+            if int(data['version']) != STATISTICS_VERSION:
+                logger.warning(f"Statistik-Sidecar {file_path} hat veraltete Version - wird ignoriert")
+                return empty_poll_statistics()
+            return PollStatistics(
+                episode_a=data['episode_a'],
+                episode_b=data['episode_b'],
+                wins_a=data['wins_a'],
+                wins_b=data['wins_b'],
+                pair_polls=data['pair_polls'],
+                watermark=int(data['watermark']),
+                n_polls=int(data['n_polls']),
+                checksum=int(data['checksum'])
+            )
+    except (OSError, ValueError, KeyError) as e:
+        logger.warning(f"Statistik-Sidecar {file_path} nicht lesbar, wird ignoriert: {e}")
+        return empty_poll_statistics()
+
+
+def save_poll_statistics(file_path: Path, stats: PollStatistics) -> None:
+    """
+    Speichert das Statistik-Sidecar atomar.
+    
+    Args:
+        file_path: Pfad zur Sidecar-Datei
+        stats: Zu speichernde Statistiken
+        
+    Raises:
+        PollStatisticsError: Wenn die Datei nicht geschrieben werden kann
+    """
+    buffer = io.BytesIO()
+    np.savez(
+        buffer,
+        version=np.int64(STATISTICS_VERSION),
+        episode_a=stats.episode_a,
+        episode_b=stats.episode_b,
+        wins_a=stats.wins_a,
+        wins_b=stats.wins_b,
+        pair_polls=stats.pair_polls,
+        watermark=np.int64(stats.watermark),
+        n_polls=np.int64(stats.n_polls),
+        checksum=np.uint64(stats.checksum)
+    )
+    
+    try:
+        atomic_write_bytes(file_path, buffer.getvalue())
+    except OSError as e:
+        raise PollStatisticsError(f"Fehler beim Schreiben des Statistik-Sidecars {file_path}: {e}")
+    
+    logger.debug(f"Statistik-Sidecar geschrieben: {file_path} ({len(stats.episode_a)} Paare)")
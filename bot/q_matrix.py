@@ -0,0 +1,364 @@
+"""
+Paarweise Reihenfolge-Wahrscheinlichkeiten aus dem Bootstrap (q-Matrix)
+
+Für das Matchmaking (docs/matchmaking.md, "Order-uncertainty") wird
+q_ij = P(theta_i > theta_j) über die Bootstrap-Resamples benötigt.
+
+Statt einer TSV mit zehntausenden Textzeilen wird nur das obere Dreieck
+(i < j) als Binärdatei gespeichert, zeilenweise gepackt:
+
+    k(i, j) = i * n - i * (i + 1) / 2 + (j - i - 1)
+
+Gespeichert werden Halbzählwerte 2 * #(theta_i > theta_j) + #(theta_i ==
+theta_j), Gleichstände zählen also je zur Hälfte (uint8 bis 127 Resamples,
+sonst uint16). Gleichstände sind nicht selten: Eine Episode ohne Polls im
+Resample erhält dort den Prior-Wert, zwei solche Episoden liegen gleichauf.
+q_ij = Wert / 2B ist exakt und q_ji = 1 - q_ij gilt auch mit Gleichständen;
+bei 250 Episoden sind das ~62 KB statt einer TSV von mehreren MB. Die Datei
+wird als Memory-Map geöffnet, Abfragen für Kandidatenpaare lesen nur die
+benötigten Einträge.
+
+Berechnet wird blockweise über Zeilen (höchstens Q_BLOCK_ENTRIES
+Vergleiche gleichzeitig), ohne einen Tensor (B, n, n) aufzubauen; die
+Blöcke werden direkt in die Memory-Map geschrieben.
+
+Dateien (in data/.cache/, abgeleitet und jederzeit neu erzeugbar):
+- bootstrap_q_matrix.json: Metadaten (Episoden, B, Poll-Index, Seed)
+- bootstrap_q_matrix_<token>.npy: gepackte Zählwerte
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from bot.atomic_io import atomic_replace, atomic_write_bytes
+from bot.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# Bei inkompatiblen Änderungen am Dateiformat erhöhen
+Q_MATRIX_VERSION = 2
+
+# Maximale Anzahl gleichzeitiger Vergleiche (B * Zeilen * n) pro Block
+Q_BLOCK_ENTRIES = 4_000_000
+
+
+class QMatrixError(Exception):
+    """Exception für Fehler beim Berechnen, Lesen oder Schreiben der q-Matrix"""
+    pass
+
+
+class QMatrix(NamedTuple):
+    """
+    Gepackte q-Matrix (oberes Dreieck).
+    
+    Attributes:
+        episode_ids: Sortierte Episode-IDs (Index = Zeile/Spalte)
+        counts: Halbzählwerte 2 * #(theta_i > theta_j) + #(theta_i == theta_j)
+            pro Paar i < j (gepackt, ggf. Memory-Map); q_ij = counts / 2B
+        n_resamples: Anzahl Bootstrap-Resamples B
+        updated_at_poll_idx: Anzahl Polls beim Bootstrap-Lauf
+        seed: Entropie der SeedSequence des Bootstrap-Laufs
+    """
+    episode_ids: np.ndarray
+    counts: np.ndarray
+    n_resamples: int
+    updated_at_poll_idx: int
+    seed: int
+
+
+def n_packed_pairs(n_items: int) -> int:
+    """Anzahl der Paare i < j bei n_items Episoden."""
+    return n_items * (n_items - 1) // 2
+
+
+def packed_index(idx_i: np.ndarray, idx_j: np.ndarray, n_items: int) -> np.ndarray:
+    """
+    Position der Paare (i, j) mit i < j im gepackten oberen Dreieck.
+    
+    Args:
+        idx_i: Zeilenindizes (kleinerer Index)
+        idx_j: Spaltenindizes (größerer Index)
+        n_items: Anzahl der Episoden
+        
+    Returns:
+        Array mit Positionen (int64)
+    """
+    idx_i = np.asarray(idx_i, dtype=np.int64)
+    idx_j = np.asarray(idx_j, dtype=np.int64)
+    return idx_i * n_items - idx_i * (idx_i + 1) // 2 + (idx_j - idx_i - 1)
+
+
+def count_dtype(n_resamples: int) -> np.dtype:
+    """
+    Kleinster Datentyp, der Halbzählwerte bis 2 * n_resamples exakt speichert.
+    
+    Raises:
+        QMatrixError: Bei mehr als 32767 Resamples
+    """
+    if 2 * n_resamples <= np.iinfo(np.uint8).max:
+        return np.dtype(np.uint8)
+    if 2 * n_resamples <= np.iinfo(np.uint16).max:
+        return np.dtype(np.uint16)
+    raise QMatrixError(f"Zu viele Resamples für die q-Matrix: {n_resamples}")
+
+
+def _block_rows(n_resamples: int, n_items: int) -> int:
+    """Zeilen pro Block, sodass B * Zeilen * n höchstens Q_BLOCK_ENTRIES ist."""
+    return max(1, Q_BLOCK_ENTRIES // max(1, n_resamples * n_items))
+
+
+def _fill_q_counts(theta: np.ndarray, out: np.ndarray) -> None:
+    """
+    Schreibt die gepackten Halbzählwerte blockweise nach out.
+    
+    #(>) + #(>=) ergibt 2 * #(>) + #(==) ohne eigenen Vergleich auf
+    Gleichheit. Die Zeilen start..stop belegen im gepackten Layout einen
+    zusammenhängenden Bereich; pro Block werden nur die Spalten ab start
+    verglichen.
+    """
+    n_resamples, n_items = theta.shape
+    rows_per_block = _block_rows(n_resamples, n_items)
+    
+    for start in range(0, n_items - 1, rows_per_block):
+        stop = min(start + rows_per_block, n_items - 1)
+        rows, cols = theta[:, start:stop, None], theta[:, None, start:]
+        counts = (rows > cols).sum(axis=0, dtype=np.int32) + (rows >= cols).sum(axis=0, dtype=np.int32)
+        
+        # Nur j > i (im Block: Spalte c > Zeile r), zeilenweise = gepackte Reihenfolge
+        upper = np.arange(n_items - start)[None, :] > np.arange(stop - start)[:, None]
+        first = packed_index(start, start + 1, n_items)
+        last = packed_index(stop, stop + 1, n_items) if stop < n_items - 1 else n_packed_pairs(n_items)
+        out[first:last] = counts[upper]
+
+
+def compute_q_counts(theta: np.ndarray) -> np.ndarray:
+    """
+    Berechnet die gepackten Halbzählwerte im Speicher.
+    
+    Args:
+        theta: Bootstrap-Draws (B, n_items)
+        
+    Returns:
+        Array (n_items * (n_items - 1) / 2,) mit 2 * #(theta_i > theta_j)
+        + #(theta_i == theta_j)
+    """
+    theta = np.asarray(theta, dtype=np.float64)
+    out = np.zeros(n_packed_pairs(theta.shape[1]), dtype=count_dtype(theta.shape[0]))
+    _fill_q_counts(theta, out)
+    return out
+
+
+def lookup_q(q_matrix: QMatrix, episode_a: Sequence[int], episode_b: Sequence[int]) -> np.ndarray:
+    """
+    Liest q = P(theta_a > theta_b) für Kandidatenpaare.
+    
+    Gleichstände zählen zur Hälfte, die Orientierung wird daher exakt über
+    q_ba = 1 - q_ab berücksichtigt. Gleiche Episode ergibt 0.5, Episoden
+    ohne Bootstrap-Wert ergeben NaN.
+    
+    Args:
+        q_matrix: Geladene q-Matrix
+        episode_a: Episode-IDs der ersten Episode pro Paar
+        episode_b: Episode-IDs der zweiten Episode pro Paar
+        
+    Returns:
+        Array (float64) mit q pro Paar
+    """
+    ids = q_matrix.episode_ids
+    n_items = len(ids)
+    episode_a = np.asarray(episode_a, dtype=np.int64)
+    episode_b = np.asarray(episode_b, dtype=np.int64)
+    if n_items == 0:
+        return np.full(episode_a.shape, np.nan)
+    
+    idx_a = np.searchsorted(ids, episode_a).clip(max=n_items - 1)
+    idx_b = np.searchsorted(ids, episode_b).clip(max=n_items - 1)
+    known = (ids[idx_a] == episode_a) & (ids[idx_b] == episode_b)
+    
+    q = np.full(episode_a.shape, np.nan)
+    q[known & (idx_a == idx_b)] = 0.5
+    
+    scale = 2.0 * q_matrix.n_resamples
+    forward = known & (idx_a < idx_b)
+    q[forward] = q_matrix.counts[packed_index(idx_a[forward], idx_b[forward], n_items)] / scale
+    
+    # Gespeichert ist das Paar (b, a); mit halb gezählten Gleichständen gilt q_ab = 1 - q_ba exakt
+    backward = known & (idx_a > idx_b)
+    q[backward] = 1.0 - q_matrix.counts[packed_index(idx_b[backward], idx_a[backward], n_items)] / scale
+    return q
+
+
+def default_q_matrix_path(polls_path: Path) -> Path:
+    """
+    Standardpfad der q-Matrix-Metadaten (data/.cache/).
+    
+    Args:
+        polls_path: Pfad zu polls.tsv
+        
+    Returns:
+        Pfad zu bootstrap_q_matrix.json
+    """
+    return polls_path.parent / '.cache' / 'bootstrap_q_matrix.json'
+
+
+def _data_path(meta_path: Path, token: str) -> Path:
+    """Pfad der Datendatei zu einem Token (neben den Metadaten)."""
+    return meta_path.with_name(f"{meta_path.stem}_{token}.npy")
+
+
+def _meta_for(
+    episode_ids: np.ndarray,
+    n_resamples: int,
+    updated_at_poll_idx: int,
+    seed: int
+) -> Dict[str, Any]:
+    """Metadaten ohne Token (bestimmen den Inhalt der Datendatei)."""
+    return {
+        'version': Q_MATRIX_VERSION,
+        'episode_ids': [int(ep_id) for ep_id in episode_ids],
+        'n_resamples': int(n_resamples),
+        'updated_at_poll_idx': int(updated_at_poll_idx),
+        'seed': int(seed)
+    }
+
+
+def load_q_matrix(meta_path: Path) -> Optional[QMatrix]:
+    """
+    Öffnet die gespeicherte q-Matrix als Memory-Map.
+    
+    Eine fehlende, unlesbare oder veraltete Datei ergibt None (q ist dann
+    noch nicht verfügbar, siehe S_q = 0 in docs/matchmaking.md).
+    
+    Args:
+        meta_path: Pfad zu bootstrap_q_matrix.json
+        
+    Returns:
+        QMatrix oder None
+    """
+    if not meta_path.exists():
+        return None
+    
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('version') != Q_MATRIX_VERSION:
+            return None
+        
+        episode_ids = np.array(meta['episode_ids'], dtype=np.int64)
+        counts = np.load(_data_path(meta_path, meta['token']), mmap_mode='r')
+        if counts.shape != (n_packed_pairs(len(episode_ids)),) \
+                or counts.dtype != count_dtype(meta['n_resamples']):
+            return None
+    except (OSError, ValueError, KeyError, TypeError, QMatrixError) as e:
+        logger.warning(f"q-Matrix {meta_path} nicht lesbar, wird ignoriert: {e}")
+        return None
+    
+    return QMatrix(
+        episode_ids=episode_ids,
+        counts=counts,
+        n_resamples=int(meta['n_resamples']),
+        updated_at_poll_idx=int(meta['updated_at_poll_idx']),
+        seed=int(meta['seed'])
+    )
+
+
+def save_q_matrix(
+    meta_path: Path,
+    theta: np.ndarray,
+    episode_ids: np.ndarray,
+    updated_at_poll_idx: int,
+    seed: int
+) -> None:
+    """
+    Berechnet die q-Matrix blockweise und speichert sie atomar.
+    
+    Die Zählwerte werden Block für Block direkt in eine temporäre
+    Memory-Map geschrieben, die danach die Datendatei ersetzt. Die
+    Metadaten werden zuletzt geschrieben und verweisen über den Token im
+    Dateinamen immer auf vollständige Daten. Alte Datendateien werden
+    danach entfernt.
+    
+    Args:
+        meta_path: Pfad zu bootstrap_q_matrix.json
+        theta: Bootstrap-Draws (B, n_items)
+        episode_ids: Episode-IDs der Spalten von theta (sortiert)
+        updated_at_poll_idx: Anzahl Polls beim Bootstrap-Lauf
+        seed: Entropie der SeedSequence des Bootstrap-Laufs
+        
+    Raises:
+        QMatrixError: Bei ungültigen Eingaben oder Schreibfehlern
+    """
+    theta = np.asarray(theta, dtype=np.float64)
+    if theta.ndim != 2 or theta.shape[1] != len(episode_ids):
+        raise QMatrixError(
+            f"theta hat Shape {theta.shape}, erwartet (B, {len(episode_ids)})"
+        )
+    n_resamples, n_items = theta.shape
+    
+    meta = _meta_for(episode_ids, n_resamples, updated_at_poll_idx, seed)
+    meta['token'] = hashlib.sha256(json.dumps(meta, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+    data_path = _data_path(meta_path, meta['token'])
+    
+    try:
+        with atomic_replace(data_path) as tmp_path:
+            out = np.lib.format.open_memmap(
+                tmp_path, mode='w+', dtype=count_dtype(n_resamples), shape=(n_packed_pairs(n_items),)
+            )
+            _fill_q_counts(theta, out)
+            out.flush()
+            del out
+        atomic_write_bytes(meta_path, json.dumps(meta).encode('utf-8'))
+    except OSError as e:
+        raise QMatrixError(f"Fehler beim Schreiben der q-Matrix {meta_path}: {e}")
+    
+    for old_path in meta_path.parent.glob(f"{meta_path.stem}_*.npy"):
+        if old_path != data_path:
+            try:
+                old_path.unlink()
+            except OSError:
+                # z.B. noch gemappt (Windows) - beim nächsten Schreiben erneut
+                pass
+    
+    logger.info(f"q-Matrix geschrieben: {n_items} Episoden, {n_packed_pairs(n_items)} Paare")
+
+
+def refresh_q_matrix(
+    meta_path: Path,
+    theta: np.ndarray,
+    episode_ids: np.ndarray,
+    updated_at_poll_idx: int,
+    seed: int
+) -> bool:
+    """
+    Aktualisiert die q-Matrix, falls sie nicht zum Bootstrap-Lauf passt.
+    
+    Stimmen Episoden, B, Poll-Index und Seed mit der gespeicherten Matrix
+    überein, bleibt die Datei unverändert.
+    
+    Args:
+        meta_path: Pfad zu bootstrap_q_matrix.json
+        theta: Bootstrap-Draws (B, n_items)
+        episode_ids: Episode-IDs der Spalten von theta (sortiert)
+        updated_at_poll_idx: Anzahl Polls beim Bootstrap-Lauf
+        seed: Entropie der SeedSequence des Bootstrap-Laufs
+        
+    Returns:
+        True, wenn die Matrix neu geschrieben wurde
+        
+    Raises:
+        QMatrixError: Bei ungültigen Eingaben oder Schreibfehlern
+    """
+    current = load_q_matrix(meta_path)
+    if current is not None \
+            and _meta_for(current.episode_ids, current.n_resamples, current.updated_at_poll_idx, current.seed) \
+            == _meta_for(episode_ids, np.shape(theta)[0], updated_at_poll_idx, seed):
+        logger.info("q-Matrix ist aktuell - keine Neuberechnung")
+        return False
+    
+    save_q_matrix(meta_path, theta, episode_ids, updated_at_poll_idx, seed)
+    return True
@@ -0,0 +1,146 @@
+"""
+Ergebnis-Cache für Rating-Berechnungen
+
+Dieses Modul speichert das Ergebnis des letzten Bradley-Terry-Laufs zusammen
+mit einem Digest über die verwendeten Polls und Modellparameter. Ist der
+Digest bei einem späteren Lauf identisch (keine neu finalisierten Polls,
+gleiche Parameter), kann das Ergebnis ohne erneuten Fit übernommen werden.
+
+Der Cache ist eine abgeleitete Datei (JSON) und kann jederzeit gelöscht werden.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Union
+
+import numpy as np
+
+from bot.atomic_io import atomic_write_bytes
+from bot.logger import get_logger
+from bot.tsv_repository import PollColumns
+
+logger = get_logger(__name__)
+
+
+# Bei inkompatiblen Änderungen an Modell oder Cache-Format erhöhen
+CACHE_VERSION = 1
+
+
+class RatingCacheError(Exception):
+    """Exception für Fehler beim Lesen oder Schreiben des Rating-Caches"""
+    pass
+
+
+def compute_poll_digest(polls: Union[List[Dict], PollColumns], params: Dict[str, Any]) -> str:
+    """
+    Berechnet einen inhaltsbasierten Digest über Polls und Modellparameter.
+    
+    Der Digest hängt nur von den Paaren und Stimmen ab, nicht von der
+    Reihenfolge der Polls oder der Orientierung (A/B) eines Polls.
+    
+    Args:
+        polls: Geparste Poll-Daten (episode_a_id, episode_b_id, votes_a, votes_b)
+            oder PollColumns
+        params: Modellparameter, die das Ergebnis beeinflussen (z.B. alpha, tol)
+        
+    Returns:
+        SHA-256 Hex-Digest
+    """
+    if isinstance(polls, PollColumns):
+        rows = np.column_stack([
+            polls.episode_a_id, polls.episode_b_id, polls.votes_a, polls.votes_b
+        ]).astype(np.int64)
+    else:
+        rows = np.array(
+            [(poll['episode_a_id'], poll['episode_b_id'], poll['votes_a'], poll['votes_b'])
+             for poll in polls],
+            dtype=np.int64
+        ).reshape(-1, 4)
+    
+    # Orientierung kanonisieren (kleinere Episode zuerst)
+    swap = rows[:, 0] > rows[:, 1]
+    rows[swap] = rows[swap][:, [1, 0, 3, 2]]
+    
+    # Reihenfolge kanonisieren
+    order = np.lexsort(rows.T[::-1])
+    rows = np.ascontiguousarray(rows[order])
+    
+    digest = hashlib.sha256()
+    digest.update(json.dumps(
+        {'version': CACHE_VERSION, 'params': params},
+        sort_keys=True
+    ).encode('utf-8'))
+    digest.update(rows.astype('<i8').tobytes())
+    return digest.hexdigest()
+
+
+def load_cached_ratings(cache_path: Path, digest: str) -> Optional[List[Dict[str, Any]]]:
+    """
+    Lädt das gecachte Ergebnis, falls der Digest übereinstimmt.
+    
+    Ein fehlender oder unlesbarer Cache wird wie ein Cache-Miss behandelt.
+    
+    Args:
+        cache_path: Pfad zur Cache-Datei
+        digest: Erwarteter Digest (von compute_poll_digest)
+        
+    Returns:
+        Liste von Rating-Dictionaries (episode_id, utility, matches) oder None
+    """
+    if not cache_path.exists():
+        return None
+    
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Rating-Cache {cache_path} nicht lesbar, wird ignoriert: {e}")
+        return None
+    
+    if cached.get('version') != CACHE_VERSION or cached.get('digest') != digest:
+        return None
+    
+    return [
+        {
+            'episode_id': int(row['episode_id']),
+            'utility': float(row['utility']),
+            'matches': int(row['matches'])
+        }
+        for row in cached.get('ratings', [])
+    ]
+
+
+def save_cached_ratings(cache_path: Path, digest: str, rating_rows: List[Dict[str, Any]]) -> None:
+    """
+    Speichert ein Berechnungsergebnis atomar im Cache.
+    
+    Ein abgebrochener Lauf hinterlässt keinen halb geschriebenen Cache.
+    
+    Args:
+        cache_path: Pfad zur Cache-Datei
+        digest: Digest der Eingaben (von compute_poll_digest)
+        rating_rows: Rating-Dictionaries (episode_id, utility, matches)
+        
+    Raises:
+        RatingCacheError: Wenn die Datei nicht geschrieben werden kann
+    """
+    payload = {
+        'version': CACHE_VERSION,
+        'digest': digest,
+        'ratings': [
+            {
+                'episode_id': int(row['episode_id']),
+                'utility': float(row['utility']),
+                'matches': int(row['matches'])
+            }
+            for row in rating_rows
+        ]
+    }
+    
+    try:
+        atomic_write_bytes(cache_path, json.dumps(payload).encode('utf-8'))
+    except OSError as e:
+        raise RatingCacheError(f"Fehler beim Schreiben des Rating-Caches {cache_path}: {e}")
+    
+    logger.debug(f"Rating-Cache geschrieben: {cache_path}")
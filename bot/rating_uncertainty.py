@@ -0,0 +1,209 @@
+"""
+Analytische Unsicherheit der Ratings (Laplace-Approximation)
+
+Zwischen zwei Bootstrap-Läufen liefert dieses Modul Standardfehler aus der
+Krümmung der Zielfunktion am Optimum: Sigma = H^-1 mit der regularisierten
+Fisher-Information H (bt_solvers.fisher_information). Benötigt werden
+
+- die Diagonale von Sigma aus dem Cholesky-Faktor H = L L^T: L^-1 per
+  LAPACK trtri (gleiche Kosten wie die Zerlegung, n^3/3), diag(Sigma) sind
+  die Spaltensummen von L^-1 zum Quadrat,
+- ein weiterer Solve mit zwei rechten Seiten (Sigma 1 und Sigma u) für die
+  zentrierten log-Stärken und die normierten Utilities (Delta-Methode).
+
+Das ist nur im dichten Bereich bezahlbar (bis UNCERTAINTY_MAX_ITEMS
+Episoden, 3000 Episoden: ~0.6 s); darüber werden keine Standardfehler
+berechnet. Der Graph-Laplace in H ist nahezu singulär in Richtung 1, eine
+stochastische Schätzung der Diagonale (Hutchinson) wäre dort unbrauchbar
+ungenau, und scipy bietet keine dünne Cholesky-Zerlegung für eine
+Selected Inversion.
+
+Die Standardfehler beziehen sich wie sd_theta aus dem Bootstrap auf das
+zentrierte theta (sum theta = 0). Rang-Intervalle folgen aus den paarweisen
+Wahrscheinlichkeiten P(theta_j > theta_i) unter Normalapproximation
+(Kovarianzen zwischen Episoden werden dafür vernachlässigt).
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+import scipy.linalg
+from scipy.linalg import lapack
+from scipy.special import ndtr, ndtri
+
+from bot.bt_solvers import NEWTON_DENSE_MAX_ITEMS, PairwiseCounts, fisher_information
+from bot.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+# Konfidenzniveau der Rang-Intervalle
+RANK_INTERVAL_LEVEL = 0.95
+
+# Bis zu dieser Episodenzahl werden Standardfehler berechnet (dichte Cholesky)
+UNCERTAINTY_MAX_ITEMS = NEWTON_DENSE_MAX_ITEMS
+
+# Zeilen pro Block bei den Rängen
+SOLVE_BLOCK_SIZE = 256
+
+
+class RatingUncertaintyError(Exception):
+    """Exception für Fehler bei der Unsicherheitsberechnung"""
+    pass
+
+
+class StandardErrors(NamedTuple):
+    """
+    Standardfehler pro Episode (parallel zu theta).
+    
+    Attributes:
+        se_theta: Standardfehler des zentrierten theta
+        se_utility: Standardfehler der normierten Utility (mean = 1)
+    """
+    se_theta: np.ndarray
+    se_utility: np.ndarray
+
+
+class RankIntervals(NamedTuple):
+    """
+    Ränge pro Episode (1 = stärkste Episode).
+    
+    Attributes:
+        rank: Rang nach theta
+        rank_low: Untere Grenze des Intervalls (bester plausibler Rang)
+        rank_high: Obere Grenze des Intervalls (schlechtester plausibler Rang)
+    """
+    rank: np.ndarray
+    rank_low: np.ndarray
+    rank_high: np.ndarray
+
+
+def _covariance_diagonal_and_products(matrix: np.ndarray, rhs: np.ndarray):
+    """
+    Diagonale von matrix^-1 und matrix^-1 @ rhs aus einer Cholesky-Zerlegung.
+    
+    diag(H^-1) = Spaltensummen von L^-1 zum Quadrat (H = L L^T); L^-1 per
+    LAPACK trtri im Speicher des Faktors.
+    """
+    factor = scipy.linalg.cholesky(matrix, lower=True)
+    products = scipy.linalg.cho_solve((factor, True), rhs)
+    inverse_factor, info = lapack.dtrtri(factor, lower=1, overwrite_c=1)
+    if info != 0:
+        raise np.linalg.LinAlgError(f"Cholesky-Faktor singulär (trtri info={info})")
+    diagonal = np.einsum('ij,ij->j', inverse_factor, inverse_factor)
+    return diagonal, products
+
+
+def standard_errors(
+    theta: np.ndarray,
+    counts: PairwiseCounts,
+    alpha: float
+) -> StandardErrors:
+    """
+    Standardfehler von theta und Utilities aus der Hesse-Matrix am Optimum.
+    
+    theta darf zentriert sein (Rückgabe von fit_bradley_terry_model()); die
+    Hesse-Matrix wird am Optimum mit mean(exp(theta)) = 1 ausgewertet.
+    
+    Für Gewichte w mit sum(w) = 1 ist die Varianz von theta_i - w^T theta
+    gleich Sigma_ii - 2 (Sigma w)_i + w^T Sigma w. Das zentrierte theta
+    verwendet w = 1/n, log(utility) verwendet w = utility/n.
+    
+    Kosten: eine Cholesky-Zerlegung und eine Dreiecksinversion (O(n^3)),
+    daher nur bis UNCERTAINTY_MAX_ITEMS Episoden.
+    
+    Args:
+        theta: Log-Stärken von fit_bradley_terry_model()
+        counts: Aggregierte Paar-Counts des Fits
+        alpha: Regularisierungsstärke des Fits (muss > 0 sein)
+        
+    Returns:
+        StandardErrors
+        
+    Raises:
+        RatingUncertaintyError: Bei alpha <= 0, mehr als UNCERTAINTY_MAX_ITEMS
+            Episoden oder nicht positiv definiter Matrix
+    """
+    if alpha <= 0:
+        raise RatingUncertaintyError("alpha muss > 0 sein (ohne Prior ist theta nur bis auf eine Konstante bestimmt)")
+    
+    n = len(theta)
+    if n > UNCERTAINTY_MAX_ITEMS:
+        raise RatingUncertaintyError(
+            f"{n} Episoden - Standardfehler nur bis {UNCERTAINTY_MAX_ITEMS} Episoden (dichte Cholesky-Zerlegung)"
+        )
+    theta = theta - np.log(np.mean(np.exp(theta)))
+    utility = np.exp(theta) / np.mean(np.exp(theta))
+    weights = np.column_stack([np.full(n, 1.0 / n), utility / n])
+    
+    information = fisher_information(theta, counts, n, alpha)
+    try:
+        diagonal, products = _covariance_diagonal_and_products(information, weights)
+    except (np.linalg.LinAlgError, RuntimeError) as e:
+        raise RatingUncertaintyError(f"Fisher-Information nicht positiv definit: {e}")
+    
+    quadratic = np.einsum('ij,ij->j', weights, products)
+    variance = diagonal[:, None] - 2.0 * products + quadratic
+    variance = np.maximum(variance, 0.0)
+    
+    return StandardErrors(
+        se_theta=np.sqrt(variance[:, 0]),
+        se_utility=utility * np.sqrt(variance[:, 1])
+    )
+
+
+def rank_intervals(
+    theta: np.ndarray,
+    se_theta: np.ndarray,
+    level: float = RANK_INTERVAL_LEVEL
+) -> RankIntervals:
+    """
+    Rang-Intervalle aus paarweisen Überholwahrscheinlichkeiten.
+    
+    Der Rang von i ist 1 + Anzahl der j mit theta_j > theta_i. Mit
+    p_ji = Phi((theta_j - theta_i) / sqrt(se_i^2 + se_j^2)) hat er
+    Erwartung 1 + sum p_ji und Varianz sum p_ji (1 - p_ji); das Intervall ist
+    Erwartung +- z * Standardabweichung, gerundet und auf 1..n begrenzt.
+    Berechnet blockweise über Zeilen (Speicher O(Block * n)).
+    
+    Args:
+        theta: Log-Stärken
+        se_theta: Standardfehler von theta
+        level: Konfidenzniveau (0 < level < 1)
+        
+    Returns:
+        RankIntervals
+        
+    Raises:
+        RatingUncertaintyError: Bei ungültigem Konfidenzniveau
+    """
+    if not 0.0 < level < 1.0:
+        raise RatingUncertaintyError(f"level muss zwischen 0 und 1 liegen, erhalten: {level}")
+    
+    n = len(theta)
+    z = ndtri(0.5 + level / 2.0)
+    order = np.argsort(-theta, kind='stable')
+    rank = np.empty(n, dtype=np.int64)
+    rank[order] = np.arange(1, n + 1)
+    
+    expected = np.empty(n)
+    spread = np.empty(n)
+    variance = se_theta ** 2
+    for start in range(0, n, SOLVE_BLOCK_SIZE):
+        stop = min(start + SOLVE_BLOCK_SIZE, n)
+        diff = theta[None, :] - theta[start:stop, None]
+        scale = np.sqrt(variance[None, :] + variance[start:stop, None])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            p = np.where(scale > 0, ndtr(diff / scale), (diff > 0).astype(np.float64))
+        p[np.arange(stop - start), np.arange(start, stop)] = 0.0
+        expected[start:stop] = 1.0 + p.sum(axis=1)
+        spread[start:stop] = np.sqrt((p * (1.0 - p)).sum(axis=1))
+    
+    rank_low = np.clip(np.floor(expected - z * spread), 1, n).astype(np.int64)
+    rank_high = np.clip(np.ceil(expected + z * spread), 1, n).astype(np.int64)
+    return RankIntervals(
+        rank=rank,
+        rank_low=np.minimum(rank_low, rank),
+        rank_high=np.maximum(rank_high, rank)
+    )
+
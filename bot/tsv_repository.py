@@ -2,18 +2,60 @@
 TSV Repository
 
 Dieses Modul stellt Funktionen zum Laden, Validieren und Schreiben von TSV-Dateien bereit.
-Zentraler Ort für alle TSV-Dateioperationen (polls.tsv, ratings.tsv).
+Zentraler Ort für alle TSV-Dateioperationen (polls.tsv, ratings.tsv,
+bootstrap_theta_sd.tsv).
 Episoden werden nicht mehr aus TSV geladen, sondern über die Dreimetadaten API.
 """
 
 import csv
+import hashlib
+import io
+import json
+import os
+import warnings
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, NamedTuple, Optional, Sequence, Tuple, Union
 from datetime import datetime, timezone
+
+import numpy as np
+
+from bot.atomic_io import atomic_write_bytes
 from bot.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Erwartete Header von polls.tsv in der richtigen Reihenfolge
+POLLS_HEADERS = [
+    'poll_id', 'reddit_post_id', 'created_at', 'closes_at',
+    'episode_a_id', 'episode_b_id', 'votes_a', 'votes_b', 'finalized_at'
+]
+
+# Spalten von polls.tsv, die spaltenweise (typisiert) geladen werden
+POLL_COLUMN_INDICES = (0, 4, 5, 6, 7, 8)
+
+# Bei inkompatiblen Änderungen am Format des Binär-Caches erhöhen
+POLL_CACHE_VERSION = 2
+
+# Bytes vor dem gecachten Dateiende, die beim Anhängen verglichen werden
+POLL_CACHE_TAIL_WINDOW = 1 << 16
+
+# finalized_at für noch nicht finalisierte Polls (liegt nach jedem Cutoff)
+NOT_FINALIZED = np.iinfo(np.int64).max
+
+# Erwartete Header von bootstrap_theta_sd.tsv
+BOOTSTRAP_SD_HEADERS = ['episode_id', 'sd_theta', 'updated_at_poll_idx']
+
+# Erwartete Header von rating_uncertainty.tsv
+RATING_UNCERTAINTY_HEADERS = [
+    'episode_id', 'se_theta', 'se_utility', 'rank', 'rank_low', 'rank_high', 'calculated_at'
+]
+
+# Erwartete Header von component_ratings.tsv
+COMPONENT_RATINGS_HEADERS = ['episode_id', 'component_id', 'utility', 'matches', 'calculated_at']
+
+# Erwartete Header von catalogs.tsv
+CATALOGS_HEADERS = ['name', 'table', 'anchor_episode_id', 'data_dir']
+
 
 class TSVError(Exception):
     """Exception für TSV-Fehler (Laden oder Schreiben)"""
@@ -87,10 +129,7 @@ def load_polls(file_path: Path) -> List[Dict[str, str]]:
                 raise TSVError(f"Keine Header-Zeile gefunden in {file_path}")
             
             # Erwartete Header in der richtigen Reihenfolge
-            expected_headers = [
-                'poll_id', 'reddit_post_id', 'created_at', 'closes_at',
-                'episode_a_id', 'episode_b_id', 'votes_a', 'votes_b', 'finalized_at'
-            ]
+            expected_headers = POLLS_HEADERS
             
             actual_headers = list(reader.fieldnames)
             
@@ -114,6 +153,454 @@ def load_polls(file_path: Path) -> List[Dict[str, str]]:
         raise TSVError(f"Fehler beim Laden der Datei {file_path}: {e}")
 
 
+class PollColumns(NamedTuple):
+    """
+    Polls spaltenweise als typisierte NumPy-Arrays (ein Eintrag pro Poll).
+    
+    Attributes:
+        poll_id: Poll-IDs (int64)
+        episode_a_id: Erste Episode (int64)
+        episode_b_id: Zweite Episode (int64)
+        votes_a: Stimmen für Episode A (int64)
+        votes_b: Stimmen für Episode B (int64)
+        finalized_at: Unix-Sekunden (UTC, int64), NOT_FINALIZED wenn leer
+    """
+    poll_id: np.ndarray
+    episode_a_id: np.ndarray
+    episode_b_id: np.ndarray
+    votes_a: np.ndarray
+    votes_b: np.ndarray
+    finalized_at: np.ndarray
+
+
+def _days_from_civil(year: np.ndarray, month: np.ndarray, day: np.ndarray) -> np.ndarray:
+    """Tage seit 1970-01-01 für gregorianische Daten (vektorisiert)."""
+    year = year - (month <= 2)
+    era = np.floor_divide(year, 400)
+    year_of_era = year - era * 400
+    day_of_year = (153 * (month + np.where(month > 2, -3, 9)) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468
+
+
+def parse_epoch_seconds(values: Union[np.ndarray, Sequence[str]]) -> np.ndarray:
+    """
+    Wandelt ISO-8601 Timestamps (UTC) gesammelt in Unix-Sekunden um.
+    
+    Werte im Schema-Format YYYY-MM-DDTHH:MM:SSZ werden direkt aus den
+    Bytes berechnet, ohne Python-Objekte pro Wert; alle anderen (z.B. mit
+    Offset) parst NumPy. Leere Werte ergeben NOT_FINALIZED.
+    
+    Args:
+        values: Timestamps als Byte-Array (dtype S) oder Strings
+        
+    Returns:
+        int64-Array mit Unix-Sekunden (UTC)
+        
+    Raises:
+        ValueError: Wenn ein Timestamp nicht geparst werden kann
+    """
+    if not isinstance(values, np.ndarray) or values.dtype.kind != 'S':
+        try:
+            values = np.array(values, dtype='S')
+        except UnicodeEncodeError as e:
+            raise ValueError(f"Ungültiges Zeitformat: {e}")
+    
+    epochs = np.full(len(values), NOT_FINALIZED, dtype=np.int64)
+    if len(values) == 0:
+        return epochs
+    
+    # Bytes als Matrix (eine Zeile pro Timestamp, 0 = Stringende)
+    width = values.dtype.itemsize
+    chars = np.ascontiguousarray(values).view(np.uint8).reshape(len(values), width)
+    if width < 21:
+        chars = np.pad(chars, ((0, 0), (0, 21 - width)))
+    digits = chars[:, :20] - np.uint8(ord('0'))
+    
+    def number(start: int, width: int) -> np.ndarray:
+        result = digits[:, start].astype(np.int64)
+        for i in range(start + 1, start + width):
+            result = result * 10 + digits[:, i]
+        return result
+    
+    digit_positions = [0, 1, 2, 3, 5, 6, 8, 9, 11, 12, 14, 15, 17, 18]
+    year, month, day = number(0, 4), number(5, 2), number(8, 2)
+    hour, minute, second = number(11, 2), number(14, 2), number(17, 2)
+    
+    is_leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    month_days = np.array([0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+    fixed = (
+        (chars[:, 20] == 0)
+        & np.all(digits[:, digit_positions] <= 9, axis=1)
+        & (chars[:, 4] == ord('-')) & (chars[:, 7] == ord('-')) & (chars[:, 10] == ord('T'))
+        & (chars[:, 13] == ord(':')) & (chars[:, 16] == ord(':')) & (chars[:, 19] == ord('Z'))
+        & (month >= 1) & (month <= 12) & (day >= 1)
+        & (day <= month_days[np.clip(month, 0, 12)] + ((month == 2) & is_leap))
+        & (hour < 24) & (minute < 60) & (second < 60)
+    )
+    epochs[fixed] = (
+        _days_from_civil(year[fixed], month[fixed], day[fixed]) * 86400
+        + hour[fixed] * 3600 + minute[fixed] * 60 + second[fixed]
+    )
+    
+    # Übrige Formate (und leere Werte) über NumPy parsen
+    other = np.flatnonzero(~fixed)
+    if len(other):
+        with warnings.catch_warnings():
+            # 'Z' bzw. Offsets werden von NumPy nach UTC umgerechnet
+            warnings.simplefilter('ignore', UserWarning)
+            warnings.simplefilter('ignore', DeprecationWarning)
+            parsed = values[other].astype(str).astype('datetime64[s]')
+        valid = ~np.isnat(parsed)
+        epochs[other[valid]] = parsed[valid].astype(np.int64)
+    
+    return epochs
+
+
+def _parse_poll_rows(source) -> PollColumns:
+    """
+    Parst Datenzeilen von polls.tsv (ohne Header) spaltenweise.
+    
+    Raises:
+        ValueError: Wenn Werte nicht geparst werden können
+    """
+    with warnings.catch_warnings():
+        # Keine Datenzeilen: leeres Ergebnis statt Warnung
+        warnings.simplefilter('ignore', UserWarning)
+        table = np.loadtxt(
+            source,
+            delimiter='\t',
+            usecols=POLL_COLUMN_INDICES,
+            dtype=[
+                ('poll_id', np.int64),
+                ('episode_a_id', np.int64),
+                ('episode_b_id', np.int64),
+                ('votes_a', np.int64),
+                ('votes_b', np.int64),
+                ('finalized_at', 'S32')
+            ],
+            comments=None,
+            quotechar='"',
+            ndmin=1
+        )
+    
+    return PollColumns(
+        poll_id=table['poll_id'],
+        episode_a_id=table['episode_a_id'],
+        episode_b_id=table['episode_b_id'],
+        votes_a=table['votes_a'],
+        votes_b=table['votes_b'],
+        finalized_at=parse_epoch_seconds(table['finalized_at'])
+    )
+
+
+def _parse_poll_columns(file_path: Path) -> PollColumns:
+    """
+    Parst polls.tsv spaltenweise (ohne Cache, siehe load_poll_columns()).
+    
+    Raises:
+        TSVError: Wenn die Datei nicht geladen werden kann, Header falsch
+            sind oder Werte nicht geparst werden können
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8', newline='') as f:
+            header_line = f.readline()
+            header = header_line.rstrip('\r\n').split('\t')
+            if not header_line or header == ['']:
+                raise TSVError(f"Keine Header-Zeile gefunden in {file_path}")
+            if header != POLLS_HEADERS:
+                raise TSVError(
+                    f"Header-Schema in polls.tsv stimmt nicht überein.\n"
+                    f"Erwartet: {POLLS_HEADERS}\n"
+                    f"Gefunden: {header}"
+                )
+            
+            columns = _parse_poll_rows(f)
+        
+    except TSVError:
+        raise
+    except ValueError as e:
+        raise TSVError(f"Fehler beim Parsen der TSV-Datei {file_path}: {e}")
+    except Exception as e:
+        raise TSVError(f"Fehler beim Laden der Datei {file_path}: {e}")
+    
+    return columns
+
+
+def default_poll_cache_dir(polls_path: Path) -> Path:
+    """
+    Standardverzeichnis des Binär-Caches neben polls.tsv (data/.cache/).
+    
+    Args:
+        polls_path: Pfad zu polls.tsv
+        
+    Returns:
+        Cache-Verzeichnis
+    """
+    return polls_path.parent / '.cache'
+
+
+def _chained_sha256(file_path: Path, segments: Sequence[int]) -> str:
+    """
+    Verketteter SHA-256 über die Segmente der Datei (blockweise gelesen).
+    
+    segments sind aufsteigende Endoffsets; der Hash eines Segments wird über
+    den Hex-Digest des vorherigen und die Bytes des Segments gebildet. Bei
+    einem einzigen Segment ist das der SHA-256 der Datei.
+    """
+    content_hash = ''
+    with open(file_path, 'rb') as f:
+        position = 0
+        for segment_end in segments:
+            digest = hashlib.sha256(content_hash.encode('ascii'))
+            while position < segment_end:
+                block = f.read(min(1 << 20, segment_end - position))
+                if not block:
+                    raise OSError(f"{file_path} ist kürzer als {segment_end} Bytes")
+                digest.update(block)
+                position += len(block)
+            content_hash = digest.hexdigest()
+    return content_hash
+
+
+def _tail_sha256(file_path: Path, size: int) -> str:
+    """SHA-256 der letzten POLL_CACHE_TAIL_WINDOW Bytes vor Offset size."""
+    start = max(0, size - POLL_CACHE_TAIL_WINDOW)
+    with open(file_path, 'rb') as f:
+        f.seek(start)
+        return hashlib.sha256(f.read(size - start)).hexdigest()
+
+
+def _poll_cache_paths(file_path: Path, cache_dir: Path, content_hash: str) -> Tuple[Path, Path]:
+    """Pfade von Metadaten (JSON) und Daten (.npy) des Binär-Caches."""
+    meta_path = cache_dir / f"{file_path.stem}_columns.json"
+    data_path = cache_dir / f"{file_path.stem}_columns_{content_hash[:16]}.npy"
+    return meta_path, data_path
+
+
+def _load_cached_poll_columns(file_path: Path, cache_dir: Path, stat) -> Optional[PollColumns]:
+    """
+    Lädt die Spalten aus dem Binär-Cache als Memory-Map.
+    
+    Stimmen Größe und mtime der TSV mit den Metadaten überein, wird der
+    Cache ohne Lesen der TSV verwendet. Sonst entscheidet bei gleicher Größe
+    der Inhalts-Hash (z.B. nach touch oder erneutem Auschecken). Ein
+    fehlender oder unlesbarer Cache ergibt None.
+    """
+    meta_path, _ = _poll_cache_paths(file_path, cache_dir, '')
+    if not meta_path.exists():
+        return None
+    
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('version') != POLL_CACHE_VERSION:
+            return None
+        
+        if (meta['size'], meta['mtime_ns']) != (stat.st_size, stat.st_mtime_ns):
+            if meta['size'] != stat.st_size or _chained_sha256(file_path, meta['segments']) != meta['sha256']:
+                return None
+            # Inhalt unverändert, nur mtime neu: Metadaten nachziehen
+            meta['mtime_ns'] = stat.st_mtime_ns
+            atomic_write_bytes(meta_path, json.dumps(meta).encode('utf-8'))
+        
+        _, data_path = _poll_cache_paths(file_path, cache_dir, meta['sha256'])
+        table = np.load(data_path, mmap_mode='r')
+        if table.shape[0] != len(PollColumns._fields) or table.dtype != np.int64:
+            return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Poll-Cache für {file_path} nicht lesbar, wird neu erstellt: {e}")
+        return None
+    
+    return PollColumns(*table)
+
+
+def _append_to_cached_poll_columns(
+    file_path: Path,
+    cache_dir: Path,
+    stat
+) -> Optional[Tuple[PollColumns, str, List[int]]]:
+    """
+    Ergänzt die gecachten Spalten um an polls.tsv angehängte Zeilen.
+    
+    polls.tsv wächst im Workflow append-only (abgeschlossene Umfragen als
+    neue Zeilen). Ist die Datei größer als beim Cachen und stimmen die
+    letzten POLL_CACHE_TAIL_WINDOW Bytes vor dem gecachten Ende mit dem
+    gespeicherten Hash überein, gelten die gecachten Zeilen als unverändert;
+    gelesen und geparst werden nur dieses Fenster und die angehängten Bytes.
+    Der Inhalts-Hash wird über die angehängten Bytes verkettet fortgeführt
+    (_chained_sha256), ohne den Anfang der Datei erneut zu lesen.
+    
+    Umschreibungen weiter vorn in einer gleichzeitig verlängerten Datei
+    erkennt diese Prüfung nicht; solche Änderungen entstehen im Workflow
+    nicht. Gekürzte Dateien, ein geändertes Fenster, eine vorher
+    unvollständige oder eine noch unvollständige angehängte letzte Zeile
+    ergeben None (die Datei wird dann vollständig geparst).
+    
+    Returns:
+        Tuple (PollColumns, Inhalts-Hash, Segment-Endoffsets) oder None
+        
+    Raises:
+        TSVError: Wenn angehängte Werte nicht geparst werden können
+    """
+    meta_path, _ = _poll_cache_paths(file_path, cache_dir, '')
+    if not meta_path.exists():
+        return None
+    
+    try:
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('version') != POLL_CACHE_VERSION or stat.st_size <= meta['size']:
+            return None
+        
+        cached_size = meta['size']
+        window_start = max(0, cached_size - POLL_CACHE_TAIL_WINDOW)
+        with open(file_path, 'rb') as f:
+            f.seek(window_start)
+            window = f.read(cached_size - window_start)
+            if hashlib.sha256(window).hexdigest() != meta['tail_sha256'] or not window.endswith(b'\n'):
+                return None
+            appended = f.read(stat.st_size - cached_size)
+        if len(appended) != stat.st_size - cached_size or not appended.endswith(b'\n'):
+            return None
+        
+        _, data_path = _poll_cache_paths(file_path, cache_dir, meta['sha256'])
+        table = np.load(data_path, mmap_mode='r')
+        if table.shape[0] != len(PollColumns._fields) or table.dtype != np.int64:
+            return None
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Poll-Cache für {file_path} nicht lesbar, wird neu erstellt: {e}")
+        return None
+    
+    try:
+        new_columns = _parse_poll_rows(io.StringIO(appended.decode('utf-8'), newline=''))
+    except ValueError as e:
+        raise TSVError(f"Fehler beim Parsen der TSV-Datei {file_path}: {e}")
+    
+    content_hash = hashlib.sha256(meta['sha256'].encode('ascii') + appended).hexdigest()
+    columns = PollColumns(*np.concatenate([table, np.stack(new_columns).astype(np.int64)], axis=1))
+    logger.info(
+        f"Polls geladen: {len(columns.poll_id)} Einträge "
+        f"({len(new_columns.poll_id)} angehängt, übrige aus dem Binär-Cache)"
+    )
+    return columns, content_hash, meta['segments'] + [stat.st_size]
+
+
+def _save_cached_poll_columns(
+    file_path: Path,
+    cache_dir: Path,
+    stat,
+    columns: PollColumns,
+    content_hash: Optional[str] = None,
+    segments: Optional[List[int]] = None
+) -> None:
+    """
+    Schreibt den Binär-Cache (Daten zuerst, dann Metadaten, beides atomar).
+    
+    Die Datendatei trägt den Inhalts-Hash im Namen; Metadaten zeigen daher
+    nie auf Daten einer anderen TSV-Version. Alte Datendateien werden danach
+    entfernt. content_hash und segments stammen aus
+    _append_to_cached_poll_columns(); ohne sie ist die ganze Datei ein
+    Segment und der Hash ihr SHA-256.
+    """
+    if content_hash is None:
+        segments = [stat.st_size]
+        content_hash = _chained_sha256(file_path, segments)
+    meta_path, data_path = _poll_cache_paths(file_path, cache_dir, content_hash)
+    
+    buffer = io.BytesIO()
+    np.save(buffer, np.stack(columns).astype(np.int64, copy=False), allow_pickle=False)
+    atomic_write_bytes(data_path, buffer.getvalue())
+    atomic_write_bytes(meta_path, json.dumps({
+        'version': POLL_CACHE_VERSION,
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'sha256': content_hash,
+        'segments': segments,
+        'tail_sha256': _tail_sha256(file_path, stat.st_size)
+    }).encode('utf-8'))
+    
+    for old_path in cache_dir.glob(f"{file_path.stem}_columns_*.npy"):
+        if old_path != data_path:
+            try:
+                old_path.unlink()
+            except OSError:
+                # z.B. noch gemappt (Windows) - beim nächsten Schreiben erneut
+                pass
+    
+    logger.debug(f"Poll-Cache geschrieben: {data_path}")
+
+
+def load_poll_columns(
+    file_path: Path,
+    use_cache: bool = True,
+    cache_dir: Optional[Path] = None
+) -> PollColumns:
+    """
+    Lädt polls.tsv spaltenweise in typisierte NumPy-Arrays.
+    
+    Im Gegensatz zu load_polls() entstehen keine Dictionaries pro Zeile:
+    Zahlen werden von np.loadtxt gesammelt geparst, Timestamps in einem
+    Schritt nach Unix-Sekunden umgerechnet. Nicht benötigte Spalten
+    (reddit_post_id, created_at, closes_at) werden nicht gelesen.
+    
+    Mit use_cache wird das Ergebnis als .npy neben polls.tsv abgelegt
+    (Schlüssel: Größe, mtime und Inhalts-Hash der TSV). Ist die TSV unverändert,
+    werden die Spalten per Memory-Map aus dem Cache gelesen (read-only)
+    statt erneut geparst. Wurden seit dem Cachen nur Zeilen angehängt,
+    werden nur diese geparst und an die gecachten Spalten gehängt; die
+    Jobs (Rating-Update, Online-Ratings, Matchmaking-State, Backfill,
+    alpha-Wahl) lesen so pro Lauf nur neue Polls. Der Cache ist abgeleitet
+    und kann jederzeit gelöscht werden.
+    
+    Args:
+        file_path: Pfad zur polls.tsv
+        use_cache: Binär-Cache verwenden und pflegen
+        cache_dir: Optional - Cache-Verzeichnis (default: data/.cache/)
+        
+    Returns:
+        PollColumns (Arrays können leer sein)
+        
+    Raises:
+        TSVError: Wenn die Datei nicht geladen werden kann, Header falsch
+            sind oder Werte nicht geparst werden können
+    """
+    if not file_path.exists():
+        raise TSVError(f"Datei nicht gefunden: {file_path}")
+    
+    if not use_cache:
+        columns = _parse_poll_columns(file_path)
+        logger.info(f"Polls geladen: {len(columns.poll_id)} Einträge (spaltenweise)")
+        return columns
+    
+    if cache_dir is None:
+        cache_dir = default_poll_cache_dir(file_path)
+    
+    stat = file_path.stat()
+    columns = _load_cached_poll_columns(file_path, cache_dir, stat)
+    if columns is not None:
+        logger.info(f"Polls geladen: {len(columns.poll_id)} Einträge (Binär-Cache)")
+        return columns
+    
+    appended = _append_to_cached_poll_columns(file_path, cache_dir, stat)
+    if appended is not None:
+        columns, content_hash, segments = appended
+    else:
+        columns = _parse_poll_columns(file_path)
+        content_hash, segments = None, None
+        logger.info(f"Polls geladen: {len(columns.poll_id)} Einträge (spaltenweise)")
+    
+    # Nur cachen, wenn die TSV während des Parsens unverändert blieb
+    after = file_path.stat()
+    if (after.st_size, after.st_mtime_ns) == (stat.st_size, stat.st_mtime_ns):
+        try:
+            _save_cached_poll_columns(file_path, cache_dir, stat, columns, content_hash, segments)
+        except OSError as e:
+            logger.warning(f"Poll-Cache konnte nicht geschrieben werden: {e}")
+    
+    return columns
+
+
 def load_ratings(file_path: Path) -> List[Dict[str, str]]:
     """
     Lädt die ratings.tsv Datei und validiert das Schema.
@@ -177,6 +664,9 @@ def append_ratings(
       - Header stimmt → nur Daten anhängen
       - Header stimmt nicht → Exception werfen
     
+    Endet die Datei nicht mit einem Zeilenumbruch (z.B. nur Header ohne
+    abschließendes Newline), wird vor den Daten einer ergänzt.
+    
     Die Funktion übernimmt die Formatierung:
     - utility (float) → "%.6f" Format
     - calculated_at (datetime) → ISO-8601 UTC Format (YYYY-MM-DDTHH:MM:SSZ)
@@ -202,6 +692,7 @@ def append_ratings(
     # Prüfe ob Datei existiert und ob sie leer ist
     file_exists = file_path.exists()
     file_empty = False
+    missing_newline = False
     
     if file_exists:
         # Prüfe ob Datei leer ist
@@ -228,6 +719,9 @@ def append_ratings(
                             f"Gefunden: {first_line}\n"
                             f"Append-Operation abgebrochen."
                         )
+                with open(file_path, 'rb') as f:
+                    f.seek(-1, os.SEEK_END)
+                    missing_newline = f.read(1) != b'\n'
             except TSVError:
                 raise
             except Exception as e:
@@ -243,6 +737,8 @@ def append_ratings(
             # Schreibe Header nur wenn Datei neu oder leer ist
             if not file_exists or file_empty:
                 writer.writerow(expected_headers)
+            elif missing_newline:
+                f.write('\n')
             
             # Schreibe Rating-Zeilen
             for rating in ratings:
@@ -277,3 +773,283 @@ def append_ratings(
         
     except Exception as e:
         raise TSVError(f"Fehler beim Schreiben nach {file_path}: {e}")
+
+
+def load_bootstrap_theta_sd(file_path: Path) -> List[Dict[str, str]]:
+    """
+    Lädt die bootstrap_theta_sd.tsv Datei und validiert das Schema.
+    
+    Args:
+        file_path: Pfad zur bootstrap_theta_sd.tsv
+        
+    Returns:
+        Liste von Dictionaries (episode_id, sd_theta, updated_at_poll_idx)
+        
+    Raises:
+        TSVError: Wenn die Datei nicht geladen werden kann oder Header falsch sind
+    """
+    if not file_path.exists():
+        raise TSVError(f"Datei nicht gefunden: {file_path}")
+    
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            reader = csv.DictReader(f, delimiter='\t')
+            
+            if reader.fieldnames is None:
+                raise TSVError(f"Keine Header-Zeile gefunden in {file_path}")
+            
+            actual_headers = list(reader.fieldnames)
+            if actual_headers != BOOTSTRAP_SD_HEADERS:
+                raise TSVError(
+                    f"Header-Schema in {file_path.name} stimmt nicht überein.\n"
+                    f"Erwartet: {BOOTSTRAP_SD_HEADERS}\n"
+                    f"Gefunden: {actual_headers}"
+                )
+            
+            data = list(reader)
+            logger.info(f"Bootstrap-Standardabweichungen geladen: {len(data)} Einträge")
+            return data
+            
+    except csv.Error as e:
+        raise TSVError(f"Fehler beim Parsen der TSV-Datei {file_path}: {e}")
+    except TSVError:
+        raise
+    except Exception as e:
+        raise TSVError(f"Fehler beim Laden der Datei {file_path}: {e}")
+
+
+def write_bootstrap_theta_sd(file_path: Path, rows: List[Dict[str, Any]]) -> None:
+    """
+    Schreibt bootstrap_theta_sd.tsv atomar (ersetzt den vorherigen Stand).
+    
+    Im Gegensatz zu ratings.tsv ist die Datei kein Verlauf: jeder
+    Bootstrap-Lauf ersetzt alle Zeilen.
+    
+    Args:
+        file_path: Pfad zur bootstrap_theta_sd.tsv
+        rows: Liste von Dictionaries mit Keys:
+            - episode_id (int)
+            - sd_theta (float)
+            - updated_at_poll_idx (int)
+        
+    Raises:
+        TSVError: Bei Schreibfehlern
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter='\t', lineterminator='\n')
+    writer.writerow(BOOTSTRAP_SD_HEADERS)
+    for row in rows:
+        writer.writerow([row['episode_id'], f"{row['sd_theta']:.6f}", row['updated_at_poll_idx']])
+    
+    try:
+        atomic_write_bytes(file_path, buffer.getvalue().encode('utf-8'))
+    except OSError as e:
+        raise TSVError(f"Fehler beim Schreiben nach {file_path}: {e}")
+    
+    logger.info(f"{len(rows)} Bootstrap-Zeilen geschrieben nach {file_path}")
+
+
+def load_rating_uncertainty(file_path: Path) -> List[Dict[str, str]]:
+    """
+    Lädt die rating_uncertainty.tsv Datei und validiert das Schema.
+    
+    Args:
+        file_path: Pfad zur rating_uncertainty.tsv
+        
+    Returns:
+        Liste von Dictionaries (Spalten siehe RATING_UNCERTAINTY_HEADERS)
+        
+    Raises:
+        TSVError: Wenn die Datei nicht geladen werden kann oder Header falsch sind
+    """
+    if not file_path.exists():
+        raise TSVError(f"Datei nicht gefunden: {file_path}")
+    
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            reader = csv.DictReader(f, delimiter='\t')
+            
+            if reader.fieldnames is None:
+                raise TSVError(f"Keine Header-Zeile gefunden in {file_path}")
+            
+            actual_headers = list(reader.fieldnames)
+            if actual_headers != RATING_UNCERTAINTY_HEADERS:
+                raise TSVError(
+                    f"Header-Schema in {file_path.name} stimmt nicht überein.\n"
+                    f"Erwartet: {RATING_UNCERTAINTY_HEADERS}\n"
+                    f"Gefunden: {actual_headers}"
+                )
+            
+            data = list(reader)
+            logger.info(f"Rating-Unsicherheit geladen: {len(data)} Einträge")
+            return data
+            
+    except csv.Error as e:
+        raise TSVError(f"Fehler beim Parsen der TSV-Datei {file_path}: {e}")
+    except TSVError:
+        raise
+    except Exception as e:
+        raise TSVError(f"Fehler beim Laden der Datei {file_path}: {e}")
+
+
+def write_rating_uncertainty(file_path: Path, rows: List[Dict[str, Any]]) -> None:
+    """
+    Schreibt rating_uncertainty.tsv atomar (ersetzt den vorherigen Stand).
+    
+    Wie bootstrap_theta_sd.tsv kein Verlauf: jeder Rating-Lauf ersetzt alle
+    Zeilen.
+    
+    Args:
+        file_path: Pfad zur rating_uncertainty.tsv
+        rows: Liste von Dictionaries mit Keys:
+            - episode_id (int)
+            - se_theta, se_utility (float)
+            - rank, rank_low, rank_high (int)
+            - calculated_at (datetime, UTC)
+        
+    Raises:
+        TSVError: Bei Schreibfehlern
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter='\t', lineterminator='\n')
+    writer.writerow(RATING_UNCERTAINTY_HEADERS)
+    for row in rows:
+        writer.writerow([
+            row['episode_id'],
+            f"{row['se_theta']:.6f}",
+            f"{row['se_utility']:.6f}",
+            row['rank'],
+            row['rank_low'],
+            row['rank_high'],
+            row['calculated_at'].strftime('%Y-%m-%dT%H:%M:%SZ')
+        ])
+    
+    try:
+        atomic_write_bytes(file_path, buffer.getvalue().encode('utf-8'))
+    except OSError as e:
+        raise TSVError(f"Fehler beim Schreiben nach {file_path}: {e}")
+    
+    logger.info(f"{len(rows)} Unsicherheits-Zeilen geschrieben nach {file_path}")
+
+
+def load_component_ratings(file_path: Path) -> List[Dict[str, str]]:
+    """
+    Lädt die component_ratings.tsv Datei und validiert das Schema.
+    
+    Args:
+        file_path: Pfad zur component_ratings.tsv
+        
+    Returns:
+        Liste von Dictionaries (Spalten siehe COMPONENT_RATINGS_HEADERS)
+        
+    Raises:
+        TSVError: Wenn die Datei nicht geladen werden kann oder Header falsch sind
+    """
+    if not file_path.exists():
+        raise TSVError(f"Datei nicht gefunden: {file_path}")
+    
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            reader = csv.DictReader(f, delimiter='\t')
+            
+            if reader.fieldnames is None:
+                raise TSVError(f"Keine Header-Zeile gefunden in {file_path}")
+            
+            actual_headers = list(reader.fieldnames)
+            if actual_headers != COMPONENT_RATINGS_HEADERS:
+                raise TSVError(
+                    f"Header-Schema in {file_path.name} stimmt nicht überein.\n"
+                    f"Erwartet: {COMPONENT_RATINGS_HEADERS}\n"
+                    f"Gefunden: {actual_headers}"
+                )
+            
+            data = list(reader)
+            logger.info(f"Komponenten-Ratings geladen: {len(data)} Einträge")
+            return data
+            
+    except csv.Error as e:
+        raise TSVError(f"Fehler beim Parsen der TSV-Datei {file_path}: {e}")
+    except TSVError:
+        raise
+    except Exception as e:
+        raise TSVError(f"Fehler beim Laden der Datei {file_path}: {e}")
+
+
+def write_component_ratings(file_path: Path, rows: List[Dict[str, Any]]) -> None:
+    """
+    Schreibt component_ratings.tsv atomar (ersetzt den vorherigen Stand).
+    
+    Wie rating_uncertainty.tsv kein Verlauf: jeder Rating-Lauf ersetzt alle
+    Zeilen.
+    
+    Args:
+        file_path: Pfad zur component_ratings.tsv
+        rows: Liste von Dictionaries mit Keys:
+            - episode_id, component_id, matches (int)
+            - utility (float, normiert innerhalb der Komponente)
+            - calculated_at (datetime, UTC)
+        
+    Raises:
+        TSVError: Bei Schreibfehlern
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter='\t', lineterminator='\n')
+    writer.writerow(COMPONENT_RATINGS_HEADERS)
+    for row in rows:
+        writer.writerow([
+            row['episode_id'],
+            row['component_id'],
+            f"{row['utility']:.6f}",
+            row['matches'],
+            row['calculated_at'].strftime('%Y-%m-%dT%H:%M:%SZ')
+        ])
+    
+    try:
+        atomic_write_bytes(file_path, buffer.getvalue().encode('utf-8'))
+    except OSError as e:
+        raise TSVError(f"Fehler beim Schreiben nach {file_path}: {e}")
+    
+    logger.info(f"{len(rows)} Komponenten-Ratings geschrieben nach {file_path}")
+
+
+def load_catalogs(file_path: Path) -> List[Dict[str, str]]:
+    """
+    Lädt die catalogs.tsv Datei und validiert das Schema.
+    
+    Args:
+        file_path: Pfad zur catalogs.tsv
+        
+    Returns:
+        Liste von Dictionaries (Spalten siehe CATALOGS_HEADERS)
+        
+    Raises:
+        TSVError: Wenn die Datei nicht geladen werden kann oder Header falsch sind
+    """
+    if not file_path.exists():
+        raise TSVError(f"Datei nicht gefunden: {file_path}")
+    
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            reader = csv.DictReader(f, delimiter='\t')
+            
+            if reader.fieldnames is None:
+                raise TSVError(f"Keine Header-Zeile gefunden in {file_path}")
+            
+            actual_headers = list(reader.fieldnames)
+            if actual_headers != CATALOGS_HEADERS:
+                raise TSVError(
+                    f"Header-Schema in {file_path.name} stimmt nicht überein.\n"
+                    f"Erwartet: {CATALOGS_HEADERS}\n"
+                    f"Gefunden: {actual_headers}"
+                )
+            
+            data = list(reader)
+            logger.info(f"Kataloge geladen: {len(data)} Einträge")
+            return data
+    
+    except csv.Error as e:
+        raise TSVError(f"Fehler beim Parsen der TSV-Datei {file_path}: {e}")
+    except TSVError:
+        raise
+    except Exception as e:
+        raise TSVError(f"Fehler beim Laden der Datei {file_path}: {e}")
@@ -4,8 +4,9 @@ Validierungslogik für Daten
 Dieses Modul enthält die Validierungslogik für Episoden (via API) und TSV-Dateien (Polls, Ratings).
 """
 
-from typing import List, Dict, Set, Any
+from typing import List, Dict, Set, Any, Union
 from bot.logger import get_logger
+from bot.tsv_repository import PollColumns
 
 logger = get_logger(__name__)
 
@@ -51,7 +52,7 @@ def validate_episodes(episodes: List[Dict[str, Any]]) -> None:
     logger.info(f"Alle {len(episodes)} Episoden erfolgreich validiert")
 
 
-def validate_polls_schema(polls: List[Dict[str, str]]) -> None:
+def validate_polls_schema(polls: Union[List[Dict[str, str]], PollColumns]) -> None:
     """
     Validiert das Schema der polls.tsv.
     
@@ -59,11 +60,12 @@ def validate_polls_schema(polls: List[Dict[str, str]]) -> None:
     dass die Header korrekt sind (wird bereits im Loader gemacht).
     
     Args:
-        polls: Liste von Poll-Dictionaries
+        polls: Liste von Poll-Dictionaries oder PollColumns
     """
     # Basis-Validierung ist bereits im Loader erfolgt
     # Hier könnten weitere Checks hinzugefügt werden
-    logger.info(f"Polls-Schema validiert ({len(polls)} Einträge)")
+    count = len(polls.poll_id) if isinstance(polls, PollColumns) else len(polls)
+    logger.info(f"Polls-Schema validiert ({count} Einträge)")
 
 
 def validate_ratings(ratings: List[Dict[str, str]], episodes: List[Dict[str, Any]]) -> None:
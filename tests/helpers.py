@@ -0,0 +1,54 @@
+"""
+Gemeinsame Hilfsfunktionen der Tests
+
+Synthetische Polls als PollColumns und gefittete Zufallsmodelle; keine
+Dateien und keine Netzwerkzugriffe.
+"""
+
+import numpy as np
+
+from bot.bradley_terry import build_model_input, fit_bradley_terry_model
+from bot.tsv_repository import PollColumns
+
+
+def random_polls(n_episodes=30, n_polls=400, votes=20, seed=0, start=0, disconnected=False):
+    """
+    Zufällige Polls über n_episodes Episoden nach Bradley-Terry-Stärken.
+    
+    Ein Poll pro Sekunde ab start (finalized_at). Mit disconnected kommt ein
+    Poll 100 gegen 101 ohne Verbindung zu den übrigen Episoden hinzu.
+    """
+    rng = np.random.default_rng(seed)
+    strength = rng.normal(0.0, 1.0, n_episodes)
+    a = rng.integers(1, n_episodes + 1, n_polls)
+    b = (a + rng.integers(1, n_episodes, n_polls) - 1) % n_episodes + 1
+    p = 1.0 / (1.0 + np.exp(-(strength[a - 1] - strength[b - 1])))
+    votes_a = rng.binomial(votes, p)
+    polls = PollColumns(
+        poll_id=np.arange(1, n_polls + 1),
+        episode_a_id=a,
+        episode_b_id=b,
+        votes_a=votes_a,
+        votes_b=votes - votes_a,
+        finalized_at=start + np.arange(n_polls)
+    )
+    if disconnected:
+        polls = PollColumns(*(np.append(column, value) for column, value in zip(
+            polls, (n_polls + 1, 100, 101, 10, 5, start + n_polls)
+        )))
+    return polls
+
+
+def random_model(alpha, n_episodes=25, n_polls=300, votes=20, seed=0):
+    """Zufällige Polls wie random_polls(), aggregiert und mit alpha gefittet."""
+    polls = random_polls(n_episodes, n_polls, votes, seed)
+    model = build_model_input(
+        polls.episode_a_id, polls.episode_b_id, polls.votes_a, polls.votes_b, np.ones(n_polls, dtype=np.int64)
+    )
+    theta = fit_bradley_terry_model(model.counts, len(model.episode_ids), alpha=alpha, tol=1e-10)
+    return model, theta
+
+
+def subset(polls, mask):
+    """Teilmenge von PollColumns."""
+    return PollColumns(*(column[mask] for column in polls))
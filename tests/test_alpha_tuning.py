@@ -0,0 +1,107 @@
+"""
+Tests für die Wahl von alpha per Kreuzvalidierung
+
+Arbeitet mit synthetischen Polls, keine Dateien und keine Netzwerkzugriffe.
+"""
+
+import unittest
+
+import numpy as np
+
+from bot.alpha_tuning import (
+    ALPHA_GRID,
+    assign_folds,
+    build_fold_statistics,
+    held_out_log_likelihood,
+    select_alpha,
+    AlphaTuningError
+)
+from bot.bradley_terry import build_model_input, fit_bradley_terry_model, polls_to_arrays
+from tests.helpers import random_polls, subset
+
+
+class TestAlphaTuning(unittest.TestCase):
+    """Tests für bot.alpha_tuning"""
+
+    def test_fold_statistics_match_direct_aggregation(self):
+        """Zurückgehaltene Counts pro Fold entsprechen der Aggregation der Fold-Polls."""
+        polls = random_polls(disconnected=True)
+        folds = assign_folds(len(polls.poll_id), 4, seed=1)
+        stats = build_fold_statistics(polls, folds, 4)
+        full = build_model_input(*polls_to_arrays(polls))
+        
+        self.assertEqual(np.bincount(folds).tolist(), [101, 100, 100, 100])
+        self.assertEqual(stats.n_items, 30)
+        np.testing.assert_array_equal(stats.idx_a, full.counts.idx_a)
+        np.testing.assert_array_equal(stats.total_a, full.counts.wins_a)
+        np.testing.assert_allclose(stats.held_a.sum(axis=0), stats.total_a)
+        
+        in_fold = subset(polls, (folds == 2) & (polls.episode_a_id < 100))
+        a = np.searchsorted(np.arange(1, 31), in_fold.episode_a_id)
+        b = np.searchsorted(np.arange(1, 31), in_fold.episode_b_id)
+        for k in range(len(stats.idx_a)):
+            forward = (a == stats.idx_a[k]) & (b == stats.idx_b[k])
+            backward = (a == stats.idx_b[k]) & (b == stats.idx_a[k])
+            expected = in_fold.votes_a[forward].sum() + in_fold.votes_b[backward].sum()
+            self.assertEqual(stats.held_a[2, k], expected)
+
+    def test_warm_started_path_matches_cold_fits(self):
+        """Der alpha-Pfad mit Warm-Starts ergibt dieselbe Log-Likelihood wie einzelne Fits."""
+        polls = random_polls(disconnected=True)
+        alphas = [0.01, 0.3, 3.0]
+        selection = select_alpha(polls, alphas, n_folds=3, seed=2)
+        parallel = select_alpha(polls, alphas, n_folds=3, seed=2, n_workers=3)
+        
+        stats = build_fold_statistics(polls, assign_folds(len(polls.poll_id), 3, seed=2), 3)
+        train = build_model_input(*polls_to_arrays(polls)).counts._replace(
+            wins_a=stats.total_a - stats.held_a[1], wins_b=stats.total_b - stats.held_b[1]
+        )
+        theta = fit_bradley_terry_model(train, stats.n_items, alpha=0.3, tol=1e-10)
+        cold = held_out_log_likelihood(theta, stats.idx_a, stats.idx_b, stats.held_a[1], stats.held_b[1])
+        
+        self.assertAlmostEqual(selection.fold_log_likelihood[1, 1], cold, places=3)
+        np.testing.assert_allclose(parallel.fold_log_likelihood, selection.fold_log_likelihood)
+        self.assertTrue(np.all(selection.log_likelihood < 0))
+    
+    def test_one_standard_error_rule_prefers_larger_alpha(self):
+        """Gewählt wird das größte alpha innerhalb eines Standardfehlers vom Maximum."""
+        selection = select_alpha(random_polls(n_episodes=20, n_polls=300, votes=5, seed=0, disconnected=True))
+        best = selection.alphas.tolist().index(selection.best_alpha)
+        maximum = int(np.argmax(selection.log_likelihood))
+        gap = selection.log_likelihood - selection.log_likelihood[maximum]
+        
+        self.assertEqual(selection.alphas[-1], ALPHA_GRID[-1])
+        self.assertGreater(best, maximum)
+        self.assertEqual(selection.standard_error[maximum], 0.0)
+        self.assertGreaterEqual(gap[best], -selection.standard_error[best])
+        self.assertTrue(np.all(gap[best + 1:] < -selection.standard_error[best + 1:]))
+        self.assertFalse(selection.flat)
+    
+    def test_flat_curve_is_reported(self):
+        """Liegen alle alpha-Werte innerhalb eines Standardfehlers, wird die Kurve als flach gemeldet."""
+        polls = random_polls(n_episodes=10, n_polls=400, votes=200, seed=3, disconnected=True)
+        with self.assertLogs('bot.alpha_tuning', level='WARNING'):
+            selection = select_alpha(polls, [0.001, 0.002, 0.003])
+        self.assertTrue(selection.flat)
+        self.assertEqual(selection.best_alpha, 0.003)
+
+    def test_sparse_data_prefers_stronger_regularization(self):
+        """Mit wenigen Stimmen pro Poll gewinnt ein größeres alpha als mit vielen."""
+        alphas = [0.001, 0.1, 10.0]
+        sparse = select_alpha(random_polls(n_episodes=60, n_polls=150, votes=2, seed=3, disconnected=True), alphas)
+        dense = select_alpha(random_polls(n_episodes=10, n_polls=400, votes=200, seed=3, disconnected=True), alphas)
+        self.assertGreater(sparse.best_alpha, dense.best_alpha)
+
+    def test_invalid_inputs_raise(self):
+        """Ungültige Folds, alphas oder zu wenige Polls führen zu Fehlern."""
+        polls = random_polls(n_polls=10, disconnected=True)
+        with self.assertRaises(AlphaTuningError):
+            select_alpha(polls, [0.0, 0.1])
+        with self.assertRaises(AlphaTuningError):
+            select_alpha(polls, n_folds=1)
+        with self.assertRaises(AlphaTuningError):
+            select_alpha(subset(polls, np.arange(3)), n_folds=5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+"""
+Tests für die atomaren Dateioperationen
+
+Arbeitet mit temporären Dateien (tempfile), keine Netzwerkzugriffe.
+"""
+
+import os
+import stat
+import tempfile
+import unittest
+from pathlib import Path
+
+from bot.atomic_io import atomic_write_bytes, atomic_replace
+
+
+def file_mode(path: Path) -> int:
+    """Berechtigungsbits einer Datei."""
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+class TestAtomicIO(unittest.TestCase):
+    """Tests für bot.atomic_io"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+        self.umask = os.umask(0o022)
+
+    def tearDown(self):
+        os.umask(self.umask)
+        self.tmp.cleanup()
+
+    def test_new_file_gets_default_mode(self):
+        """Neue Dateien erhalten 0666 abzüglich umask statt 0600 von mkstemp."""
+        path = self.dir / "new.bin"
+        atomic_write_bytes(path, b"abc")
+        self.assertEqual(path.read_bytes(), b"abc")
+        self.assertEqual(file_mode(path), 0o644)
+        
+        with atomic_replace(self.dir / "other.npy") as tmp_path:
+            tmp_path.write_bytes(b"x")
+        self.assertEqual(file_mode(self.dir / "other.npy"), 0o644)
+
+    def test_existing_mode_is_kept(self):
+        """Beim Ersetzen bleibt der Modus der bestehenden Zieldatei erhalten."""
+        path = self.dir / "existing.bin"
+        path.write_bytes(b"old")
+        os.chmod(path, 0o640)
+        
+        atomic_write_bytes(path, b"new")
+        self.assertEqual(path.read_bytes(), b"new")
+        self.assertEqual(file_mode(path), 0o640)
+        
+        with atomic_replace(path) as tmp_path:
+            tmp_path.write_bytes(b"newer")
+        self.assertEqual(path.read_bytes(), b"newer")
+        self.assertEqual(file_mode(path), 0o640)
+
+    def test_failed_replace_leaves_target_and_no_temp_file(self):
+        """Bei einer Exception bleibt die Zieldatei unverändert, die temporäre Datei wird gelöscht."""
+        path = self.dir / "kept.bin"
+        path.write_bytes(b"old")
+        with self.assertRaises(RuntimeError):
+            with atomic_replace(path) as tmp_path:
+                tmp_path.write_bytes(b"partial")
+                raise RuntimeError("abgebrochen")
+        self.assertEqual(path.read_bytes(), b"old")
+        self.assertEqual(sorted(p.name for p in self.dir.iterdir()), ["kept.bin"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,130 @@
+"""
+Tests für den historischen Backfill von ratings.tsv
+
+Arbeitet mit temporären Dateien (tempfile), keine Netzwerkzugriffe.
+"""
+
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest import mock
+
+from bot import backfill as backfill_module
+from bot.backfill import cutoff_schedule, run_backfill, split_cutoffs, BackfillError
+from bot.bradley_terry import compute_ratings_from_polls, filter_poll_columns
+from bot.tsv_repository import load_poll_columns, load_ratings
+
+
+POLLS_HEADER = (
+    "poll_id\treddit_post_id\tcreated_at\tcloses_at\t"
+    "episode_a_id\tepisode_b_id\tvotes_a\tvotes_b\tfinalized_at\n"
+)
+
+# (a, b, votes_a, votes_b, Tag im Januar 2024); Poll 1 ohne Episode 1
+POLLS = [
+    (2, 3, 40, 60, 2), (1, 2, 70, 30, 4), (1, 3, 55, 45, 6), (3, 4, 50, 50, 9),
+    (2, 4, 65, 35, 12), (1, 4, 30, 70, 15), (4, 5, 60, 40, 18), (1, 5, 45, 55, 21)
+]
+
+
+def poll_line(poll_id, a, b, votes_a, votes_b, day):
+    """Finalisierte Poll-Zeile für polls.tsv (nicht nach finalized_at sortiert geschrieben)."""
+    return (
+        f"{poll_id}\tp{poll_id}\t2024-01-01T10:00:00Z\t2024-01-01T11:00:00Z\t"
+        f"{a}\t{b}\t{votes_a}\t{votes_b}\t2024-01-{day:02d}T12:00:00Z\n"
+    )
+
+
+def utc(day, hour=13):
+    """UTC-Zeitpunkt im Januar 2024."""
+    return datetime(2024, 1, day, hour, tzinfo=timezone.utc)
+
+
+class TestBackfill(unittest.TestCase):
+    """Tests für cutoff_schedule, sweep_cutoffs und run_backfill"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.polls_path = Path(self.tmp.name) / "polls.tsv"
+        self.output_path = Path(self.tmp.name) / "ratings_backfill.tsv"
+        lines = [poll_line(k + 1, *poll) for k, poll in enumerate(POLLS)]
+        self.polls_path.write_text(POLLS_HEADER + "".join(reversed(lines)), encoding='utf-8')
+        self.cutoffs = [utc(3), utc(7), utc(13), utc(16), utc(22)]
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_cutoff_schedule(self):
+        """Gleichabständige Cutoffs, Ende immer enthalten; ungültige Eingaben werfen."""
+        cutoffs = cutoff_schedule([], interval_days=7, start=utc(1), end=utc(20))
+        self.assertEqual(cutoffs, [utc(1), utc(8), utc(15), utc(20)])
+        self.assertEqual(split_cutoffs(cutoffs, 3), [[utc(1), utc(8)], [utc(15)], [utc(20)]])
+        with self.assertRaises(BackfillError):
+            cutoff_schedule([], interval_days=0, start=utc(1), end=utc(2))
+        with self.assertRaises(BackfillError):
+            cutoff_schedule([], interval_days=7)
+
+    def test_sweep_matches_independent_runs(self):
+        """Jeder Snapshot entspricht einem unabhängigen Lauf mit diesem Cutoff."""
+        with mock.patch.object(backfill_module, 'append_ratings', wraps=backfill_module.append_ratings) as append:
+            rows = run_backfill(self.polls_path, self.output_path, cutoffs=self.cutoffs)
+            append.assert_called_once()
+        
+        columns = load_poll_columns(self.polls_path)
+        written = load_ratings(self.output_path)
+        self.assertEqual(len(written), len(rows))
+        
+        # Cutoff am 3.: Episode 1 noch ohne Polls -> übersprungen
+        snapshots = sorted({row['calculated_at'] for row in rows})
+        self.assertEqual(snapshots, self.cutoffs[1:])
+        
+        for cutoff in self.cutoffs[1:]:
+            expected = compute_ratings_from_polls(filter_poll_columns(columns, cutoff), cutoff)
+            actual = [row for row in rows if row['calculated_at'] == cutoff]
+            self.assertEqual([row['episode_id'] for row in actual], [row['episode_id'] for row in expected])
+            self.assertEqual([row['matches'] for row in actual], [row['matches'] for row in expected])
+            for got, want in zip(actual, expected):
+                self.assertAlmostEqual(got['utility'], want['utility'], places=4)
+
+    def test_sweep_adds_each_poll_once(self):
+        """Pro Cutoff werden nur die neuen Polls eingerechnet, ohne Konsistenzprüfung des Präfixes."""
+        columns = load_poll_columns(self.polls_path)
+        with mock.patch.object(
+            backfill_module, 'add_polls_to_statistics', wraps=backfill_module.add_polls_to_statistics
+        ) as add, mock.patch('bot.poll_statistics.split_polls_at_watermark') as check:
+            run_backfill(self.polls_path, self.output_path, cutoffs=self.cutoffs)
+        
+        check.assert_not_called()
+        added = [len(call.args[1].poll_id) for call in add.call_args_list]
+        self.assertEqual(added, [1, 2, 2, 1, 2])
+        self.assertEqual(sum(added), len(filter_poll_columns(columns, self.cutoffs[-1]).poll_id))
+
+    def test_worker_ranges_match_single_process(self):
+        """Disjunkte Cutoff-Bereiche auf Workern ergeben dieselben Snapshots."""
+        single = run_backfill(self.polls_path, self.output_path, cutoffs=self.cutoffs)
+        parallel = run_backfill(
+            self.polls_path, Path(self.tmp.name) / "parallel.tsv", cutoffs=self.cutoffs, n_workers=2
+        )
+        
+        self.assertEqual(
+            [(row['episode_id'], row['calculated_at']) for row in parallel],
+            [(row['episode_id'], row['calculated_at']) for row in single]
+        )
+        for got, want in zip(parallel, single):
+            self.assertAlmostEqual(got['utility'], want['utility'], places=4)
+
+    def test_decay_and_schedule_from_polls(self):
+        """Ohne explizite Cutoffs reicht der Zeitraum vom ersten bis zum letzten Poll."""
+        rows = run_backfill(
+            self.polls_path, self.output_path, interval_days=5, half_life_days=10,
+            end=utc(25)
+        )
+        snapshots = sorted({row['calculated_at'] for row in rows})
+        self.assertEqual(snapshots[-1], utc(25))
+        self.assertEqual(snapshots[0], datetime(2024, 1, 7, 12, tzinfo=timezone.utc))
+        self.assertEqual(snapshots[1] - snapshots[0], timedelta(days=5))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,157 @@
+"""
+Tests für den gewichteten Poll-Bootstrap
+
+Arbeitet mit synthetischen Polls und temporären Dateien, keine Netzwerkzugriffe.
+"""
+
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from bot.bootstrap import (
+    build_bootstrap_input,
+    compute_bootstrap,
+    is_bootstrap_due,
+    load_bootstrap_poll_idx,
+    run_bootstrap,
+    run_bootstrap_if_due,
+    BootstrapError
+)
+from bot.poll_statistics import PollStatistics
+from bot.q_matrix import compute_q_counts, load_q_matrix
+from bot.tsv_repository import PollColumns, load_bootstrap_theta_sd, POLLS_HEADERS
+
+
+def synthetic_polls(n_episodes=8, n_polls=60, seed=0):
+    """Erzeugt zufällige PollColumns über einen zusammenhängenden Graphen."""
+    rng = np.random.default_rng(seed)
+    strength = np.linspace(-1.0, 1.0, n_episodes)
+    a = np.concatenate([np.arange(1, n_episodes), rng.integers(1, n_episodes + 1, n_polls)])
+    b = np.concatenate([np.arange(2, n_episodes + 1), rng.integers(1, n_episodes + 1, n_polls)])
+    b = np.where(a == b, b % n_episodes + 1, b)
+    totals = rng.integers(10, 100, len(a))
+    p = 1.0 / (1.0 + np.exp(-(strength[a - 1] - strength[b - 1])))
+    votes_a = rng.binomial(totals, p)
+    n = len(a)
+    return PollColumns(
+        poll_id=np.arange(1, n + 1),
+        episode_a_id=a.astype(np.int64),
+        episode_b_id=b.astype(np.int64),
+        votes_a=votes_a.astype(np.int64),
+        votes_b=(totals - votes_a).astype(np.int64),
+        finalized_at=np.arange(n, dtype=np.int64)
+    )
+
+
+class TestBootstrap(unittest.TestCase):
+    """Tests für bot.bootstrap"""
+
+    def test_input_restricted_to_anchor_component(self):
+        """
+        Test: Nur Polls der Komponente mit Episode 1, Gewichte proportional zu sqrt(n).
+        """
+        polls = [
+            {'episode_a_id': 1, 'episode_b_id': 2, 'votes_a': 9, 'votes_b': 0},
+            {'episode_a_id': 3, 'episode_b_id': 2, 'votes_a': 30, 'votes_b': 6},
+            {'episode_a_id': 5, 'episode_b_id': 6, 'votes_a': 4, 'votes_b': 4},
+        ]
+        data = build_bootstrap_input(polls)
+        
+        self.assertEqual(data.episode_ids.tolist(), [1, 2, 3])
+        self.assertEqual(data.idx_a.tolist(), [0, 2])
+        self.assertEqual(data.idx_b.tolist(), [1, 1])
+        np.testing.assert_allclose(data.probabilities, [1 / 3, 2 / 3])
+
+    def test_aggregated_input_rejected(self):
+        """
+        Test: Aggregierte Paar-Statistiken können nicht gezogen werden.
+        """
+        stats = PollStatistics(
+            episode_a=np.array([1]), episode_b=np.array([2]),
+            wins_a=np.array([5.0]), wins_b=np.array([3.0]),
+            pair_polls=np.array([2]), watermark=0, n_polls=2, checksum=0
+        )
+        with self.assertRaises(BootstrapError):
+            build_bootstrap_input(stats)
+
+    def test_reproducible_and_independent_of_workers(self):
+        """
+        Test: Gleicher Seed liefert identische Resamples, seriell wie im Prozess-Pool.
+        """
+        polls = synthetic_polls()
+        serial = compute_bootstrap(polls, n_resamples=12, seed=7, n_workers=1)
+        pooled = compute_bootstrap(polls, n_resamples=12, seed=7, n_workers=2)
+        other = compute_bootstrap(polls, n_resamples=12, seed=8, n_workers=1)
+        
+        self.assertEqual(serial.theta.shape, (12, 8))
+        np.testing.assert_array_equal(serial.theta, pooled.theta)
+        self.assertFalse(np.array_equal(serial.theta, other.theta))
+        self.assertEqual(serial.seed, 7)
+
+    def test_sd_shrinks_with_more_polls(self):
+        """
+        Test: sd_theta ist positiv und sinkt mit der Anzahl der Polls.
+        """
+        sd_few = compute_bootstrap(synthetic_polls(n_polls=40), n_resamples=30, seed=1, n_workers=1).sd_theta
+        sd_many = compute_bootstrap(synthetic_polls(n_polls=400), n_resamples=30, seed=1, n_workers=1).sd_theta
+        
+        self.assertTrue((sd_few > 0).all())
+        self.assertLess(sd_many.mean(), 0.7 * sd_few.mean())
+    
+    def test_bootstrap_schedule(self):
+        """
+        Test: Start nach 20 Polls, danach alle 5 Polls.
+        """
+        self.assertFalse(is_bootstrap_due(19, None))
+        self.assertTrue(is_bootstrap_due(20, None))
+        self.assertFalse(is_bootstrap_due(24, 20))
+        self.assertTrue(is_bootstrap_due(25, 20))
+
+    def test_run_bootstrap_writes_tsv(self):
+        """
+        Test: run_bootstrap schreibt bootstrap_theta_sd.tsv und die q-Matrix für finalisierte Polls.
+        """
+        polls = synthetic_polls(n_polls=20)
+        with tempfile.TemporaryDirectory() as tmp:
+            polls_path = Path(tmp) / 'polls.tsv'
+            lines = ['\t'.join(POLLS_HEADERS)]
+            for k in range(len(polls.poll_id)):
+                lines.append('\t'.join(str(v) for v in [
+                    polls.poll_id[k], f'r{k}', '', '',
+                    polls.episode_a_id[k], polls.episode_b_id[k],
+                    polls.votes_a[k], polls.votes_b[k], '2024-01-01T00:00:00Z'
+                ]))
+            lines.append('\t'.join(['999', 'open', '', '', '1', '2', '0', '0', '']))
+            polls_path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+            
+            calculated_at = datetime(2024, 2, 1, tzinfo=timezone.utc)
+            sd_path = Path(tmp) / 'bootstrap_theta_sd.tsv'
+            self.assertIsNone(load_bootstrap_poll_idx(sd_path))
+            
+            result = run_bootstrap(polls_path, calculated_at=calculated_at, n_resamples=5, seed=3, n_workers=1)
+            rows = load_bootstrap_theta_sd(sd_path)
+            q_matrix = load_q_matrix(Path(tmp) / '.cache' / 'bootstrap_q_matrix.json')
+            q_counts = np.array(q_matrix.counts)
+            
+            # Gleicher Poll-Stand: nicht fällig, mit force trotzdem
+            self.assertEqual(load_bootstrap_poll_idx(sd_path), len(polls.poll_id))
+            self.assertIsNone(run_bootstrap_if_due(polls_path, calculated_at=calculated_at, n_resamples=5))
+            forced = run_bootstrap_if_due(
+                polls_path, calculated_at=calculated_at, n_resamples=5, seed=3, n_workers=1, force=True
+            )
+            np.testing.assert_allclose(forced.sd_theta, result.sd_theta)
+        
+        self.assertEqual([int(row['episode_id']) for row in rows], result.episode_ids.tolist())
+        self.assertEqual({row['updated_at_poll_idx'] for row in rows}, {str(len(polls.poll_id))})
+        np.testing.assert_allclose(
+            [float(row['sd_theta']) for row in rows], result.sd_theta, atol=1e-6
+        )
+        np.testing.assert_array_equal(q_matrix.episode_ids, result.episode_ids)
+        np.testing.assert_array_equal(q_counts, compute_q_counts(result.theta))
+
+
+if __name__ == '__main__':
+    unittest.main()
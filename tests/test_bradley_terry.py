@@ -10,7 +10,23 @@ from datetime import datetime, timezone, timedelta
 
 import numpy as np
 
-from bot.bradley_terry import compute_ratings_from_polls, BradleyTerryError
+from bot.bradley_terry import (
+    compute_ratings_from_polls,
+    filter_and_parse_polls,
+    filter_poll_columns,
+    finalized_cutoff_index,
+    sort_poll_columns,
+    prepare_pairwise_data_aggregated,
+    build_connectivity_graph,
+    find_connected_component,
+    filter_polls_by_episodes,
+    count_matches_per_episode,
+    polls_to_arrays,
+    build_model_input,
+    initial_theta_from_ratings,
+    BradleyTerryError
+)
+from bot.tsv_repository import PollColumns, NOT_FINALIZED
 
 
 class TestBradleyTerry(unittest.TestCase):
@@ -203,6 +219,218 @@ class TestBradleyTerry(unittest.TestCase):
         with self.assertRaisesRegex(BradleyTerryError, "UTC timezone verwenden.*UTC offset = 0"):
             compute_ratings_from_polls(polls, non_utc_dt)
 
+    def test_aggregated_matches_expanded(self):
+        """
+        Test: Binomial-Fit liefert dieselben Utilities wie die Expansion.
+        
+        Abweichungen nur im Rahmen der Konvergenztoleranz von choix (tol=1e-6).
+        """
+        polls = [
+            {'episode_a_id': 1, 'episode_b_id': 2, 'votes_a': 70, 'votes_b': 30},
+            {'episode_a_id': 2, 'episode_b_id': 1, 'votes_a': 12, 'votes_b': 25},
+            {'episode_a_id': 1, 'episode_b_id': 3, 'votes_a': 80, 'votes_b': 20},
+            {'episode_a_id': 3, 'episode_b_id': 4, 'votes_a': 45, 'votes_b': 55},
+            {'episode_a_id': 2, 'episode_b_id': 4, 'votes_a': 60, 'votes_b': 40},
+        ]
+        
+        calculated_at = datetime.now(timezone.utc)
+        aggregated = compute_ratings_from_polls(polls, calculated_at)
+        expanded = compute_ratings_from_polls(polls, calculated_at, expand_votes=True)
+        
+        self.assertEqual(
+            [row['episode_id'] for row in aggregated],
+            [row['episode_id'] for row in expanded]
+        )
+        for agg_row, exp_row in zip(aggregated, expanded):
+            self.assertAlmostEqual(agg_row['utility'], exp_row['utility'], places=4)
+            self.assertEqual(agg_row['matches'], exp_row['matches'])
+
+    def test_aggregated_counts_merge_duplicate_pairs(self):
+        """
+        Test: Polls desselben Paars werden unabhängig von der Reihenfolge zusammengefasst.
+        """
+        polls = [
+            {'episode_a_id': 1, 'episode_b_id': 2, 'votes_a': 70, 'votes_b': 30},
+            {'episode_a_id': 2, 'episode_b_id': 1, 'votes_a': 12, 'votes_b': 25},
+        ]
+        
+        counts = prepare_pairwise_data_aggregated(polls, [1, 2])
+        
+        self.assertEqual(len(counts.idx_a), 1)
+        self.assertEqual((counts.idx_a[0], counts.idx_b[0]), (0, 1))
+        self.assertEqual(counts.wins_a[0], 95)
+        self.assertEqual(counts.wins_b[0], 42)
+
+    def test_warm_start_from_latest_snapshot(self):
+        """
+        Test: Warm-Start nutzt nur den neuesten Snapshot und liefert dieselben Utilities.
+        """
+        polls = [
+            {'episode_a_id': 1, 'episode_b_id': 2, 'votes_a': 70, 'votes_b': 30},
+            {'episode_a_id': 1, 'episode_b_id': 3, 'votes_a': 80, 'votes_b': 20},
+            {'episode_a_id': 2, 'episode_b_id': 3, 'votes_a': 60, 'votes_b': 40},
+            {'episode_a_id': 3, 'episode_b_id': 4, 'votes_a': 55, 'votes_b': 45},
+        ]
+        ratings = [
+            {'episode_id': '1', 'utility': '5.000000', 'matches': '1', 'calculated_at': '2024-01-01T00:00:00Z'},
+            {'episode_id': '1', 'utility': '1.800000', 'matches': '2', 'calculated_at': '2024-02-01T00:00:00Z'},
+            {'episode_id': '2', 'utility': '0.800000', 'matches': '2', 'calculated_at': '2024-02-01T00:00:00Z'},
+            {'episode_id': '3', 'utility': '0.400000', 'matches': '2', 'calculated_at': '2024-02-01T00:00:00Z'},
+        ]
+        
+        initial_theta = initial_theta_from_ratings(ratings)
+        
+        self.assertEqual(set(initial_theta), {1, 2, 3})
+        self.assertAlmostEqual(initial_theta[1], np.log(1.8))
+        
+        calculated_at = datetime.now(timezone.utc)
+        cold = compute_ratings_from_polls(polls, calculated_at)
+        warm = compute_ratings_from_polls(polls, calculated_at, initial_theta=initial_theta)
+        
+        # Episode 4 ist neu und startet bei theta = 0
+        self.assertEqual([row['episode_id'] for row in warm], [1, 2, 3, 4])
+        for cold_row, warm_row in zip(cold, warm):
+            self.assertAlmostEqual(cold_row['utility'], warm_row['utility'], places=5)
+
+
+    def test_poll_columns_match_parsed_polls(self):
+        """
+        Test: Spaltenweise Polls liefern dieselben Ratings wie Poll-Dictionaries.
+        """
+        rows = [
+            # (poll_id, a, b, votes_a, votes_b, finalized_at)
+            (1, 1, 2, 70, 30, '2024-01-01T10:00:00Z'),
+            (2, 2, 1, 12, 25, '2024-01-02T10:00:00Z'),
+            (3, 1, 3, 80, 20, '2024-01-03T10:00:00Z'),
+            (4, 3, 4, 0, 0, '2024-01-04T10:00:00Z'),
+            (5, 3, 4, 45, 55, '2024-01-05T10:00:00Z'),
+            (6, 2, 4, 60, 40, ''),
+            (7, 2, 3, 50, 50, '2024-03-01T10:00:00Z'),
+        ]
+        raw_polls = [
+            {
+                'poll_id': str(poll_id), 'episode_a_id': str(a), 'episode_b_id': str(b),
+                'votes_a': str(votes_a), 'votes_b': str(votes_b), 'finalized_at': finalized_at
+            }
+            for poll_id, a, b, votes_a, votes_b, finalized_at in rows
+        ]
+        columns = PollColumns(
+            poll_id=np.array([row[0] for row in rows]),
+            episode_a_id=np.array([row[1] for row in rows]),
+            episode_b_id=np.array([row[2] for row in rows]),
+            votes_a=np.array([row[3] for row in rows]),
+            votes_b=np.array([row[4] for row in rows]),
+            finalized_at=np.array([
+                int(datetime.fromisoformat(row[5].replace('Z', '+00:00')).timestamp())
+                if row[5] else NOT_FINALIZED
+                for row in rows
+            ])
+        )
+        
+        calculated_at = datetime(2024, 2, 1, tzinfo=timezone.utc)
+        parsed = filter_and_parse_polls(raw_polls, calculated_at)
+        filtered = filter_poll_columns(columns, calculated_at)
+        
+        self.assertEqual(filtered.poll_id.tolist(), [int(poll['poll_id']) for poll in parsed])
+        
+        from_dicts = compute_ratings_from_polls(parsed, calculated_at)
+        from_columns = compute_ratings_from_polls(filtered, calculated_at)
+        
+        self.assertEqual(
+            [(row['episode_id'], row['matches']) for row in from_dicts],
+            [(row['episode_id'], row['matches']) for row in from_columns]
+        )
+        for dict_row, column_row in zip(from_dicts, from_columns):
+            self.assertAlmostEqual(dict_row['utility'], column_row['utility'], places=8)
+
+    def test_poll_columns_validation(self):
+        """
+        Test: Ungültige spaltenweise Polls führen zu BradleyTerryError.
+        """
+        columns = PollColumns(
+            poll_id=np.array([1, 2]),
+            episode_a_id=np.array([1, 2]),
+            episode_b_id=np.array([2, 2]),
+            votes_a=np.array([10, 5]),
+            votes_b=np.array([5, 5]),
+            finalized_at=np.array([0, 0])
+        )
+        
+        with self.assertRaisesRegex(BradleyTerryError, "Poll 2: episode_a_id und episode_b_id sind identisch"):
+            filter_poll_columns(columns, datetime.now(timezone.utc))
+
+
+    def test_sorted_cutoff_matches_mask(self):
+        """
+        Test: Binärsuche auf sortierten Polls liefert dieselben Polls wie die Maske.
+        """
+        rng = np.random.default_rng(3)
+        n = 200
+        finalized_at = rng.integers(0, 1000, n)
+        finalized_at[rng.random(n) < 0.1] = NOT_FINALIZED
+        columns = PollColumns(
+            poll_id=np.arange(n),
+            episode_a_id=rng.integers(1, 10, n),
+            episode_b_id=rng.integers(10, 20, n),
+            votes_a=rng.integers(1, 50, n),
+            votes_b=rng.integers(1, 50, n),
+            finalized_at=finalized_at
+        )
+        
+        self.assertIsNone(finalized_cutoff_index(columns.finalized_at, 500))
+        sorted_columns = sort_poll_columns(columns)
+        self.assertIsNotNone(finalized_cutoff_index(sorted_columns.finalized_at, 500))
+        
+        for cutoff in [0, 1, 250, 999, 10**6]:
+            calculated_at = datetime.fromtimestamp(cutoff, timezone.utc)
+            by_mask = filter_poll_columns(columns, calculated_at)
+            by_search = filter_poll_columns(sorted_columns, calculated_at)
+            self.assertEqual(sorted(by_mask.poll_id.tolist()), sorted(by_search.poll_id.tolist()))
+
+    def test_unparseable_finalized_at_names_poll(self):
+        """
+        Test: Ungültiger Zeitstempel nennt den betroffenen Poll.
+        """
+        raw_polls = [
+            {'poll_id': '1', 'episode_a_id': '1', 'episode_b_id': '2', 'votes_a': '3',
+             'votes_b': '4', 'finalized_at': '2024-01-01T10:00:00Z'},
+            {'poll_id': '2', 'episode_a_id': '1', 'episode_b_id': '2', 'votes_a': '3',
+             'votes_b': '4', 'finalized_at': 'gestern'},
+        ]
+        
+        with self.assertRaisesRegex(BradleyTerryError, "finalized_at in Poll 2"):
+            filter_and_parse_polls(raw_polls, datetime.now(timezone.utc))
+
+
+    def test_model_input_matches_dict_pipeline(self):
+        """
+        Test: build_model_input liefert dieselben Fit-Eingaben wie Graph, BFS und Filterung.
+        """
+        polls = [
+            {'episode_a_id': 1, 'episode_b_id': 5, 'votes_a': 70, 'votes_b': 30},
+            {'episode_a_id': 5, 'episode_b_id': 1, 'votes_a': 12, 'votes_b': 25},
+            {'episode_a_id': 5, 'episode_b_id': 9, 'votes_a': 80, 'votes_b': 20},
+            {'episode_a_id': 3, 'episode_b_id': 4, 'votes_a': 45, 'votes_b': 55},
+            {'episode_a_id': 2, 'episode_b_id': 9, 'votes_a': 60, 'votes_b': 40},
+            {'episode_a_id': 4, 'episode_b_id': 7, 'votes_a': 10, 'votes_b': 10},
+        ]
+        
+        model_input = build_model_input(*polls_to_arrays(polls))
+        
+        connected = find_connected_component(build_connectivity_graph(polls), 1)
+        filtered = filter_polls_by_episodes(polls, connected)
+        episode_ids = sorted(connected)
+        counts = prepare_pairwise_data_aggregated(filtered, episode_ids)
+        matches = count_matches_per_episode(filtered, episode_ids)
+        
+        self.assertEqual(model_input.episode_ids.tolist(), [1, 2, 5, 9])
+        self.assertEqual(model_input.episode_ids.tolist(), episode_ids)
+        self.assertEqual(model_input.dropped_episode_ids.tolist(), [3, 4, 7])
+        self.assertEqual(model_input.matches.tolist(), [matches[ep_id] for ep_id in episode_ids])
+        self.assertEqual(model_input.n_polls, len(filtered))
+        for field in counts._fields:
+            np.testing.assert_array_equal(getattr(model_input.counts, field), getattr(counts, field))
+
 
 if __name__ == '__main__':
     unittest.main()
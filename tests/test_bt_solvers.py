@@ -0,0 +1,131 @@
+"""
+Tests für die Bradley-Terry-Solver
+
+Vergleicht die nativen NumPy-Solver untereinander und mit choix auf
+synthetischen Daten. Fokus auf Übereinstimmung und Konvergenz.
+"""
+
+import unittest
+
+import choix
+import numpy as np
+
+from bot.bradley_terry import aggregate_pairwise_counts
+from bot.bt_solvers import (
+    AUTO_NEWTON_MAX_ITEMS, NEWTON_DENSE_MAX_ITEMS, solve_mm, solve_newton, get_solver, select_solver
+)
+
+
+def make_counts(n_items: int, n_polls: int, seed: int = 0):
+    """Erzeugt zufällige, zusammenhängende Poll-Daten mit wahren Stärken."""
+    rng = np.random.default_rng(seed)
+    true_theta = rng.normal(0.0, 1.0, n_items)
+    # Kette garantiert Zusammenhang
+    chain_a = np.arange(n_items - 1)
+    chain_b = np.arange(1, n_items)
+    rand_a = rng.integers(0, n_items, n_polls)
+    rand_b = (rand_a + rng.integers(1, n_items, n_polls)) % n_items
+    idx_a = np.concatenate([chain_a, rand_a])
+    idx_b = np.concatenate([chain_b, rand_b])
+    n_votes = rng.integers(5, 60, len(idx_a))
+    p = 1.0 / (1.0 + np.exp(-(true_theta[idx_a] - true_theta[idx_b])))
+    votes_a = rng.binomial(n_votes, p)
+    return aggregate_pairwise_counts(idx_a, idx_b, votes_a, n_votes - votes_a), true_theta
+
+
+class TestBradleyTerrySolvers(unittest.TestCase):
+    """Tests für bot.bt_solvers"""
+
+    def test_mm_matches_choix_expanded(self):
+        """
+        Test: Vektorisiertes MM liefert dasselbe theta wie choix auf expandierten Daten.
+        """
+        counts, _ = make_counts(n_items=6, n_polls=15)
+        expanded = []
+        for a, b, wa, wb in zip(counts.idx_a, counts.idx_b, counts.wins_a, counts.wins_b):
+            expanded += [(int(a), int(b))] * int(wa) + [(int(b), int(a))] * int(wb)
+        
+        theta_choix = choix.mm_pairwise(6, expanded, alpha=0.01, max_iter=10000, tol=1e-8)
+        theta_mm, _ = solve_mm(counts, 6, alpha=0.01, max_iter=10000, tol=1e-8)
+        
+        np.testing.assert_allclose(theta_mm, theta_choix, atol=1e-6)
+
+    def test_newton_matches_mm(self):
+        """
+        Test: Newton konvergiert zum selben Optimum wie MM, in wenigen Iterationen.
+        """
+        counts, _ = make_counts(n_items=40, n_polls=300)
+        
+        theta_mm, _ = solve_mm(counts, 40, alpha=0.01, max_iter=100000, tol=1e-10)
+        theta_newton, n_iter = solve_newton(counts, 40, alpha=0.01, max_iter=100, tol=1e-10)
+        
+        np.testing.assert_allclose(theta_newton, theta_mm, atol=1e-6)
+        self.assertLess(n_iter, 15, f"Newton sollte schnell konvergieren, brauchte {n_iter}")
+        self.assertAlmostEqual(np.mean(np.exp(theta_newton - np.log(np.mean(np.exp(theta_newton))))), 1.0)
+
+    def test_newton_without_regularization(self):
+        """
+        Test: Newton funktioniert auch ohne Regularisierung (alpha = 0).
+        """
+        counts, _ = make_counts(n_items=10, n_polls=60)
+        
+        theta_mm, _ = solve_mm(counts, 10, alpha=0.0, max_iter=100000, tol=1e-10)
+        theta_newton, _ = solve_newton(counts, 10, alpha=0.0, max_iter=100, tol=1e-10)
+        
+        np.testing.assert_allclose(theta_newton, theta_mm, atol=1e-6)
+        self.assertAlmostEqual(float(np.sum(theta_newton)), 0.0, places=8)
+
+    def test_sparse_newton_matches_dense(self):
+        """
+        Test: Dünn besetztes Newton-System liefert dasselbe Ergebnis wie das dichte.
+        """
+        import bot.bt_solvers as bt_solvers
+        
+        counts, _ = make_counts(n_items=30, n_polls=100)
+        theta_dense, _ = solve_newton(counts, 30, alpha=0.01, max_iter=100, tol=1e-10)
+        
+        original = bt_solvers.NEWTON_DENSE_MAX_ITEMS
+        bt_solvers.NEWTON_DENSE_MAX_ITEMS = 0
+        try:
+            theta_sparse, _ = solve_newton(counts, 30, alpha=0.01, max_iter=100, tol=1e-10)
+        finally:
+            bt_solvers.NEWTON_DENSE_MAX_ITEMS = original
+        
+        np.testing.assert_allclose(theta_sparse, theta_dense, atol=1e-8)
+
+    def test_warm_start_reduces_iterations(self):
+        """
+        Test: Start beim vorherigen Optimum spart nach wenigen neuen Polls Iterationen.
+        """
+        counts, _ = make_counts(n_items=60, n_polls=600)
+        theta_prev, _ = solve_mm(counts, 60, alpha=0.01, max_iter=10000, tol=1e-6)
+        
+        # Ein neuer Poll kommt hinzu
+        updated = counts._replace(wins_a=counts.wins_a.copy())
+        updated.wins_a[0] += 10
+        
+        _, cold_iter = solve_mm(updated, 60, alpha=0.01, max_iter=10000, tol=1e-6)
+        theta_warm, warm_iter = solve_mm(updated, 60, alpha=0.01, max_iter=10000, tol=1e-6,
+                                         initial_theta=theta_prev)
+        theta_newton, _ = solve_newton(updated, 60, alpha=0.01, max_iter=100, tol=1e-10,
+                                       initial_theta=theta_prev)
+        
+        self.assertLess(warm_iter * 2, cold_iter, f"Warm: {warm_iter}, Kalt: {cold_iter}")
+        np.testing.assert_allclose(theta_warm, theta_newton, atol=1e-3)
+    
+    def test_solver_selection(self):
+        """
+        Test: 'auto' wählt anhand der Problemgröße, unbekannte Namen schlagen fehl.
+        """
+        self.assertEqual(select_solver(250), 'newton')
+        self.assertEqual(select_solver(1000), 'mm')
+        self.assertEqual(select_solver(10 ** 6), 'mm')
+        self.assertLessEqual(AUTO_NEWTON_MAX_ITEMS, NEWTON_DENSE_MAX_ITEMS)
+        self.assertEqual(get_solver('mm', 10)[0], 'mm')
+        
+        with self.assertRaises(ValueError):
+            get_solver('unknown', 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+"""
+Tests für das Rating-Update mehrerer Kataloge in einem Prozess
+
+Arbeitet mit temporären Dateien und ohne API-Abfragen (check_episodes=False
+bzw. vorgegebene Episodennummern).
+"""
+
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from bot.bradley_terry import compute_component_ratings, compute_ratings_from_polls
+from bot.catalogs import (
+    check_catalog_polls,
+    load_catalog_config,
+    run_catalogs,
+    Catalog,
+    CatalogError
+)
+from bot.tsv_repository import load_ratings
+
+
+# Zwei Komponenten: {1, 2, 5}, {3, 4, 7}
+POLLS = [
+    {'episode_a_id': 1, 'episode_b_id': 5, 'votes_a': 70, 'votes_b': 30},
+    {'episode_a_id': 3, 'episode_b_id': 4, 'votes_a': 45, 'votes_b': 55},
+    {'episode_a_id': 2, 'episode_b_id': 5, 'votes_a': 60, 'votes_b': 40},
+    {'episode_a_id': 4, 'episode_b_id': 7, 'votes_a': 30, 'votes_b': 10},
+    {'episode_a_id': 7, 'episode_b_id': 3, 'votes_a': 20, 'votes_b': 25},
+]
+
+CALCULATED_AT = datetime(2024, 2, 1, tzinfo=timezone.utc)
+
+
+def write_polls(data_dir, polls):
+    """Schreibt polls.tsv mit finalisierten Polls in data_dir."""
+    data_dir.mkdir(parents=True, exist_ok=True)
+    lines = [
+        "poll_id\treddit_post_id\tcreated_at\tcloses_at\t"
+        "episode_a_id\tepisode_b_id\tvotes_a\tvotes_b\tfinalized_at"
+    ]
+    for poll_id, poll in enumerate(polls, 1):
+        lines.append(
+            f"{poll_id}\tp{poll_id}\t2024-01-01T10:00:00Z\t2024-01-08T10:00:00Z\t"
+            f"{poll['episode_a_id']}\t{poll['episode_b_id']}\t{poll['votes_a']}\t{poll['votes_b']}\t"
+            f"2024-01-08T11:00:00Z"
+        )
+    (data_dir / "polls.tsv").write_text("\n".join(lines) + "\n", encoding='utf-8')
+
+
+class TestCatalogs(unittest.TestCase):
+    """Tests für bot.catalogs und den Anker-Parameter der Rating-Berechnung"""
+
+    def test_anchor_selects_component(self):
+        """Mit anchor_episode_id wird die Komponente der Anker-Episode gerankt."""
+        rows = compute_ratings_from_polls(POLLS, CALCULATED_AT, anchor_episode_id=4)
+        expected = [
+            row for row in compute_component_ratings(POLLS, CALCULATED_AT) if row['component_id'] == 3
+        ]
+        self.assertEqual([row['episode_id'] for row in rows], [3, 4, 7])
+        for got, want in zip(rows, expected):
+            self.assertAlmostEqual(got['utility'], want['utility'], places=6)
+        self.assertEqual(
+            [row['episode_id'] for row in compute_ratings_from_polls(POLLS, CALCULATED_AT)], [1, 2, 5]
+        )
+        self.assertEqual(
+            [
+                row['episode_id']
+                for row in compute_component_ratings(POLLS, CALCULATED_AT, skip_anchor=True, anchor_episode_id=4)
+            ],
+            [1, 2, 5]
+        )
+
+    def test_load_catalog_config(self):
+        """Ohne Datei nur die Hauptserie; Einträge werden relativ zu data_root aufgelöst und geprüft."""
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            config = root / "catalogs.tsv"
+            self.assertEqual(load_catalog_config(config), [Catalog('serie', 'serie', 1, root)])
+            
+            config.write_text(
+                "name\ttable\tanchor_episode_id\tdata_dir\n"
+                "serie\tserie\t1\t.\n"
+                "spezial\tspezial\t3\tspezial\n",
+                encoding='utf-8'
+            )
+            catalogs = load_catalog_config(config)
+            self.assertEqual([catalog.name for catalog in catalogs], ['serie', 'spezial'])
+            self.assertEqual(catalogs[1], Catalog('spezial', 'spezial', 3, root / 'spezial'))
+            
+            for bad_row in ("spezial\tspezial\t3\t.\n", "x\tserie; DROP\t1\tx\n", "x\tx\tnull\tx\n"):
+                config.write_text(
+                    "name\ttable\tanchor_episode_id\tdata_dir\nserie\tserie\t1\t.\n" + bad_row,
+                    encoding='utf-8'
+                )
+                with self.assertRaises(CatalogError):
+                    load_catalog_config(config)
+
+    def test_catalogs_are_isolated(self):
+        """Jeder Katalog schreibt in sein Verzeichnis; ein Fehler betrifft nur seinen Katalog."""
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            catalogs = [
+                Catalog('serie', 'serie', 1, root),
+                Catalog('spezial', 'spezial', 3, root / 'spezial'),
+                Catalog('kaputt', 'kaputt', 9, root / 'kaputt')
+            ]
+            write_polls(root, POLLS[:3])
+            write_polls(root / 'spezial', POLLS)
+            write_polls(root / 'kaputt', POLLS[:1])
+            
+            results = run_catalogs(catalogs, CALCULATED_AT, n_workers=2, check_episodes=False)
+            serie = load_ratings(root / 'ratings.tsv')
+            spezial = load_ratings(root / 'spezial' / 'ratings.tsv')
+            
+            self.assertTrue((root / 'spezial' / '.cache').is_dir())
+            self.assertFalse((root / 'kaputt' / 'ratings.tsv').exists())
+        
+        self.assertEqual([result.name for result in results], ['serie', 'spezial', 'kaputt'])
+        self.assertEqual([result.n_ratings for result in results], [3, 3, 0])
+        self.assertIsNone(results[1].error)
+        self.assertIn('Episode 9', results[2].error)
+        self.assertEqual([int(row['episode_id']) for row in serie], [1, 2, 5])
+        self.assertEqual([int(row['episode_id']) for row in spezial], [3, 4, 7])
+
+    def test_polls_checked_against_catalog_episodes(self):
+        """Polls mit Episoden außerhalb der Tabelle brechen den Katalog vor dem Fit ab."""
+        with tempfile.TemporaryDirectory() as tmp:
+            catalog = Catalog('spezial', 'spezial', 3, Path(tmp))
+            write_polls(catalog.data_dir, POLLS)
+            check_catalog_polls(catalog, np.array([1, 2, 3, 4, 5, 7]), CALCULATED_AT)
+            with self.assertRaises(CatalogError):
+                check_catalog_polls(catalog, np.array([3, 4, 7]), CALCULATED_AT)
+            with self.assertRaises(CatalogError):
+                check_catalog_polls(catalog._replace(anchor_episode_id=8), np.arange(1, 8), CALCULATED_AT)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+"""
+Tests für vorläufige Ratings aller Zusammenhangskomponenten
+
+Der Integrationstest arbeitet mit temporären Dateien, keine Netzwerkzugriffe.
+"""
+
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from bot.bradley_terry import (
+    build_component_inputs,
+    compute_component_ratings,
+    compute_ratings_from_polls,
+    default_component_ratings_path,
+    polls_to_arrays,
+    run_rating_update
+)
+from bot.connectivity import empty_connectivity, update_connectivity
+from bot.tsv_repository import PollColumns, load_component_ratings, load_ratings
+
+
+# Drei Komponenten: {1, 2, 5, 9}, {3, 4, 7}, {10, 11}
+POLLS = [
+    {'episode_a_id': 1, 'episode_b_id': 5, 'votes_a': 70, 'votes_b': 30},
+    {'episode_a_id': 5, 'episode_b_id': 9, 'votes_a': 80, 'votes_b': 20},
+    {'episode_a_id': 3, 'episode_b_id': 4, 'votes_a': 45, 'votes_b': 55},
+    {'episode_a_id': 2, 'episode_b_id': 9, 'votes_a': 60, 'votes_b': 40},
+    {'episode_a_id': 4, 'episode_b_id': 7, 'votes_a': 30, 'votes_b': 10},
+    {'episode_a_id': 11, 'episode_b_id': 10, 'votes_a': 25, 'votes_b': 75},
+]
+
+CALCULATED_AT = datetime(2024, 2, 1, tzinfo=timezone.utc)
+
+
+class TestComponentRatings(unittest.TestCase):
+    """Tests für build_component_inputs, compute_component_ratings und run_rating_update(components=True)"""
+
+    def test_component_inputs_largest_first(self):
+        """Jede Komponente wird aufbereitet, größte zuerst; Union-Find liefert dieselben Komponenten."""
+        inputs = build_component_inputs(*polls_to_arrays(POLLS))
+        self.assertEqual(
+            [model_input.episode_ids.tolist() for model_input in inputs],
+            [[1, 2, 5, 9], [3, 4, 7], [10, 11]]
+        )
+        self.assertEqual([model_input.n_polls for model_input in inputs], [3, 2, 1])
+        self.assertEqual(inputs[2].counts.wins_a.tolist(), [75.0])
+        
+        columns = PollColumns(
+            poll_id=np.arange(1, len(POLLS) + 1),
+            episode_a_id=np.array([poll['episode_a_id'] for poll in POLLS]),
+            episode_b_id=np.array([poll['episode_b_id'] for poll in POLLS]),
+            votes_a=np.array([poll['votes_a'] for poll in POLLS]),
+            votes_b=np.array([poll['votes_b'] for poll in POLLS]),
+            finalized_at=np.arange(len(POLLS))
+        )
+        connectivity = update_connectivity(empty_connectivity(), columns)
+        with_union_find = build_component_inputs(*polls_to_arrays(columns), connectivity=connectivity)
+        self.assertEqual(
+            [model_input.episode_ids.tolist() for model_input in with_union_find],
+            [model_input.episode_ids.tolist() for model_input in inputs]
+        )
+
+    def test_every_component_gets_ratings(self):
+        """Komponente 1 entspricht compute_ratings_from_polls; Pool und Einzelprozess stimmen überein."""
+        rows = compute_component_ratings(POLLS, CALCULATED_AT)
+        parallel = compute_component_ratings(POLLS, CALCULATED_AT, n_workers=2)
+        
+        self.assertEqual([row['component_id'] for row in rows], [1, 1, 1, 1, 3, 3, 3, 10, 10])
+        self.assertEqual(rows, parallel)
+        
+        anchor = [row for row in rows if row['component_id'] == 1]
+        expected = compute_ratings_from_polls(POLLS, CALCULATED_AT)
+        self.assertEqual([row['episode_id'] for row in anchor], [row['episode_id'] for row in expected])
+        for got, want in zip(anchor, expected):
+            self.assertAlmostEqual(got['utility'], want['utility'], places=6)
+        
+        for component in (1, 3, 10):
+            utilities = [row['utility'] for row in rows if row['component_id'] == component]
+            self.assertAlmostEqual(np.mean(utilities), 1.0, places=6)
+        by_episode = {row['episode_id']: row for row in rows}
+        self.assertGreater(by_episode[10]['utility'], by_episode[11]['utility'])
+        self.assertEqual(
+            [row['episode_id'] for row in compute_component_ratings(POLLS, CALCULATED_AT, skip_anchor=True)],
+            [3, 4, 7, 10, 11]
+        )
+
+    def test_rating_run_keeps_published_ratings(self):
+        """ratings.tsv bleibt unverändert; component_ratings.tsv enthält alle Komponenten."""
+        with tempfile.TemporaryDirectory() as tmp:
+            polls_path = Path(tmp) / "polls.tsv"
+            lines = [
+                "poll_id\treddit_post_id\tcreated_at\tcloses_at\t"
+                "episode_a_id\tepisode_b_id\tvotes_a\tvotes_b\tfinalized_at"
+            ]
+            for poll_id, poll in enumerate(POLLS, 1):
+                lines.append(
+                    f"{poll_id}\tp{poll_id}\t2024-01-01T10:00:00Z\t2024-01-08T10:00:00Z\t"
+                    f"{poll['episode_a_id']}\t{poll['episode_b_id']}\t{poll['votes_a']}\t{poll['votes_b']}\t"
+                    f"2024-01-08T11:00:00Z"
+                )
+            polls_path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+            
+            plain_path = Path(tmp) / "plain" / "ratings.tsv"
+            plain_path.parent.mkdir()
+            ratings_path = Path(tmp) / "ratings.tsv"
+            run_rating_update(polls_path, plain_path, CALCULATED_AT, use_cache=False)
+            run_rating_update(
+                polls_path, ratings_path, CALCULATED_AT, use_cache=False,
+                components=True, component_workers=2
+            )
+            
+            self.assertEqual(load_ratings(ratings_path), load_ratings(plain_path))
+            self.assertFalse(default_component_ratings_path(plain_path).exists())
+            written = load_component_ratings(default_component_ratings_path(ratings_path))
+        
+        self.assertEqual([int(row['episode_id']) for row in written], [1, 2, 5, 9, 3, 4, 7, 10, 11])
+        self.assertEqual([int(row['component_id']) for row in written], [1, 1, 1, 1, 3, 3, 3, 10, 10])
+        self.assertEqual(written[0]['calculated_at'], '2024-02-01T00:00:00Z')
+
+
+if __name__ == '__main__':
+    unittest.main()
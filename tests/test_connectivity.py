@@ -0,0 +1,124 @@
+"""
+Tests für die Union-Find-Konnektivität
+
+Arbeitet mit temporären Dateien (tempfile), keine Netzwerkzugriffe.
+"""
+
+import tempfile
+import unittest
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+
+import numpy as np
+
+from bot.bradley_terry import build_model_input, polls_to_arrays
+from bot.connectivity import (
+    empty_connectivity,
+    update_connectivity,
+    component_id,
+    component_ids,
+    is_connected,
+    count_components,
+    load_connectivity,
+    save_connectivity
+)
+
+
+def make_polls(pairs):
+    """Erzeugt geparste Polls mit aufsteigendem finalized_at."""
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return [
+        {
+            'poll_id': str(k + 1),
+            'episode_a_id': a,
+            'episode_b_id': b,
+            'votes_a': 10,
+            'votes_b': 5,
+            'finalized_at': start + timedelta(days=k)
+        }
+        for k, (a, b) in enumerate(pairs)
+    ]
+
+
+class TestConnectivity(unittest.TestCase):
+    """Tests für bot.connectivity"""
+
+    def test_components_follow_polls(self):
+        """
+        Test: Komponenten entstehen aus den Polls, component_id ist die kleinste Episode.
+        """
+        polls = make_polls([(3, 1), (4, 5), (5, 7), (2, 3)])
+        connectivity = update_connectivity(empty_connectivity(), polls)
+        
+        self.assertEqual(count_components(connectivity), 2)
+        self.assertEqual(component_ids(connectivity, [1, 2, 3, 4, 5, 7]).tolist(), [1, 1, 1, 4, 4, 4])
+        self.assertTrue(is_connected(connectivity, 2, 1))
+        self.assertFalse(is_connected(connectivity, 7, 1))
+        # Episode ohne Polls ist eine eigene Komponente
+        self.assertEqual(component_id(connectivity, 99), 99)
+
+    def test_incremental_update_matches_rebuild(self):
+        """
+        Test: Nur neue Polls werden eingerechnet, Ergebnis wie bei Neuaufbau.
+        """
+        polls = make_polls([(1, 2), (3, 4), (5, 6), (2, 3), (6, 1)])
+        
+        connectivity = update_connectivity(empty_connectivity(), polls[:3])
+        self.assertEqual(count_components(connectivity), 3)
+        connectivity = update_connectivity(connectivity, polls)
+        rebuilt = update_connectivity(empty_connectivity(), polls)
+        
+        self.assertEqual(connectivity.n_polls, 5)
+        self.assertEqual(count_components(connectivity), 1)
+        self.assertEqual(
+            component_ids(connectivity, range(1, 7)).tolist(),
+            component_ids(rebuilt, range(1, 7)).tolist()
+        )
+
+    def test_removed_polls_trigger_rebuild(self):
+        """
+        Test: Weniger bekannte Polls als gespeichert führt zum Neuaufbau.
+        """
+        polls = make_polls([(1, 2), (2, 3), (4, 5)])
+        connectivity = update_connectivity(empty_connectivity(), polls)
+        
+        connectivity = update_connectivity(connectivity, [polls[0], polls[2]])
+        
+        self.assertEqual(connectivity.n_polls, 2)
+        self.assertFalse(is_connected(connectivity, 1, 3))
+
+    def test_sidecar_roundtrip(self):
+        """
+        Test: Gespeicherte Struktur liefert nach dem Laden dieselben Komponenten.
+        """
+        polls = make_polls([(1, 2), (4, 5), (2, 8)])
+        connectivity = update_connectivity(empty_connectivity(), polls)
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / '.cache' / 'polls_components.npz'
+            save_connectivity(path, connectivity)
+            loaded = load_connectivity(path)
+        
+        self.assertEqual((loaded.watermark, loaded.n_polls), (connectivity.watermark, connectivity.n_polls))
+        self.assertEqual(
+            component_ids(loaded, [1, 2, 4, 5, 8]).tolist(),
+            component_ids(connectivity, [1, 2, 4, 5, 8]).tolist()
+        )
+
+    def test_model_input_uses_connectivity(self):
+        """
+        Test: build_model_input liefert mit Union-Find dieselbe Komponente wie ohne.
+        """
+        polls = make_polls([(1, 2), (3, 4), (2, 5), (4, 6)])
+        connectivity = update_connectivity(empty_connectivity(), polls)
+        
+        with_dsu = build_model_input(*polls_to_arrays(polls), connectivity)
+        without = build_model_input(*polls_to_arrays(polls))
+        
+        self.assertEqual(with_dsu.episode_ids.tolist(), [1, 2, 5])
+        np.testing.assert_array_equal(with_dsu.episode_ids, without.episode_ids)
+        np.testing.assert_array_equal(with_dsu.dropped_episode_ids, without.dropped_episode_ids)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+"""
+Tests für das zeitlich abklingende Rating-Modell
+
+Arbeitet mit synthetischen Polls und temporären Dateien, keine Netzwerkzugriffe.
+"""
+
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from bot.bradley_terry import compute_ratings_from_polls, BradleyTerryError
+from bot.decay import (
+    build_decayed_statistics,
+    decayed_counts,
+    empty_decayed_statistics,
+    half_life_seconds,
+    load_decayed_statistics,
+    save_decayed_statistics,
+    update_decayed_statistics,
+    DecayError,
+    SECONDS_PER_DAY
+)
+from bot.poll_statistics import add_polls_to_statistics, empty_poll_statistics
+from bot.tsv_repository import PollColumns
+from tests.helpers import subset
+
+
+START = 1_700_000_000
+
+
+def make_polls(rows):
+    """PollColumns aus (a, b, votes_a, votes_b, Tag) mit finalized_at = START + Tag."""
+    rows = np.array(rows, dtype=np.int64).reshape(-1, 5)
+    return PollColumns(
+        poll_id=np.arange(1, len(rows) + 1),
+        episode_a_id=rows[:, 0],
+        episode_b_id=rows[:, 1],
+        votes_a=rows[:, 2],
+        votes_b=rows[:, 3],
+        finalized_at=START + rows[:, 4] * SECONDS_PER_DAY
+    )
+
+
+# Episode 1 schlägt 2 früh deutlich, später gewinnt 2; 3 verbindet beide
+POLLS = make_polls([
+    (1, 2, 90, 10, 0), (1, 2, 80, 20, 10), (2, 3, 50, 50, 20),
+    (1, 3, 55, 45, 200), (2, 1, 70, 30, 380), (2, 1, 75, 25, 390)
+])
+
+
+class TestDecay(unittest.TestCase):
+    """Tests für bot.decay und den Decay-Modus von compute_ratings_from_polls"""
+
+    def test_decayed_counts_match_direct_weighting(self):
+        """Globaler Faktor ergibt dieselben Counts wie die Gewichtung jeder Stimme."""
+        half_life = half_life_seconds(30)
+        at = START + 400 * SECONDS_PER_DAY
+        counts = decayed_counts(build_decayed_statistics(POLLS, half_life), at)
+        
+        weights = np.exp2(-(at - POLLS.finalized_at) / half_life)
+        direct = add_polls_to_statistics(
+            empty_poll_statistics(),
+            POLLS._replace(votes_a=POLLS.votes_a * weights, votes_b=POLLS.votes_b * weights)
+        )
+        np.testing.assert_array_equal(counts.episode_a, direct.episode_a)
+        np.testing.assert_allclose(counts.wins_a, direct.wins_a)
+        np.testing.assert_allclose(counts.wins_b, direct.wins_b)
+        np.testing.assert_array_equal(counts.pair_polls, [4, 1, 1])
+
+    def test_incremental_update_and_rebase(self):
+        """Inkrementelles Update und Rebase ändern die abgeklungenen Counts nicht."""
+        half_life = half_life_seconds(1)
+        at = START + 400 * SECONDS_PER_DAY
+        rebuilt = build_decayed_statistics(POLLS, half_life)
+        
+        early = POLLS.finalized_at < START + 100 * SECONDS_PER_DAY
+        stats = update_decayed_statistics(empty_decayed_statistics(half_life), subset(POLLS, early))
+        stats = update_decayed_statistics(stats, POLLS)
+        
+        # 380 Halbwertszeiten zwischen erstem und letztem Update -> Rebase
+        self.assertGreater(stats.reference, START + 20 * SECONDS_PER_DAY)
+        self.assertTrue(np.all(np.isfinite(stats.weighted_a)))
+        self.assertEqual(stats.n_polls, len(POLLS.poll_id))
+        np.testing.assert_allclose(decayed_counts(stats, at).wins_a, decayed_counts(rebuilt, at).wins_a)
+        np.testing.assert_allclose(decayed_counts(stats, at).wins_b, decayed_counts(rebuilt, at).wins_b)
+
+    def test_decay_follows_recent_preference(self):
+        """Mit kurzer Halbwertszeit dominieren neue Polls; mit sehr langer gleicht das Ergebnis dem statischen Modell."""
+        calculated_at = datetime.fromtimestamp(START + 400 * SECONDS_PER_DAY, tz=timezone.utc)
+        
+        static = {row['episode_id']: row for row in compute_ratings_from_polls(POLLS, calculated_at)}
+        decayed = {
+            row['episode_id']: row
+            for row in compute_ratings_from_polls(POLLS, calculated_at, half_life_days=30)
+        }
+        long = {
+            row['episode_id']: row
+            for row in compute_ratings_from_polls(POLLS, calculated_at, half_life_days=1e9)
+        }
+        
+        self.assertGreater(static[1]['utility'], static[2]['utility'])
+        self.assertGreater(decayed[2]['utility'], decayed[1]['utility'])
+        self.assertEqual(decayed[1]['matches'], static[1]['matches'])
+        for episode_id in static:
+            self.assertAlmostEqual(long[episode_id]['utility'], static[episode_id]['utility'], places=4)
+        
+        with self.assertRaises(BradleyTerryError):
+            compute_ratings_from_polls(POLLS, calculated_at, half_life_days=0)
+
+    def test_sidecar_round_trip(self):
+        """Sidecar wird identisch geladen; andere Halbwertszeit ergibt leere Statistiken."""
+        half_life = half_life_seconds(60)
+        stats = build_decayed_statistics(POLLS, half_life)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / '.cache' / 'polls_decay.npz'
+            save_decayed_statistics(path, stats)
+            loaded = load_decayed_statistics(path, half_life)
+            other = load_decayed_statistics(path, half_life_seconds(30))
+        
+        np.testing.assert_array_equal(loaded.weighted_a, stats.weighted_a)
+        self.assertEqual(loaded.reference, stats.reference)
+        self.assertEqual(loaded.watermark, stats.watermark)
+        self.assertEqual(other.n_polls, 0)
+        with self.assertRaises(DecayError):
+            half_life_seconds(-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
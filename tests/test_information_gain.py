@@ -0,0 +1,132 @@
+"""
+Tests für die informationsoptimale Paarauswahl
+
+Vergleicht die Sherman-Morrison-Updates mit direkter Neuberechnung der
+Kovarianz auf kleinen synthetischen Modellen, keine Netzwerkzugriffe.
+"""
+
+import unittest
+
+import numpy as np
+
+from bot.bradley_terry import build_model_input, fit_bradley_terry_model
+from bot.bt_solvers import fisher_information
+from bot.information_gain import (
+    information_gain,
+    information_gain_scores,
+    posterior_covariance,
+    select_most_informative,
+    InformationGainError
+)
+from bot.matchmaking import score_pairs, MatchmakingInput, NEVER_SEEN
+
+
+ALPHA = 0.1
+
+
+def example_model():
+    """Kette 1-2-3-4 mit vielen Stimmen auf 1-2 und wenigen auf 3-4."""
+    model = build_model_input(
+        episode_a=np.array([1, 2, 3, 1]),
+        episode_b=np.array([2, 3, 4, 3]),
+        votes_a=np.array([60, 8, 3, 5]),
+        votes_b=np.array([40, 6, 2, 1]),
+        n_polls=np.array([5, 1, 1, 1])
+    )
+    theta = fit_bradley_terry_model(model.counts, len(model.episode_ids), alpha=ALPHA)
+    return model, theta
+
+
+def example_scores(episode_ids):
+    """PairScores ohne Hard-Constraint-Einschränkung für die gegebenen Episoden."""
+    n = len(episode_ids)
+    state = MatchmakingInput(
+        episode_ids=np.asarray(episode_ids),
+        theta=np.zeros(n),
+        n_total=np.full(n, 10),
+        n_calib=np.full(n, 5),
+        last_seen_poll_idx=np.full(n, NEVER_SEEN),
+        poll_count=10
+    )
+    return score_pairs(state)
+
+
+class TestInformationGain(unittest.TestCase):
+    """Tests für posterior_covariance, information_gain und select_most_informative"""
+
+    def test_fisher_information_matches_finite_differences(self):
+        """Fisher-Information ist die negative Hesse-Matrix der Zielfunktion."""
+        model, theta = example_model()
+        counts = model.counts
+        n = len(theta)
+
+        def objective(t):
+            diff = t[counts.idx_a] - t[counts.idx_b]
+            log_likelihood = np.sum(counts.wins_a * -np.logaddexp(0, -diff) + counts.wins_b * -np.logaddexp(0, diff))
+            return log_likelihood + ALPHA * np.sum(t - np.exp(t))
+        
+        h = 1e-4
+        numeric = np.zeros((n, n))
+        for i in range(n):
+            for j in range(n):
+                e_i, e_j = np.eye(n)[i] * h, np.eye(n)[j] * h
+                numeric[i, j] = -(objective(theta + e_i + e_j) - objective(theta + e_i - e_j)
+                                  - objective(theta - e_i + e_j) + objective(theta - e_i - e_j)) / (4 * h * h)
+        
+        information = fisher_information(theta, counts, n, ALPHA)
+        np.testing.assert_allclose(information, numeric, atol=1e-3)
+        np.testing.assert_allclose(fisher_information(theta, counts, n, ALPHA, dense=False).toarray(), information)
+
+    def test_gain_matches_refactorization(self):
+        """Sherman-Morrison-Gewinne stimmen mit direkter Inversion von H + w e e^T überein."""
+        model, theta = example_model()
+        scores = example_scores([1, 2, 3, 4, 7])
+        posterior = posterior_covariance(model, theta, scores.episode_ids, ALPHA)
+        
+        information = np.linalg.inv(posterior.covariance)
+        votes = 12.0
+        trace_gain = information_gain(scores, posterior, votes, 'trace')
+        logdet_gain = information_gain(scores, posterior, votes, 'logdet')
+        
+        for k, (i, j) in enumerate(zip(scores.rows, scores.cols)):
+            p = 1.0 / (1.0 + np.exp(-(posterior.theta[i] - posterior.theta[j])))
+            e = np.zeros(len(posterior.episode_ids))
+            e[i], e[j] = 1.0, -1.0
+            updated = np.linalg.inv(information + votes * p * (1 - p) * np.outer(e, e))
+            self.assertAlmostEqual(trace_gain[k], np.trace(posterior.covariance) - np.trace(updated), places=8)
+            self.assertAlmostEqual(
+                logdet_gain[k],
+                np.linalg.slogdet(posterior.covariance)[1] - np.linalg.slogdet(updated)[1],
+                places=8
+            )
+
+    def test_unobserved_episode_is_most_informative(self):
+        """Eine Episode ohne Polls (nur Prior-Varianz) gehört zum besten Paar."""
+        model, theta = example_model()
+        scores = information_gain_scores(example_scores([1, 2, 3, 4, 7]), model, theta, alpha=ALPHA)
+        
+        self.assertAlmostEqual(scores.score[scores.eligible].max(), 1.0)
+        selection = select_most_informative(scores)
+        self.assertIn(7, (selection.episode_a_id, selection.episode_b_id))
+        self.assertFalse(selection.explored)
+        
+        # Paar 1-2 ist am besten bekannt und bringt am wenigsten
+        pair_12 = np.flatnonzero((scores.rows == 0) & (scores.cols == 1))[0]
+        self.assertEqual(int(np.argmin(scores.score)), pair_12)
+
+    def test_invalid_inputs_raise(self):
+        """alpha <= 0, unbekanntes Kriterium und fehlende Episoden führen zu Fehlern."""
+        model, theta = example_model()
+        scores = example_scores([1, 2, 3])
+        
+        with self.assertRaises(InformationGainError):
+            posterior_covariance(model, theta, scores.episode_ids, alpha=0.0)
+        posterior = posterior_covariance(model, theta, scores.episode_ids, ALPHA)
+        with self.assertRaises(InformationGainError):
+            information_gain(scores, posterior, 10.0, criterion='entropy')
+        with self.assertRaises(InformationGainError):
+            information_gain(example_scores([1, 2, 9]), posterior, 10.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,200 @@
+"""
+Tests für Scoring und Auswahl im Matchmaking
+
+Arbeitet mit kleinen synthetischen Zuständen, keine Netzwerkzugriffe.
+"""
+
+import math
+import unittest
+from datetime import datetime, timezone
+
+import numpy as np
+
+from bot.bradley_terry import compute_ratings_from_polls, count_matches_per_episode
+from bot.matchmaking import (
+    build_matchmaking_input,
+    score_pairs,
+    select_pair,
+    select_round,
+    top_candidates,
+    MatchmakingInput,
+    MatchmakingError,
+    ScoreWeights,
+    NEVER_SEEN,
+    WEIGHTS_BEFORE_BOOTSTRAP
+)
+from bot.q_matrix import compute_q_counts, lookup_q, QMatrix
+
+
+def example_state(**overrides):
+    """Active Set mit calibrated, uncalibrated und unobserved Episoden."""
+    state = MatchmakingInput(
+        episode_ids=np.array([1, 2, 3, 4, 5, 9]),
+        theta=np.array([0.5, -0.2, 0.1, 0.0, 0.3, 0.0]),
+        n_total=np.array([8, 7, 3, 2, 1, 0]),
+        n_calib=np.array([2, 3, 1, 0, 1, 0]),
+        last_seen_poll_idx=np.array([19, 18, 10, 5, 2, NEVER_SEEN]),
+        poll_count=20
+    )
+    return state._replace(**overrides)
+
+
+class TestMatchmaking(unittest.TestCase):
+    """Tests für score_pairs, top_candidates und select_pair"""
+
+    def test_terms_match_spec_formulas(self):
+        """Vektorisierte Terme entsprechen den Formeln aus docs/matchmaking.md pro Paar."""
+        state = example_state()
+        scores = score_pairs(state)
+        u = 1.0 / np.sqrt(state.n_total + 1.0)
+        u = (u - u.min()) / (u.max() - u.min())
+        calibrated = [True, True, False, False, False, False]
+        uncalibrated = [False, False, True, True, True, False]
+        
+        for k, (i, j) in enumerate(zip(scores.rows, scores.cols)):
+            p = 1.0 / (1.0 + math.exp(-(state.theta[i] - state.theta[j])))
+            recency = [
+                1.0 if state.last_seen_poll_idx[x] == NEVER_SEEN
+                else 1.0 - math.exp(-(20 - state.last_seen_poll_idx[x]) / 4.0)
+                for x in (i, j)
+            ]
+            self.assertAlmostEqual(scores.s_close[k], 1.0 - 2.0 * abs(p - 0.5))
+            self.assertAlmostEqual(scores.s_unc[k], (u[i] + u[j]) / 2.0)
+            self.assertEqual(
+                scores.s_cal[k],
+                float((uncalibrated[i] and calibrated[j]) or (calibrated[i] and uncalibrated[j]))
+            )
+            self.assertAlmostEqual(scores.s_rec[k], sum(recency) / 2.0)
+            w = WEIGHTS_BEFORE_BOOTSTRAP
+            self.assertAlmostEqual(
+                scores.score[k],
+                w.close * scores.s_close[k] + w.unc * scores.s_unc[k]
+                + w.cal * scores.s_cal[k] + w.rec * scores.s_rec[k]
+            )
+
+    def test_hard_constraints(self):
+        """Unobserved nur gegen calibrated, uncalibrated-Paare nur mit Kalibrierung, Komponenten-Phase."""
+        scores = score_pairs(example_state())
+        eligible = {
+            (int(scores.episode_ids[i]), int(scores.episode_ids[j]))
+            for i, j, ok in zip(scores.rows, scores.cols, scores.eligible) if ok
+        }
+        self.assertIn((1, 9), eligible)
+        self.assertIn((3, 5), eligible)
+        self.assertNotIn((3, 4), eligible)
+        self.assertNotIn((4, 9), eligible)
+        self.assertIn((1, 2), eligible)
+        
+        components = np.array([1, 1, 1, 2, 2, 2])
+        scores = score_pairs(example_state(component_id=components))
+        self.assertFalse(np.any(scores.eligible & (components[scores.rows] == components[scores.cols])))
+
+    def test_q_term_from_q_matrix(self):
+        """S_q stammt aus der q-Matrix; Paare mit Episoden ohne Bootstrap erhalten 0."""
+        rng = np.random.default_rng(0)
+        q_ids = np.array([1, 2, 3, 4, 5])
+        q_matrix = QMatrix(q_ids, compute_q_counts(rng.normal(size=(40, 5))), 40, 20, 0)
+        state = example_state(sd_theta=np.array([0.1, 0.2, 0.4, 0.5, 0.6, np.nan]))
+        scores = score_pairs(state, q_matrix)
+        
+        ids_a = state.episode_ids[scores.rows]
+        ids_b = state.episode_ids[scores.cols]
+        q = lookup_q(q_matrix, ids_a, ids_b)
+        expected = np.where(np.isnan(q), 0.0, 1.0 - np.abs(2.0 * q - 1.0))
+        np.testing.assert_allclose(scores.s_q, expected)
+        self.assertEqual(scores.s_unc[(ids_a == 5) & (ids_b == 9)][0], 1.0)
+
+    def test_top_candidates_and_selection(self):
+        """argpartition liefert die Top-K eligible Paare; kleine Temperatur wählt das beste Paar."""
+        scores = score_pairs(example_state())
+        eligible = np.flatnonzero(scores.eligible)
+        best = eligible[np.argsort(scores.score[eligible])[::-1]]
+        
+        self.assertEqual(set(top_candidates(scores, 3)), set(best[:3]))
+        self.assertEqual(set(top_candidates(scores, 100)), set(eligible))
+        
+        selection = select_pair(scores, np.random.default_rng(0), temperature=1e-6, epsilon=0.0)
+        self.assertEqual(
+            (selection.episode_a_id, selection.episode_b_id),
+            (int(scores.episode_ids[scores.rows[best[0]]]), int(scores.episode_ids[scores.cols[best[0]]]))
+        )
+        self.assertFalse(selection.explored)
+        
+        explored = select_pair(scores, np.random.default_rng(0), epsilon=1.0)
+        self.assertTrue(explored.explored)
+        
+        with self.assertRaises(MatchmakingError):
+            select_pair(scores._replace(eligible=np.zeros_like(scores.eligible)))
+
+    def test_round_has_disjoint_pairs(self):
+        """Eine Runde enthält jede Episode höchstens einmal, auch wenn der Kandidaten-Pool erschöpft ist."""
+        rng = np.random.default_rng(3)
+        n = 30
+        state = MatchmakingInput(
+            episode_ids=np.arange(1, n + 1),
+            theta=rng.normal(size=n),
+            n_total=rng.integers(0, 12, n),
+            n_calib=rng.integers(0, 4, n),
+            last_seen_poll_idx=rng.integers(-1, 40, n),
+            poll_count=40
+        )
+        scores = score_pairs(state)
+        
+        for k_candidates in (1, 100):
+            selections = select_round(scores, 8, np.random.default_rng(0), k_candidates=k_candidates)
+            episodes = [ep for sel in selections for ep in (sel.episode_a_id, sel.episode_b_id)]
+            self.assertEqual(len(selections), 8)
+            self.assertEqual(len(set(episodes)), len(episodes))
+            for sel in selections:
+                pair = np.flatnonzero(
+                    (scores.episode_ids[scores.rows] == sel.episode_a_id)
+                    & (scores.episode_ids[scores.cols] == sel.episode_b_id)
+                )
+                self.assertTrue(scores.eligible[pair[0]])
+        
+        # 6 Episoden im Active Set: höchstens 3 disjunkte Paare, Rest wird ausgelassen
+        small = score_pairs(example_state())
+        self.assertLessEqual(len(select_round(small, 10, np.random.default_rng(0))), 3)
+    
+    def test_round_penalizes_overlapping_pairs(self):
+        """Der Überlappungs-Malus verschiebt den zweiten Poll in einen anderen Bereich der Skala."""
+        state = MatchmakingInput(
+            episode_ids=np.arange(1, 9),
+            theta=np.array([0.0, 0.005, 0.03, 0.042, 2.0, 2.015, -3.0, 3.0]),
+            n_total=np.full(8, 10),
+            n_calib=np.full(8, 3),
+            last_seen_poll_idx=np.full(8, 5),
+            poll_count=10
+        )
+        scores = score_pairs(state, weights=ScoreWeights(close=1.0, unc=0.0, cal=0.0, rec=0.0, q=0.0))
+        
+        def round_pairs(overlap_weight):
+            selections = select_round(
+                scores, 2, np.random.default_rng(0), temperature=1e-6, epsilon=0.0,
+                overlap_weight=overlap_weight
+            )
+            return [(sel.episode_a_id, sel.episode_b_id) for sel in selections]
+        
+        self.assertEqual(round_pairs(0.0), [(1, 2), (3, 4)])
+        self.assertEqual(round_pairs(1.0), [(1, 2), (5, 6)])
+    
+    def test_build_input_from_ratings(self):
+        """theta und n_total werden aus compute_ratings_from_polls und count_matches_per_episode übernommen."""
+        polls = [
+            {'episode_a_id': 1, 'episode_b_id': 2, 'votes_a': 30, 'votes_b': 10},
+            {'episode_a_id': 2, 'episode_b_id': 3, 'votes_a': 20, 'votes_b': 20},
+            {'episode_a_id': 1, 'episode_b_id': 3, 'votes_a': 25, 'votes_b': 15}
+        ]
+        ratings = compute_ratings_from_polls(polls, datetime(2024, 1, 1, tzinfo=timezone.utc))
+        counts = count_matches_per_episode(polls, [1, 2, 3])
+        state = build_matchmaking_input([3, 1, 2, 4], ratings, counts, {1: 1}, {1: 2, 2: 2, 3: 1}, 3)
+        
+        np.testing.assert_array_equal(state.episode_ids, [1, 2, 3, 4])
+        np.testing.assert_array_equal(state.n_total, [2, 2, 2, 0])
+        np.testing.assert_array_equal(state.last_seen_poll_idx, [2, 2, 1, NEVER_SEEN])
+        self.assertEqual(state.theta[3], 0.0)
+        self.assertGreater(state.theta[0], state.theta[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+"""
+Tests für den inkrementellen Matchmaking-State
+
+Arbeitet mit synthetischen Polls und temporären Dateien, keine Netzwerkzugriffe.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from bot.matchmaking import NEVER_SEEN
+from bot.matchmaking_state import (
+    active_episode_ids,
+    apply_poll,
+    build_matchmaking_input_from_state,
+    diff_matchmaking_states,
+    empty_matchmaking_state,
+    load_matchmaking_state,
+    rebuild_matchmaking_state,
+    save_matchmaking_state,
+    set_catalog_size,
+    update_matchmaking_state
+)
+from bot.tsv_repository import PollColumns
+
+
+def make_polls(pairs, start=0):
+    """PollColumns mit aufsteigendem finalized_at für eine Liste von Paaren."""
+    n = len(pairs)
+    pairs = np.array(pairs, dtype=np.int64).reshape(-1, 2)
+    return PollColumns(
+        poll_id=np.arange(start + 1, start + n + 1),
+        episode_a_id=pairs[:, 0],
+        episode_b_id=pairs[:, 1],
+        votes_a=np.full(n, 10),
+        votes_b=np.full(n, 5),
+        finalized_at=np.arange(start, start + n) * 60 + 1_700_000_000
+    )
+
+
+def seed_rounds(n_rounds):
+    """Polls innerhalb des Seed-Pools 1..8 (n_rounds < 7)."""
+    return [(i, (i + r) % 8 + 1) for r in range(n_rounds) for i in range(1, 9, 2)]
+
+
+class TestMatchmakingState(unittest.TestCase):
+    """Tests für apply_poll, Frontier, inkrementelles Update und Checkpoint"""
+
+    def test_calibration_depends_on_order(self):
+        """Kalibrierungs-Polls zählen nur gegen calibrated Episoden oder Seed-Anker."""
+        state = empty_matchmaking_state(catalog_size=20)
+        for _ in range(6):
+            state = apply_poll(state, 1, 2)
+        
+        self.assertEqual(state.n_total[0], 6)
+        self.assertEqual(state.n_calib[0], 6)
+        
+        # Episode 10 gegen Episode 9 (beide nicht calibrated, keine Seeds): keine Kalibrierung
+        state = apply_poll(state, 9, 10)
+        self.assertEqual(state.n_calib[9 - 1], 0)
+        state = apply_poll(state, 10, 1)
+        self.assertEqual(state.n_calib[10 - 1], 1)
+        self.assertEqual(state.n_calib[0], 6)
+        self.assertEqual(state.last_seen_poll_idx[10 - 1], 7)
+        self.assertEqual(state.last_seen_poll_idx[9 - 1], 6)
+        self.assertEqual(state.poll_count, 8)
+
+    def test_frontier_rolls_forward(self):
+        """Aktivierte Frontier-Episoden werden ersetzt; Active Set = activated ∪ frontier."""
+        state = empty_matchmaking_state(catalog_size=14)
+        self.assertEqual(state.frontier, [9, 10, 11, 12])
+        
+        state = apply_poll(state, 1, 10)
+        self.assertEqual(state.frontier, [9, 11, 12, 13])
+        state = apply_poll(state, 2, 12)
+        state = apply_poll(state, 3, 13)
+        self.assertEqual(state.frontier, [9, 11, 14])
+        
+        state = set_catalog_size(state, 20)
+        self.assertEqual(state.frontier, [9, 11, 14, 15])
+        np.testing.assert_array_equal(
+            active_episode_ids(state), [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15]
+        )
+        
+        # Episode außerhalb des Katalogs vergrößert die Arrays
+        state = apply_poll(state, 1, 40)
+        self.assertEqual(state.catalog_size, 40)
+        self.assertTrue(state.activated[39])
+
+    def test_incremental_update_matches_rebuild(self):
+        """Update in zwei Schritten ergibt denselben Zustand wie der Neuaufbau."""
+        pairs = seed_rounds(4) + [(1, 9), (9, 2), (10, 3), (9, 10), (11, 4), (2, 11)]
+        polls = make_polls(pairs)
+        half = PollColumns(*(column[:12] for column in polls))
+        
+        state = update_matchmaking_state(empty_matchmaking_state(catalog_size=30), half)
+        state = update_matchmaking_state(state, polls)
+        rebuilt = rebuild_matchmaking_state(polls, catalog_size=30)
+        
+        self.assertEqual(diff_matchmaking_states(state, rebuilt), [])
+        self.assertEqual(state.poll_count, len(pairs))
+        
+        # Nachträglich eingefügter Poll vor dem Watermark -> Neuaufbau
+        extra = make_polls([(5, 6)])._replace(finalized_at=polls.finalized_at[:1] + 30)
+        inserted = PollColumns(*(np.concatenate(columns) for columns in zip(polls, extra)))
+        state = update_matchmaking_state(state, inserted)
+        self.assertEqual(diff_matchmaking_states(state, rebuild_matchmaking_state(inserted, catalog_size=30)), [])
+
+    def test_checkpoint_round_trip(self):
+        """Gespeicherter Checkpoint wird identisch geladen; fehlende Datei ergibt None."""
+        state = rebuild_matchmaking_state(make_polls(seed_rounds(3) + [(1, 9)]), catalog_size=25)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / '.cache' / 'polls_matchmaking.npz'
+            self.assertIsNone(load_matchmaking_state(path))
+            save_matchmaking_state(path, state)
+            loaded = load_matchmaking_state(path)
+        
+        self.assertEqual(diff_matchmaking_states(loaded, state), [])
+        loaded = apply_poll(loaded, 2, 10)
+        self.assertEqual(loaded.n_total[10 - 1], 1)
+
+    def test_matchmaking_input_from_state(self):
+        """Matchmaking-Arrays kommen direkt aus dem State (ohne Polls)."""
+        state = rebuild_matchmaking_state(make_polls([(1, 2), (2, 9)]), catalog_size=20)
+        ratings = [{'episode_id': 1, 'utility': 2.0}, {'episode_id': 2, 'utility': 0.5}]
+        matchmaking_input = build_matchmaking_input_from_state(state, ratings)
+        
+        np.testing.assert_array_equal(matchmaking_input.episode_ids, np.arange(1, 14))
+        np.testing.assert_array_equal(matchmaking_input.n_total[:3], [1, 2, 0])
+        self.assertEqual(matchmaking_input.last_seen_poll_idx[8], 1)
+        self.assertEqual(matchmaking_input.last_seen_poll_idx[2], NEVER_SEEN)
+        self.assertAlmostEqual(matchmaking_input.theta[0], np.log(2.0))
+        self.assertEqual(matchmaking_input.poll_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
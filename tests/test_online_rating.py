@@ -0,0 +1,112 @@
+"""
+Tests für die Online-Updates der Ratings zwischen vollständigen Refits
+
+Arbeitet mit synthetischen Polls und temporären Dateien, keine Netzwerkzugriffe.
+"""
+
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from bot.bradley_terry import compute_ratings_from_polls
+from bot.online_rating import (
+    load_online_rating_state,
+    online_deviation,
+    online_rating_rows,
+    refit_online_ratings,
+    save_online_rating_state,
+    update_online_ratings
+)
+from bot.tsv_repository import PollColumns
+from tests.helpers import random_polls, subset
+
+
+START = 1_700_000_000
+
+
+class TestOnlineRating(unittest.TestCase):
+    """Tests für bot.online_rating"""
+
+    def test_online_update_tracks_exact_fit(self):
+        """Lokale Newton-Schritte bleiben nahe am exakten Fit, deutlich näher als ohne Update."""
+        polls = random_polls(n_episodes=40, n_polls=600, votes=30, start=START)
+        stale = update_online_ratings(None, subset(polls, slice(570)))
+        online = update_online_ratings(stale, polls)
+        exact = refit_online_ratings(None, polls)
+        
+        self.assertEqual(online.n_online, 30)
+        self.assertEqual(online.n_polls, 600)
+        online_error = online_deviation(online.episode_ids, online.theta, exact.episode_ids, exact.theta)
+        stale_error = online_deviation(stale.episode_ids, stale.theta, exact.episode_ids, exact.theta)
+        self.assertLess(online_error, 0.2 * stale_error)
+        self.assertLess(online_error, 0.01)
+        
+        # Refit misst die Abweichung und entspricht compute_ratings_from_polls
+        refit = refit_online_ratings(online, polls)
+        self.assertEqual(refit.n_online, 0)
+        self.assertAlmostEqual(refit.last_deviation, online_error)
+        self.assertEqual(refit.max_deviation, refit.last_deviation)
+        calculated_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        expected = compute_ratings_from_polls(polls, calculated_at)
+        rows = online_rating_rows(refit, calculated_at)
+        self.assertEqual([row['episode_id'] for row in rows], [row['episode_id'] for row in expected])
+        self.assertEqual([row['matches'] for row in rows], [row['matches'] for row in expected])
+        for got, want in zip(rows, expected):
+            self.assertAlmostEqual(got['utility'], want['utility'], places=4)
+
+    def test_new_episode_and_disconnected_poll(self):
+        """Neue Episode startet bei theta = 0; Polls ohne Episode im Modell warten auf den Refit."""
+        polls = random_polls(n_episodes=10, n_polls=100, votes=30, start=START)
+        state = update_online_ratings(None, polls)
+        extra = PollColumns(
+            poll_id=np.array([101, 102]),
+            episode_a_id=np.array([50, 3]),
+            episode_b_id=np.array([60, 11]),
+            votes_a=np.array([10, 5]),
+            votes_b=np.array([10, 25]),
+            finalized_at=np.array([START + 200, START + 201])
+        )
+        all_polls = PollColumns(*(np.concatenate(pair) for pair in zip(polls, extra)))
+        state = update_online_ratings(state, all_polls)
+        
+        self.assertEqual(state.n_polls, 102)
+        self.assertEqual(state.n_online, 1)
+        self.assertEqual(state.episode_ids[-1], 11)
+        rows = online_rating_rows(state, datetime(2024, 1, 1, tzinfo=timezone.utc))
+        self.assertEqual([row['episode_id'] for row in rows], list(range(1, 12)))
+        self.assertEqual(rows[-1]['matches'], 1)
+        self.assertGreater(rows[-1]['utility'], rows[2]['utility'])
+
+    def test_refit_triggers(self):
+        """Refit bei zu vielen Online-Updates und bei inkonsistentem Zustand."""
+        polls = random_polls(n_episodes=10, n_polls=100, votes=30, start=START)
+        state = update_online_ratings(None, subset(polls, slice(80)))
+        self.assertEqual(update_online_ratings(state, polls, max_online_polls=10).n_online, 0)
+        self.assertEqual(update_online_ratings(state, polls).n_online, 20)
+        
+        inconsistent = state._replace(n_polls=state.n_polls - 1)
+        self.assertEqual(update_online_ratings(inconsistent, polls).n_online, 0)
+
+    def test_sidecar_round_trip(self):
+        """Gespeicherter Zustand wird identisch geladen; unlesbare Datei ergibt None."""
+        polls = random_polls(n_episodes=10, n_polls=100, votes=30, start=START)
+        state = update_online_ratings(update_online_ratings(None, subset(polls, slice(90))), polls)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / '.cache' / 'polls_online.npz'
+            save_online_rating_state(path, state)
+            loaded = load_online_rating_state(path)
+            path.write_bytes(b'kein npz')
+            broken = load_online_rating_state(path)
+        
+        np.testing.assert_array_equal(loaded.theta, state.theta)
+        np.testing.assert_array_equal(loaded.counts.wins_a, state.counts.wins_a)
+        self.assertEqual(loaded.n_online, state.n_online)
+        self.assertEqual(loaded.watermark, state.watermark)
+        self.assertIsNone(broken)
+
+
+if __name__ == '__main__':
+    unittest.main()
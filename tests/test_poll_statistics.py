@@ -0,0 +1,153 @@
+"""
+Tests für das Statistik-Sidecar (suffiziente Statistiken der Polls)
+
+Arbeitet mit synthetischen Polls und temporären Dateien, keine Netzwerkzugriffe.
+"""
+
+import tempfile
+import unittest
+from datetime import datetime, timezone, timedelta
+from pathlib import Path
+
+import numpy as np
+
+from bot.bradley_terry import compute_ratings_from_polls
+from bot.poll_statistics import (
+    combine_checksums,
+    empty_poll_statistics,
+    add_polls_to_statistics,
+    poll_arrays,
+    poll_checksum,
+    update_poll_statistics,
+    statistics_match_counts,
+    load_poll_statistics,
+    save_poll_statistics
+)
+
+
+def make_polls():
+    """Erzeugt geparste Polls mit aufsteigendem finalized_at."""
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    pairs = [(1, 2, 70, 30), (2, 3, 60, 40), (1, 3, 80, 20), (3, 1, 15, 25), (3, 4, 50, 50)]
+    return [
+        {
+            'poll_id': str(k + 1),
+            'episode_a_id': a,
+            'episode_b_id': b,
+            'votes_a': va,
+            'votes_b': vb,
+            'finalized_at': start + timedelta(days=k)
+        }
+        for k, (a, b, va, vb) in enumerate(pairs)
+    ]
+
+
+class TestPollStatistics(unittest.TestCase):
+    """Tests für bot.poll_statistics"""
+
+    def test_incremental_update_equals_rebuild(self):
+        """
+        Test: Inkrementelle Aktualisierung ergibt dieselben Aggregate wie ein Neuaufbau.
+        """
+        polls = make_polls()
+        
+        stats = update_poll_statistics(empty_poll_statistics(), polls[:3])
+        stats = update_poll_statistics(stats, polls)
+        rebuilt = add_polls_to_statistics(empty_poll_statistics(), polls)
+        
+        self.assertEqual(stats.n_polls, 5)
+        self.assertEqual(stats.watermark, int(polls[-1]['finalized_at'].timestamp()))
+        for field in ('episode_a', 'episode_b', 'wins_a', 'wins_b', 'pair_polls'):
+            np.testing.assert_array_equal(getattr(stats, field), getattr(rebuilt, field))
+        
+        # Paar (1, 3) fasst zwei Polls in beiden Orientierungen zusammen
+        k = int(np.flatnonzero((stats.episode_a == 1) & (stats.episode_b == 3))[0])
+        self.assertEqual((stats.wins_a[k], stats.wins_b[k], stats.pair_polls[k]), (105, 35, 2))
+        self.assertEqual(statistics_match_counts(stats), {1: 3, 2: 2, 3: 4, 4: 1})
+
+    def test_inconsistent_sidecar_is_rebuilt(self):
+        """
+        Test: Weicht die Anzahl der Polls bis zum Watermark ab, wird neu aufgebaut.
+        """
+        polls = make_polls()
+        stats = update_poll_statistics(empty_poll_statistics(), polls[:3])
+        
+        # Poll 3 fehlt nachträglich in der Quelle
+        stats = update_poll_statistics(stats, polls[:2] + polls[3:])
+        
+        self.assertEqual(stats.n_polls, 4)
+        self.assertEqual(statistics_match_counts(stats), {1: 2, 2: 2, 3: 3, 4: 1})
+
+    def test_edited_poll_is_rebuilt(self):
+        """
+        Test: Nachträglich geänderte Stimmen bei gleicher Anzahl führen zum Neuaufbau.
+        """
+        polls = make_polls()
+        stats = update_poll_statistics(empty_poll_statistics(), polls[:3])
+        
+        edited = [dict(poll) for poll in polls]
+        edited[0]['votes_a'] = 0
+        stats = update_poll_statistics(stats, edited)
+        rebuilt = add_polls_to_statistics(empty_poll_statistics(), edited)
+        
+        np.testing.assert_array_equal(stats.wins_a, rebuilt.wins_a)
+        self.assertEqual(stats.checksum, rebuilt.checksum)
+        self.assertEqual(stats.wins_a[0], 0)
+
+    def test_checksum_is_additive_and_order_independent(self):
+        """
+        Test: Die Prüfsumme hängt nicht von der Reihenfolge ab und setzt sich aus Teilmengen zusammen.
+        """
+        arrays = poll_arrays(make_polls())
+        order = np.array([4, 2, 0, 3, 1])
+        total = poll_checksum(*arrays)
+        
+        self.assertEqual(poll_checksum(*(array[order] for array in arrays)), total)
+        self.assertEqual(
+            combine_checksums(
+                poll_checksum(*(array[:2] for array in arrays)),
+                poll_checksum(*(array[2:] for array in arrays))
+            ),
+            total
+        )
+        swapped = (arrays[0], arrays[1], arrays[3], arrays[2], arrays[4])
+        self.assertNotEqual(poll_checksum(*swapped), total)
+
+    def test_save_and_load_roundtrip(self):
+        """
+        Test: Sidecar übersteht Speichern und Laden unverändert.
+        """
+        stats = update_poll_statistics(empty_poll_statistics(), make_polls())
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / '.cache' / 'polls_stats.npz'
+            save_poll_statistics(path, stats)
+            loaded = load_poll_statistics(path)
+        
+        self.assertEqual(loaded.watermark, stats.watermark)
+        self.assertEqual(loaded.n_polls, stats.n_polls)
+        self.assertEqual(loaded.checksum, stats.checksum)
+        np.testing.assert_array_equal(loaded.wins_a, stats.wins_a)
+        np.testing.assert_array_equal(loaded.pair_polls, stats.pair_polls)
+
+    def test_compute_ratings_from_statistics(self):
+        """
+        Test: compute_ratings_from_polls liefert aus dem Sidecar dieselben Ratings.
+        """
+        polls = make_polls()
+        stats = update_poll_statistics(empty_poll_statistics(), polls)
+        calculated_at = datetime.now(timezone.utc)
+        
+        from_polls = compute_ratings_from_polls(polls, calculated_at)
+        from_stats = compute_ratings_from_polls(stats, calculated_at)
+        
+        self.assertEqual(
+            [(row['episode_id'], row['matches']) for row in from_polls],
+            [(row['episode_id'], row['matches']) for row in from_stats]
+        )
+        for row_polls, row_stats in zip(from_polls, from_stats):
+            self.assertAlmostEqual(row_polls['utility'], row_stats['utility'], places=8)
+
+
+if __name__ == '__main__':
+    unittest.main()
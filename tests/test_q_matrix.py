@@ -0,0 +1,123 @@
+"""
+Tests für die gepackte q-Matrix aus dem Bootstrap
+
+Arbeitet mit zufälligen theta-Draws und temporären Dateien, keine Netzwerkzugriffe.
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+from bot import q_matrix
+from bot.q_matrix import (
+    compute_q_counts,
+    load_q_matrix,
+    lookup_q,
+    packed_index,
+    refresh_q_matrix,
+    save_q_matrix,
+    QMatrixError
+)
+
+
+def brute_force_q(theta):
+    """Vollständige Matrix q_ij über einen Tensor (B, n, n), Gleichstände zur Hälfte."""
+    rows, cols = theta[:, :, None], theta[:, None, :]
+    return (rows > cols).mean(axis=0) + 0.5 * (rows == cols).mean(axis=0)
+
+
+class TestQMatrix(unittest.TestCase):
+    """Tests für Berechnung, Speicherung und Abfrage der q-Matrix"""
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.theta = rng.normal(np.linspace(-1.0, 1.0, 9), 0.5, size=(50, 9))
+        self.episode_ids = np.array([1, 2, 3, 5, 8, 13, 21, 34, 55])
+        self.tmp = tempfile.TemporaryDirectory()
+        self.meta_path = Path(self.tmp.name) / '.cache' / 'bootstrap_q_matrix.json'
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_counts_match_brute_force(self):
+        """Gepackte Zählwerte entsprechen dem oberen Dreieck der vollen Matrix, auch bei kleinen Blöcken."""
+        expected = brute_force_q(self.theta)[np.triu_indices(9, k=1)]
+        
+        for block_entries in (1, 100, q_matrix.Q_BLOCK_ENTRIES):
+            with mock.patch.object(q_matrix, 'Q_BLOCK_ENTRIES', block_entries):
+                counts = compute_q_counts(self.theta)
+            self.assertEqual(counts.dtype, np.uint8)
+            np.testing.assert_array_equal(counts / 100, expected)
+        
+        rows, cols = np.triu_indices(9, k=1)
+        np.testing.assert_array_equal(packed_index(rows, cols, 9), np.arange(len(rows)))
+
+    def test_uint16_for_many_resamples(self):
+        """Mehr als 127 Resamples werden als uint16 gespeichert."""
+        theta = np.random.default_rng(1).normal(size=(128, 4))
+        counts = compute_q_counts(theta)
+        self.assertEqual(counts.dtype, np.uint16)
+        np.testing.assert_array_equal(counts / 256, brute_force_q(theta)[np.triu_indices(4, k=1)])
+
+    def test_ties_of_absent_episodes_count_half(self):
+        """Episoden ohne Polls in einem Resample liegen dort gleichauf; q_ab + q_ba = 1 in beiden Orientierungen."""
+        theta = self.theta.copy()
+        absent = np.arange(50) % 5 == 0
+        theta[absent, 2] = 0.0
+        theta[absent, 4] = 0.0
+        theta[::2, 7] = theta[::2, 8]
+        save_q_matrix(self.meta_path, theta, self.episode_ids, 42, seed=7)
+        loaded = load_q_matrix(self.meta_path)
+        
+        full = brute_force_q(theta)
+        q = lookup_q(loaded, [3, 8, 34, 55], [8, 3, 55, 34])
+        np.testing.assert_allclose(q, [full[2, 4], full[4, 2], full[7, 8], full[8, 7]])
+        np.testing.assert_allclose(q[[0, 2]] + q[[1, 3]], 1.0)
+        self.assertGreaterEqual(q[2], 0.25)
+        self.assertLessEqual(q[2], 0.75)
+
+    def test_save_load_and_lookup(self):
+        """Gespeicherte Matrix wird als Memory-Map geladen; Abfragen berücksichtigen die Orientierung."""
+        save_q_matrix(self.meta_path, self.theta, self.episode_ids, 42, seed=7)
+        loaded = load_q_matrix(self.meta_path)
+        
+        self.assertIsInstance(loaded.counts, np.memmap)
+        self.assertEqual(loaded.n_resamples, 50)
+        self.assertEqual(loaded.updated_at_poll_idx, 42)
+        np.testing.assert_array_equal(loaded.episode_ids, self.episode_ids)
+        
+        full = brute_force_q(self.theta)
+        q = lookup_q(loaded, [1, 55, 8, 3, 4, 2], [55, 1, 8, 21, 2, 99])
+        self.assertAlmostEqual(q[0], full[0, 8])
+        self.assertAlmostEqual(q[1], full[8, 0])
+        self.assertEqual(q[2], 0.5)
+        self.assertAlmostEqual(q[3], full[2, 6])
+        self.assertTrue(np.isnan(q[4]))
+        self.assertTrue(np.isnan(q[5]))
+
+    def test_refresh_skips_current_matrix(self):
+        """Unveränderter Bootstrap-Lauf schreibt nicht neu, ein neuer ersetzt alte Dateien."""
+        self.assertTrue(refresh_q_matrix(self.meta_path, self.theta, self.episode_ids, 42, seed=7))
+        self.assertFalse(refresh_q_matrix(self.meta_path, self.theta, self.episode_ids, 42, seed=7))
+        
+        self.assertTrue(refresh_q_matrix(self.meta_path, self.theta[::-1], self.episode_ids, 47, seed=7))
+        self.assertEqual(len(list(self.meta_path.parent.glob('bootstrap_q_matrix_*.npy'))), 1)
+        self.assertEqual(load_q_matrix(self.meta_path).updated_at_poll_idx, 47)
+
+    def test_invalid_input_and_missing_data(self):
+        """Falsche Shape ist ein Fehler, fehlende Daten ergeben None."""
+        with self.assertRaises(QMatrixError):
+            save_q_matrix(self.meta_path, self.theta, self.episode_ids[:-1], 42, seed=7)
+        self.assertIsNone(load_q_matrix(self.meta_path))
+        
+        save_q_matrix(self.meta_path, self.theta, self.episode_ids, 42, seed=7)
+        for data_path in self.meta_path.parent.glob('bootstrap_q_matrix_*.npy'):
+            data_path.unlink()
+        self.assertIsNone(load_q_matrix(self.meta_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+"""
+Tests für den Ergebnis-Cache der Rating-Berechnung
+
+Arbeitet mit temporären Dateien (tempfile), keine Netzwerkzugriffe.
+"""
+
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest import mock
+
+from bot import bradley_terry
+from bot.bradley_terry import run_rating_update, default_rating_cache_path
+from bot.rating_cache import compute_poll_digest
+from bot.tsv_repository import load_ratings
+
+
+POLLS_HEADER = (
+    "poll_id\treddit_post_id\tcreated_at\tcloses_at\t"
+    "episode_a_id\tepisode_b_id\tvotes_a\tvotes_b\tfinalized_at\n"
+)
+
+
+def poll_line(poll_id: int, a: int, b: int, votes_a: int, votes_b: int) -> str:
+    """Erzeugt eine finalisierte Poll-Zeile für polls.tsv."""
+    return (
+        f"{poll_id}\tp{poll_id}\t2024-01-01T10:00:00Z\t2024-01-08T10:00:00Z\t"
+        f"{a}\t{b}\t{votes_a}\t{votes_b}\t2024-01-08T11:00:00Z\n"
+    )
+
+
+class TestRatingCache(unittest.TestCase):
+    """Tests für bot.rating_cache und die Cache-Integration in run_rating_update"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.data_dir = Path(self.tmp.name)
+        self.polls_path = self.data_dir / "polls.tsv"
+        self.ratings_path = self.data_dir / "ratings.tsv"
+        self.polls_path.write_text(
+            POLLS_HEADER
+            + poll_line(1, 1, 2, 70, 30)
+            + poll_line(2, 2, 3, 60, 40)
+            + poll_line(3, 1, 3, 80, 20),
+            encoding='utf-8'
+        )
+        self.calculated_at = datetime(2024, 2, 1, tzinfo=timezone.utc)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_digest_ignores_order_and_orientation(self):
+        """
+        Test: Digest hängt nicht von Reihenfolge oder A/B-Orientierung ab.
+        """
+        params = {'alpha': 0.01}
+        polls = [
+            {'episode_a_id': 1, 'episode_b_id': 2, 'votes_a': 70, 'votes_b': 30},
+            {'episode_a_id': 2, 'episode_b_id': 3, 'votes_a': 60, 'votes_b': 40},
+        ]
+        reordered = [
+            {'episode_a_id': 3, 'episode_b_id': 2, 'votes_a': 40, 'votes_b': 60},
+            {'episode_a_id': 1, 'episode_b_id': 2, 'votes_a': 70, 'votes_b': 30},
+        ]
+        
+        self.assertEqual(compute_poll_digest(polls, params), compute_poll_digest(reordered, params))
+        self.assertNotEqual(compute_poll_digest(polls, params), compute_poll_digest(polls, {'alpha': 0.1}))
+
+    def test_unreadable_snapshot_disables_warm_start(self):
+        """
+        Test: Ein nicht lesbarer Snapshot führt zu einem Fit ohne Warm-Start statt zu einem Abbruch.
+        """
+        self.ratings_path.write_text(
+            "episode_id\tutility\tmatches\tcalculated_at\n1\tkaputt\t3\t2024-01-01T00:00:00Z\n",
+            encoding='utf-8'
+        )
+        
+        with self.assertLogs('bot.bradley_terry', level='WARNING') as logs:
+            rows = run_rating_update(self.polls_path, self.ratings_path, self.calculated_at, use_cache=False)
+        
+        self.assertEqual([row['episode_id'] for row in rows], [1, 2, 3])
+        self.assertTrue(any('Warm-Start' in message for message in logs.output))
+
+    def test_unchanged_polls_skip_fit_and_snapshot(self):
+        """
+        Test: Zweiter Lauf mit unveränderten Polls fittet nicht und schreibt keinen Snapshot.
+        """
+        first = run_rating_update(self.polls_path, self.ratings_path, self.calculated_at)
+        self.assertTrue(default_rating_cache_path(self.ratings_path).exists())
+        
+        with mock.patch.object(bradley_terry, 'compute_ratings_from_polls') as compute:
+            second = run_rating_update(self.polls_path, self.ratings_path, self.calculated_at)
+            compute.assert_not_called()
+        
+        self.assertEqual(
+            [(row['episode_id'], row['utility'], row['matches']) for row in first],
+            [(row['episode_id'], row['utility'], row['matches']) for row in second]
+        )
+        self.assertEqual(len(load_ratings(self.ratings_path)), 3)
+
+    def test_cache_hit_can_write_snapshot(self):
+        """
+        Test: Mit write_snapshot_on_cache_hit wird auch bei Cache-Treffer geschrieben.
+        """
+        run_rating_update(self.polls_path, self.ratings_path, self.calculated_at)
+        run_rating_update(
+            self.polls_path, self.ratings_path, self.calculated_at,
+            write_snapshot_on_cache_hit=True
+        )
+        
+        self.assertEqual(len(load_ratings(self.ratings_path)), 6)
+
+    def test_new_poll_invalidates_cache(self):
+        """
+        Test: Ein neu finalisierter Poll führt zu einem neuen Fit.
+        """
+        run_rating_update(self.polls_path, self.ratings_path, self.calculated_at)
+        with open(self.polls_path, 'a', encoding='utf-8') as f:
+            f.write(poll_line(4, 3, 4, 50, 50))
+        
+        rows = run_rating_update(self.polls_path, self.ratings_path, self.calculated_at)
+        
+        self.assertEqual([row['episode_id'] for row in rows], [1, 2, 3, 4])
+        self.assertEqual(len(load_ratings(self.ratings_path)), 7)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,128 @@
+"""
+Tests für die analytischen Standardfehler und Rang-Intervalle
+
+Vergleicht mit der dichten Inversen auf kleinen synthetischen Problemen;
+der Integrationstest arbeitet mit temporären Dateien, keine Netzwerkzugriffe.
+"""
+
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from bot.bradley_terry import run_rating_update, default_rating_uncertainty_path
+from bot import rating_uncertainty
+from bot.bt_solvers import fisher_information
+from bot.rating_uncertainty import (
+    _covariance_diagonal_and_products,
+    rank_intervals,
+    standard_errors,
+    RatingUncertaintyError
+)
+from bot.tsv_repository import load_rating_uncertainty
+from tests.helpers import random_model
+
+
+ALPHA = 0.01
+
+
+class TestRatingUncertainty(unittest.TestCase):
+    """Tests für standard_errors, rank_intervals und die Integration in run_rating_update"""
+
+    def test_standard_errors_match_dense_inverse(self):
+        """Standardfehler entsprechen der Delta-Methode mit der dichten Inversen."""
+        model, theta = random_model(ALPHA)
+        n = len(theta)
+        errors = standard_errors(theta, model.counts, ALPHA)
+        
+        shifted = theta - np.log(np.mean(np.exp(theta)))
+        covariance = np.linalg.inv(fisher_information(shifted, model.counts, n, ALPHA))
+        centering = np.eye(n) - 1.0 / n
+        utility = np.exp(shifted)
+        jacobian = utility[:, None] * (np.eye(n) - utility[None, :] / n)
+        
+        np.testing.assert_allclose(errors.se_theta, np.sqrt(np.diag(centering @ covariance @ centering)))
+        np.testing.assert_allclose(errors.se_utility, np.sqrt(np.diag(jacobian @ covariance @ jacobian.T)))
+
+    def test_diagonal_matches_dense_inverse(self):
+        """Diagonale aus der Dreiecksinversion und Solve entsprechen der dichten Inversen."""
+        model, theta = random_model(ALPHA, n_episodes=40)
+        n = len(theta)
+        information = fisher_information(theta, model.counts, n, ALPHA)
+        rhs = np.random.default_rng(1).normal(size=(n, 2))
+        diagonal, products = _covariance_diagonal_and_products(information.copy(), rhs)
+        
+        covariance = np.linalg.inv(information)
+        np.testing.assert_allclose(diagonal, np.diag(covariance))
+        np.testing.assert_allclose(products, covariance @ rhs)
+
+    def test_more_votes_shrink_errors_and_intervals(self):
+        """Mehr Stimmen pro Poll verkleinern Standardfehler und Rang-Intervalle."""
+        few_model, few_theta = random_model(ALPHA, votes=5)
+        many_model, many_theta = random_model(ALPHA, votes=500)
+        few = standard_errors(few_theta, few_model.counts, ALPHA)
+        many = standard_errors(many_theta, many_model.counts, ALPHA)
+        self.assertTrue(np.all(many.se_theta < few.se_theta))
+        
+        few_ranks = rank_intervals(few_theta, few.se_theta)
+        many_ranks = rank_intervals(many_theta, many.se_theta)
+        self.assertLess(
+            np.mean(many_ranks.rank_high - many_ranks.rank_low),
+            np.mean(few_ranks.rank_high - few_ranks.rank_low)
+        )
+        for ranks in (few_ranks, many_ranks):
+            self.assertTrue(np.all(ranks.rank_low <= ranks.rank))
+            self.assertTrue(np.all(ranks.rank <= ranks.rank_high))
+        self.assertEqual(sorted(many_ranks.rank), list(range(1, len(many_theta) + 1)))
+        self.assertEqual(many_ranks.rank[np.argmax(many_theta)], 1)
+
+    def test_invalid_inputs_raise(self):
+        """alpha <= 0, ungültiges Konfidenzniveau und zu viele Episoden führen zu Fehlern."""
+        model, theta = random_model(ALPHA, n_episodes=5, n_polls=20)
+        with self.assertRaises(RatingUncertaintyError):
+            standard_errors(theta, model.counts, 0.0)
+        with self.assertRaises(RatingUncertaintyError):
+            rank_intervals(theta, np.ones_like(theta), level=1.0)
+        
+        original = rating_uncertainty.UNCERTAINTY_MAX_ITEMS
+        rating_uncertainty.UNCERTAINTY_MAX_ITEMS = 4
+        try:
+            with self.assertRaises(RatingUncertaintyError):
+                standard_errors(theta, model.counts, ALPHA)
+        finally:
+            rating_uncertainty.UNCERTAINTY_MAX_ITEMS = original
+
+    def test_rating_run_writes_uncertainty_file(self):
+        """run_rating_update(uncertainty=True) schreibt rating_uncertainty.tsv neben ratings.tsv."""
+        with tempfile.TemporaryDirectory() as tmp:
+            polls_path = Path(tmp) / "polls.tsv"
+            ratings_path = Path(tmp) / "ratings.tsv"
+            lines = [
+                "poll_id\treddit_post_id\tcreated_at\tcloses_at\t"
+                "episode_a_id\tepisode_b_id\tvotes_a\tvotes_b\tfinalized_at"
+            ]
+            for poll_id, (a, b, votes_a, votes_b) in enumerate([(1, 2, 70, 30), (2, 3, 60, 40), (1, 3, 80, 20)], 1):
+                lines.append(
+                    f"{poll_id}\tp{poll_id}\t2024-01-01T10:00:00Z\t2024-01-08T10:00:00Z\t"
+                    f"{a}\t{b}\t{votes_a}\t{votes_b}\t2024-01-08T11:00:00Z"
+                )
+            polls_path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+            
+            calculated_at = datetime(2024, 2, 1, tzinfo=timezone.utc)
+            run_rating_update(polls_path, ratings_path, calculated_at, use_cache=False)
+            self.assertFalse(default_rating_uncertainty_path(ratings_path).exists())
+            
+            rows = run_rating_update(polls_path, ratings_path, calculated_at, use_cache=False, uncertainty=True)
+            uncertainty = load_rating_uncertainty(default_rating_uncertainty_path(ratings_path))
+        
+        self.assertEqual([int(row['episode_id']) for row in uncertainty], [1, 2, 3])
+        self.assertEqual([int(row['rank']) for row in uncertainty], [1, 2, 3])
+        self.assertTrue(all(float(row['se_theta']) > 0 for row in uncertainty))
+        self.assertEqual(uncertainty[0]['calculated_at'], '2024-02-01T00:00:00Z')
+        self.assertAlmostEqual(rows[0]['se_utility'], float(uncertainty[0]['se_utility']), places=6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,298 @@
+"""
+Tests für das TSV Repository
+
+Arbeitet mit temporären Dateien (tempfile), keine Netzwerkzugriffe.
+"""
+
+import os
+import tempfile
+import unittest
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+from bot import tsv_repository
+from bot.tsv_repository import (
+    load_poll_columns,
+    parse_epoch_seconds,
+    NOT_FINALIZED,
+    load_polls,
+    load_ratings,
+    append_ratings,
+    TSVError
+)
+
+
+POLLS_HEADER = (
+    "poll_id\treddit_post_id\tcreated_at\tcloses_at\t"
+    "episode_a_id\tepisode_b_id\tvotes_a\tvotes_b\tfinalized_at\n"
+)
+
+
+def poll_line(poll_id: int, a: int = 1, b: int = 2, votes_a: int = 60, votes_b: int = 40) -> str:
+    """Erzeugt eine finalisierte Poll-Zeile für polls.tsv."""
+    return (
+        f"{poll_id}\tp{poll_id}\t2024-01-01T10:00:00Z\t2024-01-08T10:00:00Z\t"
+        f"{a}\t{b}\t{votes_a}\t{votes_b}\t2024-01-{poll_id:02d}T11:00:00Z\n"
+    )
+
+
+class TestPollColumnLoading(unittest.TestCase):
+    """Tests für load_poll_columns()"""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.polls_path = Path(self.tmp.name) / "polls.tsv"
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def test_columns_match_dict_loader(self):
+        """
+        Test: Spalten enthalten dieselben Werte wie load_polls(), typisiert.
+        """
+        unfinalized = poll_line(3).rsplit('\t', 1)[0] + '\t\n'
+        self.polls_path.write_text(
+            POLLS_HEADER + poll_line(1, 5, 2) + poll_line(2, 3, 4, 0, 7) + unfinalized,
+            encoding='utf-8'
+        )
+        
+        columns = load_poll_columns(self.polls_path)
+        rows = load_polls(self.polls_path)
+        
+        self.assertEqual(columns.poll_id.tolist(), [int(row['poll_id']) for row in rows])
+        self.assertEqual(columns.episode_a_id.tolist(), [5, 3, 1])
+        self.assertEqual(columns.episode_b_id.tolist(), [2, 4, 2])
+        self.assertEqual(columns.votes_a.tolist(), [60, 0, 60])
+        self.assertEqual(columns.votes_b.tolist(), [40, 7, 40])
+        self.assertEqual(
+            columns.finalized_at[0],
+            int(datetime(2024, 1, 1, 11, 0, tzinfo=timezone.utc).timestamp())
+        )
+        self.assertEqual(columns.finalized_at[2], NOT_FINALIZED)
+    
+    def test_epoch_parsing_matches_fromisoformat(self):
+        """
+        Test: Vektorisiertes Parsen entspricht datetime.fromisoformat.
+        """
+        values = [
+            '2024-01-22T11:30:00Z', '2024-02-29T23:59:59Z', '2000-03-01T00:00:00Z',
+            '1999-12-31T23:59:59Z', '2100-02-28T12:00:00Z', '2024-01-22T12:30:00+01:00'
+        ]
+        expected = [
+            int(datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp())
+            for value in values
+        ]
+        
+        self.assertEqual(parse_epoch_seconds(values).tolist(), expected)
+        self.assertEqual(parse_epoch_seconds(['']).tolist(), [NOT_FINALIZED])
+        with self.assertRaises(ValueError):
+            parse_epoch_seconds(['2023-02-29T00:00:00Z'])
+    
+    def test_header_only_file(self):
+        """
+        Test: Datei nur mit Header ergibt leere Spalten.
+        """
+        self.polls_path.write_text(POLLS_HEADER, encoding='utf-8')
+        
+        columns = load_poll_columns(self.polls_path)
+        
+        self.assertEqual(len(columns.poll_id), 0)
+        self.assertEqual(len(columns.finalized_at), 0)
+    
+    def test_invalid_values_raise(self):
+        """
+        Test: Nicht-numerische Werte oder falsche Header führen zu TSVError.
+        """
+        self.polls_path.write_text(POLLS_HEADER + poll_line(1).replace('\t60\t', '\tsechzig\t'), encoding='utf-8')
+        with self.assertRaises(TSVError):
+            load_poll_columns(self.polls_path)
+        
+        self.polls_path.write_text("poll_id\tvotes\n1\t2\n", encoding='utf-8')
+        with self.assertRaisesRegex(TSVError, "Header-Schema"):
+            load_poll_columns(self.polls_path)
+
+
+class TestPollColumnCache(unittest.TestCase):
+    """Tests für den Binär-Cache von load_poll_columns()"""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.polls_path = Path(self.tmp.name) / "polls.tsv"
+        self.polls_path.write_text(POLLS_HEADER + poll_line(1) + poll_line(2, 3, 4), encoding='utf-8')
+    
+    def tearDown(self):
+        self.tmp.cleanup()
+    
+    def test_unchanged_file_is_served_from_cache(self):
+        """
+        Test: Zweiter Aufruf parst nicht erneut und liefert dieselben Spalten.
+        """
+        first = load_poll_columns(self.polls_path)
+        
+        with mock.patch.object(tsv_repository, '_parse_poll_columns') as parse:
+            second = load_poll_columns(self.polls_path)
+        
+        parse.assert_not_called()
+        for first_column, second_column in zip(first, second):
+            np.testing.assert_array_equal(first_column, second_column)
+    
+    def test_touched_file_is_matched_by_content_hash(self):
+        """
+        Test: Nur geänderte mtime (gleicher Inhalt) verwendet weiterhin den Cache.
+        """
+        load_poll_columns(self.polls_path)
+        stat = self.polls_path.stat()
+        os.utime(self.polls_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        
+        with mock.patch.object(tsv_repository, '_parse_poll_columns') as parse:
+            load_poll_columns(self.polls_path)
+        
+        parse.assert_not_called()
+    
+    def test_changed_file_invalidates_cache(self):
+        """
+        Test: Geänderte TSV wird neu geparst, alte Cache-Daten werden entfernt.
+        """
+        load_poll_columns(self.polls_path)
+        
+        with open(self.polls_path, 'a', encoding='utf-8') as f:
+            f.write(poll_line(3, 2, 5))
+        columns = load_poll_columns(self.polls_path)
+        
+        self.assertEqual(columns.poll_id.tolist(), [1, 2, 3])
+        self.assertEqual(columns.episode_b_id.tolist(), [2, 4, 5])
+        cache_files = list((Path(self.tmp.name) / '.cache').glob('polls_columns_*.npy'))
+        self.assertEqual(len(cache_files), 1)
+
+
+class TestIncrementalPollLoading(unittest.TestCase):
+    """Tests für das Anhängen neuer Zeilen an den Binär-Cache"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.polls_path = Path(self.tmp.name) / "polls.tsv"
+        self.polls_path.write_text(POLLS_HEADER + poll_line(1) + poll_line(2), encoding='utf-8')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def append(self, text: str):
+        with open(self.polls_path, 'a', encoding='utf-8') as f:
+            f.write(text)
+
+    def assert_columns_equal(self, columns, expected):
+        for column, expected_column in zip(columns, expected):
+            np.testing.assert_array_equal(column, expected_column)
+
+    def test_parses_only_appended_rows(self):
+        """
+        Test: Angehängte Zeilen werden ohne vollständiges Parsen an den Cache gehängt.
+        """
+        load_poll_columns(self.polls_path)
+        self.append(poll_line(3, 2, 5) + poll_line(4, 1, 3))
+        
+        with mock.patch.object(tsv_repository, '_parse_poll_columns') as parse:
+            columns = load_poll_columns(self.polls_path)
+            cached = load_poll_columns(self.polls_path)
+        
+        parse.assert_not_called()
+        expected = load_poll_columns(self.polls_path, use_cache=False)
+        self.assertEqual(columns.poll_id.tolist(), [1, 2, 3, 4])
+        self.assert_columns_equal(columns, expected)
+        self.assert_columns_equal(cached, expected)
+
+    def test_append_reads_only_tail_window(self):
+        """
+        Test: Beim Anhängen wird der Anfang der Datei nicht erneut gehasht; touch prüft alle Segmente.
+        """
+        line = poll_line(1)
+        self.append(''.join(line.replace('1\tp1\t', f'{k}\tp{k}\t', 1) for k in range(3, 2002)))
+        load_poll_columns(self.polls_path)
+        self.assertGreater(self.polls_path.stat().st_size, tsv_repository.POLL_CACHE_TAIL_WINDOW)
+        self.append(line.replace('1\tp1\t', '2002\tp2002\t', 1) + line.replace('1\tp1\t', '2003\tp2003\t', 1))
+        
+        with mock.patch.object(tsv_repository, '_chained_sha256') as full_hash:
+            columns = load_poll_columns(self.polls_path)
+        full_hash.assert_not_called()
+        self.assertEqual(columns.poll_id[-3:].tolist(), [2001, 2002, 2003])
+        
+        stat = self.polls_path.stat()
+        os.utime(self.polls_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        with mock.patch.object(tsv_repository, '_parse_poll_columns') as parse:
+            touched = load_poll_columns(self.polls_path)
+        parse.assert_not_called()
+        self.assert_columns_equal(touched, load_poll_columns(self.polls_path, use_cache=False))
+
+    def test_incomplete_last_line_is_parsed_completely(self):
+        """
+        Test: Eine unvollständige angehängte Zeile wird nicht an den Cache gehängt.
+        """
+        load_poll_columns(self.polls_path)
+        self.append(poll_line(3)[:-1])
+        
+        with mock.patch.object(
+            tsv_repository, '_parse_poll_columns', wraps=tsv_repository._parse_poll_columns
+        ) as parse:
+            columns = load_poll_columns(self.polls_path)
+        
+        parse.assert_called_once()
+        self.assertEqual(columns.poll_id.tolist(), [1, 2, 3])
+
+    def test_rewritten_prefix_is_parsed_completely(self):
+        """
+        Test: Geänderte bisherige Zeilen (gleiche Länge plus neue Zeile) werden vollständig neu geparst.
+        """
+        load_poll_columns(self.polls_path)
+        self.polls_path.write_text(
+            POLLS_HEADER + poll_line(1, votes_a=61, votes_b=39) + poll_line(2) + poll_line(3),
+            encoding='utf-8'
+        )
+        
+        columns = load_poll_columns(self.polls_path)
+        
+        self.assertEqual(columns.votes_a.tolist(), [61, 60, 60])
+        self.assertEqual(columns.poll_id.tolist(), [1, 2, 3])
+
+    def test_invalid_appended_row_raises(self):
+        """
+        Test: Nicht parsebare angehängte Werte führen zu TSVError.
+        """
+        load_poll_columns(self.polls_path)
+        self.append(poll_line(3).replace('\t60\t', '\tsechzig\t'))
+        
+        with self.assertRaises(TSVError):
+            load_poll_columns(self.polls_path)
+
+
+class TestAppendRatings(unittest.TestCase):
+    """Tests für append_ratings"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.ratings_path = Path(self.tmp.name) / "ratings.tsv"
+        self.calculated_at = datetime(2024, 2, 1, tzinfo=timezone.utc)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_header_without_trailing_newline(self):
+        """
+        Test: Ein Header ohne abschließenden Zeilenumbruch wird nicht mit der ersten Zeile verklebt.
+        """
+        self.ratings_path.write_text("episode_id\tutility\tmatches\tcalculated_at", encoding='utf-8')
+        
+        for utility in (0.5, -0.25):
+            append_ratings(self.ratings_path, [
+                {'episode_id': 1, 'utility': utility, 'matches': 3, 'calculated_at': self.calculated_at}
+            ])
+        
+        rows = load_ratings(self.ratings_path)
+        self.assertEqual([row['utility'] for row in rows], ['0.500000', '-0.250000'])
+        self.assertEqual([row['episode_id'] for row in rows], ['1', '1'])
+
+
+if __name__ == '__main__':
+    unittest.main()